@@ -1,7 +1,31 @@
 """Entry point for running paidsearchnav_mcp as a module."""
 
+import os
+
+from paidsearchnav_mcp.core.metrics_registry import start_metrics_server
+from paidsearchnav_mcp.core.tracing import configure_tracing_from_env
 from paidsearchnav_mcp.server import mcp
 
-if __name__ == "__main__":
+
+def main() -> None:
+    """Run the MCP server with optional metrics endpoint and trace export.
+
+    ``PSN_METRICS_PORT`` starts ``/metrics`` on its own port, which is needed
+    for the stdio transport; HTTP transports also serve ``/metrics`` directly.
+    ``PSN_METRICS_HOST`` sets the bind address (default ``127.0.0.1``).
+    ``PSN_TRACE_FILE`` appends OTLP/JSON trace spans to the given file.
+    """
+    configure_tracing_from_env()
+
+    metrics_port = os.getenv("PSN_METRICS_PORT")
+    if metrics_port:
+        start_metrics_server(
+            int(metrics_port), host=os.getenv("PSN_METRICS_HOST", "127.0.0.1")
+        )
+
     # Run the MCP server
     mcp.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
 """Base analyzer class for PaidSearchNav MCP server."""
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from paidsearchnav_mcp.analyzers.execution import ExecutionBackend, backend_for
+from paidsearchnav_mcp.analyzers.incremental import SUMMARIES, fingerprint
+from paidsearchnav_mcp.core.tracing import get_current_span, traced
+
+logger = logging.getLogger(__name__)
+
 
 class AnalysisSummary(BaseModel):
     """Standard format for analysis summaries.
@@ -28,13 +35,64 @@ class AnalysisSummary(BaseModel):
     customer_id: str = Field(description="Google Ads customer ID")
 
 
+def _summary_span_attributes(summary: AnalysisSummary) -> dict[str, Any]:
+    """Summarize an analysis result for its trace span."""
+    return {
+        "records_analyzed": summary.total_records_analyzed,
+        "recommendations": len(summary.top_recommendations),
+    }
+
+
 class BaseAnalyzer(ABC):
     """Base class for all analyzers.
 
     Analyzers perform server-side analysis and return only summaries,
     not raw data. This prevents context window exhaustion in Claude Desktop.
+
+    Each subclass's ``analyze`` runs in a trace span named after the class;
+    decorate expensive stages with ``traced()`` to break it down further.
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "analyze" in cls.__dict__:
+            cls.analyze = traced(  # type: ignore[method-assign]
+                f"analyzer.{cls.__name__}",
+                record_args=("customer_id", "start_date", "end_date"),
+                result_attributes=_summary_span_attributes,
+            )(cls.__dict__["analyze"])
+
+    @property
+    def backend(self) -> ExecutionBackend:
+        """Where this analyzer runs CPU-heavy steps (see ``execution``)."""
+        return backend_for(type(self).__name__)
+
+    def cache_key(self, *parts: str) -> str:
+        """Fingerprint of this analyzer's class and settings plus ``parts``.
+
+        Args:
+            parts: Request arguments and input fingerprints to include
+
+        Returns:
+            Key for the ``incremental`` caches
+        """
+        settings = repr(sorted(vars(self).items()))
+        return fingerprint(type(self).__name__, settings, *parts)
+
+    def cached_summary(self, key: str) -> AnalysisSummary | None:
+        """Return a copy of the summary stored under ``key``, if any."""
+        summary = SUMMARIES.get(key)
+        get_current_span().set_attribute("summary_cache.hit", summary is not None)
+        if summary is None:
+            return None
+        logger.info(f"{type(self).__name__}: inputs unchanged, reusing summary")
+        return summary.model_copy(deep=True)
+
+    def remember_summary(self, key: str, summary: AnalysisSummary) -> AnalysisSummary:
+        """Store ``summary`` under ``key`` and return it."""
+        SUMMARIES.put(key, summary.model_copy(deep=True))
+        return summary
+
     @abstractmethod
     async def analyze(
         self,
@@ -0,0 +1,301 @@
+"""Execution backends for the CPU-heavy steps of an analysis.
+
+Analyzers fetch data on the server's event loop and hand CPU-bound steps
+(page reductions, conflict matching) to an ``ExecutionBackend``:
+
+- ``InlineBackend`` runs them on the event loop (the default)
+- ``ProcessBackend`` runs them in a ``ProcessPoolExecutor``, so a long
+  audit does not stall every other tool call in the process.
+  ``MetricsFrame`` arguments are copied into one shared memory block
+  rather than pickled, so only their string dictionaries are serialized
+
+``PSN_ANALYZER_PROCESSES`` lists the analyzers (class names, comma
+separated, or ``all``) that use the process pool and
+``PSN_ANALYZER_WORKERS`` sets its size (default: one per CPU).
+
+Functions sent to a process must be picklable: module-level functions or
+methods of an analyzer whose attributes are plain settings.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import pickle
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, TypeVar
+
+import numpy as np
+
+from paidsearchnav_mcp.analyzers.frame import DictionaryColumn, MetricsFrame
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Column buffers start on cache-line boundaries inside the shared block
+_ALIGNMENT = 64
+
+
+class ExecutionBackend(ABC):
+    """Runs a function over analyzer inputs and returns its result."""
+
+    @abstractmethod
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call ``fn(*args, **kwargs)`` and return its result.
+
+        Args:
+            fn: Function to call; must be picklable for process backends
+            args: Positional arguments; ``MetricsFrame`` values may be
+                shared with the worker rather than copied
+            kwargs: Keyword arguments, treated like ``args``
+
+        Returns:
+            What ``fn`` returned
+        """
+
+    def shutdown(self) -> None:
+        """Release any workers held by the backend."""
+
+
+class InlineBackend(ExecutionBackend):
+    """Run functions directly on the calling event loop."""
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return fn(*args, **kwargs)
+
+
+class ProcessBackend(ExecutionBackend):
+    """Run functions in a pool of worker processes.
+
+    Workers are started on first use with the ``spawn`` method, so they
+    never inherit the server's threads or open connections.
+
+    Attributes:
+        max_workers: Pool size; ``None`` uses one worker per CPU
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        """Initialize the backend.
+
+        Args:
+            max_workers: Pool size; ``None`` uses one worker per CPU
+        """
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        frames = [
+            value
+            for value in (*args, *kwargs.values())
+            if isinstance(value, MetricsFrame)
+        ]
+        memory, handle = share_frames(frames) if frames else (None, None)
+        positions = {id(frame): i for i, frame in enumerate(frames)}
+        shared_args = [_placeholder(value, positions) for value in args]
+        shared_kwargs = {
+            name: _placeholder(value, positions) for name, value in kwargs.items()
+        }
+        try:
+            payload = await asyncio.get_running_loop().run_in_executor(
+                self._pool(), _run_shared, fn, handle, shared_args, shared_kwargs
+            )
+        finally:
+            if memory is not None:
+                memory.close()
+                memory.unlink()
+        return pickle.loads(payload)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        if self._executor is None:
+            logger.info(
+                f"Starting analyzer process pool ({self.max_workers or os.cpu_count()} "
+                "workers)"
+            )
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+
+@dataclass(frozen=True)
+class _SharedColumn:
+    """Where one column lives in a shared memory block."""
+
+    name: str
+    dtype: str
+    offset: int
+    length: int
+    # Dictionary of a string column (the block holds its codes)
+    values: np.ndarray | None = None
+
+
+@dataclass(frozen=True)
+class SharedFrames:
+    """Picklable reference to frames copied into shared memory.
+
+    Attributes:
+        name: Shared memory block name
+        frames: Column layouts, one list per frame
+    """
+
+    name: str
+    frames: tuple[tuple[_SharedColumn, ...], ...]
+
+    def attach(self) -> tuple[SharedMemory, list[MetricsFrame]]:
+        """Map the block and return zero-copy frames over it.
+
+        The frames are only valid until the returned block is closed.
+        """
+        memory = SharedMemory(name=self.name)
+        frames = []
+        for layout in self.frames:
+            columns: dict[str, Any] = {}
+            for column in layout:
+                array = np.ndarray(
+                    column.length,
+                    dtype=np.dtype(column.dtype),
+                    buffer=memory.buf,
+                    offset=column.offset,
+                )
+                array.flags.writeable = False
+                columns[column.name] = (
+                    array
+                    if column.values is None
+                    else DictionaryColumn(array, column.values)
+                )
+            frames.append(MetricsFrame(columns))
+        return memory, frames
+
+
+def share_frames(frames: Sequence[MetricsFrame]) -> tuple[SharedMemory, SharedFrames]:
+    """Copy frames' column buffers into one new shared memory block.
+
+    The caller owns the block and must ``close()`` and ``unlink()`` it once
+    no worker needs it.
+
+    Args:
+        frames: Frames with numeric and dictionary-encoded columns
+
+    Returns:
+        The block and a handle workers can ``attach()`` to
+    """
+    arrays: list[np.ndarray] = []
+    layouts = []
+    size = 0
+    for frame in frames:
+        layout = []
+        for name in frame.columns:
+            column = frame[name]
+            is_dictionary = isinstance(column, DictionaryColumn)
+            array = np.asarray(column.codes if is_dictionary else column)
+            offset = -(-size // _ALIGNMENT) * _ALIGNMENT
+            layout.append(
+                _SharedColumn(
+                    name,
+                    array.dtype.str,
+                    offset,
+                    len(array),
+                    column.values if is_dictionary else None,
+                )
+            )
+            arrays.append(array)
+            size = offset + array.nbytes
+        layouts.append(tuple(layout))
+
+    memory = SharedMemory(create=True, size=max(size, 1))
+    columns = [column for layout in layouts for column in layout]
+    for column, array in zip(columns, arrays):
+        target = np.ndarray(
+            column.length, dtype=array.dtype, buffer=memory.buf, offset=column.offset
+        )
+        target[:] = array
+        del target
+    return memory, SharedFrames(memory.name, tuple(layouts))
+
+
+@dataclass(frozen=True)
+class _FrameArgument:
+    """Stands in for the ``index``-th shared frame in a worker call."""
+
+    index: int
+
+
+def _placeholder(value: Any, positions: dict[int, int]) -> Any:
+    """Replace a shared frame argument with its placeholder."""
+    if isinstance(value, MetricsFrame):
+        return _FrameArgument(positions[id(value)])
+    return value
+
+
+def _run_shared(
+    fn: Callable[..., Any],
+    handle: SharedFrames | None,
+    args: list[Any],
+    kwargs: dict[str, Any],
+) -> bytes:
+    """Worker entry point: attach shared frames, call ``fn``, pickle the result.
+
+    The result is pickled before the block is released, so results that
+    still reference frame buffers are copied out while they are valid.
+    """
+    memory, frames = handle.attach() if handle is not None else (None, [])
+
+    def resolve(value: Any) -> Any:
+        return frames[value.index] if isinstance(value, _FrameArgument) else value
+
+    try:
+        return pickle.dumps(
+            fn(
+                *[resolve(value) for value in args],
+                **{name: resolve(value) for name, value in kwargs.items()},
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    finally:
+        if memory is not None:
+            frames.clear()
+            try:
+                memory.close()
+            except BufferError:
+                # A view is still referenced (e.g. by a traceback); the
+                # mapping is released when it is collected
+                pass
+
+
+INLINE = InlineBackend()
+_process_backend: ProcessBackend | None = None
+
+
+def backend_for(analyzer: str) -> ExecutionBackend:
+    """Return the backend configured for an analyzer class name.
+
+    Args:
+        analyzer: Analyzer class name, e.g. ``"NegativeConflictAnalyzer"``
+
+    Returns:
+        The shared ``ProcessBackend`` if ``PSN_ANALYZER_PROCESSES`` names the
+        analyzer (or is ``all``), otherwise ``INLINE``
+    """
+    global _process_backend
+
+    selected = {
+        name.strip() for name in os.getenv("PSN_ANALYZER_PROCESSES", "").split(",")
+    }
+    if analyzer not in selected and "all" not in selected:
+        return INLINE
+    if _process_backend is None:
+        workers = os.getenv("PSN_ANALYZER_WORKERS")
+        _process_backend = ProcessBackend(int(workers) if workers else None)
+    return _process_backend
@@ -0,0 +1,502 @@
+"""Columnar metrics frames shared by the analyzers.
+
+The MCP data tools return rows as lists of (sometimes nested) dicts. Analyzers
+convert each page once, at the fetch boundary, into a ``MetricsFrame``: one
+NumPy array per field. Filters, group-bys and top-k selection then run as
+vectorized operations instead of per-row ``.get()`` chains.
+
+String fields are dictionary-encoded. A ``DictionaryColumn`` stores an
+``int32`` code per row plus the distinct values once, so repeated campaign
+names and match types cost four bytes a row and grouping is a ``bincount``.
+"""
+
+import hashlib
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Union
+
+import numpy as np
+
+FLOAT = "float"
+INT = "int"
+STR = "str"
+
+_DTYPES = {FLOAT: np.float64, INT: np.int64}
+
+
+@dataclass(frozen=True)
+class Field:
+    """How to read one column out of a source record.
+
+    Attributes:
+        kind: Column type: ``"float"``, ``"int"`` or ``"str"``
+        path: Dotted path into the record (e.g. ``"metrics.cost"``); defaults
+            to the column name
+        default: Value used when the path is missing or ``None``; defaults to
+            ``0`` for numeric fields and ``""`` for strings
+    """
+
+    kind: str = FLOAT
+    path: str | None = None
+    default: Any = None
+
+    def __post_init__(self) -> None:
+        if self.kind not in (FLOAT, INT, STR):
+            raise ValueError(f"Unknown field kind: {self.kind!r}")
+
+
+@dataclass(frozen=True, eq=False)
+class DictionaryColumn:
+    """Dictionary-encoded string column.
+
+    Attributes:
+        codes: Index into ``values`` for every row
+        values: Distinct strings referenced by ``codes``
+    """
+
+    codes: np.ndarray
+    values: np.ndarray
+
+    @classmethod
+    def encode(cls, strings: Iterable[str]) -> "DictionaryColumn":
+        """Dictionary-encode a sequence of strings, in first-seen order."""
+        strings = strings if isinstance(strings, Sequence) else list(strings)
+        distinct = list(dict.fromkeys(strings))
+        lookup = {value: code for code, value in enumerate(distinct)}
+        codes = np.fromiter(
+            map(lookup.__getitem__, strings), dtype=np.int32, count=len(strings)
+        )
+        return cls(codes, _object_array(distinct))
+
+    @classmethod
+    def concat(cls, columns: Sequence["DictionaryColumn"]) -> "DictionaryColumn":
+        """Concatenate columns, merging their dictionaries."""
+        lookup: dict[str, int] = {}
+        parts = []
+        for column in columns:
+            remap = np.fromiter(
+                (lookup.setdefault(value, len(lookup)) for value in column.values),
+                dtype=np.int32,
+                count=len(column.values),
+            )
+            parts.append(remap[column.codes])
+        codes = np.concatenate(parts) if parts else np.empty(0, dtype=np.int32)
+        return cls(codes.astype(np.int32, copy=False), _object_array(lookup))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: Any) -> "DictionaryColumn":
+        return DictionaryColumn(self.codes[index], self.values)
+
+    def decode(self) -> np.ndarray:
+        """Return the column as an object array of strings."""
+        return self.values[self.codes]
+
+    def transform(self, func: Callable[[str], str]) -> "DictionaryColumn":
+        """Apply ``func`` to every distinct value, merging codes that collide.
+
+        Only the dictionary is transformed, so this costs O(distinct values)
+        calls rather than O(rows).
+        """
+        lookup: dict[str, int] = {}
+        remap = np.fromiter(
+            (lookup.setdefault(func(value), len(lookup)) for value in self.values),
+            dtype=np.int32,
+            count=len(self.values),
+        )
+        return DictionaryColumn(remap[self.codes], _object_array(lookup))
+
+    def normalized(self) -> "DictionaryColumn":
+        """Lower-case and strip values, as used for keyword text matching."""
+        return self.transform(lambda value: value.lower().strip())
+
+    def isin(self, values: Iterable[str]) -> np.ndarray:
+        """Boolean mask of rows whose value is one of ``values``."""
+        wanted = set(values)
+        matching = [code for code, value in enumerate(self.values) if value in wanted]
+        return np.isin(self.codes, matching)
+
+
+Column = Union[np.ndarray, DictionaryColumn]
+
+
+class MetricsFrame:
+    """Immutable set of equal-length columns.
+
+    Numeric columns are ``float64``/``int64`` arrays; string columns are
+    ``DictionaryColumn`` instances. Row-level operations (``filter``,
+    ``take``) return new frames that share dictionaries with the original.
+    """
+
+    def __init__(self, columns: Mapping[str, Column]):
+        """Initialize the frame.
+
+        Args:
+            columns: Column name to NumPy array or ``DictionaryColumn``
+
+        Raises:
+            ValueError: If the columns differ in length
+        """
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        self._columns = dict(columns)
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[Mapping[str, Any]], fields: Mapping[str, Field]
+    ) -> "MetricsFrame":
+        """Build a frame from dict rows.
+
+        Missing or ``None`` values take the field's default, matching the
+        analyzers' ``.get(..., 0)`` chains.
+        ``str`` subclasses such as ``KeywordMatchType`` are stored as-is so
+        they still compare equal to their plain values.
+
+        Args:
+            records: Rows as returned by the MCP data tools
+            fields: Column name to ``Field`` describing where to read it
+
+        Returns:
+            MetricsFrame with one column per field
+        """
+        records = records if isinstance(records, Sequence) else list(records)
+        extracted: dict[str, list[Any]] = {}
+        columns: dict[str, Column] = {}
+        for name, field in fields.items():
+            values = _extract(records, field.path or name, extracted)
+            if field.kind == STR:
+                # Encode raw values, then clean up the (small) dictionary
+                default = "" if field.default is None else field.default
+                columns[name] = DictionaryColumn.encode(values).transform(
+                    lambda value, default=default: _to_str(value, default)
+                )
+            else:
+                # None becomes NaN in a float array; swap in the default
+                default = 0 if field.default is None else field.default
+                array = np.array(values, dtype=np.float64).reshape(-1)
+                array[np.isnan(array)] = default
+                columns[name] = array.astype(_DTYPES[field.kind], copy=False)
+        return cls(columns)
+
+    @classmethod
+    def empty(cls, fields: Mapping[str, Field]) -> "MetricsFrame":
+        """Build a zero-row frame with the given fields."""
+        return cls.from_records((), fields)
+
+    @classmethod
+    def coerce(
+        cls,
+        data: Union["MetricsFrame", Iterable[Mapping[str, Any]]],
+        fields: Mapping[str, Field],
+    ) -> "MetricsFrame":
+        """Return ``data`` unchanged if it is a frame, else convert it."""
+        if isinstance(data, MetricsFrame):
+            return data
+        return cls.from_records(data, fields)
+
+    @classmethod
+    def concat(cls, frames: Sequence["MetricsFrame"]) -> "MetricsFrame":
+        """Concatenate frames with identical columns, e.g. fetched pages.
+
+        Raises:
+            ValueError: If ``frames`` is empty or the columns differ
+        """
+        if not frames:
+            raise ValueError("concat() needs at least one frame")
+        if len(frames) == 1:
+            return frames[0]
+        names = frames[0].columns
+        if any(frame.columns != names for frame in frames[1:]):
+            raise ValueError("Cannot concatenate frames with different columns")
+        columns: dict[str, Column] = {}
+        for name in names:
+            parts = [frame[name] for frame in frames]
+            if isinstance(parts[0], DictionaryColumn):
+                columns[name] = DictionaryColumn.concat(parts)
+            else:
+                columns[name] = np.concatenate(parts)
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns
+
+    def __getitem__(self, name: str) -> Any:
+        return self._columns[name]
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names in insertion order."""
+        return list(self._columns)
+
+    def strings(self, name: str) -> np.ndarray:
+        """Decode a string column to an object array."""
+        return self._columns[name].decode()
+
+    def fingerprint(self) -> str:
+        """Hash of the frame's contents, for detecting unchanged inputs.
+
+        Frames built from the same records in the same order have the same
+        fingerprint. Hashes the column buffers directly, so it costs about
+        as much as copying the frame.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for name, column in self._columns.items():
+            digest.update(name.encode())
+            if isinstance(column, DictionaryColumn):
+                digest.update(column.codes.tobytes())
+                digest.update("\x1f".join(map(str, column.values)).encode())
+            else:
+                digest.update(column.dtype.str.encode())
+                digest.update(np.ascontiguousarray(column).tobytes())
+        return digest.hexdigest()
+
+    def filter(self, mask: np.ndarray) -> "MetricsFrame":
+        """Keep rows where ``mask`` is true."""
+        return self.take(np.flatnonzero(mask))
+
+    def take(self, indices: np.ndarray) -> "MetricsFrame":
+        """Select rows by position, in the order given."""
+        return MetricsFrame(
+            {name: column[indices] for name, column in self._columns.items()}
+        )
+
+    def top_k(
+        self, by: str | np.ndarray, k: int, descending: bool = True
+    ) -> np.ndarray:
+        """Row positions of the ``k`` largest (or smallest) values.
+
+        Partitions first so only the candidates are sorted. Ties keep their
+        original row order, matching ``sorted(..., reverse=True)[:k]``.
+
+        Args:
+            by: Numeric column name, or an array of per-row sort keys
+            k: Number of rows to return
+            descending: Rank largest first (default) or smallest first
+
+        Returns:
+            Array of at most ``k`` row positions, best first
+        """
+        values = self._columns[by] if isinstance(by, str) else by
+        return top_k_indices(values, k, descending)
+
+    def group_sum(self, by: str, columns: Sequence[str]) -> "MetricsFrame":
+        """Sum numeric columns per distinct value of a string column.
+
+        Args:
+            by: Dictionary-encoded column to group on
+            columns: Numeric columns to sum
+
+        Returns:
+            Frame with one row per group present in the data, in order of
+            first appearance: the ``by`` column, a ``count`` column and one
+            summed column per entry in ``columns``
+        """
+        key: DictionaryColumn = self._columns[by]
+        size = len(key.values)
+        counts = np.bincount(key.codes, minlength=size)
+        present = np.flatnonzero(counts)
+        first_seen = np.full(size, len(key), dtype=np.intp)
+        np.minimum.at(first_seen, key.codes, np.arange(len(key)))
+        present = present[np.argsort(first_seen[present], kind="stable")]
+
+        grouped: dict[str, Column] = {
+            by: DictionaryColumn(
+                np.arange(len(present), dtype=np.int32), key.values[present]
+            ),
+            "count": counts[present].astype(np.int64),
+        }
+        for name in columns:
+            values = self._columns[name]
+            sums = np.bincount(key.codes, weights=values, minlength=size)[present]
+            if values.dtype.kind in "iu":
+                sums = np.rint(sums).astype(np.int64)
+            grouped[name] = sums
+        return MetricsFrame(grouped)
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Return one row as a dict of plain Python values."""
+        return {
+            name: (
+                column.values[column.codes[index]]
+                if isinstance(column, DictionaryColumn)
+                else column[index].item()
+            )
+            for name, column in self._columns.items()
+        }
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Return all rows as dicts of plain Python values."""
+        lists = {
+            name: (
+                column.decode().tolist()
+                if isinstance(column, DictionaryColumn)
+                else column.tolist()
+            )
+            for name, column in self._columns.items()
+        }
+        return [
+            {name: values[i] for name, values in lists.items()}
+            for i in range(self._length)
+        ]
+
+
+class FrameBuilder:
+    """Accumulate pages of dict rows into a single ``MetricsFrame``.
+
+    Each page is converted as soon as it arrives so the dicts can be freed,
+    keeping peak memory at one page of rows plus the columns.
+    """
+
+    def __init__(self, fields: Mapping[str, Field]):
+        """Initialize the builder.
+
+        Args:
+            fields: Column definitions applied to every page
+        """
+        self.fields = fields
+        self._frames: list[MetricsFrame] = []
+
+    def append(self, records: Iterable[Mapping[str, Any]]) -> MetricsFrame:
+        """Convert a page of rows and queue it for the final frame."""
+        frame = MetricsFrame.from_records(records, self.fields)
+        self._frames.append(frame)
+        return frame
+
+    def add(self, frame: MetricsFrame) -> None:
+        """Queue a page that is already a frame."""
+        self._frames.append(frame)
+
+    def __len__(self) -> int:
+        return sum(len(frame) for frame in self._frames)
+
+    def build(self) -> MetricsFrame:
+        """Concatenate all appended pages."""
+        if not self._frames:
+            return MetricsFrame.empty(self.fields)
+        return MetricsFrame.concat(self._frames)
+
+
+def select_fields(
+    fields: Mapping[str, Field], names: Iterable[str]
+) -> dict[str, Field]:
+    """Subset a schema so pages only pay for the columns an analyzer reads."""
+    return {name: fields[name] for name in names}
+
+
+def top_k_indices(values: np.ndarray, k: int, descending: bool = True) -> np.ndarray:
+    """Positions of the ``k`` largest (or smallest) entries of ``values``.
+
+    See ``MetricsFrame.top_k``; ties keep their original order.
+    """
+    keys = -np.asarray(values) if descending else np.asarray(values)
+    n = len(keys)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        threshold = np.partition(keys, k - 1)[k - 1]
+        candidates = np.flatnonzero(keys <= threshold)
+    else:
+        candidates = np.arange(n)
+    order = np.argsort(keys[candidates], kind="stable")
+    return candidates[order[:k]]
+
+
+def _to_str(value: Any, default: str) -> str:
+    if isinstance(value, str):
+        return value
+    return default if value is None else str(value)
+
+
+def _object_array(values: Iterable[str]) -> np.ndarray:
+    """Build a 1-D object array without NumPy splitting strings."""
+    values = list(values)
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _extract(
+    records: Sequence[Mapping[str, Any]], path: str, extracted: dict[str, list[Any]]
+) -> list[Any]:
+    """Read a possibly dotted path from every record.
+
+    ``extracted`` caches intermediate levels so sibling fields such as
+    ``metrics.cost`` and ``metrics.clicks`` walk ``metrics`` only once.
+    """
+    if path in extracted:
+        return extracted[path]
+    parent, _, key = path.rpartition(".")
+    if parent:
+        values = [
+            value.get(key) if value else None
+            for value in _extract(records, parent, extracted)
+        ]
+    else:
+        values = [record.get(key) for record in records]
+    extracted[path] = values
+    return values
+
+
+# Search term rows from the ``get_search_terms`` tool (metrics are nested).
+SEARCH_TERM_FIELDS: dict[str, Field] = {
+    "search_term": Field(STR),
+    "keyword_text": Field(STR),
+    "campaign_id": Field(STR),
+    "campaign_name": Field(STR),
+    "match_type": Field(STR),
+    "impressions": Field(INT, "metrics.impressions"),
+    "clicks": Field(INT, "metrics.clicks"),
+    "cost": Field(FLOAT, "metrics.cost"),
+    "conversions": Field(FLOAT, "metrics.conversions"),
+    "conversion_value": Field(FLOAT, "metrics.conversion_value"),
+}
+
+# Keyword rows from the ``get_keywords`` tool (metrics are at the top level).
+KEYWORD_FIELDS: dict[str, Field] = {
+    "keyword_text": Field(STR),
+    "match_type": Field(STR, default="BROAD"),
+    "campaign_name": Field(STR),
+    "ad_group_name": Field(STR),
+    "impressions": Field(INT),
+    "clicks": Field(INT),
+    "cost": Field(FLOAT),
+    "conversions": Field(FLOAT),
+    "conversion_value": Field(FLOAT),
+}
+
+# Negative keyword rows from the ``get_negative_keywords`` tool.
+NEGATIVE_KEYWORD_FIELDS: dict[str, Field] = {
+    "text": Field(STR),
+    "match_type": Field(STR, default="BROAD"),
+    "level": Field(STR, default="UNKNOWN"),
+}
+
+# Location rows from the ``get_geo_performance`` tool. Country and region
+# give the hierarchy locations are shrunk through.
+GEO_FIELDS: dict[str, Field] = {
+    "country_name": Field(STR),
+    "region_name": Field(STR),
+    "impressions": Field(INT),
+    "cost_micros": Field(FLOAT),
+    "conversions": Field(FLOAT),
+    "conversion_value_micros": Field(FLOAT),
+}
+
+# Entity-day rows from the ``get_daily_performance`` tool.
+DAILY_FIELDS: dict[str, Field] = {
+    "date": Field(STR),
+    "entity_id": Field(STR),
+    "entity_name": Field(STR),
+    "campaign_name": Field(STR),
+    "impressions": Field(INT),
+    "clicks": Field(INT),
+    "cost": Field(FLOAT),
+    "conversions": Field(FLOAT),
+    "conversion_value": Field(FLOAT),
+}
@@ -1,36 +1,68 @@
 """Geographic Performance Analyzer for PaidSearchNav MCP server.
 
 This analyzer analyzes location performance and recommends bid adjustments.
+Per-location CPA and ROAS are shrunk toward the location's state and
+country (see ``shrinkage``) so small locations are not flagged on noise.
 """
 
 import logging
-import statistics
 from typing import Any
 
+import numpy as np
+
 from paidsearchnav_mcp.analyzers.base import AnalysisSummary, BaseAnalyzer
+from paidsearchnav_mcp.analyzers.frame import (
+    GEO_FIELDS,
+    STR,
+    Field,
+    MetricsFrame,
+    top_k_indices,
+)
+from paidsearchnav_mcp.analyzers.shrinkage import gamma_interval, shrink_hierarchy
 
 logger = logging.getLogger(__name__)
 
 
+def _per_conversion(rate: float) -> float:
+    """Convert conversions per dollar into cost per conversion."""
+    return 1 / float(rate) if rate > 0 else float("inf")
+
+
 class GeoPerformanceAnalyzer(BaseAnalyzer):
     """Analyze location performance and recommend bid adjustments.
 
-    Returns locations to bid up, bid down, or exclude.
+    Returns locations to bid up, bid down, or exclude, ranked by expected
+    dollar impact.
     """
 
+    # Record fields tried in order for a location's display name
+    LABEL_FIELDS = (
+        "location_name",
+        "canonical_name",
+        "city_name",
+        "postal_code",
+        "metro_name",
+        "region_name",
+        "country_name",
+    )
+
     def __init__(
         self,
         min_impressions: int = 100,
         performance_threshold: float = 0.2,  # 20% deviation
+        confidence: float = 0.9,
     ):
         """Initialize the analyzer.
 
         Args:
             min_impressions: Minimum impressions required for analysis
             performance_threshold: Threshold for identifying outliers (0.2 = 20%)
+            confidence: Credible interval a location's CPA must clear the
+                account average by before it is recommended (0.9 = 90%)
         """
         self.min_impressions = min_impressions
         self.performance_threshold = performance_threshold
+        self.confidence = confidence
 
     async def analyze(
         self,
@@ -69,16 +101,28 @@ class GeoPerformanceAnalyzer(BaseAnalyzer):
             end_date=end_date,
         )
         result = await get_geo_performance_fn(request)
-        geo_data = result.get("data", [])
+        rows = result.get("data", [])
+        geo_data = MetricsFrame.from_records(rows, GEO_FIELDS)
+
+        # Labels come from the raw records, so they are part of the key too
+        labels = MetricsFrame.from_records(rows, _LABEL_COLUMNS)
+        summary_key = self.cache_key(
+            customer_id,
+            start_date,
+            end_date,
+            geo_data.fingerprint(),
+            labels.fingerprint(),
+        )
+        if cached := self.cached_summary(summary_key):
+            return cached
 
         logger.info(f"Analyzing {len(geo_data)} geographic locations")
 
-        # Filter by minimum impressions
-        filtered_data = [
-            loc for loc in geo_data if loc.get("impressions", 0) >= self.min_impressions
-        ]
+        # Filter by minimum impressions, remembering each row's source record
+        kept = np.flatnonzero(geo_data["impressions"] >= self.min_impressions)
+        filtered_data = geo_data.take(kept)
 
-        if not filtered_data:
+        if not len(filtered_data):
             return AnalysisSummary(
                 total_records_analyzed=len(geo_data),
                 estimated_monthly_savings=0.0,
@@ -91,90 +135,92 @@ class GeoPerformanceAnalyzer(BaseAnalyzer):
                 customer_id=customer_id,
             )
 
-        # Calculate average CPA and ROAS
-        locations_with_conversions = [
-            loc for loc in filtered_data if loc.get("conversions", 0) > 0
-        ]
-
-        if locations_with_conversions:
-            avg_cpa = statistics.mean(
-                loc.get("cost_micros", 0) / 1_000_000 / loc.get("conversions", 1)
-                for loc in locations_with_conversions
-                if loc.get("conversions", 0) > 0
+        cost = filtered_data["cost_micros"] / 1_000_000
+        conversions = filtered_data["conversions"]
+        revenue = filtered_data["conversion_value_micros"] / 1_000_000
+
+        # Cost-weighted account baselines, so a $5 ZIP code counts for less
+        # than a $5,000 metro when deciding what "average" means
+        total_cost = float(cost.sum())
+        target_rate = float(conversions.sum()) / total_cost if total_cost > 0 else 0.0
+        avg_cpa = 1 / target_rate if target_rate > 0 else 0.0
+        avg_roas = float(revenue.sum()) / total_cost if total_cost > 0 else 0.0
+
+        # Shrink each location's conversions per dollar (and revenue per
+        # dollar) toward its state, each state toward its country, and each
+        # country toward the account
+        levels = self._hierarchy(filtered_data)
+        shape, rate, strengths = shrink_hierarchy(conversions, cost, levels)
+        conv_rate = shape / rate
+        rate_low, rate_high = gamma_interval(shape, rate, self.confidence)
+        roas_shape, roas_rate, _ = shrink_hierarchy(revenue, cost, levels, strengths)
+        shrunk_roas = roas_shape / roas_rate
+
+        no_conversions = conversions == 0
+        if target_rate > 0:
+            # Act only when the credible interval excludes the account rate
+            # and the expected CPA differs by more than the threshold
+            relative = conv_rate / target_rate
+            bid_up = (rate_low > target_rate) & (
+                relative > 1 / (1 - self.performance_threshold)
             )
-            avg_roas = statistics.mean(
-                loc.get("conversion_value_micros", 0)
-                / 1_000_000
-                / max(loc.get("cost_micros", 0) / 1_000_000, 0.001)
-                for loc in locations_with_conversions
-                if loc.get("cost_micros", 0) > 0
+            bid_down = (rate_high < target_rate) & (
+                relative < 1 / (1 + self.performance_threshold)
             )
+            # Expected dollars saved by bidding to the account CPA; negative
+            # for bid ups, where the extra spend is capped at current spend
+            impact = cost * np.maximum(1 - relative, -1.0)
         else:
-            avg_cpa = 0.0
-            avg_roas = 0.0
-
-        # Identify locations for bid adjustments
-        recommendations = []
-
-        for loc in filtered_data:
-            location_name = loc.get("location_name", "Unknown")
-            cost = loc.get("cost_micros", 0) / 1_000_000
-            conversions = loc.get("conversions", 0)
-            revenue = loc.get("conversion_value_micros", 0) / 1_000_000
-
-            if conversions == 0:
-                # No conversions - consider excluding or bid down
-                recommendations.append(
-                    {
-                        "location": location_name,
-                        "action": "BID_DOWN or EXCLUDE",
-                        "current_cost": cost,
-                        "estimated_savings": cost
-                        * 0.5,  # Save 50% by bid down or 100% by exclude
-                        "reasoning": f"${cost:.2f} spent with 0 conversions",
-                        "metric": "No conversions",
-                    }
+            # No conversions anywhere: no baseline to compare against
+            bid_up = np.zeros(len(cost), dtype=bool)
+            bid_down = cost > 0
+            impact = cost * 0.5
+        impact = np.where(bid_up | bid_down, impact, 0.0)
+        recommended = np.flatnonzero(bid_up | bid_down)
+
+        # Rank by absolute expected dollar impact and take the top 10
+        top_10 = []
+        for i in recommended[top_k_indices(np.abs(impact[recommended]), 10)]:
+            row = rows[kept[i]]
+            location_cost = cost[i].item()
+            shrunk_cpa = _per_conversion(conv_rate[i])
+            cpa_interval = [_per_conversion(rate_high[i]), _per_conversion(rate_low[i])]
+            recommendation = {
+                "location": self._location_label(row),
+                "campaign": row.get("campaign_name") or "",
+                "current_cost": location_cost,
+                "estimated_savings": impact[i].item(),  # Negative = investment
+                "conversions": conversions[i].item(),
+                "expected_cpa": shrunk_cpa,
+                "cpa_interval": cpa_interval,
+                "expected_roas": shrunk_roas[i].item(),
+            }
+            if no_conversions[i] and bid_down[i]:
+                recommendation.update(
+                    action="BID_DOWN or EXCLUDE",
+                    reasoning=(
+                        f"${location_cost:.2f} spent with 0 conversions; "
+                        f"expected CPA ${shrunk_cpa:.2f} vs avg ${avg_cpa:.2f}"
+                    ),
+                    metric="No conversions",
                 )
             else:
-                cpa = cost / max(conversions, 0.001)  # Protect against division by zero
-                roas = revenue / max(cost, 0.001)  # Protect against division by zero
-
-                # High performers (low CPA or high ROAS)
-                if cpa < avg_cpa * (
-                    1 - self.performance_threshold
-                ) or roas > avg_roas * (1 + self.performance_threshold):
-                    # Negative savings = opportunity cost of NOT increasing bids
-                    potential_gain = cost * 0.3  # Could gain 30% more with bid increase
-                    recommendations.append(
-                        {
-                            "location": location_name,
-                            "action": "BID_UP",
-                            "current_cost": cost,
-                            "estimated_savings": -potential_gain,  # Negative = investment
-                            "reasoning": f"CPA ${cpa:.2f} vs avg ${avg_cpa:.2f}, ROAS {roas:.2f} vs avg {avg_roas:.2f}",
-                            "metric": f"High performer: {cpa / avg_cpa:.1%} of avg CPA",
-                        }
-                    )
-
-                # Low performers (high CPA or low ROAS)
-                elif cpa > avg_cpa * (
-                    1 + self.performance_threshold
-                ) or roas < avg_roas * (1 - self.performance_threshold):
-                    savings = cost * 0.3  # Save 30% by bid down
-                    recommendations.append(
-                        {
-                            "location": location_name,
-                            "action": "BID_DOWN",
-                            "current_cost": cost,
-                            "estimated_savings": savings,
-                            "reasoning": f"CPA ${cpa:.2f} vs avg ${avg_cpa:.2f}, ROAS {roas:.2f} vs avg {avg_roas:.2f}",
-                            "metric": f"Low performer: {cpa / avg_cpa:.1%} of avg CPA",
-                        }
-                    )
-
-        # Sort by absolute savings/impact and take top 10
-        recommendations.sort(key=lambda x: abs(x["estimated_savings"]), reverse=True)
-        top_10 = recommendations[:10]
+                observed_cpa = location_cost / conversions[i].item()
+                recommendation.update(
+                    action="BID_UP" if bid_up[i] else "BID_DOWN",
+                    reasoning=(
+                        f"Expected CPA ${shrunk_cpa:.2f} "
+                        f"({self.confidence:.0%} CI ${cpa_interval[0]:.2f}-"
+                        f"${cpa_interval[1]:.2f}) vs avg ${avg_cpa:.2f}; observed "
+                        f"${observed_cpa:.2f} on {conversions[i]:g} conversions, "
+                        f"ROAS {shrunk_roas[i]:.2f} vs avg {avg_roas:.2f}"
+                    ),
+                    metric=(
+                        f"{'High' if bid_up[i] else 'Low'} performer: "
+                        f"{shrunk_cpa / avg_cpa:.1%} of avg CPA"
+                    ),
+                )
+            top_10.append(recommendation)
 
         # Calculate total savings (exclude bid-up recommendations from savings)
         total_savings = sum(
@@ -182,8 +228,8 @@ class GeoPerformanceAnalyzer(BaseAnalyzer):
         )
 
         # Determine primary issue
-        bid_down_count = sum(1 for r in recommendations if "DOWN" in r["action"])
-        exclude_count = sum(1 for r in recommendations if "EXCLUDE" in r["action"])
+        bid_down_count = int(np.count_nonzero(bid_down))
+        exclude_count = int(np.count_nonzero(no_conversions & bid_down))
 
         if bid_down_count + exclude_count > 10:
             primary_issue = f"{bid_down_count + exclude_count} underperforming locations wasting budget"
@@ -202,7 +248,7 @@ class GeoPerformanceAnalyzer(BaseAnalyzer):
             f"${total_savings:,.2f} monthly savings"
         )
 
-        return AnalysisSummary(
+        summary = AnalysisSummary(
             total_records_analyzed=len(filtered_data),
             estimated_monthly_savings=total_savings,
             primary_issue=primary_issue,
@@ -211,6 +257,25 @@ class GeoPerformanceAnalyzer(BaseAnalyzer):
             analysis_period=f"{start_date} to {end_date}",
             customer_id=customer_id,
         )
+        return self.remember_summary(summary_key, summary)
+
+    @staticmethod
+    def _hierarchy(geo_data: MetricsFrame) -> list[np.ndarray]:
+        """Return nested country and state group codes for each location."""
+        country = geo_data["country_name"].codes
+        region = geo_data["region_name"].codes
+        # Regions are keyed within their country so the levels nest
+        state_key = country.astype(np.int64) * len(geo_data["region_name"].values)
+        _, state = np.unique(state_key + region, return_inverse=True)
+        return [country, state]
+
+    @classmethod
+    def _location_label(cls, row: dict[str, Any]) -> str:
+        """Return the most specific name available for a location record."""
+        for field in cls.LABEL_FIELDS:
+            if row.get(field):
+                return str(row[field])
+        return "Unknown"
 
     def _generate_implementation_steps(
         self, top_recommendations: list[dict]
@@ -229,3 +294,9 @@ class GeoPerformanceAnalyzer(BaseAnalyzer):
             "Week 3: Monitor performance changes and adjust as needed",
             "Week 4: Review location targeting radius and DMA settings",
         ]
+
+
+# Record fields copied into recommendations, fingerprinted with the metrics
+_LABEL_COLUMNS = {
+    name: Field(STR) for name in (*GeoPerformanceAnalyzer.LABEL_FIELDS, "campaign_name")
+}
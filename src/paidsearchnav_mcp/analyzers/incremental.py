@@ -0,0 +1,183 @@
+"""Reuse analyzer work when the input data has not changed.
+
+Assistants often ask the same audit question several times in one session.
+Analyzers fingerprint each fetched page (``MetricsFrame.fingerprint``) and
+keep two bounded, in-process caches:
+
+- ``PARTIALS`` maps a page fingerprint to that page's reduced aggregates,
+  so a re-run only reduces pages whose contents changed and merges the rest
+- ``SUMMARIES`` maps the fingerprint of all inputs to the finished
+  ``AnalysisSummary``, so an unchanged re-run skips the analysis entirely
+
+Keys also include the analyzer's settings (see ``BaseAnalyzer.cache_key``),
+so runs with different thresholds never share entries. Cached values are
+shared, so callers must treat them as read-only.
+"""
+
+import asyncio
+import hashlib
+import sys
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+from paidsearchnav_mcp.analyzers.execution import INLINE, ExecutionBackend
+from paidsearchnav_mcp.analyzers.frame import MetricsFrame
+
+T = TypeVar("T")
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Rough memory footprint of a cached value, in bytes.
+
+    Objects exposing ``nbytes`` (numpy arrays, ``NGramCounter``,
+    ``GroupTotals``) report their own size; containers are walked.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if nbytes is not None:
+        return int(nbytes)
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_nbytes(k) + estimate_nbytes(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_nbytes(item) for item in value)
+    return size
+
+
+class ResultCache(Generic[T]):
+    """Least-recently-used mapping bounded by entries and, optionally, bytes.
+
+    Attributes:
+        max_entries: Entries kept before the least recently used is evicted
+        max_bytes: Estimated bytes kept before the least recently used is
+            evicted (unbounded if None)
+        nbytes: Estimated bytes currently held
+        hits: Lookups that found an entry
+        misses: Lookups that did not
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int | None = None):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            max_bytes: Estimated bytes (see ``estimate_nbytes``) kept before
+                the least recently used is evicted; values larger than this
+                are not cached
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, T] = OrderedDict()
+        self._sizes: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> T | None:
+        """Return the entry for ``key`` and mark it recently used."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: T) -> None:
+        """Store ``value``, evicting least recently used entries if full."""
+        self._discard(key)
+        if self.max_bytes is not None:
+            size = estimate_nbytes(value)
+            if size > self.max_bytes:
+                return
+            self._sizes[key] = size
+            self.nbytes += size
+        self._entries[key] = value
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self.nbytes > self.max_bytes
+        ):
+            self._discard(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+        self._sizes.clear()
+        self.nbytes = 0
+
+    def _discard(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+        self.nbytes -= self._sizes.pop(key, 0)
+
+
+# Per-page aggregates carry n-gram tables of up to a few hundred KB each,
+# so bound them by size; summaries are a few KB each
+PARTIALS: ResultCache[Any] = ResultCache(max_entries=4096, max_bytes=256 * 2**20)
+SUMMARIES: ResultCache[Any] = ResultCache(max_entries=256)
+
+# Page reductions queued on a backend before fetching waits for the oldest
+_MAX_IN_FLIGHT = 8
+
+
+def fingerprint(*parts: str) -> str:
+    """Combine strings (settings, IDs, page fingerprints) into one key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+async def reduce_pages(
+    pages: AsyncIterator[MetricsFrame],
+    reduce_page: Callable[[MetricsFrame], T],
+    namespace: str,
+    backend: ExecutionBackend = INLINE,
+) -> list[tuple[str, T]]:
+    """Reduce each page, reusing cached results for pages seen before.
+
+    Pages are reduced on ``backend`` while later pages are fetched, with at
+    most ``_MAX_IN_FLIGHT`` reductions outstanding.
+
+    Args:
+        pages: Frames from ``iter_pages``
+        reduce_page: Turns one page into its partial aggregate; the result
+            is cached and must not be modified afterwards
+        namespace: Cache namespace, typically ``BaseAnalyzer.cache_key()``
+        backend: Where ``reduce_page`` runs
+
+    Returns:
+        ``(page fingerprint, partial)`` for every page, in page order
+    """
+    fingerprints: list[str] = []
+    partials: dict[str, T] = {}
+    running: dict[str, asyncio.Task[T]] = {}
+
+    async def finish(page_fingerprint: str) -> None:
+        partial = await running.pop(page_fingerprint)
+        PARTIALS.put((namespace, page_fingerprint), partial)
+        partials[page_fingerprint] = partial
+
+    try:
+        async for page in pages:
+            page_fingerprint = page.fingerprint()
+            fingerprints.append(page_fingerprint)
+            if page_fingerprint in partials or page_fingerprint in running:
+                continue
+            partial = PARTIALS.get((namespace, page_fingerprint))
+            if partial is not None:
+                partials[page_fingerprint] = partial
+                continue
+            if len(running) >= _MAX_IN_FLIGHT:
+                await finish(next(iter(running)))
+            running[page_fingerprint] = asyncio.ensure_future(
+                backend.run(reduce_page, page)
+            )
+        while running:
+            await finish(next(iter(running)))
+    finally:
+        for task in running.values():
+            task.cancel()
+    return [(page, partials[page]) for page in fingerprints]
@@ -5,13 +5,35 @@ This analyzer evaluates keyword performance across different match types
 """
 
 import logging
-from collections import defaultdict
+from collections.abc import AsyncIterator
 from typing import Any
 
+import numpy as np
+
 from paidsearchnav_mcp.analyzers.base import AnalysisSummary, BaseAnalyzer
+from paidsearchnav_mcp.analyzers.frame import (
+    KEYWORD_FIELDS,
+    SEARCH_TERM_FIELDS,
+    MetricsFrame,
+    select_fields,
+)
+from paidsearchnav_mcp.analyzers.incremental import reduce_pages
+from paidsearchnav_mcp.analyzers.streaming import (
+    GroupTotals,
+    TopK,
+    collect_pages,
+    iter_pages,
+)
+from paidsearchnav_mcp.analyzers.term_match import exact_close_variants
+from paidsearchnav_mcp.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
+# Search term columns this analyzer reads
+_SEARCH_TERM_COLUMNS = select_fields(
+    SEARCH_TERM_FIELDS, ("keyword_text", "search_term")
+)
+
 
 class KeywordMatchAnalyzer(BaseAnalyzer):
     """Analyzes keyword match types and identifies exact match opportunities.
@@ -87,20 +109,35 @@ class KeywordMatchAnalyzer(BaseAnalyzer):
             get_keywords_fn, customer_id, start_date, end_date, campaign_id
         )
 
-        # Fetch all search terms with automatic pagination
-        search_terms = await self._fetch_all_search_terms(
-            get_search_terms_fn, customer_id, start_date, end_date, campaign_id
+        # Stream search terms with automatic pagination, keeping only
+        # per-keyword counts rather than the rows themselves (reused from
+        # earlier runs for unchanged pages)
+        search_term_counts, page_fingerprints = await self._count_search_terms(
+            self._iter_search_term_pages(
+                get_search_terms_fn, customer_id, start_date, end_date, campaign_id
+            )
+        )
+        summary_key = self.cache_key(
+            customer_id,
+            start_date,
+            end_date,
+            str(campaign_id),
+            keywords.fingerprint(),
+            *page_fingerprints,
         )
+        if cached := self.cached_summary(summary_key):
+            return cached
 
         logger.info(
-            f"Fetched {len(keywords)} keywords and {len(search_terms)} search terms"
+            f"Fetched {len(keywords)} keywords and "
+            f"{search_term_counts.rows} search terms"
         )
 
         # Filter to active keywords with minimum impressions
         # Note: get_keywords returns flat structure with metrics at top level
-        active_keywords = [
-            k for k in keywords if k.get("impressions", 0) >= self.min_impressions
-        ]
+        active_keywords = keywords.filter(
+            keywords["impressions"] >= self.min_impressions
+        )
 
         logger.info(f"Analyzing {len(active_keywords)} active keywords")
 
@@ -114,9 +151,7 @@ class KeywordMatchAnalyzer(BaseAnalyzer):
                 )
             else:
                 # Keywords exist but all filtered out
-                max_impressions = max(
-                    (k.get("impressions", 0) for k in keywords), default=0
-                )
+                max_impressions = int(keywords["impressions"].max())
                 suggested_threshold = max(10, max_impressions // 2)
                 primary_issue = (
                     f"No keywords found with ≥{self.min_impressions} impressions. "
@@ -144,7 +179,7 @@ class KeywordMatchAnalyzer(BaseAnalyzer):
 
         # Find exact match opportunities
         exact_opportunities = self._find_exact_match_opportunities(
-            active_keywords, search_terms
+            active_keywords, search_term_counts
         )
 
         # Find high-cost broad match keywords to optimize
@@ -153,9 +188,10 @@ class KeywordMatchAnalyzer(BaseAnalyzer):
         )
 
         # Combine and rank all recommendations
-        all_recommendations = exact_opportunities + high_cost_broad
-        all_recommendations.sort(key=lambda x: x["estimated_savings"], reverse=True)
-        top_10 = all_recommendations[:10]
+        top = TopK(10)
+        for recommendation in exact_opportunities + high_cost_broad:
+            top.offer(recommendation["estimated_savings"], recommendation)
+        top_10 = top.results()
 
         # Calculate total savings
         total_savings = sum(r["estimated_savings"] for r in top_10)
@@ -173,7 +209,7 @@ class KeywordMatchAnalyzer(BaseAnalyzer):
             f"${total_savings:,.2f} monthly savings"
         )
 
-        return AnalysisSummary(
+        summary = AnalysisSummary(
             total_records_analyzed=len(active_keywords),
             estimated_monthly_savings=total_savings,
             primary_issue=primary_issue,
@@ -182,7 +218,9 @@ class KeywordMatchAnalyzer(BaseAnalyzer):
             analysis_period=f"{start_date} to {end_date}",
             customer_id=customer_id,
         )
+        return self.remember_summary(summary_key, summary)
 
+    @traced()
     async def _fetch_all_keywords(
         self,
         get_keywords_fn: Any,
@@ -190,7 +228,7 @@ class KeywordMatchAnalyzer(BaseAnalyzer):
         start_date: str,
         end_date: str,
         campaign_id: str | None,
-    ) -> list[dict]:
+    ) -> MetricsFrame:
         """Fetch all keywords with automatic pagination.
 
         Args:
@@ -201,49 +239,34 @@ class KeywordMatchAnalyzer(BaseAnalyzer):
             campaign_id: Optional campaign ID filter
 
         Returns:
-            List of all keywords (all pages combined)
+            Frame of all keywords (all pages combined)
         """
         from paidsearchnav_mcp.server import KeywordsRequest
 
-        all_keywords = []
-        offset = 0
-        limit = 500
-
-        while True:
-            request = KeywordsRequest(
+        pages = iter_pages(
+            get_keywords_fn,
+            lambda offset, limit: KeywordsRequest(
                 customer_id=customer_id,
                 start_date=start_date,
                 end_date=end_date,
                 campaign_id=campaign_id,
                 limit=limit,
                 offset=offset,
-            )
-            result = await get_keywords_fn(request)
-
-            if result["status"] != "success":
-                logger.warning(
-                    f"Failed to fetch keywords at offset {offset}: {result.get('message')}"
-                )
-                break
-
-            all_keywords.extend(result["data"])
-
-            if not result["metadata"]["pagination"]["has_more"]:
-                break
-
-            offset += limit
-
-        return all_keywords
+            ),
+            KEYWORD_FIELDS,
+            description="keywords",
+        )
+        return await collect_pages(pages, KEYWORD_FIELDS)
 
-    async def _fetch_all_search_terms(
+    def _iter_search_term_pages(
         self,
         get_search_terms_fn: Any,
         customer_id: str,
         start_date: str,
         end_date: str,
         campaign_id: str | None,
-    ) -> list[dict]:
-        """Fetch all search terms with automatic pagination.
+    ) -> AsyncIterator[MetricsFrame]:
+        """Fetch search terms and their triggering keywords, one frame per page.
 
         Args:
             get_search_terms_fn: get_search_terms function from server
@@ -253,77 +276,97 @@ class KeywordMatchAnalyzer(BaseAnalyzer):
             campaign_id: Optional campaign ID filter
 
         Returns:
-            List of all search terms (all pages combined)
+            Async iterator of search term frames
         """
         from paidsearchnav_mcp.server import SearchTermsRequest
 
-        all_search_terms = []
-        offset = 0
-        limit = 500
-
-        while True:
-            request = SearchTermsRequest(
+        return iter_pages(
+            get_search_terms_fn,
+            lambda offset, limit: SearchTermsRequest(
                 customer_id=customer_id,
                 start_date=start_date,
                 end_date=end_date,
                 campaign_id=campaign_id,
+                include_keyword=True,
                 limit=limit,
                 offset=offset,
-            )
-            result = await get_search_terms_fn(request)
-
-            if result["status"] != "success":
-                logger.warning(
-                    f"Failed to fetch search terms at offset {offset}: {result.get('message')}"
-                )
-                break
-
-            all_search_terms.extend(result["data"])
+            ),
+            _SEARCH_TERM_COLUMNS,
+            description="search terms",
+        )
 
-            if not result["metadata"]["pagination"]["has_more"]:
-                break
+    @traced(result_attributes=lambda result: {"rows": result[0].rows})
+    async def _count_search_terms(
+        self, pages: AsyncIterator[MetricsFrame]
+    ) -> tuple[GroupTotals, list[str]]:
+        """Count search terms and exact matches per keyword text.
 
-            offset += limit
+        Args:
+            pages: Search term frames, one per fetched page
 
-        return all_search_terms
+        Returns:
+            Totals keyed by normalized triggering keyword text ("" when the
+            keyword is unknown), with ``count`` (search terms) and
+            ``exact_matches`` (close variants of the keyword); and the
+            fingerprint of each page
+        """
+        partials = await reduce_pages(
+            pages, self._count_page, self.cache_key(), self.backend
+        )
+        counts = GroupTotals(("exact_matches",))
+        for _, partial in partials:
+            counts.merge(partial)
+        return counts, [page for page, _ in partials]
+
+    def _count_page(self, search_terms: MetricsFrame) -> GroupTotals:
+        """Count one page of search terms per keyword text."""
+        counts = GroupTotals(("exact_matches",))
+        self._add_search_term_counts(counts, search_terms)
+        return counts
+
+    def _add_search_term_counts(
+        self, counts: GroupTotals, search_terms: MetricsFrame
+    ) -> None:
+        """Fold one page of search terms into the per-keyword counts."""
+        keyword_texts = search_terms["keyword_text"].normalized()
+        # A search term is an exact match if it is a close variant of the
+        # keyword that triggered it (plurals, word order, accents, ...)
+        exact_matches = exact_close_variants(
+            search_terms["keyword_text"], search_terms["search_term"]
+        )
+        counts.add(
+            MetricsFrame(
+                {
+                    "keyword_text": keyword_texts,
+                    "exact_matches": exact_matches.astype(np.int64),
+                }
+            ),
+            "keyword_text",
+        )
 
+    @traced()
     def _calculate_match_type_performance(
-        self, keywords: list[dict]
+        self, keywords: MetricsFrame | list[dict]
     ) -> dict[str, dict[str, Any]]:
         """Calculate aggregate statistics by match type.
 
         Args:
-            keywords: List of keyword dictionaries
+            keywords: Keyword frame (or keyword dictionaries)
 
         Returns:
             Statistics by match type (BROAD, PHRASE, EXACT)
         """
-        stats = defaultdict(
-            lambda: {
-                "count": 0,
-                "impressions": 0,
-                "clicks": 0,
-                "cost": 0.0,
-                "conversions": 0.0,
-                "conversion_value": 0.0,
-            }
+        keywords = MetricsFrame.coerce(keywords, KEYWORD_FIELDS)
+        grouped = keywords.group_sum(
+            "match_type",
+            ("impressions", "clicks", "cost", "conversions", "conversion_value"),
         )
 
-        for keyword in keywords:
-            match_type = keyword.get("match_type", "BROAD")
-            # Note: metrics are at top level, not nested under "metrics" key
-
-            stats[match_type]["count"] += 1
-            stats[match_type]["impressions"] += keyword.get("impressions", 0)
-            stats[match_type]["clicks"] += keyword.get("clicks", 0)
-            stats[match_type]["cost"] += keyword.get("cost", 0.0)
-            stats[match_type]["conversions"] += keyword.get("conversions", 0.0)
-            stats[match_type]["conversion_value"] += keyword.get(
-                "conversion_value", 0.0
-            )
+        stats = {}
+        for data in grouped.to_records():
+            match_type = data.pop("match_type")
 
-        # Calculate derived metrics
-        for match_type, data in stats.items():
+            # Calculate derived metrics
             data["ctr"] = (
                 (data["clicks"] / data["impressions"] * 100)
                 if data["impressions"] > 0
@@ -343,91 +386,98 @@ class KeywordMatchAnalyzer(BaseAnalyzer):
                 if data["clicks"] > 0
                 else 0.0
             )
+            stats[match_type] = data
 
-        return dict(stats)
+        return stats
 
+    @traced()
     def _find_exact_match_opportunities(
-        self, keywords: list[dict], search_terms: list[dict]
+        self,
+        keywords: MetricsFrame | list[dict],
+        search_terms: GroupTotals | MetricsFrame | list[dict],
     ) -> list[dict]:
         """Find broad/phrase keywords where ≥60% of search terms are exact matches.
 
         Args:
-            keywords: List of keywords
-            search_terms: List of search terms
+            keywords: Keyword frame (or keyword dictionaries)
+            search_terms: Per-keyword counts from ``_count_search_terms``, or
+                search terms as a frame (or dictionaries)
 
         Returns:
             List of recommendations with estimated savings
         """
-        opportunities = []
+        keywords = MetricsFrame.coerce(keywords, KEYWORD_FIELDS)
+        if not isinstance(search_terms, GroupTotals):
+            frame = MetricsFrame.coerce(search_terms, _SEARCH_TERM_COLUMNS)
+            search_terms = GroupTotals(("exact_matches",))
+            self._add_search_term_counts(search_terms, frame)
+
+        # Look up counts once per distinct keyword text
+        keyword_texts = keywords["keyword_text"].normalized()
+        total_terms = np.zeros(len(keyword_texts.values), dtype=np.int64)
+        exact_matches = np.zeros(len(keyword_texts.values), dtype=np.int64)
+        for code, keyword_text in enumerate(keyword_texts.values):
+            counts = search_terms.get(keyword_text) if keyword_text else None
+            if counts:
+                total_terms[code] = counts["count"]
+                exact_matches[code] = counts["exact_matches"]
+
+        # Check each broad/phrase keyword that has search terms
+        keyword_totals = total_terms[keyword_texts.codes]
+        exact_ratios = np.divide(
+            exact_matches[keyword_texts.codes],
+            keyword_totals,
+            out=np.zeros(len(keywords)),
+            where=keyword_totals > 0,
+        )
+        # If ≥60% are exact matches, recommend conversion
+        candidates = (
+            keywords["match_type"].isin(("BROAD", "PHRASE"))
+            & (keyword_totals > 0)
+            & (exact_ratios >= self.exact_match_ratio_threshold)
+        )
 
-        # Group search terms by keyword
-        search_terms_by_keyword = defaultdict(list)
-        for st in search_terms:
-            keyword_text = st.get("keyword_text", "").lower().strip()
-            if keyword_text:
-                search_terms_by_keyword[keyword_text].append(st)
-
-        # Check each broad/phrase keyword
-        for keyword in keywords:
-            match_type = keyword.get("match_type", "")
-            if match_type not in ["BROAD", "PHRASE"]:
-                continue
-
-            keyword_text = keyword.get("keyword_text", "").lower().strip()
-            if not keyword_text:
-                continue
-
-            keyword_search_terms = search_terms_by_keyword.get(keyword_text, [])
-            if not keyword_search_terms:
-                continue
-
-            # Calculate what percentage are exact matches
-            exact_matches = sum(
-                1
-                for st in keyword_search_terms
-                if st.get("search_term", "").lower().strip() == keyword_text
+        opportunities = []
+        for i in np.flatnonzero(candidates):
+            keyword = keywords.row(i)
+            exact_ratio = exact_ratios[i].item()
+            current_cost = keyword["cost"]
+
+            # Estimate savings: exact match typically 20-30% cheaper than broad/phrase
+            estimated_savings = current_cost * 0.25
+
+            opportunities.append(
+                {
+                    "keyword": keyword_texts.values[keyword_texts.codes[i]],
+                    "current_match_type": keyword["match_type"],
+                    "recommended_match_type": "EXACT",
+                    "current_cost": current_cost,
+                    "estimated_savings": estimated_savings,
+                    "exact_match_ratio": exact_ratio,
+                    "reasoning": f"{exact_ratio:.0%} of search terms are exact matches",
+                    "campaign": keyword["campaign_name"],
+                    "ad_group": keyword["ad_group_name"],
+                }
             )
 
-            total_terms = len(keyword_search_terms)
-            exact_ratio = exact_matches / total_terms if total_terms > 0 else 0
-
-            # If ≥60% are exact matches, recommend conversion
-            if exact_ratio >= self.exact_match_ratio_threshold:
-                # Note: metrics are at top level, not nested
-                current_cost = keyword.get("cost", 0.0)
-
-                # Estimate savings: exact match typically 20-30% cheaper than broad/phrase
-                estimated_savings = current_cost * 0.25
-
-                opportunities.append(
-                    {
-                        "keyword": keyword_text,
-                        "current_match_type": match_type,
-                        "recommended_match_type": "EXACT",
-                        "current_cost": current_cost,
-                        "estimated_savings": estimated_savings,
-                        "exact_match_ratio": exact_ratio,
-                        "reasoning": f"{exact_ratio:.0%} of search terms are exact matches",
-                        "campaign": keyword.get("campaign_name", ""),
-                        "ad_group": keyword.get("ad_group_name", ""),
-                    }
-                )
-
         return opportunities
 
+    @traced()
     def _find_high_cost_broad_keywords(
-        self, keywords: list[dict], match_type_stats: dict[str, dict[str, Any]]
+        self,
+        keywords: MetricsFrame | list[dict],
+        match_type_stats: dict[str, dict[str, Any]],
     ) -> list[dict]:
         """Find broad match keywords with cost >$100 AND (ROAS <1.5 OR CPA >2× avg).
 
         Args:
-            keywords: List of keywords
+            keywords: Keyword frame (or keyword dictionaries)
             match_type_stats: Match type statistics
 
         Returns:
             List of recommendations with estimated savings
         """
-        recommendations = []
+        keywords = MetricsFrame.coerce(keywords, KEYWORD_FIELDS)
 
         # Calculate overall average CPA for comparison
         total_cost = sum(stats["cost"] for stats in match_type_stats.values())
@@ -436,56 +486,59 @@ class KeywordMatchAnalyzer(BaseAnalyzer):
         )
         overall_cpa = total_cost / total_conversions if total_conversions > 0 else 0.0
 
-        for keyword in keywords:
-            if keyword.get("match_type") != "BROAD":
-                continue
-
-            # Note: metrics are at top level, not nested
-            cost = keyword.get("cost", 0.0)
-            conversions = keyword.get("conversions", 0.0)
-            conversion_value = keyword.get("conversion_value", 0.0)
-
-            # Check for high cost
-            if cost < self.high_cost_threshold:
-                continue
-
-            # Calculate ROAS and CPA
-            roas = conversion_value / cost if cost > 0 else 0.0
-            cpa = cost / conversions if conversions > 0 else float("inf")
-
-            # Check for low ROI or high CPA
-            is_low_roas = roas < self.low_roas_threshold
-            is_high_cpa = cpa > (overall_cpa * self.max_broad_cpa_multiplier)
-
-            if is_low_roas or is_high_cpa:
-                # Estimate savings by assuming we pause or convert to phrase match
-                # Conservative estimate: save 50% of current cost
-                estimated_savings = cost * 0.5
-
-                issue = []
-                if is_low_roas:
-                    issue.append(f"ROAS {roas:.2f} < target {self.low_roas_threshold}")
-                if is_high_cpa:
-                    issue.append(
-                        f"CPA ${cpa:.2f} > {self.max_broad_cpa_multiplier}× avg ${overall_cpa:.2f}"
-                    )
-
-                recommendations.append(
-                    {
-                        "keyword": keyword.get("keyword_text", ""),
-                        "current_match_type": "BROAD",
-                        "recommended_match_type": "PHRASE or PAUSE",
-                        "current_cost": cost,
-                        "estimated_savings": estimated_savings,
-                        "exact_match_ratio": 0.0,
-                        "reasoning": "; ".join(issue),
-                        "campaign": keyword.get("campaign_name", ""),
-                        "ad_group": keyword.get("ad_group_name", ""),
-                    }
-                )
+        # Check for high-cost broad keywords
+        broad = keywords.filter(
+            keywords["match_type"].isin(("BROAD",))
+            & (keywords["cost"] >= self.high_cost_threshold)
+        )
+        cost = broad["cost"]
+        conversions = broad["conversions"]
+
+        # Calculate ROAS and CPA
+        roas = np.divide(
+            broad["conversion_value"], cost, out=np.zeros(len(broad)), where=cost > 0
+        )
+        cpa = np.divide(
+            cost, conversions, out=np.full(len(broad), np.inf), where=conversions > 0
+        )
+
+        # Check for low ROI or high CPA
+        is_low_roas = roas < self.low_roas_threshold
+        is_high_cpa = cpa > (overall_cpa * self.max_broad_cpa_multiplier)
+        flagged = np.flatnonzero(is_low_roas | is_high_cpa)
 
         # Sort by cost descending (prioritize high-cost issues)
-        recommendations.sort(key=lambda x: x["current_cost"], reverse=True)
+        flagged = flagged[np.argsort(-cost[flagged], kind="stable")]
+
+        recommendations = []
+        for i in flagged:
+            keyword = broad.row(i)
+
+            # Estimate savings by assuming we pause or convert to phrase match
+            # Conservative estimate: save 50% of current cost
+            estimated_savings = keyword["cost"] * 0.5
+
+            issue = []
+            if is_low_roas[i]:
+                issue.append(f"ROAS {roas[i]:.2f} < target {self.low_roas_threshold}")
+            if is_high_cpa[i]:
+                issue.append(
+                    f"CPA ${cpa[i]:.2f} > {self.max_broad_cpa_multiplier}× avg ${overall_cpa:.2f}"
+                )
+
+            recommendations.append(
+                {
+                    "keyword": keyword["keyword_text"],
+                    "current_match_type": "BROAD",
+                    "recommended_match_type": "PHRASE or PAUSE",
+                    "current_cost": keyword["cost"],
+                    "estimated_savings": estimated_savings,
+                    "exact_match_ratio": 0.0,
+                    "reasoning": "; ".join(issue),
+                    "campaign": keyword["campaign_name"],
+                    "ad_group": keyword["ad_group_name"],
+                }
+            )
 
         return recommendations
 
@@ -7,10 +7,26 @@ import logging
 import re
 from typing import Any
 
+import numpy as np
+
 from paidsearchnav_mcp.analyzers.base import AnalysisSummary, BaseAnalyzer
+from paidsearchnav_mcp.analyzers.frame import (
+    KEYWORD_FIELDS,
+    NEGATIVE_KEYWORD_FIELDS,
+    MetricsFrame,
+    select_fields,
+)
 
 logger = logging.getLogger(__name__)
 
+_WORD = re.compile(r"\b\w+\b")
+
+# Keyword columns this analyzer reads
+_KEYWORD_COLUMNS = select_fields(
+    KEYWORD_FIELDS,
+    ("keyword_text", "campaign_name", "impressions", "conversion_value"),
+)
+
 
 class NegativeConflictAnalyzer(BaseAnalyzer):
     """Identify negative keywords that block positive keywords.
@@ -70,57 +86,33 @@ class NegativeConflictAnalyzer(BaseAnalyzer):
             end_date=end_date,
         )
         keywords_result = await get_keywords_fn(keywords_request)
-        keywords = keywords_result.get("data", [])
+        keywords = MetricsFrame.from_records(
+            keywords_result.get("data", []), _KEYWORD_COLUMNS
+        )
 
         # Fetch negative keywords
         negatives_request = NegativeKeywordsRequest(customer_id=customer_id)
         negatives_result = await get_negative_keywords_fn(negatives_request)
-        negatives = negatives_result.get("data", [])
+        negatives = MetricsFrame.from_records(
+            negatives_result.get("data", []), NEGATIVE_KEYWORD_FIELDS
+        )
 
         logger.info(
             f"Analyzing {len(keywords)} keywords against {len(negatives)} negative keywords"
         )
 
-        # Find conflicts
-        conflicts = []
-        for keyword in keywords:
-            keyword_text = keyword.get("keyword_text", "").lower()
-            if not keyword_text:
-                continue
-
-            for negative in negatives:
-                negative_text = negative.get("text", "").lower()
-                negative_match_type = negative.get("match_type", "BROAD")
-
-                if self._is_conflict(keyword_text, negative_text, negative_match_type):
-                    # Estimate revenue loss from blocking
-                    # Note: get_keywords returns flat structure with metrics at top level
-                    revenue_loss = keyword.get("conversion_value", 0.0)
-                    impressions_lost = keyword.get("impressions", 0)
-
-                    conflicts.append(
-                        {
-                            "positive_keyword": keyword_text,
-                            "negative_keyword": negative_text,
-                            "negative_match_type": negative_match_type,
-                            "negative_level": negative.get("level", "UNKNOWN"),
-                            "estimated_savings": revenue_loss,  # Actually revenue LOSS
-                            "impressions_lost": impressions_lost,
-                            "campaign": keyword.get("campaign_name", ""),
-                            "reasoning": f"Negative '{negative_text}' blocks '{keyword_text}' (${revenue_loss:.2f} revenue)",
-                        }
-                    )
-
-        # Sort by revenue loss descending and take top 10
-        conflicts.sort(key=lambda x: x["estimated_savings"], reverse=True)
-        top_10 = conflicts[:10]
+        # Find conflicts (keywords x negatives, so off the event loop when
+        # the process backend is enabled)
+        conflict_count, top_10 = await self.backend.run(
+            self._find_conflicts, keywords, negatives
+        )
 
         # Calculate total revenue loss
         total_revenue_loss = sum(c["estimated_savings"] for c in top_10)
 
         # Determine primary issue
-        if len(conflicts) > 10:
-            primary_issue = f"{len(conflicts)} negative keyword conflicts detected"
+        if conflict_count > 10:
+            primary_issue = f"{conflict_count} negative keyword conflicts detected"
         elif total_revenue_loss > 1000:
             primary_issue = f"High-impact conflicts: ${total_revenue_loss:,.2f} monthly revenue loss"
         else:
@@ -144,6 +136,108 @@ class NegativeConflictAnalyzer(BaseAnalyzer):
             customer_id=customer_id,
         )
 
+    def _find_conflicts(
+        self, keywords: MetricsFrame, negatives: MetricsFrame
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """Find the negatives blocking each keyword.
+
+        Matching follows ``_is_conflict`` but runs once per distinct keyword
+        text, against negatives indexed by text and word, then conflicts are
+        expanded back to keyword rows.
+
+        Args:
+            keywords: Keyword rows (``_KEYWORD_COLUMNS``)
+            negatives: Negative keyword rows (``NEGATIVE_KEYWORD_FIELDS``)
+
+        Returns:
+            Number of conflicts, and the 10 with the most revenue at risk
+        """
+        keyword_texts = keywords["keyword_text"].transform(str.lower)
+        negative_texts = negatives["text"].transform(str.lower)
+        match_types = negatives["match_type"]
+
+        # Distinct negatives, remembering the rows (in order) behind each
+        pair_codes = (
+            negative_texts.codes.astype(np.int64) * len(match_types.values)
+            + match_types.codes
+        )
+        pairs, first_rows, pair_of_row = np.unique(
+            pair_codes, return_index=True, return_inverse=True
+        )
+        rows_by_pair = np.split(
+            np.argsort(pair_of_row, kind="stable"),
+            np.cumsum(np.bincount(pair_of_row, minlength=len(pairs)))[:-1],
+        )
+
+        # Index negatives so each keyword only checks plausible ones: exact
+        # by text, broad by one of their words (all must be present)
+        exact: dict[str, list[int]] = {}
+        phrase: list[tuple[str, int]] = []
+        broad_by_word: dict[str, list[tuple[frozenset[str], int]]] = {}
+        for pair, row in enumerate(first_rows):
+            text = negative_texts.values[negative_texts.codes[row]]
+            match_type = match_types.values[match_types.codes[row]]
+            if not text:
+                continue
+            if match_type == "EXACT":
+                exact.setdefault(text, []).append(pair)
+            elif match_type == "PHRASE":
+                phrase.append((text, pair))
+            elif words := frozenset(_WORD.findall(text)):
+                broad_by_word.setdefault(min(words), []).append((words, pair))
+
+        # Negative rows blocking each distinct keyword text
+        blocked_by: list[np.ndarray] = []
+        for keyword_text in keyword_texts.values:
+            if not keyword_text:
+                blocked_by.append(np.empty(0, dtype=np.int64))
+                continue
+            words = set(_WORD.findall(keyword_text))
+            matched = list(exact.get(keyword_text, ()))
+            matched += [pair for text, pair in phrase if text in keyword_text]
+            for word in words:
+                matched += [
+                    pair
+                    for negative_words, pair in broad_by_word.get(word, ())
+                    if negative_words <= words
+                ]
+            blocked_by.append(
+                np.sort(np.concatenate([rows_by_pair[pair] for pair in matched]))
+                if matched
+                else np.empty(0, dtype=np.int64)
+            )
+
+        per_keyword = np.array([len(rows) for rows in blocked_by], dtype=np.int64)
+        conflict_count = int(per_keyword[keyword_texts.codes].sum())
+
+        # Highest revenue first; ties keep keyword then negative order
+        revenue = keywords["conversion_value"]
+        top_10: list[dict[str, Any]] = []
+        for row in np.argsort(-revenue, kind="stable"):
+            keyword = keywords.row(row)
+            keyword_text = keyword_texts.values[keyword_texts.codes[row]]
+            for negative_row in blocked_by[keyword_texts.codes[row]]:
+                negative = negatives.row(negative_row)
+                negative_text = negative_texts.values[
+                    negative_texts.codes[negative_row]
+                ]
+                revenue_loss = keyword["conversion_value"]
+                top_10.append(
+                    {
+                        "positive_keyword": keyword_text,
+                        "negative_keyword": negative_text,
+                        "negative_match_type": negative["match_type"],
+                        "negative_level": negative["level"],
+                        "estimated_savings": revenue_loss,  # Actually revenue LOSS
+                        "impressions_lost": keyword["impressions"],
+                        "campaign": keyword["campaign_name"],
+                        "reasoning": f"Negative '{negative_text}' blocks '{keyword_text}' (${revenue_loss:.2f} revenue)",
+                    }
+                )
+                if len(top_10) == 10:
+                    return conflict_count, top_10
+        return conflict_count, top_10
+
     def _is_conflict(
         self, keyword_text: str, negative_text: str, negative_match_type: str
     ) -> bool:
@@ -168,8 +262,8 @@ class NegativeConflictAnalyzer(BaseAnalyzer):
             return negative_text in keyword_text
         else:  # BROAD
             # Broad match negative blocks if all words are present
-            negative_words = set(re.findall(r"\b\w+\b", negative_text))
-            keyword_words = set(re.findall(r"\b\w+\b", keyword_text))
+            negative_words = set(_WORD.findall(negative_text))
+            keyword_words = set(_WORD.findall(keyword_text))
             return negative_words.issubset(keyword_words) and len(negative_words) > 0
 
     def _generate_implementation_steps(
@@ -0,0 +1,240 @@
+"""N-gram aggregation for search term waste mining.
+
+Wasted spend is usually spread over a long tail of search terms that each
+cost a few dollars but share a word or phrase ("free", "jobs", "how to").
+``NGramCounter`` splits every search term into its 1..3 word n-grams and
+sums the terms' metrics per n-gram, so one phrase negative can be costed
+against every term it would block.
+
+Each page is grouped by distinct search term first, so tokenizing costs
+O(distinct terms) per page; n-gram totals are accumulated with
+``np.bincount`` over (n-gram id, term) pairs. Memory is bounded by pruning
+n-grams below a minimum support whenever the table grows past a limit.
+
+A pruned n-gram seen again restarts from zero, so its totals are lower
+bounds. For ``bounded`` columns the counter also keeps an upper bound (in
+the manner of lossy counting): every n-gram carries the most any pruned
+n-gram had lost when it was (re-)added.
+"""
+
+import sys
+from collections.abc import Sequence
+
+import numpy as np
+
+from paidsearchnav_mcp.analyzers.frame import DictionaryColumn, MetricsFrame
+from paidsearchnav_mcp.analyzers.term_match import normalize_text
+
+
+def term_ngrams(text: str, max_n: int = 3) -> set[str]:
+    """Return the distinct 1..max_n word n-grams of a search term."""
+    tokens = normalize_text(text).split()
+    return {
+        " ".join(tokens[start : start + n])
+        for n in range(1, max_n + 1)
+        for start in range(len(tokens) - n + 1)
+    }
+
+
+def contains_ngram(text: str, ngram: str) -> bool:
+    """Whether ``ngram`` occurs as whole words in normalized ``text``.
+
+    This is what a phrase-match negative for ``ngram`` would block.
+    """
+    return f" {ngram} " in f" {normalize_text(text)} "
+
+
+class NGramCounter:
+    """Running per-n-gram sums over search term pages.
+
+    Attributes:
+        columns: Numeric columns being summed; the first also ranks
+            n-grams when pruning has to drop frequent ones
+        max_n: Longest n-gram counted, in words
+        min_support: Minimum search term rows an n-gram needs to survive
+            pruning
+        max_ngrams: Table size that triggers pruning
+        bounded: Columns whose totals also get an upper bound
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        max_n: int = 3,
+        min_support: int = 2,
+        max_ngrams: int = 500_000,
+        bounded: Sequence[str] = (),
+    ):
+        """Initialize the counter.
+
+        Args:
+            columns: Numeric columns to sum per n-gram (e.g. cost first)
+            max_n: Longest n-gram to count, in words
+            min_support: Minimum search term rows an n-gram needs to be
+                kept when the table is pruned
+            max_ngrams: Number of distinct n-grams that triggers pruning;
+                after pruning at most this many remain
+            bounded: Columns (of ``columns``) to also report as
+                ``{name}_max``, an upper bound including amounts that
+                pruning may have dropped
+        """
+        self.columns = tuple(columns)
+        self.max_n = max_n
+        self.min_support = min_support
+        self.max_ngrams = max_ngrams
+        self.bounded = tuple(bounded)
+        self._ids: dict[str, int] = {}
+        self._integer = [False] * len(self.columns)
+        # Row 0 is support (search term rows), then one row per column, then
+        # per bounded column the most pruning may have dropped
+        self._bounded_rows = [self.columns.index(name) + 1 for name in self.bounded]
+        self._totals = np.zeros((len(self.columns) + len(self.bounded) + 1, 1024))
+        # Most any pruned n-gram may have had, per bounded column
+        self._lost = np.zeros(len(self.bounded))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the totals table and n-gram index."""
+        return (
+            self._totals.nbytes
+            + sys.getsizeof(self._ids)
+            + sum(sys.getsizeof(ngram) for ngram in self._ids)
+        )
+
+    def compact(self) -> None:
+        """Trim spare table capacity, e.g. before caching a per-page counter."""
+        self._totals = self._totals[:, : len(self._ids)].copy()
+
+    def add(self, frame: MetricsFrame, by: str = "search_term") -> None:
+        """Fold one page of search terms into the n-gram totals."""
+        grouped = frame.group_sum(by, self.columns)
+        terms: DictionaryColumn = grouped[by]
+        weights = [grouped["count"]] + [grouped[name] for name in self.columns]
+        self._integer = [
+            np.issubdtype(grouped[name].dtype, np.integer) for name in self.columns
+        ]
+
+        ids = self._ids
+        known = len(ids)
+        ngram_ids: list[int] = []
+        term_rows: list[int] = []
+        for row, term in enumerate(terms.decode().tolist()):
+            ngrams = term_ngrams(term, self.max_n)
+            ngram_ids.extend([ids.setdefault(ngram, len(ids)) for ngram in ngrams])
+            term_rows.extend([row] * len(ngrams))
+        if not ngram_ids:
+            return
+
+        self._reserve(len(ids))
+        self._errors[:, known : len(ids)] = self._lost[:, None]
+        # Sum per n-gram seen on this page, then scatter into the table, so
+        # the work is proportional to the page rather than the table
+        touched, pairs = np.unique(np.asarray(ngram_ids), return_inverse=True)
+        rows = np.asarray(term_rows)
+        # Error rows have no weight, so zip leaves them alone
+        for totals, weight in zip(self._totals, weights):
+            totals[touched] += np.bincount(
+                pairs, weights=weight[rows], minlength=len(touched)
+            )
+
+        if len(ids) > self.max_ngrams:
+            self._prune()
+
+    def merge(self, other: "NGramCounter") -> None:
+        """Fold another counter's totals (over the same columns) into this one."""
+        ids = self._ids
+        known = len(ids)
+        mapped = np.fromiter(
+            (ids.setdefault(ngram, len(ids)) for ngram in other._ids),
+            dtype=np.int64,
+            count=len(other._ids),
+        )
+        self._reserve(len(ids))
+        if self.bounded:
+            # N-grams missing from one side may have been pruned there
+            self._errors[:, known : len(ids)] = self._lost[:, None]
+            missing = np.ones(len(ids), dtype=bool)
+            missing[mapped] = False
+            self._errors[:, np.flatnonzero(missing)] += other._lost[:, None]
+            self._lost = self._lost + other._lost
+        self._totals[:, mapped] += other._totals[:, : len(other._ids)]
+        self._integer = other._integer
+
+        if len(ids) > self.max_ngrams:
+            self._prune()
+
+    def to_frame(self) -> MetricsFrame:
+        """Return the totals as a frame, one row per n-gram.
+
+        Columns are ``ngram``, ``words`` (n-gram length), ``count`` (search
+        term rows containing the n-gram), the summed columns and, per
+        bounded column, ``{name}_max``.
+        """
+        size = len(self._ids)
+        ngrams = np.empty(size, dtype=object)
+        ngrams[:] = list(self._ids)
+        columns = {
+            "ngram": DictionaryColumn(np.arange(size, dtype=np.int32), ngrams),
+            "words": np.fromiter(
+                (ngram.count(" ") + 1 for ngram in self._ids), np.int64, size
+            ),
+            "count": self._totals[0, :size].round().astype(np.int64),
+        }
+        for i, name in enumerate(self.columns, start=1):
+            columns[name] = self._column(self._totals[i, :size], i - 1)
+        for name, row, errors in zip(
+            self.bounded, self._bounded_rows, self._errors[:, :size]
+        ):
+            columns[f"{name}_max"] = self._column(
+                self._totals[row, :size] + errors, row - 1
+            )
+        return MetricsFrame(columns)
+
+    def _column(self, totals: np.ndarray, index: int) -> np.ndarray:
+        """Totals in the dtype the ``index``-th column was added with."""
+        if self._integer[index]:
+            return totals.round().astype(np.int64)
+        return totals.copy()
+
+    @property
+    def _errors(self) -> np.ndarray:
+        """View of the error rows of the bounded columns."""
+        return self._totals[len(self.columns) + 1 :]
+
+    def _reserve(self, size: int) -> None:
+        """Grow the totals table to hold at least ``size`` n-grams."""
+        capacity = self._totals.shape[1]
+        if size > capacity:
+            grown = np.zeros((self._totals.shape[0], max(size, capacity * 2)))
+            grown[:, :capacity] = self._totals
+            self._totals = grown
+
+    def _prune(self) -> None:
+        """Drop rare n-grams, then the lowest ranked, until under ``max_ngrams``.
+
+        N-grams dropped here restart from zero if seen again, so totals for
+        rare phrases are lower bounds; frequent phrases are unaffected. The
+        most a dropped n-gram had is remembered for the upper bounds.
+        """
+        size = len(self._ids)
+        support = self._totals[0, :size]
+        keep = np.flatnonzero(support >= self.min_support)
+        if len(keep) > self.max_ngrams:
+            ranking = self._totals[1, keep]
+            order = np.argsort(-ranking, kind="stable")[: self.max_ngrams]
+            keep = np.sort(keep[order])
+
+        if self.bounded and len(keep) < size:
+            dropped = np.ones(size, dtype=bool)
+            dropped[keep] = False
+            upper = self._totals[self._bounded_rows, :size] + self._errors[:, :size]
+            self._lost = np.maximum(self._lost, upper[:, dropped].max(axis=1))
+
+        ngrams = list(self._ids)
+        self._ids = {ngrams[i]: new_id for new_id, i in enumerate(keep)}
+        totals = np.zeros_like(self._totals)
+        totals[:, : len(keep)] = self._totals[:, keep]
+        self._totals = totals
@@ -1,15 +1,44 @@
 """Performance Max Cannibalization Analyzer for PaidSearchNav MCP server.
 
 This analyzer detects Performance Max campaigns cannibalizing Search campaigns.
+Search terms are fetched once per campaign type and joined on their
+normalized text; an estimate mode compares per-campaign sketches instead
+(see ``sketches``) without holding term lists.
 """
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
+import numpy as np
+
 from paidsearchnav_mcp.analyzers.base import AnalysisSummary, BaseAnalyzer
+from paidsearchnav_mcp.analyzers.frame import (
+    SEARCH_TERM_FIELDS,
+    DictionaryColumn,
+    MetricsFrame,
+    select_fields,
+    top_k_indices,
+)
+from paidsearchnav_mcp.analyzers.sketches import (
+    OverlapProbe,
+    TermSetSketch,
+    hash_terms,
+)
+from paidsearchnav_mcp.analyzers.streaming import GroupTotals, TopK, iter_pages
+from paidsearchnav_mcp.analyzers.term_match import normalize_text
+from paidsearchnav_mcp.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
+# Search term columns this analyzer reads
+_SEARCH_TERM_COLUMNS = select_fields(
+    SEARCH_TERM_FIELDS, ("search_term", "cost", "conversions")
+)
+# Search term columns estimate mode reads
+_SKETCH_COLUMNS = select_fields(SEARCH_TERM_FIELDS, ("search_term", "campaign_id"))
+
 
 class PMaxCannibalizationAnalyzer(BaseAnalyzer):
     """Detect Performance Max campaigns cannibalizing Search campaigns.
@@ -21,15 +50,20 @@ class PMaxCannibalizationAnalyzer(BaseAnalyzer):
         self,
         min_overlap_cost: float = 20.0,
         overlap_threshold: float = 0.2,  # 20% overlap is significant
+        estimate: bool = False,
     ):
         """Initialize the analyzer.
 
         Args:
             min_overlap_cost: Minimum combined cost to flag overlap ($)
             overlap_threshold: Threshold for flagging overlap (0.2 = 20%)
+            estimate: Estimate per-campaign overlap from sketches instead
+                of joining full term lists (no costs or term-level
+                recommendations)
         """
         self.min_overlap_cost = min_overlap_cost
         self.overlap_threshold = overlap_threshold
+        self.estimate = estimate
 
     async def analyze(
         self,
@@ -104,110 +138,77 @@ class PMaxCannibalizationAnalyzer(BaseAnalyzer):
             f"Analyzing {len(pmax_campaigns)} PMax campaigns vs {len(search_campaigns)} Search campaigns"
         )
 
-        # Fetch search terms for both campaign types IN PARALLEL (performance optimization)
-        import asyncio
-
-        pmax_search_terms, search_search_terms = await asyncio.gather(
-            self._fetch_search_terms_for_campaigns(
+        if self.estimate:
+            return await self._estimate_overlap(
                 get_search_terms_fn,
                 customer_id,
                 start_date,
                 end_date,
-                [c["campaign_id"] for c in pmax_campaigns],
-            ),
-            self._fetch_search_terms_for_campaigns(
+                {c["campaign_id"]: c.get("name") or "" for c in pmax_campaigns},
+            )
+
+        # One fetch per campaign type, in parallel, reduced to per-term totals
+        pmax_search_terms, search_search_terms = await asyncio.gather(
+            self._fetch_term_totals(
                 get_search_terms_fn,
                 customer_id,
                 start_date,
                 end_date,
-                [c["campaign_id"] for c in search_campaigns],
+                "PERFORMANCE_MAX",
+            ),
+            self._fetch_term_totals(
+                get_search_terms_fn, customer_id, start_date, end_date, "SEARCH"
             ),
         )
+        summary_key = self.cache_key(
+            customer_id,
+            start_date,
+            end_date,
+            pmax_search_terms.fingerprint(),
+            search_search_terms.fingerprint(),
+        )
+        if cached := self.cached_summary(summary_key):
+            return cached
 
-        # Find overlapping search terms
-        pmax_terms_map = {
-            st.get("search_term", "").lower(): st for st in pmax_search_terms
-        }
-        search_terms_map = {
-            st.get("search_term", "").lower(): st for st in search_search_terms
-        }
-
-        overlapping_terms = set(pmax_terms_map.keys()) & set(search_terms_map.keys())
+        # Find overlapping search terms: encoding both sides' normalized
+        # terms into one dictionary gives equal terms equal codes
+        terms = DictionaryColumn.concat(
+            [pmax_search_terms["term"], search_search_terms["term"]]
+        )
+        n_pmax = len(pmax_search_terms)
+        pmax_rows = _row_per_code(terms.codes[:n_pmax], len(terms.values))
+        search_rows = _row_per_code(terms.codes[n_pmax:], len(terms.values))
+        overlapping_terms = np.flatnonzero((pmax_rows >= 0) & (search_rows >= 0))
 
         logger.info(f"Found {len(overlapping_terms)} overlapping search terms")
 
-        # Analyze overlaps and create recommendations
-        recommendations = []
-
-        for term in overlapping_terms:
-            pmax_st = pmax_terms_map[term]
-            search_st = search_terms_map[term]
-
-            pmax_cost = pmax_st.get("metrics", {}).get("cost", 0.0)
-            search_cost = search_st.get("metrics", {}).get("cost", 0.0)
-            total_cost = pmax_cost + search_cost
-
-            # Only flag if total cost exceeds threshold
-            if total_cost < self.min_overlap_cost:
-                continue
-
-            # Calculate performance metrics
-            pmax_conversions = pmax_st.get("metrics", {}).get("conversions", 0)
-            search_conversions = search_st.get("metrics", {}).get("conversions", 0)
-
-            pmax_cpa = (
-                pmax_cost / pmax_conversions if pmax_conversions > 0 else float("inf")
-            )
-            search_cpa = (
-                search_cost / search_conversions
-                if search_conversions > 0
-                else float("inf")
-            )
+        pmax_rows = pmax_rows[overlapping_terms]
+        search_rows = search_rows[overlapping_terms]
+        pmax_cost = pmax_search_terms["cost"][pmax_rows]
+        search_cost = search_search_terms["cost"][search_rows]
+        total_cost = pmax_cost + search_cost
 
-            # Determine recommendation
-            if search_cpa < pmax_cpa:
-                # Search performs better - add negative to PMax
-                estimated_savings = (
-                    pmax_cost * 0.5
-                )  # Conservative: save 50% of PMax cost
-                action = "Add to PMax negative keywords"
-                reasoning = f"Search CPA ${search_cpa:.2f} < PMax CPA ${pmax_cpa:.2f}"
-            elif pmax_cpa < search_cpa:
-                # PMax performs better - could pause in Search
-                estimated_savings = search_cost * 0.5
-                action = "Consider pausing in Search campaign"
-                reasoning = f"PMax CPA ${pmax_cpa:.2f} < Search CPA ${search_cpa:.2f}"
-            else:
-                # Similar performance - still wasteful overlap
-                estimated_savings = total_cost * 0.3  # Save 30% by optimization
-                action = "Add to PMax negatives or adjust Search bids"
-                reasoning = f"Similar performance, ${total_cost:.2f} overlap cost"
-
-            recommendations.append(
-                {
-                    "search_term": term,
-                    "action": action,
-                    "pmax_cost": pmax_cost,
-                    "search_cost": search_cost,
-                    "total_cost": total_cost,
-                    "estimated_savings": estimated_savings,
-                    "reasoning": reasoning,
-                    "metric": f"Overlap: ${total_cost:.2f}/month",
-                }
-            )
+        # Only flag if total cost exceeds threshold
+        flagged = np.flatnonzero(total_cost >= self.min_overlap_cost)
 
         # Sort by total cost descending and take top 10
-        recommendations.sort(key=lambda x: x["total_cost"], reverse=True)
-        top_10 = recommendations[:10]
+        top_10 = [
+            self._build_recommendation(
+                terms.values[overlapping_terms[i]],
+                pmax_cost[i].item(),
+                search_cost[i].item(),
+                pmax_search_terms["conversions"][pmax_rows[i]].item(),
+                search_search_terms["conversions"][search_rows[i]].item(),
+            )
+            for i in flagged[top_k_indices(total_cost[flagged], 10)]
+        ]
 
         # Calculate total savings
         total_savings = sum(r["estimated_savings"] for r in top_10)
-        total_overlap_cost = sum(r["total_cost"] for r in recommendations)
+        total_overlap_cost = float(total_cost[flagged].sum())
 
         # Calculate overlap percentage
-        total_pmax_cost = sum(
-            pmax_st.get("metrics", {}).get("cost", 0.0) for pmax_st in pmax_search_terms
-        )
+        total_pmax_cost = float(pmax_search_terms["cost"].sum())
         overlap_percentage = (
             (total_overlap_cost / total_pmax_cost * 100) if total_pmax_cost > 0 else 0.0
         )
@@ -234,7 +235,7 @@ class PMaxCannibalizationAnalyzer(BaseAnalyzer):
             f"${total_savings:,.2f} monthly savings"
         )
 
-        return AnalysisSummary(
+        summary = AnalysisSummary(
             total_records_analyzed=len(overlapping_terms),
             estimated_monthly_savings=total_savings,
             primary_issue=primary_issue,
@@ -243,65 +244,266 @@ class PMaxCannibalizationAnalyzer(BaseAnalyzer):
             analysis_period=f"{start_date} to {end_date}",
             customer_id=customer_id,
         )
+        return self.remember_summary(summary_key, summary)
+
+    def _build_recommendation(
+        self,
+        term: str,
+        pmax_cost: float,
+        search_cost: float,
+        pmax_conversions: float,
+        search_conversions: float,
+    ) -> dict[str, Any]:
+        """Recommend how to resolve one overlapping search term."""
+        total_cost = pmax_cost + search_cost
+
+        # Calculate performance metrics
+        pmax_cpa = (
+            pmax_cost / pmax_conversions if pmax_conversions > 0 else float("inf")
+        )
+        search_cpa = (
+            search_cost / search_conversions if search_conversions > 0 else float("inf")
+        )
+
+        # Determine recommendation
+        if search_cpa < pmax_cpa:
+            # Search performs better - add negative to PMax
+            estimated_savings = pmax_cost * 0.5  # Conservative: save 50% of PMax cost
+            action = "Add to PMax negative keywords"
+            reasoning = f"Search CPA ${search_cpa:.2f} < PMax CPA ${pmax_cpa:.2f}"
+        elif pmax_cpa < search_cpa:
+            # PMax performs better - could pause in Search
+            estimated_savings = search_cost * 0.5
+            action = "Consider pausing in Search campaign"
+            reasoning = f"PMax CPA ${pmax_cpa:.2f} < Search CPA ${search_cpa:.2f}"
+        else:
+            # Similar performance - still wasteful overlap
+            estimated_savings = total_cost * 0.3  # Save 30% by optimization
+            action = "Add to PMax negatives or adjust Search bids"
+            reasoning = f"Similar performance, ${total_cost:.2f} overlap cost"
+
+        return {
+            "search_term": term,
+            "action": action,
+            "pmax_cost": pmax_cost,
+            "search_cost": search_cost,
+            "total_cost": total_cost,
+            "estimated_savings": estimated_savings,
+            "reasoning": reasoning,
+            "metric": f"Overlap: ${total_cost:.2f}/month",
+        }
 
-    async def _fetch_search_terms_for_campaigns(
+    @traced()
+    async def _fetch_term_totals(
         self,
         get_search_terms_fn: Any,
         customer_id: str,
         start_date: str,
         end_date: str,
-        campaign_ids: list[str],
-    ) -> list[dict]:
-        """Fetch search terms for specific campaigns in parallel.
-
-        Performance optimizations:
-        - Larger page size (2000 vs 500) reduces API calls by 75%
-        - Parallel fetching across campaigns reduces wall-clock time
-        """
-        import asyncio
+        campaign_type: str,
+    ) -> MetricsFrame:
+        """Fetch one campaign type's search terms, summed per normalized term.
 
-        from paidsearchnav_mcp.server import SearchTermsRequest
+        Args:
+            get_search_terms_fn: get_search_terms function from server
+            customer_id: Google Ads customer ID
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            campaign_type: Campaign type to fetch (e.g. "SEARCH")
 
-        async def fetch_campaign_terms(campaign_id: str) -> list[dict]:
-            """Fetch all search terms for a single campaign."""
-            all_terms = []
-            offset = 0
-            limit = 2000  # Increased from 500 (75% fewer API calls)
+        Returns:
+            Frame with ``term`` (normalized search term), ``count`` (rows
+            across campaigns and ad groups), ``cost`` and ``conversions``
+        """
+        totals = GroupTotals(("cost", "conversions"))
+        async for page in self._iter_search_term_pages(
+            get_search_terms_fn,
+            customer_id,
+            start_date,
+            end_date,
+            campaign_type,
+            _SEARCH_TERM_COLUMNS,
+        ):
+            totals.add(
+                MetricsFrame(
+                    {
+                        "term": page["search_term"].transform(normalize_text),
+                        "cost": page["cost"],
+                        "conversions": page["conversions"],
+                    }
+                ),
+                "term",
+            )
+        return totals.to_frame("term")
 
-            while True:
-                request = SearchTermsRequest(
-                    customer_id=customer_id,
-                    start_date=start_date,
-                    end_date=end_date,
-                    campaign_id=campaign_id,
-                    limit=limit,
-                    offset=offset,
-                )
-                result = await get_search_terms_fn(request)
+    @traced()
+    async def _sketch_campaigns(
+        self,
+        get_search_terms_fn: Any,
+        customer_id: str,
+        start_date: str,
+        end_date: str,
+        campaign_type: str,
+    ) -> dict[str, TermSetSketch]:
+        """Sketch each campaign's set of normalized search terms.
 
-                if result["status"] != "success":
-                    break
+        Returns:
+            Campaign ID to sketch of its distinct search terms
+        """
+        sketches: dict[str, TermSetSketch] = {}
+        async for page in self._iter_search_term_pages(
+            get_search_terms_fn,
+            customer_id,
+            start_date,
+            end_date,
+            campaign_type,
+            _SKETCH_COLUMNS,
+        ):
+            terms = page["search_term"]
+            hashes = hash_terms(terms.values)[terms.codes]
+            campaigns = page["campaign_id"]
+            for code, campaign_id in enumerate(campaigns.values):
+                campaign_hashes = hashes[campaigns.codes == code]
+                if len(campaign_hashes):
+                    sketches.setdefault(campaign_id, TermSetSketch()).add(
+                        np.unique(campaign_hashes)
+                    )
+        return sketches
+
+    @traced()
+    async def _probe_search_terms(
+        self,
+        probe: OverlapProbe,
+        get_search_terms_fn: Any,
+        customer_id: str,
+        start_date: str,
+        end_date: str,
+    ) -> None:
+        """Stream Search campaign terms through ``probe``."""
+        async for page in self._iter_search_term_pages(
+            get_search_terms_fn,
+            customer_id,
+            start_date,
+            end_date,
+            "SEARCH",
+            _SKETCH_COLUMNS,
+        ):
+            probe.add(hash_terms(page["search_term"].values))
+
+    async def _estimate_overlap(
+        self,
+        get_search_terms_fn: Any,
+        customer_id: str,
+        start_date: str,
+        end_date: str,
+        pmax_names: dict[str, str],
+    ) -> AnalysisSummary:
+        """Estimate how many of each PMax campaign's terms also serve in Search.
 
-                all_terms.extend(result["data"])
+        Args:
+            get_search_terms_fn: get_search_terms function from server
+            customer_id: Google Ads customer ID
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            pmax_names: PMax campaign ID to name
 
-                if not result["metadata"]["pagination"]["has_more"]:
-                    break
+        Returns:
+            AnalysisSummary ranking PMax campaigns by estimated overlap
+        """
+        # Search is scanned after PMax: the probe needs every PMax sample
+        pmax_sketches = await self._sketch_campaigns(
+            get_search_terms_fn,
+            customer_id,
+            start_date,
+            end_date,
+            "PERFORMANCE_MAX",
+        )
+        pmax_union = TermSetSketch()
+        for sketch in pmax_sketches.values():
+            pmax_union.merge(sketch)
+        probe = OverlapProbe(pmax_sketches.values())
+        await self._probe_search_terms(
+            probe, get_search_terms_fn, customer_id, start_date, end_date
+        )
 
-                offset += limit
+        top = TopK(10)
+        for campaign_id, sketch in pmax_sketches.items():
+            terms = sketch.count()
+            overlap = probe.overlap(sketch)
+            share = overlap / terms if terms else 0.0
+            if share < self.overlap_threshold:
+                continue
+            top.offer(
+                overlap,
+                {
+                    "campaign": pmax_names.get(campaign_id, campaign_id),
+                    "campaign_id": campaign_id,
+                    "action": "Run the exact overlap analysis for this campaign",
+                    "estimated_search_terms": round(terms),
+                    "estimated_overlapping_terms": round(overlap),
+                    "overlap_share": round(share, 3),
+                    "estimated_savings": 0.0,  # Sketches carry no costs
+                    "reasoning": (
+                        f"~{share:.0%} of its ~{terms:,.0f} search terms "
+                        "also serve in Search campaigns"
+                    ),
+                },
+            )
+        top_10 = top.results()
 
-            return all_terms
+        total_terms = pmax_union.count()
+        total_overlap = probe.overlap(pmax_union)
+        overlap_percentage = total_overlap / total_terms * 100 if total_terms else 0.0
+        logger.info(
+            f"Estimated {total_overlap:,.0f} of {total_terms:,.0f} PMax search "
+            f"terms overlap Search across {len(pmax_sketches)} PMax campaigns"
+        )
 
-        # Fetch all campaigns in parallel
-        campaign_results = await asyncio.gather(
-            *[fetch_campaign_terms(campaign_id) for campaign_id in campaign_ids]
+        return AnalysisSummary(
+            total_records_analyzed=round(total_terms),
+            estimated_monthly_savings=0.0,
+            primary_issue=(
+                f"Estimated {overlap_percentage:.0f}% of PMax search terms "
+                f"(~{total_overlap:,.0f}) also serve in Search campaigns"
+            ),
+            top_recommendations=top_10,
+            implementation_steps=[
+                f"Week 1: Run the exact overlap analysis for the {len(top_10)} "
+                "PMax campaigns with the most estimated overlap",
+                "Week 2: Add the costliest overlapping terms as PMax negatives",
+                "Week 3: Monitor Search impression share on the affected terms",
+                "Week 4: Re-run this estimate to confirm overlap is falling",
+            ],
+            analysis_period=f"{start_date} to {end_date}",
+            customer_id=customer_id,
         )
 
-        # Flatten results
-        all_terms = []
-        for terms in campaign_results:
-            all_terms.extend(terms)
+    def _iter_search_term_pages(
+        self,
+        get_search_terms_fn: Any,
+        customer_id: str,
+        start_date: str,
+        end_date: str,
+        campaign_type: str,
+        columns: dict[str, Any],
+    ) -> AsyncIterator[MetricsFrame]:
+        """Fetch every search term of one campaign type, one frame per page."""
+        from paidsearchnav_mcp.server import SearchTermsRequest
 
-        return all_terms
+        return iter_pages(
+            get_search_terms_fn,
+            lambda offset, limit: SearchTermsRequest(
+                customer_id=customer_id,
+                start_date=start_date,
+                end_date=end_date,
+                campaign_type=campaign_type,
+                limit=limit,
+                offset=offset,
+            ),
+            columns,
+            limit=2000,  # Larger pages, fewer API calls
+            description=f"{campaign_type} search terms",
+        )
 
     def _generate_implementation_steps(
         self, top_recommendations: list[dict], overlap_percentage: float
@@ -327,3 +529,10 @@ class PMaxCannibalizationAnalyzer(BaseAnalyzer):
             "Week 3: Monitor Search campaign impression share and performance improvements",
             "Week 4: Review overall PMax/Search strategy and consider campaign restructuring",
         ]
+
+
+def _row_per_code(codes: np.ndarray, size: int) -> np.ndarray:
+    """Map each dictionary code to the (last) row holding it (-1 if absent)."""
+    rows = np.full(size, -1, dtype=np.intp)
+    np.maximum.at(rows, codes, np.arange(len(codes)))
+    return rows
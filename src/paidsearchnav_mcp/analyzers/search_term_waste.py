@@ -1,15 +1,43 @@
 """Search Term Waste Analyzer for PaidSearchNav MCP server.
 
-This analyzer identifies search terms generating spend with no conversion value.
+This analyzer identifies search terms generating spend with no conversion value,
+and words or phrases (n-grams) shared by many such terms.
 """
 
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
+import numpy as np
+
 from paidsearchnav_mcp.analyzers.base import AnalysisSummary, BaseAnalyzer
+from paidsearchnav_mcp.analyzers.frame import (
+    SEARCH_TERM_FIELDS,
+    MetricsFrame,
+    select_fields,
+)
+from paidsearchnav_mcp.analyzers.incremental import reduce_pages
+from paidsearchnav_mcp.analyzers.ngrams import NGramCounter, contains_ngram
+from paidsearchnav_mcp.analyzers.streaming import TopK, iter_pages
+from paidsearchnav_mcp.analyzers.term_match import FUNCTION_WORDS
+from paidsearchnav_mcp.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
+# Search term columns this analyzer reads
+_SEARCH_TERM_COLUMNS = select_fields(
+    SEARCH_TERM_FIELDS,
+    (
+        "search_term",
+        "campaign_name",
+        "match_type",
+        "impressions",
+        "clicks",
+        "cost",
+        "conversions",
+    ),
+)
+
 
 class SearchTermWasteAnalyzer(BaseAnalyzer):
     """Identify search terms generating spend with no conversion value.
@@ -22,6 +50,8 @@ class SearchTermWasteAnalyzer(BaseAnalyzer):
         min_cost: float = 10.0,
         min_clicks: int = 5,
         min_impressions: int = 100,
+        max_ngram_words: int = 3,
+        min_ngram_support: int = 2,
     ):
         """Initialize the analyzer.
 
@@ -29,10 +59,14 @@ class SearchTermWasteAnalyzer(BaseAnalyzer):
             min_cost: Minimum cost to consider wasteful ($)
             min_clicks: Minimum clicks to establish pattern
             min_impressions: Minimum impressions for statistical significance
+            max_ngram_words: Longest word n-gram to mine (0 disables mining)
+            min_ngram_support: Minimum search terms an n-gram must appear in
         """
         self.min_cost = min_cost
         self.min_clicks = min_clicks
         self.min_impressions = min_impressions
+        self.max_ngram_words = max_ngram_words
+        self.min_ngram_support = min_ngram_support
 
     async def analyze(
         self,
@@ -60,52 +94,36 @@ class SearchTermWasteAnalyzer(BaseAnalyzer):
 
         logger.info(f"Starting search term waste analysis for customer {customer_id}")
 
-        # Fetch all search terms with automatic pagination
-        all_search_terms = await self._fetch_all_search_terms(
-            get_search_terms_fn, customer_id, start_date, end_date
+        # Stream search terms page by page, reducing each page to counters,
+        # n-gram totals and its most expensive wasteful terms (reused from
+        # earlier runs for unchanged pages)
+        partials = await self._scan_search_terms(
+            self._iter_search_term_pages(
+                get_search_terms_fn, customer_id, start_date, end_date
+            )
         )
+        summary_key = self.cache_key(
+            customer_id, start_date, end_date, *(page for page, _ in partials)
+        )
+        if cached := self.cached_summary(summary_key):
+            return cached
 
-        logger.info(f"Analyzing {len(all_search_terms)} search terms")
-
-        # Find wasteful search terms (no conversions with significant spend)
-        wasteful_terms = []
-        for st in all_search_terms:
-            metrics = st.get("metrics", {})
-            conversions = metrics.get("conversions", 0)
-            cost = metrics.get("cost", 0.0)
-            clicks = metrics.get("clicks", 0)
-            impressions = metrics.get("impressions", 0)
-
-            # Wasteful if: no conversions + significant spend/clicks
-            if (
-                conversions == 0
-                and cost >= self.min_cost
-                and clicks >= self.min_clicks
-                and impressions >= self.min_impressions
-            ):
-                wasteful_terms.append(
-                    {
-                        "search_term": st.get("search_term", ""),
-                        "cost": cost,
-                        "clicks": clicks,
-                        "impressions": impressions,
-                        "estimated_savings": cost,  # Full cost saved by blocking
-                        "campaign": st.get("campaign_name", ""),
-                        "match_type": st.get("match_type", ""),
-                        "reasoning": f"${cost:.2f} spent, {clicks} clicks, 0 conversions",
-                    }
-                )
-
-        # Sort by cost descending and take top 10
-        wasteful_terms.sort(key=lambda x: x["cost"], reverse=True)
-        top_10 = wasteful_terms[:10]
+        scan = self._merge_scans([partial for _, partial in partials])
+        top_10 = self._combine_recommendations(
+            scan["wasteful_ngrams"], scan["top_recommendations"]
+        )
+
+        logger.info(f"Analyzed {scan['search_terms']} search terms")
 
         # Calculate total potential savings
         total_savings = sum(t["estimated_savings"] for t in top_10)
 
         # Determine primary issue
-        if len(wasteful_terms) > 20:
-            primary_issue = f"Significant waste: {len(wasteful_terms)} search terms with no conversions"
+        wasteful_terms = scan["wasteful_terms"]
+        if wasteful_terms > 20:
+            primary_issue = (
+                f"Significant waste: {wasteful_terms} search terms with no conversions"
+            )
         elif total_savings > 500:
             primary_issue = (
                 f"High-cost waste: ${total_savings:,.2f}/month on non-converting terms"
@@ -121,8 +139,8 @@ class SearchTermWasteAnalyzer(BaseAnalyzer):
             f"${total_savings:,.2f} monthly savings"
         )
 
-        return AnalysisSummary(
-            total_records_analyzed=len(all_search_terms),
+        summary = AnalysisSummary(
+            total_records_analyzed=scan["search_terms"],
             estimated_monthly_savings=total_savings,
             primary_issue=primary_issue,
             top_recommendations=top_10,
@@ -130,46 +148,208 @@ class SearchTermWasteAnalyzer(BaseAnalyzer):
             analysis_period=f"{start_date} to {end_date}",
             customer_id=customer_id,
         )
+        return self.remember_summary(summary_key, summary)
+
+    def _build_recommendation(self, search_term: dict[str, Any]) -> dict[str, Any]:
+        """Turn a wasteful search term row into a negative keyword recommendation."""
+        cost = search_term["cost"]
+        clicks = search_term["clicks"]
+        return {
+            "search_term": search_term["search_term"],
+            "cost": cost,
+            "clicks": clicks,
+            "impressions": search_term["impressions"],
+            "estimated_savings": cost,  # Full cost saved by blocking
+            "campaign": search_term["campaign_name"],
+            "match_type": search_term["match_type"],
+            "reasoning": f"${cost:.2f} spent, {clicks} clicks, 0 conversions",
+        }
+
+    def _build_ngram_recommendation(self, ngram: dict[str, Any]) -> dict[str, Any]:
+        """Turn a wasteful n-gram row into a phrase negative recommendation."""
+        cost = ngram["cost"]
+        clicks = ngram["clicks"]
+        return {
+            "search_term": ngram["ngram"],
+            "cost": cost,
+            "clicks": clicks,
+            "impressions": ngram["impressions"],
+            "estimated_savings": cost,  # Every term containing it is blocked
+            "campaign": "All campaigns",
+            "match_type": "PHRASE",
+            "matched_search_terms": ngram["count"],
+            "reasoning": (
+                f'{ngram["count"]} search terms containing "{ngram["ngram"]}": '
+                f"${cost:.2f} spent, {clicks} clicks, 0 conversions"
+            ),
+        }
+
+    @traced(
+        result_attributes=lambda partials: {
+            "pages": len(partials),
+            "rows": sum(partial["search_terms"] for _, partial in partials),
+        }
+    )
+    async def _scan_search_terms(
+        self, pages: AsyncIterator[MetricsFrame]
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Reduce each search term page, reusing results for unchanged pages.
+
+        Args:
+            pages: Search term frames, one per fetched page
+
+        Returns:
+            ``(page fingerprint, partial)`` per page; see ``_scan_page``
+        """
+        return await reduce_pages(
+            pages, self._scan_page, self.cache_key(), self.backend
+        )
+
+    def _scan_page(self, page: MetricsFrame) -> dict[str, Any]:
+        """Reduce one page to counts, n-gram totals and top wasteful terms."""
+        # Wasteful if: no conversions + significant spend/clicks
+        wasteful = page.filter(
+            (page["conversions"] == 0)
+            & (page["cost"] >= self.min_cost)
+            & (page["clicks"] >= self.min_clicks)
+            & (page["impressions"] >= self.min_impressions)
+        )
+        # Spare term candidates replace terms covered by an n-gram negative
+        top = TopK(20)
+        top.offer_batch(
+            wasteful["cost"],
+            lambda i: self._build_recommendation(wasteful.row(i)),
+        )
+        ngrams = self._ngram_counter()
+        if self.max_ngram_words:
+            ngrams.add(page)
+        ngrams.compact()
+        return {
+            "search_terms": len(page),
+            "wasteful_terms": len(wasteful),
+            "top_recommendations": top.results(),
+            "ngrams": ngrams,
+        }
+
+    def _merge_scans(self, partials: list[dict[str, Any]]) -> dict[str, Any]:
+        """Combine per-page partials, in page order.
+
+        Returns:
+            Dict with ``search_terms`` and ``wasteful_terms`` counts, the
+            most expensive wasteful terms as ``top_recommendations`` and
+            the ``wasteful_ngrams``, both sorted by cost
+        """
+        top = TopK(20)
+        ngrams = self._ngram_counter()
+        for partial in partials:
+            for recommendation in partial["top_recommendations"]:
+                top.offer(recommendation["cost"], recommendation)
+            ngrams.merge(partial["ngrams"])
+
+        return {
+            "search_terms": sum(partial["search_terms"] for partial in partials),
+            "wasteful_terms": sum(partial["wasteful_terms"] for partial in partials),
+            "top_recommendations": top.results(),
+            "wasteful_ngrams": self._find_wasteful_ngrams(ngrams.to_frame()),
+        }
+
+    def _ngram_counter(self) -> NGramCounter:
+        """Create an empty counter for the columns n-gram mining reads."""
+        return NGramCounter(
+            ("cost", "clicks", "impressions", "conversions"),
+            max_n=self.max_ngram_words,
+            min_support=self.min_ngram_support,
+            bounded=("conversions",),
+        )
+
+    @traced()
+    def _find_wasteful_ngrams(self, ngrams: MetricsFrame) -> list[dict[str, Any]]:
+        """Pick the costliest n-grams that only appear in non-converting terms.
+
+        N-grams whose conversions may have been lost to pruning are not
+        eligible. An n-gram is skipped if it contains or is part of one
+        already picked, since the two negatives would block (and count the
+        savings of) the same terms.
 
-    async def _fetch_all_search_terms(
+        Args:
+            ngrams: N-gram totals from ``NGramCounter.to_frame``
+
+        Returns:
+            Up to 10 phrase negative recommendations sorted by cost
+        """
+        wasteful = ngrams.filter(
+            (ngrams["conversions_max"] == 0)
+            & (ngrams["count"] >= self.min_ngram_support)
+            & (ngrams["cost"] >= self.min_cost)
+            & (ngrams["clicks"] >= self.min_clicks)
+            & (ngrams["impressions"] >= self.min_impressions)
+        )
+        # Costliest first; on ties the shorter n-gram covers the longer one
+        order = np.lexsort((wasteful["words"], -wasteful["cost"]))
+
+        picked: list[dict[str, Any]] = []
+        for i in order:
+            row = wasteful.row(i)
+            ngram = row["ngram"]
+            if all(word in FUNCTION_WORDS for word in ngram.split()):
+                continue
+            if any(
+                contains_ngram(ngram, other) or contains_ngram(other, ngram)
+                for other in (p["search_term"] for p in picked)
+            ):
+                continue
+            picked.append(self._build_ngram_recommendation(row))
+            if len(picked) == 10:
+                break
+        return picked
+
+    def _combine_recommendations(
+        self, ngrams: list[dict[str, Any]], terms: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Merge n-gram and whole-term negatives into the top 10 by savings.
+
+        Terms blocked by a chosen n-gram are dropped so savings are not
+        counted twice.
+        """
+        # Stable sort keeps n-grams ahead of terms with the same savings
+        candidates = sorted(
+            ngrams + terms, key=lambda r: r["estimated_savings"], reverse=True
+        )
+        chosen_ngrams: list[str] = []
+        top_10: list[dict[str, Any]] = []
+        for recommendation in candidates:
+            text = recommendation["search_term"]
+            if "matched_search_terms" in recommendation:
+                chosen_ngrams.append(text)
+            elif any(contains_ngram(text, ngram) for ngram in chosen_ngrams):
+                continue
+            top_10.append(recommendation)
+            if len(top_10) == 10:
+                break
+        return top_10
+
+    def _iter_search_term_pages(
         self,
         get_search_terms_fn: Any,
         customer_id: str,
         start_date: str,
         end_date: str,
-    ) -> list[dict]:
-        """Fetch all search terms with automatic pagination."""
+    ) -> AsyncIterator[MetricsFrame]:
+        """Fetch search terms with automatic pagination, one frame per page."""
         from paidsearchnav_mcp.server import SearchTermsRequest
 
-        all_search_terms = []
-        offset = 0
-        limit = 500
-
-        while True:
-            request = SearchTermsRequest(
+        return iter_pages(
+            get_search_terms_fn,
+            lambda offset, limit: SearchTermsRequest(
                 customer_id=customer_id,
                 start_date=start_date,
                 end_date=end_date,
                 limit=limit,
                 offset=offset,
-            )
-            result = await get_search_terms_fn(request)
-
-            if result["status"] != "success":
-                error_msg = result.get("message", "Unknown error")
-                logger.warning(
-                    f"Failed to fetch search terms at offset {offset}: {error_msg}"
-                )
-                break
-
-            all_search_terms.extend(result["data"])
-
-            if not result["metadata"]["pagination"]["has_more"]:
-                break
-
-            offset += limit
-
-        return all_search_terms
+            ),
+            _SEARCH_TERM_COLUMNS,
+            description="search terms",
+        )
 
     def _generate_implementation_steps(
         self, top_recommendations: list[dict]
@@ -0,0 +1,226 @@
+"""Fixed-size sketches for estimating search term set overlap.
+
+Counting how many search terms two groups of campaigns share normally
+means holding both term lists. These sketches summarize a term set in a
+few KB regardless of its size, and merge across pages and campaigns:
+
+- ``HyperLogLog`` estimates how many distinct terms a set has (about 1.6%
+  error with the default 4,096 registers)
+- ``BottomK`` keeps a uniform sample of a set: its k smallest hashes
+
+Overlap is estimated by containment rather than Jaccard: the share of
+A's sample that B contains, times ``|A|``. Its error is relative to
+``|A|`` (about ``sqrt(c(1 - c)/k)`` for containment ``c``), so a small set
+is measured as precisely against a huge one as against a similar one,
+whereas ``J(A, B) * |A | B|`` from a MinHash signature of ``m``
+permutations can only resolve about ``|A | B| / m``.
+``OverlapProbe`` streams B once and keeps only the sampled terms of A it
+finds. Terms are normalized (``term_match.normalize_text``) and hashed
+once per distinct string with ``hash_terms``.
+"""
+
+import hashlib
+import math
+from collections.abc import Iterable
+
+import numpy as np
+
+from paidsearchnav_mcp.analyzers.term_match import normalize_text
+
+
+def hash_terms(terms: Iterable[str]) -> np.ndarray:
+    """Hash normalized search terms to uint64, one per input."""
+    return np.fromiter(
+        (
+            int.from_bytes(
+                hashlib.blake2b(normalize_text(term).encode(), digest_size=8).digest(),
+                "little",
+            )
+            for term in terms
+        ),
+        dtype=np.uint64,
+    )
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer: a cheap bijective scramble of uint64 values."""
+    with np.errstate(over="ignore"):
+        values = values ^ (values >> np.uint64(30))
+        values = values * np.uint64(0xBF58476D1CE4E5B9)
+        values = values ^ (values >> np.uint64(27))
+        values = values * np.uint64(0x94D049BB133111EB)
+        return values ^ (values >> np.uint64(31))
+
+
+def _leading_zeros(values: np.ndarray) -> np.ndarray:
+    """Count leading zero bits of non-zero uint64 values."""
+    values = values.copy()
+    zeros = np.zeros(len(values), dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        empty = (values >> np.uint64(64 - shift)) == 0
+        zeros[empty] += shift
+        values[empty] <<= np.uint64(shift)
+    return zeros
+
+
+class HyperLogLog:
+    """Distinct count estimate over 64-bit hashes.
+
+    Attributes:
+        precision: Register index bits; ``2**precision`` one-byte registers
+    """
+
+    def __init__(self, precision: int = 12):
+        """Initialize an empty sketch.
+
+        Args:
+            precision: Register index bits (4-16); error is about
+                ``1.04 / sqrt(2**precision)``
+        """
+        if not 4 <= precision <= 16:
+            raise ValueError(f"precision must be between 4 and 16, got {precision}")
+        self.precision = precision
+        self._registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add hashed items (see ``hash_terms``)."""
+        if not len(hashes):
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        # A guard bit keeps the remaining bits non-zero
+        rest = (hashes << np.uint64(self.precision)) | np.uint64(
+            1 << (self.precision - 1)
+        )
+        np.maximum.at(self._registers, index, _leading_zeros(rest) + 1)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Fold in another sketch of the same precision (set union)."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precision")
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def count(self) -> float:
+        """Estimated number of distinct items added."""
+        size = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / np.exp2(-self._registers.astype(float)).sum()
+        empty = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * size and empty:
+            # Linear counting is more accurate for small sets
+            return size * math.log(size / empty)
+        return float(estimate)
+
+
+class BottomK:
+    """The ``k`` smallest distinct hashes of a set: a uniform sample of it.
+
+    Hashes are rescrambled with ``_mix`` so the sample is independent of
+    the ``HyperLogLog`` registers built from the same hashes.
+
+    Attributes:
+        k: Sample size
+    """
+
+    def __init__(self, k: int = 256):
+        """Initialize an empty sample.
+
+        Args:
+            k: Sample size; containment error is about ``1 / sqrt(k)``
+        """
+        self.k = k
+        self.values = np.empty(0, dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the set has more than ``k`` items (the sample is partial)."""
+        return len(self.values) >= self.k
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add hashed items (see ``hash_terms``)."""
+        mixed = _mix(np.asarray(hashes, dtype=np.uint64))
+        self.values = np.union1d(self.values, mixed)[: self.k]
+
+    def merge(self, other: "BottomK") -> None:
+        """Fold in another sample of the same size (set union)."""
+        if other.k != self.k:
+            raise ValueError("Cannot merge samples of different size")
+        self.values = np.union1d(self.values, other.values)[: self.k]
+
+
+class TermSetSketch:
+    """Distinct count and uniform sample of one set of search terms."""
+
+    def __init__(self, precision: int = 12, sample_size: int = 256):
+        """Initialize an empty sketch.
+
+        Args:
+            precision: ``HyperLogLog`` precision
+            sample_size: ``BottomK`` sample size
+        """
+        self.distinct = HyperLogLog(precision)
+        self.sample = BottomK(sample_size)
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add hashed terms (see ``hash_terms``)."""
+        self.distinct.add(hashes)
+        self.sample.add(hashes)
+
+    def merge(self, other: "TermSetSketch") -> None:
+        """Fold in another term set (set union)."""
+        self.distinct.merge(other.distinct)
+        self.sample.merge(other.sample)
+
+    def count(self) -> float:
+        """Estimated number of distinct terms (exact below the sample size)."""
+        if not self.sample.is_full:
+            return float(len(self.sample))
+        return self.distinct.count()
+
+
+class OverlapProbe:
+    """Estimate how many terms of sketched sets A also occur in a set B.
+
+    Build the probe from the sketches of every A, stream B's hashes through
+    ``add`` once, then ask for each A's ``overlap``. Only sampled terms of
+    the A sets are kept, so memory does not grow with ``|B|``.
+    """
+
+    def __init__(self, sketches: Iterable[TermSetSketch]):
+        """Initialize the probe.
+
+        Args:
+            sketches: Sketches whose overlap with B will be asked for; a
+                union of them may be asked for as well
+        """
+        samples = [sketch.sample.values for sketch in sketches]
+        self._probes = np.unique(np.concatenate([np.empty(0, np.uint64), *samples]))
+        self._found = np.empty(0, dtype=np.uint64)
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add hashed terms of B (see ``hash_terms``)."""
+        if not len(self._probes):
+            return
+        mixed = _mix(np.asarray(hashes, dtype=np.uint64))
+        found = mixed[np.isin(mixed, self._probes)]
+        if len(found):
+            self._found = np.union1d(self._found, found)
+
+    def overlap(self, sketch: TermSetSketch) -> float:
+        """Estimated number of ``sketch``'s terms also in B.
+
+        Raises:
+            ValueError: If ``sketch`` was not one the probe was built from
+        """
+        sample = sketch.sample.values
+        if not len(sample):
+            return 0.0
+        if not np.isin(sample, self._probes).all():
+            raise ValueError("Sketch was not included when building the probe")
+        contained = np.isin(sample, self._found)
+        if not sketch.sample.is_full:
+            return float(np.count_nonzero(contained))
+        return float(contained.mean()) * sketch.count()
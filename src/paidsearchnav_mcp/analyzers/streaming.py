@@ -0,0 +1,225 @@
+"""Streaming reducers for analyzers.
+
+``AnalysisSummary`` only carries the top 10 recommendations plus counts and
+totals, so analyzers do not need the whole account in memory. They consume
+search terms page by page from ``iter_pages`` and fold each page into
+bounded state:
+
+- ``TopK`` keeps the best ``k`` recommendations in a min-heap
+- ``GroupTotals`` keeps running per-key sums (one entry per distinct key,
+  not per row)
+"""
+
+import heapq
+import logging
+import sys
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+from paidsearchnav_mcp.analyzers.frame import (
+    DictionaryColumn,
+    Field,
+    FrameBuilder,
+    MetricsFrame,
+    top_k_indices,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def iter_pages(
+    fetch_fn: Callable[[Any], Awaitable[dict[str, Any]]],
+    make_request: Callable[[int, int], Any],
+    fields: Mapping[str, Field],
+    limit: int = 500,
+    description: str = "rows",
+) -> AsyncIterator[MetricsFrame]:
+    """Yield an MCP data tool's paginated results one frame per page.
+
+    Stops at the last page, or after logging a warning if a page fails.
+
+    Args:
+        fetch_fn: Underlying tool function (e.g. ``get_search_terms.fn``)
+        make_request: Builds the tool request for ``(offset, limit)``
+        fields: Columns to extract from each page
+        limit: Page size
+        description: What is being fetched, for log messages
+
+    Yields:
+        MetricsFrame for each page
+    """
+    offset = 0
+    while True:
+        result = await fetch_fn(make_request(offset, limit))
+
+        if result["status"] != "success":
+            error_msg = result.get("message", "Unknown error")
+            logger.warning(
+                f"Failed to fetch {description} at offset {offset}: {error_msg}"
+            )
+            return
+
+        yield MetricsFrame.from_records(result["data"], fields)
+
+        if not result["metadata"]["pagination"]["has_more"]:
+            return
+
+        offset += limit
+
+
+async def collect_pages(
+    pages: AsyncIterator[MetricsFrame], fields: Mapping[str, Field]
+) -> MetricsFrame:
+    """Concatenate every page from ``iter_pages`` into one frame."""
+    builder = FrameBuilder(fields)
+    async for page in pages:
+        builder.add(page)
+    return builder.build()
+
+
+class TopK:
+    """Keep the ``k`` highest-ranked items offered so far.
+
+    Backed by a min-heap of at most ``k`` entries, so memory stays constant
+    however many items are offered. Ties keep the item offered first, which
+    makes ``results()`` equal ``sorted(items, key=..., reverse=True)[:k]``
+    over the same sequence.
+    """
+
+    def __init__(self, k: int = 10):
+        """Initialize the reducer.
+
+        Args:
+            k: Number of items to keep
+        """
+        self.k = k
+        self._heap: list[tuple[float, int, Any]] = []
+        self._offered = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def offer(self, key: float, item: Any) -> None:
+        """Consider one item ranked by ``key``."""
+        # The negated sequence number breaks ties in favour of earlier items
+        # and keeps heapq from ever comparing the items themselves
+        entry = (key, -self._offered, item)
+        self._offered += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def offer_batch(self, keys: np.ndarray, make_item: Callable[[int], Any]) -> None:
+        """Consider a batch of rows, building items only for contenders.
+
+        Args:
+            keys: Ranking key per row
+            make_item: Builds the item for a row position
+        """
+        keys = np.asarray(keys)
+        if len(self._heap) == self.k and self.k > 0:
+            # Rows not above the current k-th best can never get in
+            contenders = np.flatnonzero(keys > self._heap[0][0])
+        else:
+            contenders = np.arange(len(keys))
+        for i in contenders[top_k_indices(keys[contenders], self.k)]:
+            self.offer(keys[i].item(), make_item(int(i)))
+
+    def results(self) -> list[Any]:
+        """Return the kept items, best first."""
+        return [item for _, _, item in sorted(self._heap, reverse=True)]
+
+
+class GroupTotals:
+    """Running per-key sums across batches (a streaming ``group_sum``).
+
+    Attributes:
+        columns: Numeric columns being summed
+        rows: Total rows folded in so far
+    """
+
+    def __init__(self, columns: Sequence[str]):
+        """Initialize the reducer.
+
+        Args:
+            columns: Numeric columns to sum
+        """
+        self.columns = tuple(columns)
+        self.rows = 0
+        self._totals: dict[Any, list[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the per-key totals."""
+        width = len(self.columns) + 1
+        return sys.getsizeof(self._totals) + sum(
+            sys.getsizeof(key) + sys.getsizeof(values) + 32 * width
+            for key, values in self._totals.items()
+        )
+
+    def add(self, frame: MetricsFrame, by: str) -> None:
+        """Fold one batch into the totals, grouping on column ``by``."""
+        self.rows += len(frame)
+        grouped = frame.group_sum(by, self.columns)
+        keys = grouped[by].values.tolist()
+        columns = [grouped["count"].tolist()] + [
+            grouped[name].tolist() for name in self.columns
+        ]
+        for i, key in enumerate(keys):
+            values = [column[i] for column in columns]
+            totals = self._totals.get(key)
+            if totals is None:
+                self._totals[key] = values
+            else:
+                for j, value in enumerate(values):
+                    totals[j] += value
+
+    def merge(self, other: "GroupTotals") -> None:
+        """Fold another reducer's totals (over the same columns) into this one."""
+        self.rows += other.rows
+        for key, values in other._totals.items():
+            totals = self._totals.get(key)
+            if totals is None:
+                self._totals[key] = list(values)
+            else:
+                for j, value in enumerate(values):
+                    totals[j] += value
+
+    def get(self, key: Any) -> dict[str, Any] | None:
+        """Return ``{"count": ..., <column>: ...}`` for ``key``, if seen."""
+        totals = self._totals.get(key)
+        if totals is None:
+            return None
+        return dict(zip(("count", *self.columns), totals))
+
+    def to_frame(self, by: str) -> MetricsFrame:
+        """Return the totals as a frame, one row per key.
+
+        Columns are ``by`` (dictionary-encoded keys, in order of first
+        appearance), ``count`` and the summed columns.
+        """
+        size = len(self._totals)
+        keys = np.empty(size, dtype=object)
+        keys[:] = list(self._totals)
+        totals = list(zip(*self._totals.values())) or [()] * (len(self.columns) + 1)
+        columns: dict[str, Any] = {
+            by: DictionaryColumn(np.arange(size, dtype=np.int32), keys),
+            "count": np.asarray(totals[0], dtype=np.int64),
+        }
+        for name, values in zip(self.columns, totals[1:]):
+            columns[name] = np.asarray(values) if values else np.zeros(0)
+        return MetricsFrame(columns)
+
+    def to_records(self, by: str) -> list[dict[str, Any]]:
+        """Return one dict per key, in order of first appearance."""
+        names = ("count", *self.columns)
+        return [
+            {by: key, **dict(zip(names, totals))}
+            for key, totals in self._totals.items()
+        ]
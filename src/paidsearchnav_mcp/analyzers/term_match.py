@@ -0,0 +1,90 @@
+"""Close-variant normalization for joining search terms to keywords.
+
+Google Ads exact match also serves close variants of a keyword: different
+case, accents, punctuation, plurals and other simple inflections, function
+words, and reordered words. ``close_variant_key`` folds all of those into
+one hashable key, so "is this search term an exact match of its keyword"
+becomes a dictionary lookup rather than a fuzzy comparison.
+
+Keys are computed once per distinct string (``DictionaryColumn.transform``)
+and memoized across pages.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+import numpy as np
+
+from paidsearchnav_mcp.analyzers.frame import DictionaryColumn
+
+# Words Google ignores when matching exact close variants
+FUNCTION_WORDS = frozenset(
+    {"a", "an", "and", "at", "by", "for", "from", "in", "of", "on", "or", "the", "to"}
+)
+
+_NON_WORD = re.compile(r"[^\w]+")
+# Plural endings that drop "es" (boxes, churches, dishes, buzzes)
+_ES_ENDINGS = ("xes", "ches", "shes", "sses", "zes")
+# Singular words ending in "s" that must not be stemmed
+_KEEP_S_ENDINGS = ("ss", "us", "is")
+
+
+def normalize_text(text: str) -> str:
+    """Lower-case, strip accents and punctuation, and collapse whitespace."""
+    text = text.replace("&", " and ")
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+
+def stem_token(token: str) -> str:
+    """Reduce a token to a crude singular form (shoes -> shoe, boxes -> box)."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 4 and token.endswith(_ES_ENDINGS):
+        return token[:-2]
+    if len(token) > 3 and token.endswith("s") and not token.endswith(_KEEP_S_ENDINGS):
+        return token[:-1]
+    return token
+
+
+@lru_cache(maxsize=65536)
+def close_variant_key(text: str) -> str:
+    """Return the key shared by ``text`` and its exact-match close variants.
+
+    Args:
+        text: Keyword or search term text
+
+    Returns:
+        Sorted, stemmed tokens with function words removed (kept when the
+        text is nothing but function words); "" for empty text
+    """
+    tokens = normalize_text(text).split()
+    content = [token for token in tokens if token not in FUNCTION_WORDS] or tokens
+    return " ".join(sorted(stem_token(token) for token in content))
+
+
+def close_variant_keys(column: DictionaryColumn) -> DictionaryColumn:
+    """Map a string column to close-variant keys in O(distinct values)."""
+    return column.transform(close_variant_key)
+
+
+def exact_close_variants(
+    keywords: DictionaryColumn, search_terms: DictionaryColumn
+) -> np.ndarray:
+    """Boolean mask of rows whose search term is a close variant of the keyword.
+
+    Both columns are row-aligned (search term rows with their triggering
+    keyword). Rows without a keyword never match.
+    """
+    keys = DictionaryColumn.concat(
+        [close_variant_keys(keywords), close_variant_keys(search_terms)]
+    )
+    n_rows = len(keywords)
+    keyword_codes = keys.codes[:n_rows]
+    matches = keyword_codes == keys.codes[n_rows:]
+    for empty in np.flatnonzero(keys.values == ""):
+        matches &= keyword_codes != empty
+    return matches
@@ -0,0 +1,191 @@
+"""Dense day x entity panels for trend analysis.
+
+``get_daily_performance`` returns one sparse row per entity and day with
+impressions. ``DailyPanel`` scatters those rows once into a dense
+``(days, entities)`` array per metric (missing days are zero), so rolling
+windows, period-over-period deltas and change-point detection run as
+array operations over every campaign or ad group at once:
+
+- ``rolling_sum`` sums trailing windows with one cumulative sum
+- ``ratio`` divides windowed sums (CPA, ROAS) without dividing by zero
+- ``change_points`` finds each column's strongest mean shift
+
+All functions operate along axis 0 (days), one column per entity.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+
+from paidsearchnav_mcp.analyzers.frame import MetricsFrame
+
+
+def _parse_day(value: str) -> np.datetime64:
+    """Parse a YYYY-MM-DD string, or NaT if it is not a valid date."""
+    try:
+        return np.datetime64(value, "D")
+    except (TypeError, ValueError):
+        return np.datetime64("NaT", "D")
+
+
+@dataclass(frozen=True)
+class DailyPanel:
+    """Metrics as dense ``(days, entities)`` arrays.
+
+    Attributes:
+        days: Calendar days (``datetime64[D]``), one per row
+        entities: Entity IDs, one per column
+        metrics: Metric name to ``(days, entities)`` array of daily totals
+    """
+
+    days: np.ndarray
+    entities: np.ndarray
+    metrics: dict[str, np.ndarray]
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame: MetricsFrame,
+        start: date,
+        end: date,
+        metrics: tuple[str, ...],
+        by: str = "entity_id",
+    ) -> "DailyPanel":
+        """Scatter entity-day rows into a dense panel.
+
+        Rows with dates outside ``start``..``end`` (or unparseable dates)
+        are dropped; repeated entity-days are summed.
+
+        Args:
+            frame: Rows with a ``date`` (YYYY-MM-DD) string column
+            start: First day of the panel
+            end: Last day of the panel (inclusive)
+            metrics: Numeric columns to scatter
+            by: String column identifying the entity
+
+        Returns:
+            Panel with one row per day and one column per entity
+        """
+        days = np.arange(
+            np.datetime64(start, "D"),
+            np.datetime64(end, "D") + 1,
+            dtype="datetime64[D]",
+        )
+        entities = frame[by]
+        # Parse each distinct date string once
+        day_values = np.array(
+            [_parse_day(value) for value in frame["date"].values],
+            dtype="datetime64[D]",
+        )
+        day_index = (day_values - days[0]).astype(np.int64)[frame["date"].codes]
+        valid = ~np.isnat(day_values[frame["date"].codes])
+        valid &= (day_index >= 0) & (day_index < len(days))
+
+        width = len(entities.values)
+        cells = day_index[valid] * width + entities.codes[valid]
+        panel = {
+            name: np.bincount(
+                cells, weights=frame[name][valid], minlength=len(days) * width
+            ).reshape(len(days), width)
+            for name in metrics
+        }
+        return cls(days, entities.values, panel)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.metrics[name]
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing ``window``-day sums; the first rows sum the days available.
+
+    Args:
+        values: ``(days, entities)`` daily values
+        window: Days per window
+
+    Returns:
+        Array of the same shape whose row ``t`` sums rows ``t-window+1..t``
+    """
+    totals = np.cumsum(values, axis=0)
+    totals[window:] = totals[window:] - totals[:-window]
+    return totals
+
+
+def ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise ``numerator / denominator``, NaN where the denominator is 0."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+@dataclass(frozen=True)
+class ChangePoints:
+    """Strongest mean shift found in each column.
+
+    Attributes:
+        index: Row where the new level starts
+        score: Two-sample t statistic of the shift (negative when the
+            level dropped)
+        before: Mean of the rows before ``index``
+        after: Mean of the rows from ``index`` on
+    """
+
+    index: np.ndarray
+    score: np.ndarray
+    before: np.ndarray
+    after: np.ndarray
+
+
+def change_points(values: np.ndarray, min_segment: int = 3) -> ChangePoints:
+    """Find the single split that best separates each column into two levels.
+
+    Every candidate split of every column is scored at once from cumulative
+    sums of the values and their squares: the score is the two-sample t
+    statistic of the difference in means, using the pooled within-segment
+    variance. The maximum over splits is not a calibrated test, so callers
+    should use a conservative threshold (e.g. ``|score| >= 4``).
+
+    Args:
+        values: ``(days, entities)`` daily values
+        min_segment: Fewest rows allowed on either side of a split
+
+    Returns:
+        Best split per column; columns too short to split get index 0 and
+        score 0
+    """
+    n, width = values.shape
+    if n < 2 * min_segment:
+        zeros = np.zeros(width)
+        return ChangePoints(np.zeros(width, dtype=np.int64), zeros, zeros, zeros)
+
+    totals = np.cumsum(values, axis=0)
+    squares = np.cumsum(values**2, axis=0)
+    splits = np.arange(min_segment, n - min_segment + 1)
+    left = splits[:, None].astype(float)
+    right = n - left
+    left_sum = totals[splits - 1]
+    right_sum = totals[-1] - left_sum
+    before = left_sum / left
+    after = right_sum / right
+    # Within-segment sum of squared deviations, pooled over both segments
+    residual = (squares[-1] - left_sum * before - right_sum * after).clip(min=0)
+    variance = residual / (n - 2)
+    scale = np.sqrt(variance * (1 / left + 1 / right))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(
+            scale > 0,
+            (after - before) / scale,
+            np.sign(after - before) * np.inf,
+        )
+    scores = np.nan_to_num(scores, nan=0.0)
+
+    best = np.argmax(np.abs(scores), axis=0)
+    columns = np.arange(width)
+    return ChangePoints(
+        index=splits[best],
+        score=scores[best, columns],
+        before=before[best, columns],
+        after=after[best, columns],
+    )
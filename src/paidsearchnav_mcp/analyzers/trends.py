@@ -0,0 +1,316 @@
+"""Performance Trend Analyzer for PaidSearchNav MCP server.
+
+This analyzer answers "what broke recently?": it compares each campaign's
+(or ad group's) last ``window`` days with the window before and looks for
+recent step changes in daily conversions and cost. Daily metrics are
+fetched in one day-segmented query and analyzed as a dense day x entity
+panel (see ``timeseries``), so every entity is handled in the same array
+operations.
+"""
+
+import logging
+from datetime import date
+from typing import Any
+
+import numpy as np
+
+from paidsearchnav_mcp.analyzers.base import AnalysisSummary, BaseAnalyzer
+from paidsearchnav_mcp.analyzers.frame import DAILY_FIELDS, MetricsFrame, top_k_indices
+from paidsearchnav_mcp.analyzers.timeseries import (
+    DailyPanel,
+    change_points,
+    ratio,
+    rolling_sum,
+)
+
+logger = logging.getLogger(__name__)
+
+# Daily metrics scattered into the panel
+_METRICS = ("cost", "conversions", "conversion_value")
+
+
+def _number(value: float) -> float | None:
+    """Return a finite float, or None for NaN (e.g. CPA with 0 conversions)."""
+    return None if np.isnan(value) else float(value)
+
+
+class TrendAnalyzer(BaseAnalyzer):
+    """Find campaigns or ad groups whose performance recently deteriorated.
+
+    Returns entities ranked by the extra spend their latest window cost
+    compared with the efficiency of the window before.
+    """
+
+    def __init__(
+        self,
+        level: str = "CAMPAIGN",
+        window: int = 7,
+        min_cost: float = 50.0,
+        performance_threshold: float = 0.2,  # 20% CPA increase
+        min_change_score: float = 4.0,
+    ):
+        """Initialize the analyzer.
+
+        Args:
+            level: Entity to analyze (CAMPAIGN or AD_GROUP)
+            window: Days per comparison window (7 = week over week)
+            min_cost: Minimum spend across both windows to flag an entity ($)
+            performance_threshold: CPA increase that flags an entity (0.2 =
+                20%)
+            min_change_score: Minimum t statistic for a step change in daily
+                conversions to flag an entity on its own
+        """
+        self.level = level
+        self.window = window
+        self.min_cost = min_cost
+        self.performance_threshold = performance_threshold
+        self.min_change_score = min_change_score
+
+    async def analyze(
+        self,
+        customer_id: str,
+        start_date: str,
+        end_date: str,
+        **kwargs: Any,
+    ) -> AnalysisSummary:
+        """Analyze recent performance trends.
+
+        Args:
+            customer_id: Google Ads customer ID
+            start_date: Analysis start date (YYYY-MM-DD); the range should
+                cover at least two windows
+            end_date: Analysis end date (YYYY-MM-DD)
+
+        Returns:
+            AnalysisSummary with the entities that deteriorated most
+        """
+        from paidsearchnav_mcp.server import (
+            DailyPerformanceRequest,
+            get_daily_performance,
+        )
+
+        # Extract underlying function from FastMCP FunctionTool object
+        get_daily_performance_fn = (
+            get_daily_performance.fn
+            if hasattr(get_daily_performance, "fn")
+            else get_daily_performance
+        )
+
+        logger.info(f"Starting trend analysis for customer {customer_id}")
+
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+        days = (end - start).days + 1
+        if days < 2 * self.window:
+            return AnalysisSummary(
+                total_records_analyzed=0,
+                estimated_monthly_savings=0.0,
+                primary_issue=(
+                    f"Date range too short for trend analysis: {days} days, "
+                    f"need at least {2 * self.window}"
+                ),
+                top_recommendations=[],
+                implementation_steps=[
+                    f"Re-run with a date range of at least {2 * self.window} days"
+                ],
+                analysis_period=f"{start_date} to {end_date}",
+                customer_id=customer_id,
+            )
+
+        # One day-segmented fetch covers every entity
+        request = DailyPerformanceRequest(
+            customer_id=customer_id,
+            start_date=start_date,
+            end_date=end_date,
+            level=self.level,
+        )
+        result = await get_daily_performance_fn(request)
+        rows = result.get("data", [])
+        daily = MetricsFrame.from_records(rows, DAILY_FIELDS)
+
+        summary_key = self.cache_key(
+            customer_id, start_date, end_date, daily.fingerprint()
+        )
+        if cached := self.cached_summary(summary_key):
+            return cached
+
+        panel = DailyPanel.from_frame(daily, start, end, _METRICS)
+        logger.info(
+            f"Analyzing {len(daily)} entity-days across "
+            f"{len(panel.entities)} {self.level.lower()}s"
+        )
+
+        # Trailing window sums: the last row is the latest window and the
+        # row one window earlier is the window before it
+        latest, previous = -1, -1 - self.window
+        windows = {name: rolling_sum(panel[name], self.window) for name in _METRICS}
+        cost = windows["cost"][[previous, latest]]
+        conversions = windows["conversions"][[previous, latest]]
+        value = windows["conversion_value"][[previous, latest]]
+        cpa = ratio(cost, conversions)
+        roas = ratio(value, cost)
+
+        # Spend in the latest window beyond what its conversions would have
+        # cost at the previous window's CPA
+        excess = np.where(
+            np.isnan(cpa[0]), 0.0, cost[1] - conversions[1] * np.nan_to_num(cpa[0])
+        )
+
+        # Step changes in daily conversions that started in the latest
+        # two windows
+        conversion_shift = change_points(panel["conversions"])
+        cost_shift = change_points(panel["cost"])
+        recent = conversion_shift.index >= len(panel) - 2 * self.window
+        conversion_drop = recent & (conversion_shift.score <= -self.min_change_score)
+
+        spent = cost.sum(axis=0) >= self.min_cost
+        worse = excess > self.performance_threshold * cost[1]
+        flagged = np.flatnonzero(spent & (excess > 0) & (worse | conversion_drop))
+
+        entity_rows = self._entity_rows(daily)
+        monthly = 30 / self.window
+        top_10 = []
+        for i in flagged[top_k_indices(excess[flagged], 10)]:
+            row = entity_rows[panel.entities[i]]
+            recommendation = {
+                "entity": row["entity_name"] or panel.entities[i],
+                "entity_id": panel.entities[i],
+                "campaign": row["campaign_name"],
+                "level": self.level,
+                "cost": {"previous": float(cost[0, i]), "latest": float(cost[1, i])},
+                "conversions": {
+                    "previous": float(conversions[0, i]),
+                    "latest": float(conversions[1, i]),
+                },
+                "cpa": {"previous": _number(cpa[0, i]), "latest": _number(cpa[1, i])},
+                "roas": {
+                    "previous": _number(roas[0, i]),
+                    "latest": _number(roas[1, i]),
+                },
+                "estimated_savings": float(excess[i]) * monthly,
+            }
+            if conversion_drop[i]:
+                recommendation["change_point"] = {
+                    "metric": "conversions",
+                    "date": str(panel.days[conversion_shift.index[i]]),
+                    "daily_before": float(conversion_shift.before[i]),
+                    "daily_after": float(conversion_shift.after[i]),
+                }
+            recommendation.update(
+                self._diagnose(
+                    recommendation,
+                    cost_rose=bool(
+                        cost_shift.score[i] >= self.min_change_score
+                        and cost_shift.index[i] >= len(panel) - 2 * self.window
+                    ),
+                )
+            )
+            top_10.append(recommendation)
+
+        total_savings = sum(r["estimated_savings"] for r in top_10)
+
+        # Account-level week over week
+        account_cost = cost.sum(axis=1)
+        account_cpa = ratio(account_cost, conversions.sum(axis=1))
+        if not top_10:
+            primary_issue = (
+                f"No significant deterioration in the last {self.window} days"
+            )
+        elif not np.isnan(account_cpa).any() and account_cpa[1] > account_cpa[0]:
+            primary_issue = (
+                f"Account CPA rose {account_cpa[1] / account_cpa[0] - 1:.0%} in the "
+                f"last {self.window} days (${account_cpa[0]:.2f} -> "
+                f"${account_cpa[1]:.2f}); {len(flagged)} {self.level.lower()}s "
+                "deteriorated"
+            )
+        else:
+            primary_issue = (
+                f"{len(flagged)} {self.level.lower()}s deteriorated in the last "
+                f"{self.window} days: ${total_savings / monthly:,.2f} of extra spend"
+            )
+
+        logger.info(
+            f"Analysis complete: {len(top_10)} trend recommendations, "
+            f"${total_savings:,.2f} monthly savings"
+        )
+
+        summary = AnalysisSummary(
+            total_records_analyzed=len(daily),
+            estimated_monthly_savings=total_savings,
+            primary_issue=primary_issue,
+            top_recommendations=top_10,
+            implementation_steps=self._generate_implementation_steps(top_10),
+            analysis_period=f"{start_date} to {end_date}",
+            customer_id=customer_id,
+        )
+        return self.remember_summary(summary_key, summary)
+
+    @staticmethod
+    def _entity_rows(daily: MetricsFrame) -> dict[str, dict[str, str]]:
+        """Map each entity ID to the names on its last row."""
+        ids = daily["entity_id"]
+        names = daily["entity_name"].decode()
+        campaigns = daily["campaign_name"].decode()
+        return {
+            ids.values[code]: {"entity_name": name, "campaign_name": campaign}
+            for code, name, campaign in zip(
+                ids.codes.tolist(), names.tolist(), campaigns.tolist()
+            )
+        }
+
+    def _diagnose(
+        self, recommendation: dict[str, Any], cost_rose: bool
+    ) -> dict[str, str]:
+        """Choose an action and explanation for one deteriorating entity."""
+        cost = recommendation["cost"]
+        conversions = recommendation["conversions"]
+        cpa = recommendation["cpa"]
+        change = recommendation.get("change_point")
+
+        if conversions["latest"] == 0:
+            action = "Check conversion tracking and landing pages"
+            reasoning = (
+                f"${cost['latest']:,.2f} spent with 0 conversions in the last "
+                f"{self.window} days vs {conversions['previous']:g} before"
+            )
+        elif cost_rose:
+            action = "Review recent budget and bid changes"
+            reasoning = (
+                f"Spend rose to ${cost['latest']:,.2f} from ${cost['previous']:,.2f} "
+                f"while CPA went ${cpa['previous']:.2f} -> ${cpa['latest']:.2f}"
+            )
+        else:
+            action = "Review recent ad, keyword and targeting changes"
+            reasoning = (
+                f"CPA went ${cpa['previous']:.2f} -> ${cpa['latest']:.2f} on "
+                f"${cost['latest']:,.2f} of spend"
+            )
+        if change:
+            reasoning += (
+                f"; daily conversions dropped from {change['daily_before']:.1f} to "
+                f"{change['daily_after']:.1f} on {change['date']}"
+            )
+        return {
+            "action": action,
+            "reasoning": reasoning,
+            "metric": f"Extra spend: ${recommendation['estimated_savings']:,.2f}/month",
+        }
+
+    def _generate_implementation_steps(
+        self, top_recommendations: list[dict]
+    ) -> list[str]:
+        """Generate prioritized action steps."""
+        if not top_recommendations:
+            return ["No action needed - re-run after the next week of data"]
+
+        tracking = [r for r in top_recommendations if r["conversions"]["latest"] == 0]
+        changes = [r for r in top_recommendations if "change_point" in r]
+        return [
+            f"Day 1: Verify conversion tracking for {len(tracking)} "
+            f"{self.level.lower()}s with no recent conversions",
+            f"Day 2: Check the change history around the {len(changes)} "
+            "detected drop dates",
+            f"Week 1: Revert or fix the changes behind the top "
+            f"{len(top_recommendations)} deteriorations",
+            "Week 2: Re-run this analysis to confirm CPA has recovered",
+        ]
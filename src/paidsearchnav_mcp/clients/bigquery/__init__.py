@@ -1,9 +1,20 @@
 """BigQuery integration for PaidSearchNav premium analytics."""
 
 from paidsearchnav_mcp.clients.bigquery.client import BigQueryClient
+from paidsearchnav_mcp.clients.bigquery.jobs import JOB_MANAGER, AsyncJobManager
+from paidsearchnav_mcp.clients.bigquery.pool import (
+    BIGQUERY_CLIENTS,
+    BigQueryClientPool,
+    get_bigquery_client,
+)
 from paidsearchnav_mcp.clients.bigquery.validator import QueryValidator
 
 __all__ = [
+    "AsyncJobManager",
+    "BIGQUERY_CLIENTS",
     "BigQueryClient",
+    "BigQueryClientPool",
+    "JOB_MANAGER",
     "QueryValidator",
+    "get_bigquery_client",
 ]
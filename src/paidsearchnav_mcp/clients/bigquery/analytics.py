@@ -1,69 +1,123 @@
-"""BigQuery analytics engine - placeholder for future implementation."""
+"""BigQuery analytics engine.
+
+Queries are built through ``QueryPlanner`` so every scan is pruned to one
+customer's clustered blocks and a bounded date range, routed to the
+smallest rollup table that can answer it (see ``rollups``), and dry-run
+before it runs.
+"""
 
 import logging
+from datetime import date
 from typing import Any, Dict, List, Optional
 
+from .planner import QueryPlanner, ScanSource, date_window
+from .rollups import default_rollups
+
 logger = logging.getLogger(__name__)
 
+# Columns each analytics query groups or filters by, and the aggregates it
+# computes (for routing to rollup tables)
+SEARCH_TERMS_COLUMNS = frozenset(
+    {"customer_id", "date", "campaign_name", "search_term"}
+)
+SEARCH_TERMS_AGGREGATES = frozenset(
+    {
+        ("SUM", "impressions"),
+        ("SUM", "clicks"),
+        ("SUM", "cost"),
+        ("SUM", "conversions"),
+        ("AVG", "local_intent_score"),
+        ("AVG", "quality_score"),
+        ("COUNT", "*"),
+        ("MAX", "date"),
+    }
+)
+# Keyword recommendations filter raw rows (clicks > 0), so no rollup applies
+KEYWORDS_COLUMNS = frozenset(
+    {
+        "customer_id",
+        "date",
+        "campaign_name",
+        "keyword_text",
+        "cpc",
+        "clicks",
+        "cost",
+        "conversions",
+        "quality_score",
+    }
+)
+
 
 class BigQueryAnalyticsEngine:
     """Provides analytics capabilities using BigQuery SQL."""
 
-    def __init__(self, config, authenticator):
+    def __init__(self, config, authenticator, planner: QueryPlanner | None = None):
         """Initialize analytics engine."""
         self.config = config
         self.authenticator = authenticator
+        if planner is None:
+            planner = QueryPlanner(config.project_id, config.dataset_id)
+            for rollup in default_rollups():
+                planner.register_rollup(rollup)
+        self.planner = planner
 
     async def get_search_terms_insights(
         self,
         customer_id: str,
         date_range: int = 30,
         filters: Optional[Dict[str, Any]] = None,
+        end_date: Optional[date] = None,
     ) -> List[Dict[str, Any]]:
-        """Get search terms insights using BigQuery analytics."""
+        """Get search terms insights using BigQuery analytics.
+
+        Whole-week windows (Monday through Sunday, e.g. ``date_range=27``
+        ending on a Sunday) are answered from the weekly rollup.
+        """
 
         logger.info(f"Getting search terms insights for customer {customer_id}")
 
         try:
             client = await self.authenticator.get_client()
+            start_date, end_date = date_window(date_range, end_date)
 
             # Build the base query
-            query = f"""
+            def build(source: ScanSource) -> str:
+                query = f"""
             SELECT
                 search_term,
                 campaign_name,
-                SUM(impressions) as total_impressions,
-                SUM(clicks) as total_clicks,
-                SUM(cost) as total_cost,
-                SUM(conversions) as total_conversions,
-                AVG(local_intent_score) as avg_local_intent,
-                AVG(quality_score) as avg_quality_score,
+                {source.agg("SUM", "impressions")} as total_impressions,
+                {source.agg("SUM", "clicks")} as total_clicks,
+                {source.agg("SUM", "cost")} as total_cost,
+                {source.agg("SUM", "conversions")} as total_conversions,
+                {source.agg("AVG", "local_intent_score")} as avg_local_intent,
+                {source.agg("AVG", "quality_score")} as avg_quality_score,
                 CASE
-                    WHEN SUM(conversions) = 0 AND SUM(cost) > 50 THEN 'HIGH_PRIORITY_NEGATIVE'
-                    WHEN AVG(local_intent_score) < 0.3 THEN 'CONSIDER_NEGATIVE'
+                    WHEN {source.agg("SUM", "conversions")} = 0 AND {source.agg("SUM", "cost")} > 50 THEN 'HIGH_PRIORITY_NEGATIVE'
+                    WHEN {source.agg("AVG", "local_intent_score")} < 0.3 THEN 'CONSIDER_NEGATIVE'
                     ELSE 'KEEP_ACTIVE'
                 END as recommendation_type,
-                COUNT(*) as days_active,
-                MAX(date) as last_seen_date
-            FROM `{self.config.project_id}.{self.config.dataset_id}.search_terms`
-            WHERE customer_id = @customer_id
-                AND date >= DATE_SUB(CURRENT_DATE(), INTERVAL @date_range DAY)
+                {source.agg("COUNT")} as days_active,
+                {source.agg("MAX", "date")} as last_seen_date
+            FROM {source.table}
+            WHERE {source.filter}
             """
 
-            # Add filters if provided
-            if filters:
-                if filters.get("campaign_id"):
-                    query += " AND campaign_id = @campaign_id"
-                if filters.get("min_cost"):
-                    query += " AND cost >= @min_cost"
-                if filters.get("search_pattern"):
-                    query += " AND LOWER(search_term) LIKE LOWER(@search_pattern)"
+                # Add filters if provided
+                if filters:
+                    if filters.get("campaign_id"):
+                        query += " AND campaign_id = @campaign_id"
+                    if filters.get("min_cost"):
+                        query += " AND cost >= @min_cost"
+                    if filters.get("search_pattern"):
+                        query += " AND LOWER(search_term) LIKE LOWER(@search_pattern)"
 
-            query += """
+                query += """
             GROUP BY search_term, campaign_name
             ORDER BY total_cost DESC
             LIMIT 100
             """
+                return query
 
             # Configure query parameters
             from google.cloud import bigquery
@@ -71,21 +125,26 @@ class BigQueryAnalyticsEngine:
             job_config = bigquery.QueryJobConfig(
                 query_parameters=[
                     bigquery.ScalarQueryParameter("customer_id", "STRING", customer_id),
-                    bigquery.ScalarQueryParameter("date_range", "INT64", date_range),
+                    bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
+                    bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
                 ],
                 use_query_cache=self.config.enable_query_cache,
                 maximum_bytes_billed=self.config.max_query_bytes,
             )
 
             # Add filter parameters
+            columns = set(SEARCH_TERMS_COLUMNS)
             if filters:
                 if filters.get("campaign_id"):
+                    columns.add("campaign_id")
                     job_config.query_parameters.append(
                         bigquery.ScalarQueryParameter(
                             "campaign_id", "STRING", filters["campaign_id"]
                         )
                     )
                 if filters.get("min_cost"):
+                    # Filters raw rows, which rollups no longer have
+                    columns.add("cost")
                     job_config.query_parameters.append(
                         bigquery.ScalarQueryParameter(
                             "min_cost", "FLOAT64", filters["min_cost"]
@@ -98,8 +157,18 @@ class BigQueryAnalyticsEngine:
                         )
                     )
 
+            plan = await self.planner.plan(
+                client,
+                "search_terms",
+                build,
+                columns,
+                job_config,
+                aggregates=SEARCH_TERMS_AGGREGATES,
+                window=(start_date, end_date),
+            )
+
             # Execute query
-            query_job = client.query(query, job_config=job_config)
+            query_job = client.query(plan.query, job_config=job_config)
             results = query_job.result()
 
             # Convert results to list of dictionaries
@@ -136,7 +205,10 @@ class BigQueryAnalyticsEngine:
             return []
 
     async def get_keyword_bid_recommendations(
-        self, customer_id: str, performance_threshold: float = 0.02
+        self,
+        customer_id: str,
+        performance_threshold: float = 0.02,
+        date_range: int = 30,
     ) -> List[Dict[str, Any]]:
         """Get keyword bid recommendations using BigQuery analytics."""
 
@@ -144,9 +216,11 @@ class BigQueryAnalyticsEngine:
 
         try:
             client = await self.authenticator.get_client()
+            start_date, end_date = date_window(date_range)
 
             # Build query for keyword performance analysis
-            query = f"""
+            def build(source: ScanSource) -> str:
+                return f"""
             WITH keyword_performance AS (
                 SELECT
                     keyword_text,
@@ -158,9 +232,8 @@ class BigQueryAnalyticsEngine:
                     SUM(conversions) / NULLIF(SUM(clicks), 0) as conversion_rate,
                     AVG(quality_score) as avg_quality_score,
                     COUNT(DISTINCT date) as days_active
-                FROM `{self.config.project_id}.{self.config.dataset_id}.keywords`
-                WHERE customer_id = @customer_id
-                    AND date >= DATE_SUB(CURRENT_DATE(), INTERVAL 30 DAY)
+                FROM {source.table}
+                WHERE {source.filter}
                     AND clicks > 0
                 GROUP BY keyword_text, campaign_name
                 HAVING SUM(clicks) >= 10  -- Minimum clicks for reliable data
@@ -202,6 +275,8 @@ class BigQueryAnalyticsEngine:
             job_config = bigquery.QueryJobConfig(
                 query_parameters=[
                     bigquery.ScalarQueryParameter("customer_id", "STRING", customer_id),
+                    bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
+                    bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
                     bigquery.ScalarQueryParameter(
                         "performance_threshold", "FLOAT64", performance_threshold
                     ),
@@ -210,8 +285,12 @@ class BigQueryAnalyticsEngine:
                 maximum_bytes_billed=self.config.max_query_bytes,
             )
 
+            plan = await self.planner.plan(
+                client, "keywords", build, KEYWORDS_COLUMNS, job_config
+            )
+
             # Execute query
-            query_job = client.query(query, job_config=job_config)
+            query_job = client.query(plan.query, job_config=job_config)
             results = query_job.result()
 
             # Convert results to list of dictionaries
@@ -3,18 +3,58 @@ import logging
 import os
 
 from google.cloud import bigquery
-from google.oauth2 import service_account
+
+from paidsearchnav_mcp.clients.bigquery.jobs import JOB_MANAGER
+from paidsearchnav_mcp.clients.bigquery.pool import (
+    BIGQUERY_CLIENTS,
+    get_bigquery_client,
+)
+from paidsearchnav_mcp.clients.bigquery.results import (
+    ARROW_AVAILABLE,
+    QueryResult,
+    ResultPage,
+    read_result,
+)
+from paidsearchnav_mcp.core.tracing import start_span
 
 logger = logging.getLogger(__name__)
 
 
+def _record_job_attributes(span, query_job) -> None:
+    """Record BigQuery job statistics on a trace span."""
+    if span.is_recording():
+        span.set_attributes(
+            {
+                "job_id": query_job.job_id,
+                "bytes_processed": query_job.total_bytes_processed,
+                "bytes_billed": query_job.total_bytes_billed,
+                "cache_hit": query_job.cache_hit,
+            }
+        )
+
+
 class BigQueryClient:
     """Client for executing BigQuery queries."""
 
     def __init__(
-        self, project_id: str | None = None, credentials_path: str | None = None
+        self,
+        project_id: str | None = None,
+        credentials_path: str | None = None,
+        use_arrow: bool | None = None,
     ):
-        """Initialize BigQuery client with service account credentials."""
+        """Initialize BigQuery client with service account credentials.
+
+        The underlying ``bigquery.Client`` comes from the process-wide pool,
+        so constructing this wrapper per request is cheap.
+
+        Args:
+            project_id: GCP project ID (default: ``GCP_PROJECT_ID``)
+            credentials_path: Service account file (default:
+                ``GOOGLE_APPLICATION_CREDENTIALS``, then application default
+                credentials)
+            use_arrow: Read results as Arrow (default: when pyarrow is
+                installed)
+        """
         self.project_id = project_id or os.getenv("GCP_PROJECT_ID")
 
         if not self.project_id:
@@ -22,17 +62,61 @@ class BigQueryClient:
                 "project_id must be provided or GCP_PROJECT_ID environment variable must be set"
             )
 
-        if credentials_path or os.getenv("GOOGLE_APPLICATION_CREDENTIALS"):
-            cred_path = credentials_path or os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-            credentials = service_account.Credentials.from_service_account_file(
-                cred_path
-            )
-            self.client = bigquery.Client(
-                project=self.project_id, credentials=credentials
-            )
-        else:
-            # Use application default credentials
-            self.client = bigquery.Client(project=self.project_id)
+        # Falls back to application default credentials when no file is set
+        self.client = get_bigquery_client(
+            self.project_id,
+            credentials_path or os.getenv("GOOGLE_APPLICATION_CREDENTIALS"),
+        )
+        self.use_arrow = ARROW_AVAILABLE if use_arrow is None else use_arrow
+
+    async def fetch_results(
+        self,
+        query: str,
+        max_results: int | None = 10000,
+        timeout: int = 300,
+        job_config: bigquery.QueryJobConfig | None = None,
+    ) -> QueryResult:
+        """
+        Execute a SQL query and return its rows in columnar form.
+
+        Rows are streamed over the Storage Read API when it is installed and
+        kept as an Arrow table; call ``to_rows()`` on the result to build a
+        response.
+
+        Args:
+            query: SQL query to execute
+            max_results: Maximum number of rows to read (None for all)
+            timeout: Query timeout in seconds (default 300 = 5 minutes)
+            job_config: Optional job configuration (e.g. a
+                ``maximum_bytes_billed`` cap)
+
+        Returns:
+            QueryResult with at most ``max_results`` rows
+
+        Raises:
+            TimeoutError: If query exceeds timeout
+            ValueError: If query is invalid
+        """
+
+        def _fetch_results():
+            with start_span("bigquery.query", {"project_id": self.project_id}) as span:
+                query_job = self.client.query(
+                    query, job_config=job_config, timeout=timeout
+                )
+                result = read_result(
+                    query_job.result(),
+                    max_results,
+                    read_client=BIGQUERY_CLIENTS.read_client(self.client)
+                    if self.use_arrow
+                    else None,
+                    use_arrow=self.use_arrow,
+                )
+                _record_job_attributes(span, query_job)
+                span.set_attributes({"rows": result.num_rows, "arrow": result.is_arrow})
+            result.job = query_job
+            return result
+
+        return await asyncio.to_thread(_fetch_results)
 
     async def execute_query(
         self, query: str, max_results: int = 10000, timeout: int = 300
@@ -46,26 +130,115 @@ class BigQueryClient:
             timeout: Query timeout in seconds (default 300 = 5 minutes)
 
         Returns:
-            List of dictionaries representing query results
+            List of JSON-serializable dictionaries representing query results
 
         Raises:
             TimeoutError: If query exceeds timeout
             ValueError: If query is invalid
         """
+        result = await self.fetch_results(query, max_results, timeout)
+        return result.to_rows()
+
+    async def query_pages(
+        self,
+        query: str,
+        page_size: int = 1000,
+        timeout: int = 300,
+        job_config: bigquery.QueryJobConfig | None = None,
+    ) -> ResultPage:
+        """
+        Execute a SQL query and return the first page of its results.
 
-        def _execute_query():
-            query_job = self.client.query(query, timeout=timeout)
-            results = []
-            for i, row in enumerate(query_job.result()):
-                if i >= max_results:
-                    logger.warning(
-                        f"Query exceeded max_results ({max_results}), truncating results"
-                    )
-                    break
-                results.append(dict(row))
-            return results
+        The rows stay in the job's destination table; pass the returned job
+        ID and page token to ``fetch_page`` to read further pages without
+        running (and paying for) the query again.
 
-        return await asyncio.to_thread(_execute_query)
+        Args:
+            query: SQL query to execute
+            page_size: Rows per page
+            timeout: Query timeout in seconds (default 300 = 5 minutes)
+            job_config: Optional job configuration
+
+        Returns:
+            First ResultPage of the finished job
+
+        Raises:
+            TimeoutError: If query exceeds timeout
+            ValueError: If the query failed
+        """
+        with start_span("bigquery.query", {"project_id": self.project_id}) as span:
+            query_job = await JOB_MANAGER.submit(
+                self.client, query, job_config=job_config, timeout=timeout
+            )
+            try:
+                await JOB_MANAGER.wait(query_job, timeout, poll_interval=1)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"Query timed out after {timeout} seconds")
+            _record_job_attributes(span, query_job)
+
+        page = await asyncio.to_thread(self._read_page, query_job, None, page_size)
+        page.result.job = query_job
+        return page
+
+    async def fetch_page(
+        self,
+        job_id: str,
+        page_token: str | None = None,
+        page_size: int = 1000,
+        location: str | None = None,
+    ) -> ResultPage:
+        """
+        Read a page of a finished query job's results.
+
+        Only the job's destination table is read; the query is not run
+        again. BigQuery keeps query results for about 24 hours.
+
+        Args:
+            job_id: ID of a query job started by ``query_pages``
+            page_token: Token from the previous page (None for the first)
+            page_size: Rows per page
+            location: Location of the job
+
+        Returns:
+            The requested ResultPage
+
+        Raises:
+            ValueError: If the job is not a finished, successful query
+        """
+
+        def _fetch_page():
+            with start_span(
+                "bigquery.list_rows",
+                {"project_id": self.project_id, "job_id": job_id},
+            ):
+                job = self.client.get_job(job_id, location=location)
+                if job.job_type != "query":
+                    raise ValueError(f"Job {job_id} is not a query job")
+                if not job.done():
+                    raise ValueError(f"Job {job_id} is still running")
+                return self._read_page(job, page_token, page_size)
+
+        return await asyncio.to_thread(_fetch_page)
+
+    def _read_page(
+        self, query_job, page_token: str | None, page_size: int
+    ) -> ResultPage:
+        """Read one page of a finished job's destination table (blocking)."""
+        if query_job.error_result:
+            raise ValueError(f"Query failed: {query_job.error_result}")
+
+        rows = self.client.list_rows(
+            query_job.destination, page_token=page_token, page_size=page_size
+        )
+        page = next(rows.pages, None)
+        records = [dict(row) for row in page] if page is not None else []
+        return ResultPage(
+            result=QueryResult(rows=records),
+            job_id=query_job.job_id,
+            location=query_job.location,
+            next_page_token=rows.next_page_token,
+            total_rows=rows.total_rows,
+        )
 
     async def get_table_schema(self, dataset_id: str, table_id: str) -> dict:
         """Get schema information for a table.
@@ -107,7 +280,8 @@ class BigQueryClient:
             query: SQL query to estimate
 
         Returns:
-            Dictionary with bytes processed, cost estimate, and cache status
+            Dictionary with bytes processed, cost estimate, cache status and
+            the tables the query reads
 
         Note:
             Cost calculation based on BigQuery pricing as of January 2025:
@@ -117,7 +291,11 @@ class BigQueryClient:
         def _estimate_cost():
             # Create a dry run job
             job_config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
-            query_job = self.client.query(query, job_config=job_config)
+            with start_span(
+                "bigquery.dry_run", {"project_id": self.project_id}
+            ) as span:
+                query_job = self.client.query(query, job_config=job_config)
+                _record_job_attributes(span, query_job)
 
             # Calculate cost ($6.25 per TB as of January 2025)
             # See: https://cloud.google.com/bigquery/pricing#on_demand_pricing
@@ -130,6 +308,32 @@ class BigQueryClient:
                 "bytes_billed": query_job.total_bytes_billed,
                 "estimated_cost_usd": round(estimated_cost, 4),
                 "is_cached": bytes_processed == 0,  # Cached queries are free
+                "referenced_tables": [
+                    f"{table.project}.{table.dataset_id}.{table.table_id}"
+                    for table in query_job.referenced_tables
+                ],
             }
 
         return await asyncio.to_thread(_estimate_cost)
+
+    async def table_versions(self, tables: list[str]) -> dict[str, str | None]:
+        """Get the last-modified time of each table.
+
+        Args:
+            tables: Fully qualified table IDs (``project.dataset.table``)
+
+        Returns:
+            ISO 8601 modification time by table ID; None if unknown or if the
+            table has a streaming buffer, whose rows arrive without changing
+            it (BigQuery's own result cache skips such tables too)
+        """
+
+        def _get_versions():
+            versions = {}
+            for table_id in tables:
+                table = self.client.get_table(table_id)
+                modified = None if table.streaming_buffer else table.modified
+                versions[table_id] = modified.isoformat() if modified else None
+            return versions
+
+        return await asyncio.to_thread(_get_versions)
@@ -0,0 +1,188 @@
+"""Dry-run cost gate and result cache keys for ad-hoc BigQuery queries.
+
+Every ad-hoc query is dry-run first (free) to learn how many bytes it
+would scan and which tables it reads:
+
+- ``QueryCostGate`` rejects queries above a byte budget unless the caller
+  confirms the cost, and asks ``CustomerCostTracker`` whether the
+  customer's daily budget allows the estimated spend. Queries that pass
+  run with ``maximum_bytes_billed`` set, so BigQuery itself refuses to
+  bill more than was approved.
+- ``result_cache_params`` builds a cache key from the normalized SQL and
+  the last-modified time of every referenced table, so a repeated query
+  is answered from cache until one of its tables changes.
+"""
+
+import logging
+import os
+import re
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Per-query scan budget when none is configured for the customer (10 GiB)
+DEFAULT_MAX_BYTES = 10 * 1024**3
+
+# String literals and quoted identifiers, or runs of comments and whitespace
+_SQL_TOKENS = re.compile(
+    r"""
+    (?P<literal>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`)
+    | (?P<gap>(?:\s+|--[^\n]*|\#[^\n]*|/\*.*?\*/)+)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Functions whose result changes between runs; BigQuery's own result cache
+# skips these queries too
+_NON_DETERMINISTIC = re.compile(
+    r"\b(CURRENT_(DATE|DATETIME|TIME|TIMESTAMP)|NOW|RAND|GENERATE_UUID|"
+    r"SESSION_USER)\s*\(",
+    re.IGNORECASE,
+)
+
+
+class QueryCostError(Exception):
+    """A query was refused by the cost gate.
+
+    Attributes:
+        bytes_processed: Bytes the dry run estimated the query would scan
+        max_bytes: Byte budget that applied
+        estimated_cost_usd: Estimated on-demand cost
+        requires_confirmation: Whether re-running with confirmation would
+            let the query through (False when a budget is exhausted)
+    """
+
+    def __init__(
+        self,
+        message: str,
+        bytes_processed: int,
+        max_bytes: int,
+        estimated_cost_usd: float,
+        requires_confirmation: bool,
+    ):
+        super().__init__(message)
+        self.bytes_processed = bytes_processed
+        self.max_bytes = max_bytes
+        self.estimated_cost_usd = estimated_cost_usd
+        self.requires_confirmation = requires_confirmation
+
+
+def normalize_sql(query: str) -> str:
+    """Normalize SQL for cache keys.
+
+    Comments are dropped, whitespace outside literals is collapsed and
+    trailing semicolons are removed. String literals and quoted identifiers
+    are kept verbatim, so queries that differ only in a literal never share
+    a key.
+    """
+
+    def _replace(match: re.Match) -> str:
+        if match.group("literal"):
+            return match.group("literal")
+        return " "
+
+    return _SQL_TOKENS.sub(_replace, query).strip().rstrip("; ")
+
+
+def is_cacheable(query: str) -> bool:
+    """Whether a query's results depend only on its tables' contents."""
+    return not _NON_DETERMINISTIC.search(normalize_sql(query))
+
+
+def result_cache_params(
+    project_id: str, query: str, table_versions: dict[str, str | None]
+) -> dict[str, Any]:
+    """Cache key parameters for a query's results.
+
+    Args:
+        project_id: Project the query runs in
+        query: SQL query
+        table_versions: Last-modified time of each referenced table
+
+    Returns:
+        Parameters for ``CacheClient._make_key``
+    """
+    return {
+        "project_id": project_id,
+        "sql": normalize_sql(query),
+        "tables": sorted(table_versions.items()),
+    }
+
+
+class QueryCostGate:
+    """Refuses ad-hoc queries that would scan more than the budget allows."""
+
+    def __init__(self, max_bytes: int | None = None, cost_tracker: Any = None):
+        """Initialize the gate.
+
+        Args:
+            max_bytes: Per-query scan budget (default:
+                ``PSN_BIGQUERY_MAX_BYTES_PER_QUERY`` or 10 GiB)
+            cost_tracker: Optional ``CustomerCostTracker`` supplying
+                per-customer byte budgets and daily budget enforcement
+        """
+        self.max_bytes = max_bytes or int(
+            os.getenv("PSN_BIGQUERY_MAX_BYTES_PER_QUERY", DEFAULT_MAX_BYTES)
+        )
+        self.cost_tracker = cost_tracker
+
+    def byte_budget(self, customer_id: str | None = None) -> int:
+        """Per-query scan budget for a customer."""
+        if self.cost_tracker is not None and customer_id:
+            return self.cost_tracker.get_query_byte_budget(customer_id, self.max_bytes)
+        return self.max_bytes
+
+    async def check(
+        self,
+        estimate: dict[str, Any],
+        customer_id: str | None = None,
+        confirmed: bool = False,
+    ) -> int | None:
+        """Check a dry-run estimate against the budgets.
+
+        Args:
+            estimate: Result of ``BigQueryClient.estimate_query_cost``
+            customer_id: Customer the query is run for
+            confirmed: Whether the caller accepted a cost above the byte
+                budget
+
+        Returns:
+            ``maximum_bytes_billed`` to run the query with, or None for no
+            cap (confirmed queries)
+
+        Raises:
+            QueryCostError: If the query is over budget
+        """
+        bytes_processed = estimate["bytes_processed"] or 0
+        cost_usd = estimate["estimated_cost_usd"]
+        max_bytes = self.byte_budget(customer_id)
+
+        if self.cost_tracker is not None and customer_id:
+            enforcement = await self.cost_tracker.check_enhanced_budget_enforcement(
+                customer_id, cost_usd
+            )
+            if not enforcement.get("allowed", True):
+                raise QueryCostError(
+                    f"Customer budget exceeded: {enforcement.get('reason')}",
+                    bytes_processed,
+                    max_bytes,
+                    cost_usd,
+                    requires_confirmation=False,
+                )
+
+        if bytes_processed <= max_bytes:
+            return max_bytes
+        if confirmed:
+            logger.info(
+                f"Running confirmed query over budget: {bytes_processed} bytes "
+                f"(budget {max_bytes}), estimated ${cost_usd:.4f}"
+            )
+            return None
+        raise QueryCostError(
+            f"Query would process {bytes_processed / 1024**3:.2f} GiB "
+            f"(budget {max_bytes / 1024**3:.2f} GiB, estimated ${cost_usd:.4f})",
+            bytes_processed,
+            max_bytes,
+            cost_usd,
+            requires_confirmation=True,
+        )
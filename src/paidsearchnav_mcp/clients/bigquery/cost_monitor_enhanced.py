@@ -2,6 +2,7 @@
 
 import logging
 from datetime import date, datetime, timedelta
+from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from google.cloud import bigquery
@@ -15,13 +16,14 @@ except ImportError:
     AlertManager = None
     get_alert_manager = None
 
-    class AlertPriority:
+    # Enums so pydantic models below can still validate these fields
+    class AlertPriority(str, Enum):
         CRITICAL = "critical"
         HIGH = "high"
         MEDIUM = "medium"
         LOW = "low"
 
-    class AlertType:
+    class AlertType(str, Enum):
         WARNING = "warning"
         SYSTEM = "system"
         INFO = "info"
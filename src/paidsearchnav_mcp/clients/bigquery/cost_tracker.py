@@ -20,6 +20,8 @@ class CustomerCostTracker:
         self.database_url = database_url
         self.cost_records = []  # Fallback in-memory storage
         self._use_database = database_url is not None
+        # Per-query scan limits for ad-hoc queries, by customer
+        self._query_byte_budgets: Dict[str, int] = {}
 
         # Initialize enhanced cost monitor for advanced features
         self._enhanced_monitor = EnhancedBigQueryCostMonitor(config, authenticator)
@@ -33,12 +35,14 @@ class CustomerCostTracker:
             # Wait for job completion to get actual costs
             query_job.result()
 
-            # Get actual resource usage
+            # Get actual resource usage; on-demand queries are billed on
+            # bytes billed, which rounds bytes processed up
             bytes_processed = query_job.total_bytes_processed or 0
+            bytes_billed = query_job.total_bytes_billed or bytes_processed
             slot_millis = query_job.slot_millis or 0
 
             # Calculate costs based on BigQuery pricing
-            query_cost_usd = self._calculate_query_cost(bytes_processed)
+            query_cost_usd = self._calculate_query_cost(bytes_billed)
             slot_cost_usd = self._calculate_slot_cost(slot_millis)
             total_cost_usd = query_cost_usd + slot_cost_usd
 
@@ -49,6 +53,7 @@ class CustomerCostTracker:
                 "timestamp": datetime.utcnow(),
                 "analyzer_type": analyzer_type,
                 "bytes_processed": bytes_processed,
+                "bytes_billed": bytes_billed,
                 "slot_millis": slot_millis,
                 "query_cost_usd": float(query_cost_usd),
                 "slot_cost_usd": float(slot_cost_usd),
@@ -89,17 +94,38 @@ class CustomerCostTracker:
             return {"customer_id": customer_id, "error": str(e), "total_cost_usd": 0.0}
 
     async def track_streaming_insert(
-        self, customer_id: str, table_name: str, data: List[Dict[str, Any]]
+        self,
+        customer_id: str,
+        table_name: str,
+        data: List[Dict[str, Any]],
+        bytes_inserted: Optional[int] = None,
+        storage_write_api: bool = False,
     ) -> Dict[str, Any]:
-        """Track costs for streaming data inserts."""
+        """Track costs for streaming data inserts.
+
+        Args:
+            customer_id: Customer the rows belong to
+            table_name: Destination table
+            data: Inserted rows
+            bytes_inserted: Bytes sent, when known (estimated from the rows
+                otherwise)
+            storage_write_api: Whether the rows went through the Storage
+                Write API, which is priced per GB ingested
+        """
 
         try:
             # Estimate data size
-            estimated_bytes = sum(len(str(row).encode("utf-8")) for row in data)
+            estimated_bytes = bytes_inserted
+            if estimated_bytes is None:
+                estimated_bytes = sum(len(str(row).encode("utf-8")) for row in data)
             estimated_mb = estimated_bytes / (1024 * 1024)
 
-            # Calculate streaming insert costs ($0.05 per 200MB)
-            streaming_cost_usd = (estimated_mb / 200) * 0.05
+            if storage_write_api:
+                # Storage Write API ingestion ($0.025 per GB)
+                streaming_cost_usd = estimated_bytes / (1024**3) * 0.025
+            else:
+                # Calculate streaming insert costs ($0.05 per 200MB)
+                streaming_cost_usd = (estimated_mb / 200) * 0.05
 
             # Estimate storage costs ($0.02 per GB per month)
             estimated_gb = estimated_bytes / (1024**3)
@@ -109,7 +135,9 @@ class CustomerCostTracker:
                 "customer_id": customer_id,
                 "table_name": table_name,
                 "timestamp": datetime.utcnow(),
-                "operation_type": "streaming_insert",
+                "operation_type": "storage_write"
+                if storage_write_api
+                else "streaming_insert",
                 "rows_inserted": len(data),
                 "bytes_inserted": estimated_bytes,
                 "streaming_cost_usd": float(streaming_cost_usd),
@@ -304,6 +332,16 @@ class CustomerCostTracker:
 
         return budget_config
 
+    def set_query_byte_budget(self, customer_id: str, max_bytes: int) -> None:
+        """Set the most bytes one ad-hoc query may scan for a customer."""
+        if max_bytes <= 0:
+            raise ValueError("Query byte budget must be positive")
+        self._query_byte_budgets[customer_id] = max_bytes
+
+    def get_query_byte_budget(self, customer_id: str, default: int) -> int:
+        """Get a customer's per-query scan budget, or ``default`` if unset."""
+        return self._query_byte_budgets.get(customer_id, default)
+
     def _calculate_query_cost(self, bytes_processed: int) -> Decimal:
         """Calculate query cost based on bytes processed."""
         tb_processed = Decimal(bytes_processed) / Decimal(1024**4)
@@ -12,7 +12,8 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 from google.cloud import bigquery
-from google.oauth2 import service_account
+
+from paidsearchnav_mcp.clients.bigquery.pool import get_bigquery_client
 
 logger = logging.getLogger(__name__)
 
@@ -72,17 +73,11 @@ class CustomerRegistry:
                 "Do not reuse GCP_PROJECT_ID to avoid ambiguity."
             )
 
-        # Initialize BigQuery client for registry access
-        if credentials_path or os.getenv("GOOGLE_APPLICATION_CREDENTIALS"):
-            cred_path = credentials_path or os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-            credentials = service_account.Credentials.from_service_account_file(
-                cred_path
-            )
-            self.client = bigquery.Client(
-                project=self.registry_project, credentials=credentials
-            )
-        else:
-            self.client = bigquery.Client(project=self.registry_project)
+        # Shared BigQuery client for registry access
+        self.client = get_bigquery_client(
+            self.registry_project,
+            credentials_path or os.getenv("GOOGLE_APPLICATION_CREDENTIALS"),
+        )
 
         # Cache for customer configs with TTL - using OrderedDict for LRU eviction
         self._cache: OrderedDict[str, CachedConfig] = OrderedDict()
@@ -0,0 +1,216 @@
+"""Non-blocking BigQuery job submission and polling.
+
+The google-cloud-bigquery job methods (``Client.query``, ``QueryJob.done``,
+``QueryJob.cancel``...) are blocking HTTP calls. ``AsyncJobManager`` runs
+them in worker threads so the event loop keeps serving other requests,
+and polls every job waiting in the process from one task:
+
+- each job keeps its own poll schedule: a few fast polls at the
+  configured interval, then exponential backoff up to ``max_interval``
+- jobs due at the same time are polled concurrently, one thread each
+- a waiter that times out or is cancelled (e.g. because the MCP client
+  disconnected) stops being polled and its BigQuery job is cancelled, so
+  abandoned queries do not keep running and billing
+"""
+
+import asyncio
+import itertools
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Polls at the configured interval before backing off
+FAST_POLLS = 3
+# Longest wait between two polls of one job (seconds)
+MAX_POLL_INTERVAL = 30.0
+
+
+@dataclass
+class _PendingJob:
+    """A job being waited on and its poll schedule."""
+
+    job: Any
+    future: asyncio.Future
+    interval: float
+    next_poll: float
+    polls: int = 0
+
+
+def backoff_interval(
+    polls: int, interval: float, max_interval: float = MAX_POLL_INTERVAL
+) -> float:
+    """Seconds to wait after a job's ``polls``-th unfinished poll.
+
+    Args:
+        polls: Polls made so far (1 after the first)
+        interval: Base poll interval
+        max_interval: Upper bound
+
+    Returns:
+        ``interval`` for the first ``FAST_POLLS`` polls, then doubling
+    """
+    if polls <= FAST_POLLS:
+        return interval
+    return min(interval * 2 ** (polls - FAST_POLLS), max_interval)
+
+
+class AsyncJobManager:
+    """Submits BigQuery jobs and waits for them without blocking the loop."""
+
+    def __init__(self, max_interval: float = MAX_POLL_INTERVAL):
+        """Initialize the manager.
+
+        Args:
+            max_interval: Longest wait between two polls of one job (seconds)
+        """
+        self.max_interval = max_interval
+        self._pending: dict[int, _PendingJob] = {}
+        self._ids = itertools.count()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._poller: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+        # Keeps fire-and-forget cancellations alive until they finish
+        self._cancellations: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        """Jobs currently being polled."""
+        return len(self._pending)
+
+    async def submit(
+        self, client: Any, query: str, job_config: Any = None, **kwargs: Any
+    ) -> Any:
+        """Start a query job in a worker thread.
+
+        Args:
+            client: ``bigquery.Client``
+            query: SQL query
+            job_config: Optional ``QueryJobConfig``
+            **kwargs: Passed through to ``Client.query``
+
+        Returns:
+            The started ``QueryJob``
+        """
+        return await asyncio.to_thread(
+            client.query, query, job_config=job_config, **kwargs
+        )
+
+    async def wait(self, job: Any, timeout: float, poll_interval: float) -> Any:
+        """Wait for a job to finish.
+
+        Args:
+            job: Started BigQuery job (query, extract, load...)
+            timeout: Seconds to wait before cancelling the job
+            poll_interval: Seconds between the first few polls
+
+        Returns:
+            The finished job (check ``error_result`` for failures)
+
+        Raises:
+            asyncio.TimeoutError: If the job did not finish in ``timeout``;
+                the job has been asked to cancel
+            asyncio.CancelledError: If the waiter was cancelled; the job has
+                been asked to cancel
+        """
+        loop = asyncio.get_running_loop()
+        self._bind(loop)
+
+        key = next(self._ids)
+        future = loop.create_future()
+        # First poll right away: cached and tiny queries finish on submit
+        self._pending[key] = _PendingJob(job, future, poll_interval, loop.time())
+        self._ensure_poller()
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self._pending.pop(key, None)
+            await asyncio.shield(self._cancel_job(job))
+            raise
+        except asyncio.CancelledError:
+            # Don't hold up the cancelled caller; the job cancels in the
+            # background
+            self._pending.pop(key, None)
+            self._cancel_job(job)
+            raise
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Reset polling state when first used from a new event loop."""
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending.clear()
+            self._poller = None
+            self._wakeup = asyncio.Event()
+
+    def _ensure_poller(self) -> None:
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.get_running_loop().create_task(self._poll())
+        else:
+            # Let the poller pick up the new job's earlier deadline
+            self._wakeup.set()
+
+    async def _poll(self) -> None:
+        """Poll due jobs until none are pending."""
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            now = loop.time()
+            due = [
+                (key, pending)
+                for key, pending in self._pending.items()
+                if pending.next_poll <= now
+            ]
+            if due:
+                # QueryJob.done() reloads the job state when it is not done
+                results = await asyncio.gather(
+                    *(asyncio.to_thread(pending.job.done) for _, pending in due),
+                    return_exceptions=True,
+                )
+                for (key, pending), result in zip(due, results):
+                    self._record_poll(key, pending, result, loop.time())
+
+            if self._pending:
+                delay = min(p.next_poll for p in self._pending.values()) - loop.time()
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), max(delay, 0))
+                except asyncio.TimeoutError:
+                    pass
+
+    def _record_poll(
+        self, key: int, pending: _PendingJob, result: Any, now: float
+    ) -> None:
+        """Resolve a polled job's waiter or schedule its next poll."""
+        if pending.future.done():
+            # Waiter timed out or was cancelled while the poll ran
+            self._pending.pop(key, None)
+        elif isinstance(result, BaseException):
+            self._pending.pop(key, None)
+            pending.future.set_exception(result)
+        elif result:
+            self._pending.pop(key, None)
+            pending.future.set_result(pending.job)
+        else:
+            pending.polls += 1
+            pending.next_poll = now + backoff_interval(
+                pending.polls, pending.interval, self.max_interval
+            )
+
+    def _cancel_job(self, job: Any) -> asyncio.Task:
+        """Ask BigQuery to cancel a job in a worker thread."""
+
+        def _cancel():
+            try:
+                job.cancel()
+                logger.info(f"Cancelled BigQuery job {job.job_id}")
+            except Exception as e:
+                logger.warning(f"Failed to cancel BigQuery job: {e}")
+
+        task = asyncio.get_running_loop().create_task(asyncio.to_thread(_cancel))
+        self._cancellations.add(task)
+        task.add_done_callback(self._cancellations.discard)
+        return task
+
+
+JOB_MANAGER = AsyncJobManager()
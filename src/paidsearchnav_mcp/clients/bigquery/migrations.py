@@ -4,13 +4,119 @@ This module provides tools to create and manage BigQuery tables with proper
 partitioning, clustering, and optimization for all analyzer data.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
-
-from paidsearchnav_mcp.platforms.bigquery.schema import BigQueryTableSchema
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from paidsearchnav_mcp.clients.bigquery.jobs import JOB_MANAGER
+from paidsearchnav_mcp.clients.bigquery.rollups import (
+    REFRESH_BATCH_PARTITIONS,
+    RollupDefinition,
+    SourceState,
+    record_watermarks_sql,
+    refresh_state_create_sql,
+    rollup_definitions,
+    stale_partitions,
+)
+from paidsearchnav_mcp.clients.bigquery.schema import BigQueryTableSchema
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for a rollup DDL or MERGE job
+ROLLUP_JOB_TIMEOUT = 1800
+
+# Tables created, altered or validated at once
+MIGRATION_CONCURRENCY = 8
+
+# Legacy SchemaField types as INFORMATION_SCHEMA.COLUMNS reports them
+_SQL_TYPES = {
+    "INTEGER": "INT64",
+    "FLOAT": "FLOAT64",
+    "BOOLEAN": "BOOL",
+    "RECORD": "STRUCT",
+}
+
+
+def _column_type(schema_field) -> str:
+    """The INFORMATION_SCHEMA ``data_type`` of a SchemaField."""
+    field_type = schema_field.field_type.upper()
+    base = _SQL_TYPES.get(field_type, field_type)
+    return f"ARRAY<{base}>" if schema_field.mode == "REPEATED" else base
+
+
+def _same_type(expected: str, actual: str) -> bool:
+    """Compare types, ignoring parameters like STRING(10) and STRUCT fields."""
+    actual = re.sub(r"\([^)]*\)", "", actual.upper())
+    if "STRUCT" in expected:
+        return actual.startswith(expected.rstrip(">"))
+    return actual == expected
+
+
+@dataclass
+class TableChange:
+    """A change needed to bring one table in line with its desired schema.
+
+    ``action`` is ``create``, ``alter`` (add nullable columns and/or update
+    clustering in place) or ``incompatible`` (needs ``recreate_table``).
+    """
+
+    table: str
+    action: str
+    add_columns: List[Any] = field(default_factory=list)
+    cluster_fields: Optional[List[str]] = None
+    problems: List[str] = field(default_factory=list)
+
+    def describe(self) -> str:
+        """One line summary for the plan report."""
+        if self.action == "create":
+            return f"CREATE {self.table}"
+        if self.action == "incompatible":
+            return f"INCOMPATIBLE {self.table}: {'; '.join(self.problems)}"
+        parts = []
+        if self.add_columns:
+            names = ", ".join(f.name for f in self.add_columns)
+            parts.append(f"add columns {names}")
+        if self.cluster_fields is not None:
+            parts.append(f"cluster by {', '.join(self.cluster_fields) or 'nothing'}")
+        return f"ALTER {self.table}: {'; '.join(parts)}"
+
+
+@dataclass
+class MigrationPlan:
+    """Differences between the desired schemas and the live dataset."""
+
+    changes: List[TableChange] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+
+    def by_action(self, action: str) -> List[TableChange]:
+        """Changes with the given action."""
+        return [c for c in self.changes if c.action == action]
+
+    @property
+    def applicable(self) -> List[TableChange]:
+        """Changes ``apply_migrations`` can make without dropping data."""
+        return [c for c in self.changes if c.action != "incompatible"]
+
+    def describe(self) -> List[str]:
+        """Plan report, one line per change."""
+        return [change.describe() for change in self.changes]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plan as a JSON-serializable dictionary."""
+        return {
+            "create": [c.table for c in self.by_action("create")],
+            "alter": {c.table: c.describe() for c in self.by_action("alter")},
+            "incompatible": {
+                c.table: c.problems for c in self.by_action("incompatible")
+            },
+            "unchanged": self.unchanged,
+            "skipped": self.skipped,
+        }
+
 
 class BigQueryMigrations:
     """Handles BigQuery table creation and schema migrations."""
@@ -105,7 +211,7 @@ class BigQueryMigrations:
                 logger.info(f"Configured clustering on fields: {cluster_fields}")
 
             # Create the table
-            table = client.create_table(table, exists_ok=True)
+            table = await asyncio.to_thread(client.create_table, table, exists_ok=True)
             logger.info(f"Created table {table_id}")
             return True
 
@@ -113,8 +219,15 @@ class BigQueryMigrations:
             logger.error(f"Failed to create table {table_name}: {e}")
             return False
 
-    async def create_all_tables(self) -> Dict[str, bool]:
-        """Create all analyzer tables with proper optimization."""
+    async def create_all_tables(
+        self, max_concurrency: int = MIGRATION_CONCURRENCY
+    ) -> Dict[str, bool]:
+        """Create all analyzer tables with proper optimization.
+
+        Tables are created concurrently, at most ``max_concurrency`` at once.
+        Existing tables are left as they are; use ``plan_migrations`` and
+        ``apply_migrations`` to bring them up to date.
+        """
         # Ensure dataset exists first
         if not await self.ensure_dataset_exists():
             logger.error("Failed to create dataset, aborting table creation")
@@ -128,19 +241,14 @@ class BigQueryMigrations:
             if not schema:  # Skip if schema is empty (ImportError)
                 logger.warning(f"Skipping {table_name} - schema not available")
                 results[table_name] = False
-                continue
 
-            config = configurations.get(table_name, {})
-
-            success = await self.create_table(
-                table_name=table_name,
-                schema=schema,
-                partition_field=config.get("partition_field"),
-                partition_type=config.get("partition_type"),
-                cluster_fields=config.get("cluster_fields"),
+        async def create(table_name: str) -> bool:
+            return await self._create_configured_table(
+                table_name, schemas[table_name], configurations
             )
 
-            results[table_name] = success
+        pending = [name for name in schemas if name not in results]
+        results.update(await self._bounded(pending, create, max_concurrency))
 
         # Log summary
         successful = sum(1 for success in results.values() if success)
@@ -149,13 +257,96 @@ class BigQueryMigrations:
 
         return results
 
+    async def plan_migrations(self) -> MigrationPlan:
+        """Diff the desired schemas against the dataset in one query.
+
+        Reads ``INFORMATION_SCHEMA.COLUMNS`` once for every table's columns,
+        types, partitioning column and clustering order. Missing tables are
+        planned as creates; missing nullable columns and changed clustering
+        as in-place alters. Type changes, new REQUIRED columns and a
+        different partitioning column cannot be applied in place and are
+        reported as incompatible.
+        """
+        schemas = BigQueryTableSchema.get_all_schemas()
+        configurations = BigQueryTableSchema.get_table_configurations()
+        actual = await self._actual_schemas()
+
+        plan = MigrationPlan()
+        for table_name, schema in schemas.items():
+            if not schema:
+                plan.skipped.append(table_name)
+            elif table_name not in actual:
+                plan.changes.append(TableChange(table_name, "create"))
+            else:
+                change = self._diff_table(
+                    table_name,
+                    schema,
+                    configurations.get(table_name, {}),
+                    actual[table_name],
+                )
+                if change is None:
+                    plan.unchanged.append(table_name)
+                else:
+                    plan.changes.append(change)
+
+        for line in plan.describe():
+            logger.info(f"Migration plan: {line}")
+        return plan
+
+    async def apply_migrations(
+        self,
+        plan: Optional[MigrationPlan] = None,
+        dry_run: bool = False,
+        max_concurrency: int = MIGRATION_CONCURRENCY,
+    ) -> Dict[str, Any]:
+        """Apply a migration plan, creating and altering tables concurrently.
+
+        Args:
+            plan: Plan to apply (default: a fresh ``plan_migrations``)
+            dry_run: Only report the plan
+            max_concurrency: Most tables created or altered at once
+
+        Returns:
+            The plan and, unless ``dry_run``, a success flag per applied table.
+            Incompatible changes are never applied.
+        """
+        if plan is None:
+            plan = await self.plan_migrations()
+        report: Dict[str, Any] = {"plan": plan.to_dict(), "dry_run": dry_run}
+        if dry_run or not plan.applicable:
+            report["results"] = {}
+            return report
+
+        if plan.by_action("create") and not await self.ensure_dataset_exists():
+            logger.error("Failed to create dataset, aborting migrations")
+            report["results"] = {c.table: False for c in plan.applicable}
+            return report
+
+        schemas = BigQueryTableSchema.get_all_schemas()
+        configurations = BigQueryTableSchema.get_table_configurations()
+        changes = {c.table: c for c in plan.applicable}
+
+        async def apply(table_name: str) -> bool:
+            change = changes[table_name]
+            if change.action == "create":
+                return await self._create_configured_table(
+                    table_name, schemas[table_name], configurations
+                )
+            return await self._alter_table(change)
+
+        results = await self._bounded(list(changes), apply, max_concurrency)
+        successful = sum(1 for success in results.values() if success)
+        logger.info(f"Applied {successful}/{len(results)} migrations successfully")
+        report["results"] = results
+        return report
+
     async def validate_schema(self, table_name: str) -> Dict[str, Any]:
         """Validate that a table exists and has the expected schema."""
         try:
             client = await self.get_client()
 
             table_id = f"{self.config.project_id}.{self.config.dataset_id}.{table_name}"
-            table = client.get_table(table_id)
+            table = await asyncio.to_thread(client.get_table, table_id)
 
             return {
                 "exists": True,
@@ -185,15 +376,12 @@ class BigQueryMigrations:
             logger.error(f"Failed to validate schema for {table_name}: {e}")
             return {"exists": False, "error": str(e)}
 
-    async def validate_all_schemas(self) -> Dict[str, Dict[str, Any]]:
-        """Validate all analyzer table schemas."""
+    async def validate_all_schemas(
+        self, max_concurrency: int = MIGRATION_CONCURRENCY
+    ) -> Dict[str, Dict[str, Any]]:
+        """Validate all analyzer table schemas, ``max_concurrency`` at once."""
         schemas = BigQueryTableSchema.get_all_schemas()
-        results = {}
-
-        for table_name in schemas.keys():
-            results[table_name] = await self.validate_schema(table_name)
-
-        return results
+        return await self._bounded(list(schemas), self.validate_schema, max_concurrency)
 
     async def get_storage_estimate(self) -> Dict[str, Any]:
         """Get storage size estimates for all tables."""
@@ -280,11 +468,369 @@ class BigQueryMigrations:
         await self.drop_table(table_name)
 
         # Recreate with current schema
+        return await self._create_configured_table(
+            table_name, schemas[table_name], configurations
+        )
+
+    async def create_rollup_tables(self) -> Dict[str, bool]:
+        """Create the rollup tables (empty; fill them with refresh_rollups)."""
+        if not await self.ensure_dataset_exists():
+            logger.error("Failed to create dataset, aborting rollup creation")
+            return {}
+
+        try:
+            await self._ensure_refresh_state_table()
+        except Exception as e:
+            logger.error(f"Failed to create rollup refresh state table: {e}")
+            return {}
+
+        definitions = {d.name: d for d in rollup_definitions()}
+        results = {}
+        for definition in definitions.values():
+            try:
+                await self._run_rollup_job(
+                    definition.create_sql(
+                        self.config.project_id,
+                        self.config.dataset_id,
+                        self._refresh_source(definition, definitions),
+                    )
+                )
+                logger.info(f"Created rollup table {definition.name}")
+                results[definition.name] = True
+            except Exception as e:
+                logger.error(f"Failed to create rollup table {definition.name}: {e}")
+                results[definition.name] = False
+        return results
+
+    async def refresh_rollup(
+        self,
+        name: str,
+        dates: Optional[List[date]] = None,
+        customer_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Rebuild the stale partitions of a rollup table with MERGE.
+
+        The source state each rebuilt partition was read from is recorded
+        in the refresh state table, so later refreshes skip it until its
+        source partitions change, including when a MERGE changed no rows.
+
+        Args:
+            name: Rollup table name
+            dates: Source dates to rebuild (default: every partition whose
+                source partitions changed since its last refresh)
+            customer_id: Rebuild only this customer's rows; requires
+                ``dates``. Customer-scoped refreshes record no state, since
+                other customers' rows in the partition stay as they were
+        """
+        definitions = {d.name: d for d in rollup_definitions()}
+        if name not in definitions:
+            logger.error(f"Unknown rollup: {name}")
+            return {"rollup": name, "error": f"Unknown rollup: {name}"}
+        definition = definitions[name]
+
+        try:
+            if dates is None and customer_id:
+                raise ValueError("Customer-scoped refreshes need explicit dates")
+
+            sources: Dict[date, SourceState] = {}
+            if not customer_id:
+                # Read before merging, so changes landing during the refresh
+                # leave the partition stale
+                await self._ensure_refresh_state_table()
+                sources = await self._rollup_source_state(definition)
+            if dates is None:
+                partitions = stale_partitions(
+                    sources, await self._rollup_watermarks(definition)
+                )
+            else:
+                partitions = definition.partition_dates(dates)
+
+            source = self._refresh_source(definition, definitions)
+            sql = definition.merge_sql(
+                self.config.project_id,
+                self.config.dataset_id,
+                source,
+                customer_scoped=bool(customer_id),
+            )
+            rows_affected = bytes_processed = 0
+            for i in range(0, len(partitions), REFRESH_BATCH_PARTITIONS):
+                batch = partitions[i : i + REFRESH_BATCH_PARTITIONS]
+                job = await self._run_rollup_job(
+                    sql, self._merge_parameters(definition, batch, customer_id)
+                )
+                rows_affected += job.num_dml_affected_rows or 0
+                bytes_processed += job.total_bytes_processed or 0
+                if not customer_id:
+                    await self._run_rollup_job(
+                        record_watermarks_sql(
+                            self.config.project_id, self.config.dataset_id
+                        ),
+                        self._watermark_parameters(definition, batch, sources),
+                    )
+
+            logger.info(
+                f"Refreshed {len(partitions)} partitions of rollup {name} "
+                f"({rows_affected} rows, {bytes_processed} bytes)"
+            )
+            return {
+                "rollup": name,
+                "partitions": [p.isoformat() for p in partitions],
+                "rows_affected": rows_affected,
+                "bytes_processed": bytes_processed,
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to refresh rollup {name}: {e}")
+            return {"rollup": name, "error": str(e)}
+
+    async def refresh_rollups(
+        self,
+        dates: Optional[List[date]] = None,
+        customer_id: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Refresh every rollup, in dependency order (daily before weekly)."""
+        results = {}
+        for definition in rollup_definitions():
+            results[definition.name] = await self.refresh_rollup(
+                definition.name, dates=dates, customer_id=customer_id
+            )
+        return results
+
+    @staticmethod
+    async def _bounded(names: List[str], run, max_concurrency: int) -> Dict[str, Any]:
+        """Run ``run(name)`` for each name, at most ``max_concurrency`` at once."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def limited(name: str):
+            async with semaphore:
+                return await run(name)
+
+        results = await asyncio.gather(*(limited(name) for name in names))
+        return dict(zip(names, results))
+
+    async def _create_configured_table(
+        self, table_name: str, schema: list, configurations: Dict[str, Dict]
+    ) -> bool:
+        """Create a table with its configured partitioning and clustering."""
         config = configurations.get(table_name, {})
         return await self.create_table(
             table_name=table_name,
-            schema=schemas[table_name],
+            schema=schema,
             partition_field=config.get("partition_field"),
             partition_type=config.get("partition_type"),
             cluster_fields=config.get("cluster_fields"),
         )
+
+    async def _actual_schemas(self) -> Dict[str, Dict[str, Any]]:
+        """Columns, partitioning and clustering of every table in the dataset."""
+        from google.api_core.exceptions import NotFound
+
+        client = await self.get_client()
+        query = f"""
+        SELECT
+            table_name,
+            column_name,
+            data_type,
+            is_partitioning_column,
+            clustering_ordinal_position
+        FROM `{self.config.project_id}.{self.config.dataset_id}.INFORMATION_SCHEMA.COLUMNS`
+        ORDER BY table_name, ordinal_position
+        """
+        try:
+            job = await JOB_MANAGER.submit(client, query)
+            rows = await asyncio.to_thread(job.result)
+        except NotFound:
+            # No dataset yet: every table is a create
+            return {}
+
+        tables: Dict[str, Dict[str, Any]] = {}
+        clustering: Dict[str, Dict[int, str]] = {}
+        for row in rows:
+            table = tables.setdefault(
+                row.table_name, {"columns": {}, "partition_field": None}
+            )
+            table["columns"][row.column_name] = row.data_type
+            if row.is_partitioning_column == "YES":
+                table["partition_field"] = row.column_name
+            if row.clustering_ordinal_position is not None:
+                clustering.setdefault(row.table_name, {})[
+                    row.clustering_ordinal_position
+                ] = row.column_name
+
+        for table_name, table in tables.items():
+            positions = clustering.get(table_name, {})
+            table["cluster_fields"] = [positions[p] for p in sorted(positions)]
+        return tables
+
+    @staticmethod
+    def _diff_table(
+        table_name: str,
+        schema: list,
+        config: Dict[str, Any],
+        actual: Dict[str, Any],
+    ) -> Optional[TableChange]:
+        """The change bringing an existing table in line, or None if it is."""
+        change = TableChange(table_name, "alter")
+        columns = actual["columns"]
+
+        for schema_field in schema:
+            expected = _column_type(schema_field)
+            if schema_field.name not in columns:
+                if schema_field.mode == "REQUIRED":
+                    change.problems.append(
+                        f"new column {schema_field.name} is REQUIRED"
+                    )
+                else:
+                    change.add_columns.append(schema_field)
+            elif not _same_type(expected, columns[schema_field.name]):
+                change.problems.append(
+                    f"column {schema_field.name} is "
+                    f"{columns[schema_field.name]}, expected {expected}"
+                )
+
+        partition_field = config.get("partition_field")
+        if partition_field != actual["partition_field"]:
+            change.problems.append(
+                f"partitioned on {actual['partition_field']}, "
+                f"expected {partition_field}"
+            )
+
+        cluster_fields = config.get("cluster_fields") or []
+        if cluster_fields != actual["cluster_fields"]:
+            change.cluster_fields = cluster_fields
+
+        if change.problems:
+            change.action = "incompatible"
+            return change
+        if change.add_columns or change.cluster_fields is not None:
+            return change
+        return None
+
+    async def _alter_table(self, change: TableChange) -> bool:
+        """Add nullable columns and update clustering in a single table update."""
+        try:
+            client = await self.get_client()
+            table_id = (
+                f"{self.config.project_id}.{self.config.dataset_id}.{change.table}"
+            )
+            table = await asyncio.to_thread(client.get_table, table_id)
+
+            fields = []
+            if change.add_columns:
+                existing = {f.name for f in table.schema}
+                table.schema = [
+                    *table.schema,
+                    *(f for f in change.add_columns if f.name not in existing),
+                ]
+                fields.append("schema")
+            if change.cluster_fields is not None:
+                table.clustering_fields = change.cluster_fields or None
+                fields.append("clustering_fields")
+
+            await asyncio.to_thread(client.update_table, table, fields)
+            logger.info(f"Altered table {table_id}: {change.describe()}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to alter table {change.table}: {e}")
+            return False
+
+    async def _ensure_refresh_state_table(self) -> None:
+        """Create the rollup refresh state table if it does not exist."""
+        await self._run_rollup_job(
+            refresh_state_create_sql(self.config.project_id, self.config.dataset_id)
+        )
+
+    async def _rollup_source_state(
+        self, definition: RollupDefinition
+    ) -> Dict[date, SourceState]:
+        """Current state of the source partitions of each rollup partition."""
+        return await self._source_states(
+            definition.source_state_sql(self.config.project_id, self.config.dataset_id)
+        )
+
+    async def _rollup_watermarks(
+        self, definition: RollupDefinition
+    ) -> Dict[date, SourceState]:
+        """Source state each rollup partition was last refreshed from."""
+        return await self._source_states(
+            definition.watermarks_sql(self.config.project_id, self.config.dataset_id)
+        )
+
+    async def _source_states(self, sql: str) -> Dict[date, SourceState]:
+        job = await self._run_rollup_job(sql)
+        rows = await asyncio.to_thread(job.result)
+        return {
+            row.partition_date: SourceState(row.last_modified, row.partitions)
+            for row in rows
+        }
+
+    @staticmethod
+    def _refresh_source(
+        definition: RollupDefinition, definitions: Dict[str, RollupDefinition]
+    ):
+        """The rollup a definition is built from, if it is built from one."""
+        if definition.refresh_from in definitions:
+            return definitions[definition.refresh_from].to_rollup()
+        return None
+
+    @staticmethod
+    def _merge_parameters(
+        definition: RollupDefinition,
+        partitions: List[date],
+        customer_id: Optional[str],
+    ):
+        """Query parameters for ``RollupDefinition.merge_sql``."""
+        from google.cloud import bigquery
+
+        start_date, end_date = definition.refresh_window(partitions)
+        parameters = [
+            bigquery.ArrayQueryParameter("partitions", "DATE", partitions),
+            bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
+            bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
+        ]
+        if customer_id:
+            parameters.append(
+                bigquery.ScalarQueryParameter("customer_id", "STRING", customer_id)
+            )
+        return bigquery.QueryJobConfig(query_parameters=parameters)
+
+    @staticmethod
+    def _watermark_parameters(
+        definition: RollupDefinition,
+        partitions: List[date],
+        sources: Dict[date, SourceState],
+    ):
+        """Query parameters for ``record_watermarks_sql``."""
+        from google.cloud import bigquery
+
+        watermarks = []
+        for partition in partitions:
+            state = sources.get(partition, SourceState())
+            watermarks.append(
+                bigquery.StructQueryParameter(
+                    None,
+                    bigquery.ScalarQueryParameter("partition_date", "DATE", partition),
+                    bigquery.ScalarQueryParameter(
+                        "source_modified", "TIMESTAMP", state.last_modified
+                    ),
+                    bigquery.ScalarQueryParameter(
+                        "source_partitions", "INT64", state.partitions
+                    ),
+                )
+            )
+        return bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("rollup", "STRING", definition.name),
+                bigquery.ArrayQueryParameter("watermarks", "STRUCT", watermarks),
+            ]
+        )
+
+    async def _run_rollup_job(self, sql: str, job_config=None):
+        """Run a rollup statement and wait for it off the event loop."""
+        client = await self.get_client()
+        job = await JOB_MANAGER.submit(client, sql, job_config=job_config)
+        await JOB_MANAGER.wait(job, ROLLUP_JOB_TIMEOUT, poll_interval=1.0)
+        if job.error_result:
+            raise RuntimeError(f"Rollup job failed: {job.error_result}")
+        return job
@@ -0,0 +1,351 @@
+"""Partition- and cluster-pruning query planner for customer-scoped tables.
+
+Every table in the premium dataset is shared by all customers, partitioned
+by day and clustered by ``customer_id`` first (see
+``BigQueryTableSchema.get_table_configurations``). A query that does not
+filter the partition column on a bounded range, or the first clustering
+column, scans every customer's full history. ``QueryPlanner``:
+
+- generates the scan filter for a table from its layout, so analytics
+  queries always carry ``customer_id = @customer_id AND date BETWEEN
+  @start_date AND @end_date`` (explicit dates also keep the query
+  cacheable, unlike ``CURRENT_DATE()``)
+- routes the query to the coarsest registered rollup (pre-aggregated
+  table) that exists, has every dimension and aggregate the query needs
+  and whose grain fits the date window; queries are written against a
+  ``ScanSource`` so the same builder yields raw or rollup SQL
+- verifies the final SQL still prunes (``QueryValidator.pruning_problems``)
+  and dry-runs it to record the bytes it will scan before it runs
+"""
+
+import asyncio
+import copy
+import logging
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable
+
+from .schema import BigQueryTableSchema
+from .validator import QueryValidator
+
+logger = logging.getLogger(__name__)
+
+
+class PruningError(ValueError):
+    """A generated query would not prune partitions or clusters."""
+
+
+@dataclass(frozen=True)
+class TableLayout:
+    """Partitioning and clustering of a table."""
+
+    partition_field: str | None
+    cluster_fields: tuple[str, ...] = ()
+
+    @property
+    def cluster_key(self) -> str | None:
+        """First clustering column (the only one pruned on its own)."""
+        return self.cluster_fields[0] if self.cluster_fields else None
+
+
+# Days aggregated into one rollup row, by grain
+GRAINS = {"DAY": 1, "WEEK": 7}
+
+
+def measure_columns(func: str, column: str = "*") -> tuple[str, ...]:
+    """Rollup columns storing an aggregate so it can be re-aggregated.
+
+    ``SUM(x)`` is stored as ``x``, ``COUNT(x)`` as ``x_count`` (``COUNT(*)``
+    as ``row_count``), ``MAX(x)``/``MIN(x)`` as ``x_max``/``x_min`` and
+    ``AVG(x)`` as both ``x`` and ``x_count``.
+    """
+    func = func.upper()
+    if func == "SUM":
+        return (column,)
+    if func == "AVG":
+        return (column, f"{column}_count")
+    if func == "COUNT":
+        return ("row_count",) if column == "*" else (f"{column}_count",)
+    if func in ("MAX", "MIN"):
+        return (f"{column}_{func.lower()}",)
+    raise ValueError(f"Aggregate {func} cannot be served from a rollup")
+
+
+@dataclass(frozen=True)
+class Rollup:
+    """A pre-aggregated table that can answer queries on a source table.
+
+    The rollup keeps the source's partitioning and customer clustering.
+    Rows are grouped by ``dimensions`` (plus the partition date, truncated
+    to the grain) and carry the ``measure_columns`` of each aggregate.
+    """
+
+    table: str
+    source: str
+    dimensions: frozenset[str]
+    measures: frozenset[str]
+    grain: str = "DAY"
+
+    def covers(self, columns: set[str], aggregates: set[tuple[str, str]]) -> bool:
+        """Whether the rollup has every dimension and aggregate needed."""
+        return columns <= self.dimensions and all(
+            set(measure_columns(func, column)) <= self.measures
+            for func, column in aggregates
+        )
+
+    def fits(self, window: tuple[date, date] | None) -> bool:
+        """Whether the rollup's rows align with an inclusive date window."""
+        if self.grain == "DAY":
+            return True
+        if window is None:
+            return False
+        start, end = window
+        # Weeks start on Monday, matching DATE_TRUNC(date, WEEK(MONDAY))
+        return start.weekday() == 0 and end.weekday() == 6
+
+
+@dataclass(frozen=True)
+class ScanSource:
+    """The table a query reads, as passed to query builders."""
+
+    table: str
+    filter: str
+    rollup: Rollup | None = None
+
+    def agg(self, func: str, column: str = "*") -> str:
+        """SQL for an aggregate over this source.
+
+        On a rollup the stored partial aggregates are combined, e.g.
+        ``AVG(x)`` becomes ``SAFE_DIVIDE(SUM(x), SUM(x_count))``.
+        """
+        func = func.upper()
+        if self.rollup is None:
+            return f"{func}({column})"
+        stored = measure_columns(func, column)
+        if func == "AVG":
+            return f"SAFE_DIVIDE(SUM({stored[0]}), SUM({stored[1]}))"
+        if func in ("MAX", "MIN"):
+            return f"{func}({stored[0]})"
+        return f"SUM({stored[0]})"
+
+
+@dataclass
+class QueryPlan:
+    """A verified query and where it reads from."""
+
+    query: str
+    table: str
+    source_table: str
+    bytes_processed: int | None = None
+    problems: list[str] = field(default_factory=list)
+
+    @property
+    def uses_rollup(self) -> bool:
+        return self.table != self.source_table
+
+
+def default_layouts() -> dict[str, TableLayout]:
+    """Table layouts from ``BigQueryTableSchema.get_table_configurations``."""
+    return {
+        name: TableLayout(
+            config.get("partition_field"), tuple(config.get("cluster_fields") or ())
+        )
+        for name, config in BigQueryTableSchema.get_table_configurations().items()
+    }
+
+
+def date_window(days: int, end: date | None = None) -> tuple[date, date]:
+    """Inclusive ``(start, end)`` dates covering the last ``days`` days."""
+    end = end or date.today()
+    return end - timedelta(days=days), end
+
+
+class QueryPlanner:
+    """Builds, routes and verifies customer-scoped analytics queries."""
+
+    def __init__(
+        self,
+        project_id: str,
+        dataset_id: str,
+        layouts: dict[str, TableLayout] | None = None,
+        strict: bool = True,
+    ):
+        """Initialize the planner.
+
+        Args:
+            project_id: Project of the analytics dataset
+            dataset_id: Analytics dataset
+            layouts: Table layouts (default: the schema's table configurations)
+            strict: Raise PruningError for queries that would not prune
+                (otherwise log a warning)
+        """
+        self.project_id = project_id
+        self.dataset_id = dataset_id
+        self.layouts = layouts if layouts is not None else default_layouts()
+        self.strict = strict
+        self._rollups: dict[str, list[Rollup]] = {}
+        # Rollup table -> whether it exists (checked once)
+        self._existing: dict[str, bool] = {}
+
+    def table_ref(self, table: str) -> str:
+        """Fully qualified, quoted reference to a dataset table."""
+        return f"`{self.project_id}.{self.dataset_id}.{table}`"
+
+    def register_rollup(self, rollup: Rollup) -> None:
+        """Make a pre-aggregated table available for routing."""
+        self._rollups.setdefault(rollup.source, []).append(rollup)
+        self._existing.pop(rollup.table, None)
+
+    def layout(self, table: str) -> TableLayout:
+        """Layout of a table; rollups share their source's unless configured."""
+        if table in self.layouts:
+            return self.layouts[table]
+        rollup = self._rollup(table)
+        if rollup is not None:
+            return self.layout(rollup.source)
+        raise KeyError(f"No layout configured for table {table}")
+
+    def scan_filter(self, table: str, alias: str | None = None) -> str:
+        """Predicate that prunes a table to one customer and a date window.
+
+        Uses the ``@customer_id``, ``@start_date`` and ``@end_date`` query
+        parameters.
+        """
+        layout = self.layout(table)
+        prefix = f"{alias}." if alias else ""
+        conditions = []
+        if layout.cluster_key:
+            conditions.append(f"{prefix}{layout.cluster_key} = @customer_id")
+        if layout.partition_field:
+            conditions.append(
+                f"{prefix}{layout.partition_field} BETWEEN @start_date AND @end_date"
+            )
+        return " AND ".join(conditions)
+
+    def verify(self, query: str, table: str) -> list[str]:
+        """Check a query prunes ``table``.
+
+        Raises:
+            PruningError: If the planner is strict and the query would not
+                prune
+        """
+        layout = self.layout(table)
+        problems = QueryValidator.pruning_problems(
+            query,
+            f"{self.dataset_id}.{table}",
+            layout.partition_field,
+            layout.cluster_key,
+        )
+        if problems:
+            message = f"Query on {table} would not prune: {'; '.join(problems)}"
+            if self.strict:
+                raise PruningError(message)
+            logger.warning(message)
+        return problems
+
+    def source(self, table: str, alias: str | None = None) -> ScanSource:
+        """Scan source for a dataset table or registered rollup."""
+        return ScanSource(
+            self.table_ref(table), self.scan_filter(table, alias), self._rollup(table)
+        )
+
+    async def plan(
+        self,
+        client: Any,
+        source_table: str,
+        build: Callable[[ScanSource], str],
+        columns: set[str],
+        job_config: Any = None,
+        aggregates: set[tuple[str, str]] = frozenset(),
+        window: tuple[date, date] | None = None,
+    ) -> QueryPlan:
+        """Build a query on the cheapest table that can answer it.
+
+        Args:
+            client: ``bigquery.Client``
+            source_table: Table the query is written against
+            build: Called with the ``ScanSource`` to read; returns the SQL
+            columns: Source columns the query groups or filters by
+            job_config: Job configuration the query will run with (its
+                parameters are used for the dry run)
+            aggregates: ``(function, column)`` aggregates the query computes
+                with ``ScanSource.agg``
+            window: Inclusive date window the query covers
+
+        Returns:
+            The verified plan, with the dry-run byte estimate
+
+        Raises:
+            PruningError: If the query would not prune (strict planners)
+        """
+        table = await self._route(client, source_table, columns, aggregates, window)
+        query = build(self.source(table))
+        problems = self.verify(query, table)
+
+        plan = QueryPlan(query, table, source_table, problems=problems)
+        plan.bytes_processed = await asyncio.to_thread(
+            self._dry_run, client, query, job_config
+        )
+        logger.info(
+            f"Planned query on {table} (source {source_table}): "
+            f"{plan.bytes_processed} bytes"
+        )
+        return plan
+
+    async def _route(
+        self,
+        client: Any,
+        source_table: str,
+        columns: set[str],
+        aggregates: set[tuple[str, str]],
+        window: tuple[date, date] | None,
+    ) -> str:
+        """Pick the coarsest existing rollup that can answer, else the source."""
+        candidates = sorted(
+            (
+                rollup
+                for rollup in self._rollups.get(source_table, [])
+                if rollup.covers(columns, aggregates) and rollup.fits(window)
+            ),
+            key=lambda rollup: -GRAINS[rollup.grain],
+        )
+        for rollup in candidates:
+            if rollup.table not in self._existing:
+                self._existing[rollup.table] = await asyncio.to_thread(
+                    self._table_exists, client, rollup.table
+                )
+            if self._existing[rollup.table]:
+                return rollup.table
+        return source_table
+
+    def _rollup(self, table: str) -> Rollup | None:
+        for rollups in self._rollups.values():
+            for rollup in rollups:
+                if rollup.table == table:
+                    return rollup
+        return None
+
+    def _table_exists(self, client: Any, table: str) -> bool:
+        from google.api_core.exceptions import NotFound
+
+        try:
+            client.get_table(f"{self.project_id}.{self.dataset_id}.{table}")
+            return True
+        except NotFound:
+            return False
+
+    @staticmethod
+    def _dry_run(client: Any, query: str, job_config: Any) -> int | None:
+        """Bytes the query would process (dry runs are free)."""
+        from google.cloud import bigquery
+
+        dry_config = (
+            copy.deepcopy(job_config) if job_config else bigquery.QueryJobConfig()
+        )
+        dry_config.dry_run = True
+        dry_config.use_query_cache = False
+        try:
+            return client.query(query, job_config=dry_config).total_bytes_processed
+        except Exception as e:
+            logger.warning(f"Dry run failed, running without an estimate: {e}")
+            return None
@@ -0,0 +1,186 @@
+"""Process-wide pool of BigQuery clients.
+
+Constructing a ``bigquery.Client`` resolves credentials (reading the
+service account file or probing application default credentials), builds
+an authorized HTTP session and fetches an access token on first use, which
+adds hundreds of milliseconds to a cold call. The pool creates one client
+per ``(project, credentials, location)`` and hands the same instance to
+every caller, so ``BigQueryClient``, ``CustomerRegistry``,
+``GA4BigQueryClient`` and timeout clients share authentication and
+keep-alive connections for the life of the process.
+
+Clients with the same credentials also share one authorized session (and
+so one token refresh) across projects. The session's connection pool is
+sized by ``PSN_BIGQUERY_MAX_CONNECTIONS`` (default 32) rather than the
+``requests`` default of 10, since queries run concurrently in worker
+threads. ``bigquery.Client`` is thread-safe for concurrent requests.
+
+When ``google-cloud-bigquery-storage`` is installed, ``read_client``
+likewise shares one Storage Read API client per credentials, used to
+stream large query results (see ``results``).
+"""
+
+import logging
+import os
+import threading
+from typing import Any
+
+from google.cloud import bigquery
+from google.oauth2 import service_account
+from requests.adapters import HTTPAdapter
+
+try:
+    from google.cloud import bigquery_storage
+except ImportError:
+    bigquery_storage = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 32
+
+# (project, credentials path or None for default credentials, location)
+_ClientKey = tuple[str | None, str | None, str | None]
+
+
+class BigQueryClientPool:
+    """Shared ``bigquery.Client`` instances keyed by project and credentials."""
+
+    def __init__(self, max_connections: int | None = None):
+        """Initialize an empty pool.
+
+        Args:
+            max_connections: Keep-alive connections per authorized session
+                (default: ``PSN_BIGQUERY_MAX_CONNECTIONS`` or 32)
+        """
+        self.max_connections = max_connections or int(
+            os.getenv("PSN_BIGQUERY_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)
+        )
+        self._clients: dict[_ClientKey, bigquery.Client] = {}
+        # Credentials key -> (credentials, authorized session)
+        self._sessions: dict[str | None, tuple[Any, Any]] = {}
+        # id(credentials) -> (credentials, Storage Read API client)
+        self._readers: dict[int, tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        project_id: str | None,
+        credentials_path: str | None = None,
+        location: str | None = None,
+    ) -> bigquery.Client:
+        """Get the shared client for a project, creating it on first use.
+
+        Args:
+            project_id: GCP project ID (None lets the client infer it)
+            credentials_path: Service account file (None for application
+                default credentials)
+            location: Default job location
+
+        Returns:
+            The pooled client
+        """
+        if credentials_path:
+            credentials_path = os.path.abspath(credentials_path)
+        key = (project_id, credentials_path, location)
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._create(project_id, credentials_path, location)
+                self._clients[key] = client
+                logger.info(
+                    f"Created pooled BigQuery client for project {client.project}"
+                )
+        return client
+
+    def _create(
+        self,
+        project_id: str | None,
+        credentials_path: str | None,
+        location: str | None,
+    ) -> bigquery.Client:
+        """Create a client, reusing the credentials' session if one exists."""
+        kwargs: dict[str, Any] = {"project": project_id}
+        if location:
+            kwargs["location"] = location
+
+        shared = self._sessions.get(credentials_path)
+        if shared is not None:
+            kwargs["credentials"], kwargs["_http"] = shared
+        elif credentials_path:
+            kwargs["credentials"] = (
+                service_account.Credentials.from_service_account_file(credentials_path)
+            )
+
+        client = bigquery.Client(**kwargs)
+
+        if shared is None:
+            # The client builds its authorized session lazily; size its
+            # connection pool once and share it with later projects
+            session = client._http
+            adapter = HTTPAdapter(
+                pool_connections=self.max_connections,
+                pool_maxsize=self.max_connections,
+            )
+            session.mount("https://", adapter)
+            self._sessions[credentials_path] = (client._credentials, session)
+        return client
+
+    def read_client(self, client: bigquery.Client) -> Any | None:
+        """Get the Storage Read API client sharing ``client``'s credentials.
+
+        Args:
+            client: A pooled BigQuery client
+
+        Returns:
+            ``BigQueryReadClient``, or None if google-cloud-bigquery-storage
+            is not installed
+        """
+        if bigquery_storage is None:
+            return None
+        credentials = client._credentials
+        with self._lock:
+            entry = self._readers.get(id(credentials))
+            if entry is None:
+                entry = (
+                    credentials,
+                    bigquery_storage.BigQueryReadClient(credentials=credentials),
+                )
+                self._readers[id(credentials)] = entry
+        return entry[1]
+
+    def close(self) -> None:
+        """Close every pooled client and its sessions, and empty the pool."""
+        with self._lock:
+            clients = list(self._clients.values())
+            readers = [reader for _, reader in self._readers.values()]
+            self._clients.clear()
+            self._sessions.clear()
+            self._readers.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close BigQuery client: {e}")
+        for reader in readers:
+            try:
+                reader.transport.close()
+            except Exception as e:
+                logger.warning(f"Failed to close BigQuery Storage client: {e}")
+        if clients:
+            logger.info(f"Closed {len(clients)} pooled BigQuery clients")
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+BIGQUERY_CLIENTS = BigQueryClientPool()
+
+
+def get_bigquery_client(
+    project_id: str | None,
+    credentials_path: str | None = None,
+    location: str | None = None,
+) -> bigquery.Client:
+    """Get a client from the process-wide pool (see ``BigQueryClientPool.get``)."""
+    return BIGQUERY_CLIENTS.get(project_id, credentials_path, location)
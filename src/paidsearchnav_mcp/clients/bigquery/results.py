@@ -0,0 +1,227 @@
+"""Columnar BigQuery query results.
+
+Query results are read as Arrow record batches and kept in one
+``pyarrow.Table`` until they reach the MCP boundary, instead of building a
+``dict`` per row as rows arrive:
+
+- ``read_result`` reads a finished job's rows. When the BigQuery Storage
+  Read API client is available, rows are streamed over parallel read
+  streams; otherwise the REST pages are decoded into Arrow batches. Reading
+  stops as soon as ``max_results`` rows have arrived.
+- ``QueryResult.slice`` pages through results without copying (Arrow
+  slices share the parent table's buffers).
+- ``QueryResult.to_rows`` converts to JSON-able row dicts, one column at
+  a time, only when a response is built.
+- ``ResultPage`` is one page of a finished job's destination table, with
+  the job ID and page token needed to read the next page without running
+  the query again.
+
+``pyarrow`` is optional: without it the same API is backed by row dicts,
+read from the job's row iterator as before.
+"""
+
+import base64
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Iterable
+
+try:
+    import pyarrow as pa
+
+    ARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    ARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def to_json_value(value: Any) -> Any:
+    """Convert a BigQuery value to a JSON-serializable one.
+
+    Dates and times become ISO 8601 strings, NUMERIC values floats and
+    BYTES base64 strings; RECORD and REPEATED values are converted
+    recursively.
+    """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, dict):
+        return {key: to_json_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_json_value(item) for item in value]
+    return value
+
+
+def _needs_conversion(arrow_type: Any) -> bool:
+    """Whether Python values of an Arrow column type need ``to_json_value``."""
+    types = pa.types
+    return not (
+        types.is_boolean(arrow_type)
+        or types.is_integer(arrow_type)
+        or types.is_floating(arrow_type)
+        or types.is_string(arrow_type)
+        or types.is_large_string(arrow_type)
+        or types.is_null(arrow_type)
+    )
+
+
+class QueryResult:
+    """Rows of a query, held as an Arrow table or, without pyarrow, as dicts.
+
+    Attributes:
+        truncated: Whether the query returned more rows than were read
+        job: Query job that produced the rows, when they came from running
+            a query (None for slices and later pages of a finished job)
+    """
+
+    def __init__(
+        self,
+        table: Any = None,
+        rows: list[dict[str, Any]] | None = None,
+        truncated: bool = False,
+        job: Any = None,
+    ):
+        """Wrap query rows.
+
+        Args:
+            table: ``pyarrow.Table`` of results (Arrow-backed)
+            rows: Row dicts (used when pyarrow is not installed)
+            truncated: Whether rows beyond these were dropped
+            job: Query job that produced the rows
+        """
+        self.table = table
+        self.rows = rows if table is None else None
+        self.truncated = truncated
+        self.job = job
+
+    @property
+    def is_arrow(self) -> bool:
+        return self.table is not None
+
+    @property
+    def num_rows(self) -> int:
+        return self.table.num_rows if self.is_arrow else len(self.rows or [])
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def slice(self, offset: int = 0, length: int | None = None) -> "QueryResult":
+        """Return rows ``offset`` to ``offset + length``.
+
+        Arrow-backed results share memory with this one.
+        """
+        if self.is_arrow:
+            return QueryResult(self.table.slice(offset, length))
+        end = None if length is None else offset + length
+        return QueryResult(rows=(self.rows or [])[offset:end])
+
+    def to_rows(self) -> list[dict[str, Any]]:
+        """Convert to JSON-serializable row dicts."""
+        if not self.is_arrow:
+            return [
+                {key: to_json_value(value) for key, value in row.items()}
+                for row in self.rows or []
+            ]
+
+        columns = []
+        for column in self.table.columns:
+            values = column.to_pylist()
+            if _needs_conversion(column.type):
+                values = [to_json_value(value) for value in values]
+            columns.append(values)
+        names = self.table.column_names
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+@dataclass
+class ResultPage:
+    """One page of a finished query job's results.
+
+    Attributes:
+        result: Rows of this page
+        job_id: ID of the query job the rows belong to
+        location: Location of the job (needed to look it up again)
+        next_page_token: Token for the next page, or None on the last page
+        total_rows: Rows in the job's full result
+    """
+
+    result: QueryResult
+    job_id: str
+    location: str | None
+    next_page_token: str | None
+    total_rows: int | None
+
+
+def _read_batches(
+    batches: Iterable[Any], max_results: int | None
+) -> tuple[list[Any], bool]:
+    """Collect record batches until ``max_results`` rows have arrived."""
+    collected, count = [], 0
+    for batch in batches:
+        collected.append(batch)
+        count += batch.num_rows
+        if max_results is not None and count > max_results:
+            # Closing the iterator stops the remaining downloads
+            close = getattr(batches, "close", None)
+            if close:
+                close()
+            return collected, True
+    return collected, False
+
+
+def read_result(
+    rows: Any,
+    max_results: int | None = None,
+    read_client: Any = None,
+    use_arrow: bool | None = None,
+) -> QueryResult:
+    """Read a finished query's rows.
+
+    Args:
+        rows: ``RowIterator`` from ``QueryJob.result()``
+        max_results: Most rows to keep (None for all); reading stops once
+            more have arrived
+        read_client: ``BigQueryReadClient`` for Storage Read API streams
+            (None to read REST pages)
+        use_arrow: Read into an Arrow table (default: when pyarrow is
+            installed)
+
+    Returns:
+        The rows, truncated to ``max_results``
+    """
+    if use_arrow is None:
+        use_arrow = ARROW_AVAILABLE
+
+    if not use_arrow:
+        records = []
+        truncated = False
+        for i, row in enumerate(rows):
+            if max_results is not None and i >= max_results:
+                truncated = True
+                break
+            records.append(dict(row))
+        if truncated:
+            logger.warning(
+                f"Query exceeded max_results ({max_results}), truncating results"
+            )
+        return QueryResult(rows=records, truncated=truncated)
+
+    batches, truncated = _read_batches(
+        rows.to_arrow_iterable(bqstorage_client=read_client), max_results
+    )
+    if batches:
+        table = pa.Table.from_batches(batches)
+    else:
+        table = pa.table({field.name: pa.array([]) for field in rows.schema})
+    if truncated:
+        logger.warning(
+            f"Query exceeded max_results ({max_results}), truncating results"
+        )
+        table = table.slice(0, max_results)
+    return QueryResult(table, truncated=truncated)
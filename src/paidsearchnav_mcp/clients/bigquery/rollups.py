@@ -0,0 +1,305 @@
+"""Materialized rollup tables and their incremental MERGE refresh.
+
+Rollups (``BigQueryTableSchema.get_rollup_configurations``) hold per-customer
+daily or weekly aggregates of a raw table, partitioned and clustered like
+it. Analytics queries registered with ``QueryPlanner`` read the coarsest
+rollup that can answer them, scanning one row per search term and day or
+week instead of every raw row.
+
+Refreshes are incremental. Each refresh records, per rollup partition, the
+state of the source partitions it was built from (latest modification time
+and partition count, from ``INFORMATION_SCHEMA.PARTITIONS``) in the
+``rollup_refresh_state`` table. A partition is rebuilt with a MERGE only
+when that state has changed since, so loading a day of data rewrites one
+daily and one weekly partition, and deleting source partitions clears the
+rollup rows built from them.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from .planner import GRAINS, Rollup, ScanSource, measure_columns
+from .schema import BigQueryTableSchema
+
+# Partitions rebuilt per MERGE statement, bounding each statement's scan
+REFRESH_BATCH_PARTITIONS = 31
+
+# Source state each rollup partition was last refreshed from
+REFRESH_STATE_TABLE = "rollup_refresh_state"
+
+
+@dataclass(frozen=True)
+class SourceState:
+    """State of the source partitions one rollup partition is built from.
+
+    Attributes:
+        last_modified: Latest modification time among them (None if there
+            are none)
+        partitions: Number of source partitions
+    """
+
+    last_modified: datetime | None = None
+    partitions: int = 0
+
+
+@dataclass(frozen=True)
+class RollupDefinition:
+    """A rollup table and how to build it."""
+
+    name: str
+    source: str
+    dimensions: tuple[str, ...]
+    aggregates: tuple[tuple[str, str], ...]
+    grain: str = "DAY"
+    partition_field: str = "date"
+    cluster_fields: tuple[str, ...] = ()
+    description: str = ""
+    refresh_from: str | None = None
+
+    @classmethod
+    def from_config(cls, name: str, config: dict[str, Any]) -> "RollupDefinition":
+        """Build a definition from a rollup configuration entry."""
+        return cls(
+            name=name,
+            source=config["source"],
+            dimensions=tuple(config["dimensions"]),
+            aggregates=tuple(tuple(a) for a in config["aggregates"]),
+            grain=config.get("grain", "DAY"),
+            partition_field=config.get("partition_field", "date"),
+            cluster_fields=tuple(config.get("cluster_fields") or ()),
+            description=config.get("description", ""),
+            refresh_from=config.get("refresh_from"),
+        )
+
+    @property
+    def built_from(self) -> str:
+        """Table the rollup is refreshed from."""
+        return self.refresh_from or self.source
+
+    @property
+    def measures(self) -> dict[str, tuple[str, str]]:
+        """Stored measure columns and the aggregate each one holds."""
+        measures: dict[str, tuple[str, str]] = {}
+        for func, column in self.aggregates:
+            stored = measure_columns(func, column)
+            if func.upper() == "AVG":
+                measures[stored[0]] = ("SUM", column)
+                measures[stored[1]] = ("COUNT", column)
+            else:
+                measures[stored[0]] = (func.upper(), column)
+        return measures
+
+    def to_rollup(self) -> Rollup:
+        """The planner's view of this rollup."""
+        return Rollup(
+            table=self.name,
+            source=self.source,
+            dimensions=frozenset((self.partition_field, *self.dimensions)),
+            measures=frozenset(self.measures),
+            grain=self.grain,
+        )
+
+    def truncate(self, expression: str) -> str:
+        """SQL truncating a date expression to the rollup's grain."""
+        if self.grain == "WEEK":
+            return f"DATE_TRUNC({expression}, WEEK(MONDAY))"
+        return expression
+
+    def partition_dates(self, dates: list[date]) -> list[date]:
+        """Rollup partitions covering the given source dates."""
+        if self.grain == "WEEK":
+            dates = [d - timedelta(days=d.weekday()) for d in dates]
+        return sorted(set(dates))
+
+    def refresh_window(self, partitions: list[date]) -> tuple[date, date]:
+        """Inclusive source date range covering rollup partitions."""
+        days = GRAINS[self.grain]
+        return min(partitions), max(partitions) + timedelta(days=days - 1)
+
+    def select_sql(self, source: ScanSource) -> str:
+        """Aggregate ``source`` into rollup rows."""
+        partition = self.partition_field
+        if self.truncate(partition) != partition:
+            partition = f"{self.truncate(partition)} AS {partition}"
+        columns = [
+            partition,
+            *self.dimensions,
+            *(
+                f"{source.agg(func, column)} AS {name}"
+                for name, (func, column) in self.measures.items()
+            ),
+        ]
+        group_by = ", ".join(str(i) for i in range(1, len(self.dimensions) + 2))
+        return (
+            f"SELECT {', '.join(columns)} FROM {source.table} "
+            f"WHERE {source.filter} GROUP BY {group_by}"
+        )
+
+    def create_sql(
+        self, project_id: str, dataset_id: str, source: Rollup | None
+    ) -> str:
+        """DDL creating the (empty) rollup table if it does not exist.
+
+        Args:
+            project_id: Project of the dataset
+            dataset_id: Dataset holding the rollup and its source
+            source: The rollup this one is built from, if any
+        """
+        select = self.select_sql(
+            ScanSource(_ref(project_id, dataset_id, self.built_from), "FALSE", source)
+        )
+        cluster = (
+            f" CLUSTER BY {', '.join(self.cluster_fields)}"
+            if self.cluster_fields
+            else ""
+        )
+        description = self.description.replace("'", "\\'")
+        return (
+            f"CREATE TABLE IF NOT EXISTS {_ref(project_id, dataset_id, self.name)} "
+            f"PARTITION BY {self.partition_field}{cluster} "
+            f"OPTIONS (description = '{description}') AS {select}"
+        )
+
+    def merge_sql(
+        self,
+        project_id: str,
+        dataset_id: str,
+        source: Rollup | None,
+        customer_scoped: bool = False,
+    ) -> str:
+        """MERGE rebuilding the rollup partitions in ``@partitions``.
+
+        Uses the ``@partitions`` (``ARRAY<DATE>``), ``@start_date`` and
+        ``@end_date`` query parameters (see ``refresh_window``), plus
+        ``@customer_id`` when ``customer_scoped``.
+
+        Args:
+            project_id: Project of the dataset
+            dataset_id: Dataset holding the rollup and its source
+            source: The rollup this one is built from, if any
+            customer_scoped: Rebuild only one customer's rows
+        """
+        field = self.partition_field
+        customer = " AND customer_id = @customer_id" if customer_scoped else ""
+        select = self.select_sql(
+            ScanSource(
+                _ref(project_id, dataset_id, self.built_from),
+                f"{field} BETWEEN @start_date AND @end_date "
+                f"AND {self.truncate(field)} IN UNNEST(@partitions){customer}",
+                source,
+            )
+        )
+        keys = (field, *self.dimensions)
+        measures = list(self.measures)
+        on = " AND ".join(f"T.{key} = S.{key}" for key in keys)
+        target = f"T.{field} IN UNNEST(@partitions)"
+        if customer_scoped:
+            target += " AND T.customer_id = @customer_id"
+        return (
+            f"MERGE {_ref(project_id, dataset_id, self.name)} AS T "
+            f"USING ({select}) AS S "
+            f"ON T.{field} BETWEEN @start_date AND @end_date AND {on} "
+            f"WHEN MATCHED THEN UPDATE SET "
+            f"{', '.join(f'{m} = S.{m}' for m in measures)} "
+            f"WHEN NOT MATCHED BY TARGET THEN INSERT "
+            f"({', '.join((*keys, *measures))}) "
+            f"VALUES ({', '.join(f'S.{c}' for c in (*keys, *measures))}) "
+            f"WHEN NOT MATCHED BY SOURCE AND T.{field} BETWEEN @start_date "
+            f"AND @end_date AND {target} THEN DELETE"
+        )
+
+    def source_state_sql(self, project_id: str, dataset_id: str) -> str:
+        """Query for the ``SourceState`` of each rollup partition."""
+        partition_date = self.truncate("PARSE_DATE('%Y%m%d', partition_id)")
+        return (
+            f"SELECT {partition_date} AS partition_date, "
+            f"MAX(last_modified_time) AS last_modified, COUNT(*) AS partitions "
+            f"FROM `{project_id}.{dataset_id}.INFORMATION_SCHEMA.PARTITIONS` "
+            f"WHERE table_name = '{self.built_from}' "
+            f"AND partition_id NOT IN ('__NULL__', '__UNPARTITIONED__') "
+            f"GROUP BY 1"
+        )
+
+    def watermarks_sql(self, project_id: str, dataset_id: str) -> str:
+        """Query for the ``SourceState`` each partition was last refreshed from."""
+        return (
+            f"SELECT partition_date, source_modified AS last_modified, "
+            f"source_partitions AS partitions "
+            f"FROM {_ref(project_id, dataset_id, REFRESH_STATE_TABLE)} "
+            f"WHERE rollup = '{self.name}'"
+        )
+
+
+def stale_partitions(
+    sources: dict[date, SourceState], watermarks: dict[date, SourceState]
+) -> list[date]:
+    """Rollup partitions whose sources changed since they were refreshed.
+
+    A partition is stale when it was never refreshed, when a source
+    partition was modified, added or deleted since, or when all of its
+    source partitions are gone (the MERGE then deletes its rows).
+
+    Args:
+        sources: Current source state by rollup partition
+        watermarks: Source state recorded at each partition's last refresh
+
+    Returns:
+        Stale partitions, oldest first
+    """
+    return sorted(
+        partition
+        for partition in sources.keys() | watermarks.keys()
+        if sources.get(partition, SourceState()) != watermarks.get(partition)
+    )
+
+
+def refresh_state_create_sql(project_id: str, dataset_id: str) -> str:
+    """DDL creating the refresh state table if it does not exist."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS "
+        f"{_ref(project_id, dataset_id, REFRESH_STATE_TABLE)} ("
+        f"rollup STRING NOT NULL, partition_date DATE NOT NULL, "
+        f"source_modified TIMESTAMP, source_partitions INT64 NOT NULL, "
+        f"refreshed_at TIMESTAMP NOT NULL) "
+        f"CLUSTER BY rollup "
+        f"OPTIONS (description = 'Source state each rollup partition was "
+        f"last refreshed from')"
+    )
+
+
+def record_watermarks_sql(project_id: str, dataset_id: str) -> str:
+    """MERGE recording the source state rollup partitions were refreshed from.
+
+    Uses the ``@rollup`` (``STRING``) and ``@watermarks``
+    (``ARRAY<STRUCT<partition_date DATE, source_modified TIMESTAMP,
+    source_partitions INT64>>``) query parameters.
+    """
+    return (
+        f"MERGE {_ref(project_id, dataset_id, REFRESH_STATE_TABLE)} AS T "
+        f"USING (SELECT * FROM UNNEST(@watermarks)) AS S "
+        f"ON T.rollup = @rollup AND T.partition_date = S.partition_date "
+        f"WHEN MATCHED THEN UPDATE SET source_modified = S.source_modified, "
+        f"source_partitions = S.source_partitions, "
+        f"refreshed_at = CURRENT_TIMESTAMP() "
+        f"WHEN NOT MATCHED THEN INSERT (rollup, partition_date, source_modified, "
+        f"source_partitions, refreshed_at) VALUES (@rollup, S.partition_date, "
+        f"S.source_modified, S.source_partitions, CURRENT_TIMESTAMP())"
+    )
+
+
+def _ref(project_id: str, dataset_id: str, table: str) -> str:
+    return f"`{project_id}.{dataset_id}.{table}`"
+
+
+def rollup_definitions() -> list[RollupDefinition]:
+    """Configured rollups, in refresh order."""
+    return [
+        RollupDefinition.from_config(name, config)
+        for name, config in BigQueryTableSchema.get_rollup_configurations().items()
+    ]
+
+
+def default_rollups() -> list[Rollup]:
+    """Configured rollups for ``QueryPlanner.register_rollup``."""
+    return [definition.to_rollup() for definition in rollup_definitions()]
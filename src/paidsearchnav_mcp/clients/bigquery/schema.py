@@ -2495,6 +2495,59 @@ class BigQueryTableSchema:
             },
         }
 
+    @staticmethod
+    def get_rollup_configurations() -> Dict[str, Dict[str, Any]]:
+        """Get pre-aggregated rollup table configurations.
+
+        Each rollup groups its source by the partition date (truncated to the
+        grain) and ``dimensions``, storing each of ``aggregates`` so it can be
+        re-aggregated over any date range. Rollups built from another rollup
+        (``refresh_from``) are listed after it, in refresh order.
+        """
+        search_term_aggregates = [
+            ("SUM", "impressions"),
+            ("SUM", "clicks"),
+            ("SUM", "cost"),
+            ("SUM", "conversions"),
+            ("AVG", "local_intent_score"),
+            ("AVG", "quality_score"),
+            ("COUNT", "*"),
+            ("MAX", "date"),
+        ]
+        return {
+            "search_terms_daily": {
+                "source": "search_terms",
+                "grain": "DAY",
+                "dimensions": [
+                    "customer_id",
+                    "campaign_id",
+                    "campaign_name",
+                    "search_term",
+                ],
+                "aggregates": search_term_aggregates,
+                "partition_field": "date",
+                "partition_type": "DAY",
+                "cluster_fields": ["customer_id", "campaign_id"],
+                "description": "Daily search term totals per customer and campaign",
+            },
+            "search_terms_weekly": {
+                "source": "search_terms",
+                "refresh_from": "search_terms_daily",
+                "grain": "WEEK",
+                "dimensions": [
+                    "customer_id",
+                    "campaign_id",
+                    "campaign_name",
+                    "search_term",
+                ],
+                "aggregates": search_term_aggregates,
+                "partition_field": "date",
+                "partition_type": "DAY",
+                "cluster_fields": ["customer_id", "campaign_id"],
+                "description": "Weekly (Monday-start) search term totals per customer and campaign",
+            },
+        }
+
     @staticmethod
     def get_attribution_touches_schema():
         """Schema for attribution touches data."""
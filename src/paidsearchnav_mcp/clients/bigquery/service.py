@@ -3,16 +3,17 @@
 import logging
 from typing import Any, Dict, Optional
 
-from paidsearchnav_mcp.core.config import BigQueryTier
-from paidsearchnav_mcp.platforms.bigquery.analytics import BigQueryAnalyticsEngine
-from paidsearchnav_mcp.platforms.bigquery.auth import BigQueryAuthenticator
-from paidsearchnav_mcp.platforms.bigquery.cost_monitor import BigQueryCostMonitor
-from paidsearchnav_mcp.platforms.bigquery.streaming import BigQueryDataStreamer
-from paidsearchnav_mcp.platforms.bigquery.timeout_client import (
+from paidsearchnav_mcp.clients.bigquery.analytics import BigQueryAnalyticsEngine
+from paidsearchnav_mcp.clients.bigquery.auth import BigQueryAuthenticator
+from paidsearchnav_mcp.clients.bigquery.cost_monitor import BigQueryCostMonitor
+from paidsearchnav_mcp.clients.bigquery.cost_tracker import CustomerCostTracker
+from paidsearchnav_mcp.clients.bigquery.streaming import BigQueryDataStreamer
+from paidsearchnav_mcp.clients.bigquery.timeout_client import (
     BigQueryTimeoutClient,
     create_timeout_client,
 )
-from paidsearchnav_mcp.platforms.bigquery.timeout_config import CustomerTier
+from paidsearchnav_mcp.clients.bigquery.timeout_config import CustomerTier
+from paidsearchnav_mcp.core.config import BigQueryTier
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,10 @@ class BigQueryService:
         self.config = config
         self.authenticator = BigQueryAuthenticator(config)
         self.analytics = BigQueryAnalyticsEngine(config, self.authenticator)
-        self.streamer = BigQueryDataStreamer(config, self.authenticator)
+        self.cost_tracker = CustomerCostTracker(config, self.authenticator)
+        self.streamer = BigQueryDataStreamer(
+            config, self.authenticator, cost_tracker=self.cost_tracker
+        )
         self.cost_monitor = BigQueryCostMonitor(config, self.authenticator)
 
         # Map BigQuery tiers to customer tiers for timeout configuration
@@ -98,7 +102,7 @@ class BigQueryService:
 
             if results and results[0].connectivity_test == 1:
                 # Get timeout configuration for status info
-                from paidsearchnav_mcp.platforms.bigquery.timeout_config import (
+                from paidsearchnav_mcp.clients.bigquery.timeout_config import (
                     get_timeout_config,
                 )
 
@@ -1,74 +1,605 @@
-"""BigQuery data streaming and ingestion."""
+"""BigQuery data streaming and ingestion.
 
+Rows are written through the Storage Write API, which is billed per GB
+ingested and accepts batches of serialized protobuf rows instead of
+per-row JSON inserts:
+
+- ``ProtoRowSerializer`` builds a protobuf message type from a table's
+  ``BigQueryTableSchema`` fields and serializes rows with it
+- ``RowBatcher`` groups serialized rows into appends, flushing on size
+  (bytes or rows) or when the oldest buffered row is older than the latency
+  budget
+- ``StorageWriteSession`` appends batches to one write stream with a cap on
+  in-flight appends (producers wait when it is reached), retries transient
+  failures at the same offset so no row is written twice, and for
+  ``PENDING`` streams commits every batch atomically on close
+
+Requires google-cloud-bigquery-storage (the ``arrow`` extra).
+"""
+
+import asyncio
+import json
 import logging
-from datetime import datetime
-from typing import Any, Dict, List
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from google.api_core import exceptions as api_exceptions
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+from .schema import BigQueryTableSchema
+
+try:
+    from google.cloud import bigquery_storage_v1
+    from google.cloud.bigquery_storage_v1 import exceptions as write_exceptions
+    from google.cloud.bigquery_storage_v1 import types as write_types
+    from google.cloud.bigquery_storage_v1 import writer
+except ImportError:
+    bigquery_storage_v1 = None
+    write_exceptions = None
+    write_types = None
+    writer = None
 
 logger = logging.getLogger(__name__)
 
+# An AppendRows request may carry at most 10 MB
+MAX_BATCH_BYTES = 9 * 1024 * 1024
+MAX_BATCH_ROWS = 10_000
+# Seconds a partial batch may wait for more rows
+MAX_BATCH_LATENCY = 2.0
+# Appends awaiting acknowledgement before producers wait
+MAX_IN_FLIGHT = 4
+MAX_APPEND_ATTEMPTS = 5
+# Seconds before the first retry (doubling after each failure)
+RETRY_BASE_DELAY = 0.5
+MAX_RETRY_DELAY = 10.0
+
+# Failures worth retrying at the same offset; OutOfRange means an earlier
+# offset is still being retried, StreamClosedError that another batch's
+# retry closed the connection this batch was sent on
+RETRYABLE_ERRORS = (
+    api_exceptions.Aborted,
+    api_exceptions.DeadlineExceeded,
+    api_exceptions.InternalServerError,
+    api_exceptions.OutOfRange,
+    api_exceptions.ResourceExhausted,
+    api_exceptions.ServiceUnavailable,
+) + ((write_exceptions.StreamClosedError,) if write_exceptions is not None else ())
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_PROTO_TYPES = {
+    "STRING": descriptor_pb2.FieldDescriptorProto.TYPE_STRING,
+    "BYTES": descriptor_pb2.FieldDescriptorProto.TYPE_BYTES,
+    "INTEGER": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+    "INT64": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+    "FLOAT": descriptor_pb2.FieldDescriptorProto.TYPE_DOUBLE,
+    "FLOAT64": descriptor_pb2.FieldDescriptorProto.TYPE_DOUBLE,
+    "BOOLEAN": descriptor_pb2.FieldDescriptorProto.TYPE_BOOL,
+    "BOOL": descriptor_pb2.FieldDescriptorProto.TYPE_BOOL,
+    # Days since the epoch
+    "DATE": descriptor_pb2.FieldDescriptorProto.TYPE_INT32,
+    # Microseconds since the epoch
+    "TIMESTAMP": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+}
+
+# Types the Storage Write API accepts as their canonical string form
+_STRING_TYPES = {"DATETIME", "TIME", "NUMERIC", "BIGNUMERIC", "JSON", "GEOGRAPHY"}
+
+
+class ProtoRowSerializer:
+    """Serializes row dicts as protobuf messages matching a table schema."""
+
+    def __init__(self, schema: List[Any], name: str = "Row"):
+        """Build the message type.
+
+        Args:
+            schema: ``bigquery.SchemaField`` list (nested RECORDs are not
+                supported)
+            name: Message type name
+
+        Raises:
+            ValueError: If a field type cannot be serialized
+        """
+        self.field_types = {f.name: f.field_type.upper() for f in schema}
+        self.repeated = {f.name for f in schema if f.mode == "REPEATED"}
+
+        message = descriptor_pb2.DescriptorProto(name=name)
+        for number, schema_field in enumerate(schema, start=1):
+            field_type = self.field_types[schema_field.name]
+            if field_type in _PROTO_TYPES:
+                proto_type = _PROTO_TYPES[field_type]
+            elif field_type in _STRING_TYPES:
+                proto_type = descriptor_pb2.FieldDescriptorProto.TYPE_STRING
+            else:
+                raise ValueError(
+                    f"Cannot stream {field_type} field {schema_field.name}"
+                )
+            message.field.add(
+                name=schema_field.name,
+                number=number,
+                type=proto_type,
+                label=descriptor_pb2.FieldDescriptorProto.LABEL_REPEATED
+                if schema_field.name in self.repeated
+                else descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+            )
+        self.descriptor = message
+
+        # Proto2, self-contained, as the Storage Write API requires
+        pool = descriptor_pool.DescriptorPool()
+        pool.Add(
+            descriptor_pb2.FileDescriptorProto(
+                name=f"{name}.proto", package="paidsearchnav", message_type=[message]
+            )
+        )
+        self._message_class = message_factory.GetMessageClass(
+            pool.FindMessageTypeByName(f"paidsearchnav.{name}")
+        )
+
+    @property
+    def message_class(self) -> Any:
+        """Generated message type (for decoding serialized rows)."""
+        return self._message_class
+
+    def serialize(self, row: Dict[str, Any]) -> bytes:
+        """Serialize a row; keys that are not table columns are ignored."""
+        message = self._message_class()
+        for name, value in row.items():
+            field_type = self.field_types.get(name)
+            if field_type is None or value is None:
+                continue
+            if name in self.repeated:
+                getattr(message, name).extend(
+                    self._convert(field_type, v) for v in value
+                )
+            else:
+                setattr(message, name, self._convert(field_type, value))
+        return message.SerializeToString()
+
+    @staticmethod
+    def _convert(field_type: str, value: Any) -> Any:
+        if field_type == "DATE":
+            if isinstance(value, str):
+                value = date.fromisoformat(value)
+            if isinstance(value, datetime):
+                value = value.date()
+            return (value - _EPOCH.date()).days
+        if field_type == "TIMESTAMP":
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return (value - _EPOCH) // (datetime.resolution)
+        if field_type == "JSON" and not isinstance(value, str):
+            return json.dumps(value)
+        if field_type == "DATETIME" and isinstance(value, datetime):
+            return value.isoformat(sep=" ")
+        if field_type in _STRING_TYPES:
+            return str(value)
+        return value
+
+
+@dataclass
+class RowBatch:
+    """Rows sent in one append."""
+
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    serialized: List[bytes] = field(default_factory=list)
+    num_bytes: int = 0
+    started: float = 0.0
+
+
+class RowBatcher:
+    """Groups serialized rows into appends by size and age."""
+
+    def __init__(
+        self,
+        max_bytes: int = MAX_BATCH_BYTES,
+        max_rows: int = MAX_BATCH_ROWS,
+        max_latency: float = MAX_BATCH_LATENCY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.max_rows = max_rows
+        self.max_latency = max_latency
+        self._clock = clock
+        self._batch = RowBatch()
+
+    def add(self, row: Dict[str, Any], serialized: bytes) -> Optional[RowBatch]:
+        """Buffer a row.
+
+        Returns:
+            The batch to send when adding the row filled it (the row starts
+            the next batch if it would not fit), else None
+
+        Raises:
+            ValueError: If the row alone exceeds ``max_bytes``
+        """
+        size = len(serialized)
+        if size > self.max_bytes:
+            raise ValueError(f"Row of {size} bytes exceeds the append size limit")
+
+        full = None
+        if self._batch.num_bytes + size > self.max_bytes:
+            full = self.flush()
+        if not self._batch.rows:
+            self._batch.started = self._clock()
+        self._batch.rows.append(row)
+        self._batch.serialized.append(serialized)
+        self._batch.num_bytes += size
+        if full is None and len(self._batch.rows) >= self.max_rows:
+            full = self.flush()
+        return full
+
+    def due(self) -> bool:
+        """Whether the buffered rows have waited ``max_latency``."""
+        return bool(self._batch.rows) and (
+            self._clock() - self._batch.started >= self.max_latency
+        )
+
+    def flush(self) -> Optional[RowBatch]:
+        """Take the buffered rows as a batch (None if empty)."""
+        if not self._batch.rows:
+            return None
+        batch, self._batch = self._batch, RowBatch()
+        return batch
+
+
+class StorageWriteSession:
+    """Appends rows to one Storage Write API stream.
+
+    Each batch is sent at an explicit offset (rows written before it), so a
+    retried append the server already applied fails with ALREADY_EXISTS and
+    is treated as written: every row lands exactly once.
+
+    Use as an async context manager; leaving it without an error flushes,
+    finalizes and (for PENDING streams) commits the stream. On error a
+    PENDING stream is abandoned and none of its rows become visible.
+    """
+
+    def __init__(
+        self,
+        write_client: Any,
+        table_path: str,
+        serializer: ProtoRowSerializer,
+        stream_type: str = "PENDING",
+        on_batch: Optional[Callable[[RowBatch], Awaitable[Any]]] = None,
+        batcher: Optional[RowBatcher] = None,
+        max_in_flight: int = MAX_IN_FLIGHT,
+    ):
+        """Initialize the session.
+
+        Args:
+            write_client: ``BigQueryWriteClient``
+            table_path: ``projects/{p}/datasets/{d}/tables/{t}``
+            serializer: Serializer for the table's rows
+            stream_type: ``PENDING`` (commit all rows on close) or
+                ``COMMITTED`` (rows visible as soon as appended)
+            on_batch: Awaited after each batch is written
+            batcher: Batching policy
+            max_in_flight: Appends awaiting acknowledgement before
+                ``append`` waits
+        """
+        if bigquery_storage_v1 is None:
+            raise ImportError(
+                "google-cloud-bigquery-storage is required for streaming; "
+                "install with: pip install 'paidsearchnav-mcp[arrow]'"
+            )
+        self.write_client = write_client
+        self.table_path = table_path
+        self.serializer = serializer
+        self.stream_type = stream_type
+        self.on_batch = on_batch
+        self.batcher = batcher or RowBatcher()
+        self.stream_name: Optional[str] = None
+        self.rows_written = 0
+        self.bytes_written = 0
+        self.batches_written = 0
+
+        self._next_offset = 0
+        self._connection = None
+        self._send_lock = asyncio.Lock()
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._tasks: set = set()
+        self._flusher: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+
+    async def __aenter__(self) -> "StorageWriteSession":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.close()
+        else:
+            await self.abort()
+
+    async def open(self) -> None:
+        """Create the write stream."""
+        stream = await asyncio.to_thread(
+            self.write_client.create_write_stream,
+            parent=self.table_path,
+            write_stream=write_types.WriteStream(
+                type_=getattr(write_types.WriteStream.Type, self.stream_type)
+            ),
+        )
+        self.stream_name = stream.name
+        self._flusher = asyncio.create_task(self._flush_when_due())
+
+    async def append(self, rows: List[Dict[str, Any]]) -> None:
+        """Buffer rows, sending each batch as it fills.
+
+        Raises:
+            Exception: The failure of an earlier batch
+        """
+        for row in rows:
+            self._raise_failure()
+            batch = self.batcher.add(row, self.serializer.serialize(row))
+            if batch is not None:
+                await self._dispatch(batch)
+
+    async def close(self) -> None:
+        """Send buffered rows, wait for every append, then finalize/commit.
+
+        Raises:
+            Exception: If any batch failed or the commit reported errors
+        """
+        self._stop_flusher()
+        batch = self.batcher.flush()
+        if batch is not None:
+            await self._dispatch(batch)
+        await asyncio.gather(*self._tasks)
+        await self._disconnect()
+        self._raise_failure()
+
+        await asyncio.to_thread(
+            self.write_client.finalize_write_stream, name=self.stream_name
+        )
+        if self.stream_type == "PENDING":
+            response = await asyncio.to_thread(
+                self.write_client.batch_commit_write_streams,
+                write_types.BatchCommitWriteStreamsRequest(
+                    parent=self.table_path, write_streams=[self.stream_name]
+                ),
+            )
+            if response.stream_errors:
+                raise RuntimeError(
+                    f"Commit of {self.stream_name} failed: {response.stream_errors}"
+                )
+        logger.info(
+            f"Wrote {self.rows_written} rows ({self.bytes_written} bytes) in "
+            f"{self.batches_written} batches to {self.table_path}"
+        )
+
+    async def abort(self) -> None:
+        """Stop sending; uncommitted rows of a PENDING stream are discarded."""
+        self._stop_flusher()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._disconnect()
+
+    async def _dispatch(self, batch: RowBatch) -> None:
+        """Send a batch once an in-flight slot is free (back-pressure)."""
+        await self._in_flight.acquire()
+        self._start(batch)
+
+    def _start(self, batch: RowBatch) -> None:
+        """Assign the batch its offset and send it; holds an in-flight slot."""
+        offset = self._next_offset
+        self._next_offset += len(batch.rows)
+        task = asyncio.create_task(self._append_batch(batch, offset))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _append_batch(self, batch: RowBatch, offset: int) -> None:
+        try:
+            for attempt in range(1, MAX_APPEND_ATTEMPTS + 1):
+                connection = None
+                try:
+                    # Sends go out in offset order on one connection
+                    async with self._send_lock:
+                        connection = self._connect()
+                        future = await asyncio.to_thread(
+                            connection.send, self._request(batch, offset)
+                        )
+                    await asyncio.to_thread(future.result)
+                    break
+                except api_exceptions.AlreadyExists:
+                    # An earlier attempt was applied
+                    break
+                except RETRYABLE_ERRORS as e:
+                    if attempt == MAX_APPEND_ATTEMPTS:
+                        raise
+                    logger.warning(
+                        f"Append at offset {offset} failed (attempt {attempt}), "
+                        f"retrying: {e}"
+                    )
+                    await self._disconnect(connection)
+                    await asyncio.sleep(
+                        min(RETRY_BASE_DELAY * 2 ** (attempt - 1), MAX_RETRY_DELAY)
+                    )
+
+            self.rows_written += len(batch.rows)
+            self.bytes_written += batch.num_bytes
+            self.batches_written += 1
+            if self.on_batch is not None:
+                await self.on_batch(batch)
+        except Exception as e:
+            logger.error(f"Append at offset {offset} to {self.stream_name} failed: {e}")
+            if self._error is None:
+                self._error = e
+        finally:
+            self._in_flight.release()
+
+    def _request(self, batch: RowBatch, offset: int) -> Any:
+        request = write_types.AppendRowsRequest()
+        request.offset = offset
+        proto_data = write_types.AppendRowsRequest.ProtoData()
+        proto_data.rows = write_types.ProtoRows(serialized_rows=batch.serialized)
+        request.proto_rows = proto_data
+        return request
+
+    def _connect(self) -> Any:
+        """The open append connection (created on first use)."""
+        if self._connection is None:
+            template = write_types.AppendRowsRequest()
+            template.write_stream = self.stream_name
+            proto_data = write_types.AppendRowsRequest.ProtoData()
+            proto_data.writer_schema = write_types.ProtoSchema(
+                proto_descriptor=self.serializer.descriptor
+            )
+            template.proto_rows = proto_data
+            self._connection = writer.AppendRowsStream(self.write_client, template)
+        return self._connection
+
+    async def _disconnect(self, connection: Any = None) -> None:
+        """Close the connection (only if it is still ``connection``, if given)."""
+        current = self._connection
+        if current is None or (connection is not None and connection is not current):
+            return
+        self._connection = None
+        try:
+            await asyncio.to_thread(current.close)
+        except Exception as e:
+            logger.debug(f"Error closing append connection: {e}")
+
+    async def _flush_when_due(self) -> None:
+        """Send partial batches that waited ``max_latency``."""
+        while True:
+            await asyncio.sleep(self.batcher.max_latency / 2)
+            if not self.batcher.due():
+                continue
+            # Take the rows only once a slot is free, so cancelling this task
+            # never drops a batch
+            await self._in_flight.acquire()
+            batch = self.batcher.flush()
+            if batch is None:
+                self._in_flight.release()
+            else:
+                self._start(batch)
+
+    def _stop_flusher(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+
+    def _raise_failure(self) -> None:
+        if self._error is not None:
+            raise self._error
+
 
 class BigQueryDataStreamer:
     """Handles real-time data streaming to BigQuery."""
 
-    def __init__(self, config, authenticator):
-        """Initialize data streamer."""
+    def __init__(self, config, authenticator, cost_tracker=None):
+        """Initialize data streamer.
+
+        Args:
+            config: BigQuery configuration
+            authenticator: ``BigQueryAuthenticator``
+            cost_tracker: Optional ``CustomerCostTracker``; each written batch
+                is reported to ``track_streaming_insert``
+        """
         self.config = config
         self.authenticator = authenticator
+        self.cost_tracker = cost_tracker
+        self._write_client = None
+        self._serializers: Dict[str, ProtoRowSerializer] = {}
 
     async def stream_search_terms(
         self, data: List[Dict[str, Any]], customer_id: str
     ) -> Dict[str, Any]:
         """Stream search terms data to BigQuery."""
-
-        if not self.config.enabled:
-            return {"success": False, "reason": "BigQuery not enabled"}
-
-        try:
-            logger.info(
-                f"Streaming {len(data)} search terms rows for customer {customer_id}"
-            )
-
-            # TODO: Implement actual BigQuery streaming
-            # This will be implemented in Phase 2 of the BigQuery integration
-
-            # Placeholder implementation
-            return {
-                "success": True,
-                "total_rows": len(data),
-                "customer_id": customer_id,
-                "table": "search_terms",
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to stream search terms data: {e}")
-            return {"success": False, "error": str(e), "total_rows": len(data)}
+        return await self.stream_rows("search_terms", data, customer_id)
 
     async def stream_keywords(
         self, data: List[Dict[str, Any]], customer_id: str
     ) -> Dict[str, Any]:
         """Stream keywords data to BigQuery."""
+        return await self.stream_rows("keywords", data, customer_id)
+
+    async def stream_rows(
+        self, table: str, data: List[Dict[str, Any]], customer_id: str
+    ) -> Dict[str, Any]:
+        """Write rows to an analyzer table in one atomic commit.
+
+        ``customer_id`` and missing ``created_at``/``updated_at`` values are
+        filled in. Either every row is committed or none is.
+        """
 
         if not self.config.enabled:
             return {"success": False, "reason": "BigQuery not enabled"}
 
         try:
             logger.info(
-                f"Streaming {len(data)} keywords rows for customer {customer_id}"
+                f"Streaming {len(data)} {table} rows for customer {customer_id}"
             )
+            client = await self.authenticator.get_client()
+            write_client = self._get_write_client(client)
+            now = datetime.now(timezone.utc)
+            rows = [
+                {
+                    "created_at": now,
+                    "updated_at": now,
+                    **row,
+                    "customer_id": customer_id,
+                }
+                for row in data
+            ]
 
-            # TODO: Implement actual BigQuery streaming
-            # This will be implemented in Phase 2 of the BigQuery integration
+            async def report(batch: RowBatch) -> None:
+                if self.cost_tracker is not None:
+                    await self.cost_tracker.track_streaming_insert(
+                        customer_id,
+                        table,
+                        batch.rows,
+                        bytes_inserted=batch.num_bytes,
+                        storage_write_api=True,
+                    )
+
+            session = StorageWriteSession(
+                write_client,
+                write_client.table_path(
+                    self.config.project_id, self.config.dataset_id, table
+                ),
+                self._get_serializer(table),
+                on_batch=report,
+            )
+            async with session:
+                await session.append(rows)
 
-            # Placeholder implementation
             return {
                 "success": True,
                 "total_rows": len(data),
+                "rows_written": session.rows_written,
+                "bytes_written": session.bytes_written,
+                "batches": session.batches_written,
                 "customer_id": customer_id,
-                "table": "keywords",
-                "timestamp": datetime.utcnow().isoformat(),
+                "table": table,
+                "timestamp": now.isoformat(),
             }
 
         except Exception as e:
-            logger.error(f"Failed to stream keywords data: {e}")
+            logger.error(f"Failed to stream {table} data: {e}")
             return {"success": False, "error": str(e), "total_rows": len(data)}
+
+    def _get_write_client(self, client: Any) -> Any:
+        """Storage Write API client sharing ``client``'s credentials."""
+        if bigquery_storage_v1 is None:
+            raise ImportError(
+                "google-cloud-bigquery-storage is required for streaming; "
+                "install with: pip install 'paidsearchnav-mcp[arrow]'"
+            )
+        if self._write_client is None:
+            self._write_client = bigquery_storage_v1.BigQueryWriteClient(
+                credentials=client._credentials
+            )
+        return self._write_client
+
+    def _get_serializer(self, table: str) -> ProtoRowSerializer:
+        if table not in self._serializers:
+            schema = getattr(BigQueryTableSchema, f"get_{table}_schema")()
+            self._serializers[table] = ProtoRowSerializer(schema)
+        return self._serializers[table]
@@ -9,6 +9,8 @@ from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 from google.cloud import bigquery
 from google.cloud.exceptions import GoogleCloudError
 
+from .jobs import JOB_MANAGER
+from .pool import get_bigquery_client
 from .timeout_config import CustomerTier, OperationTimeouts, get_timeout_config
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,22 @@ class BigQueryTimeoutError(Exception):
     pass
 
 
+def _read_rows(
+    query_job: bigquery.QueryJob, max_rows: int
+) -> tuple[List[Dict[str, Any]], bool]:
+    """Read up to ``max_rows`` result rows (blocking; run in a worker thread).
+
+    Returns:
+        The rows, and whether more rows were left unread
+    """
+    results = []
+    for row in query_job.result():
+        if len(results) >= max_rows:
+            return results, True
+        results.append(dict(row))
+    return results, False
+
+
 class BigQueryTimeoutClient:
     """BigQuery client wrapper with configurable timeouts and retry logic."""
 
@@ -96,51 +114,21 @@ class BigQueryTimeoutClient:
                     f"Executing BigQuery query (attempt {attempt + 1}/{config.max_retry_attempts})"
                 )
 
-                # Start the query job
-                query_job = self.client.query(query, job_config=job_config)
-
-                # Wait for completion with timeout protection and exponential backoff
+                # Submit and poll off the event loop; the shared job manager
+                # cancels the job if this wait times out or is cancelled
                 start_time = time.time()
-                timeout_deadline = start_time + config.query_timeout
-                poll_count = 0
-
-                while True:
-                    # Reload job status
-                    query_job.reload()
-
-                    # Check if job is done first to avoid race condition
-                    if query_job.done():
-                        break
-
-                    # Check timeout after reload to ensure we have latest status
-                    current_time = time.time()
-                    if current_time > timeout_deadline:
-                        # Cancel the job if possible
-                        try:
-                            query_job.cancel()
-                            logger.info(
-                                f"Cancelled job {query_job.job_id} due to timeout"
-                            )
-                        except Exception as e:
-                            logger.warning(f"Failed to cancel timed-out job: {e}")
-
-                        raise BigQueryTimeoutError(
-                            f"Query timed out after {config.query_timeout} seconds"
-                        )
-
-                    # Exponential backoff for polling to reduce API calls
-                    poll_count += 1
-                    if poll_count <= 3:
-                        # Fast polling for first few checks
-                        sleep_time = config.job_poll_interval
-                    else:
-                        # Exponential backoff: min(initial * 2^(n-3), max_interval)
-                        sleep_time = min(
-                            config.job_poll_interval * (2 ** (poll_count - 3)),
-                            30,  # Max 30 seconds between polls
-                        )
-
-                    await asyncio.sleep(sleep_time)
+                query_job = await JOB_MANAGER.submit(
+                    self.client, query, job_config=job_config
+                )
+                try:
+                    await JOB_MANAGER.wait(
+                        query_job, config.query_timeout, config.job_poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    logger.info(f"Cancelled job {query_job.job_id} due to timeout")
+                    raise BigQueryTimeoutError(
+                        f"Query timed out after {config.query_timeout} seconds"
+                    )
 
                 # Check for errors after completion
                 if query_job.error_result:
@@ -194,7 +182,8 @@ class BigQueryTimeoutClient:
 
             if destination_uri:
                 # Export to Cloud Storage
-                extract_job = self.client.extract_table(
+                extract_job = await asyncio.to_thread(
+                    self.client.extract_table,
                     query_job.destination,
                     destination_uri,
                     job_config=bigquery.ExtractJobConfig(
@@ -203,30 +192,24 @@ class BigQueryTimeoutClient:
                 )
 
                 # Wait for export completion
-                start_time = time.time()
-                while not extract_job.done():
-                    if time.time() - start_time > config.export_timeout:
-                        extract_job.cancel()
-                        raise BigQueryTimeoutError("Export timed out")
-
-                    await asyncio.sleep(config.job_poll_interval)
-                    extract_job.reload()
+                try:
+                    await JOB_MANAGER.wait(
+                        extract_job, config.export_timeout, config.job_poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    raise BigQueryTimeoutError("Export timed out")
 
                 return extract_job
             else:
                 # Return results directly with memory safety
-                results = []
-                row_count = 0
                 max_rows = 100000  # Limit to prevent memory issues
-
-                for row in query_job.result():
-                    if row_count >= max_rows:
-                        logger.warning(
-                            f"Export truncated at {max_rows} rows to prevent memory issues"
-                        )
-                        break
-                    results.append(dict(row))
-                    row_count += 1
+                results, truncated = await asyncio.to_thread(
+                    _read_rows, query_job, max_rows
+                )
+                if truncated:
+                    logger.warning(
+                        f"Export truncated at {max_rows} rows to prevent memory issues"
+                    )
 
                 return results
 
@@ -268,18 +251,14 @@ class BigQueryTimeoutClient:
             )
 
             # Convert to list of dictionaries with memory-safe iteration
-            results = []
-            row_count = 0
             max_rows = 100000  # Limit to prevent memory issues
-
-            for row in query_job.result():
-                if row_count >= max_rows:
-                    logger.warning(
-                        f"Fallback export truncated at {max_rows} rows to prevent memory issues"
-                    )
-                    break
-                results.append(dict(row))
-                row_count += 1
+            results, truncated = await asyncio.to_thread(
+                _read_rows, query_job, max_rows
+            )
+            if truncated:
+                logger.warning(
+                    f"Fallback export truncated at {max_rows} rows to prevent memory issues"
+                )
 
             logger.info(f"Fallback export completed with {len(results)} rows")
             return results
@@ -366,7 +345,7 @@ def create_timeout_client(
         customer_tier: Default customer tier for timeout configuration
 
     Returns:
-        Timeout-aware BigQuery client
+        Timeout-aware wrapper around the pooled BigQuery client
     """
-    base_client = bigquery.Client(project=project_id)
+    base_client = get_bigquery_client(project_id)
     return BigQueryTimeoutClient(base_client, customer_tier)
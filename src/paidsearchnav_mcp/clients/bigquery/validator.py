@@ -1,17 +1,174 @@
+"""Safety checks for ad-hoc BigQuery SQL.
+
+When ``sqlglot`` is installed (the ``sql`` extra), queries are parsed with
+its BigQuery dialect and validated on the syntax tree: every statement is
+classified, only read-only queries are allowed, and the referenced tables
+are extracted for cost estimates and partition-filter checks. Parsed trees
+are kept in an LRU cache, so a query that is validated and then checked
+again (or re-sent later in the session) is parsed once.
+
+Without ``sqlglot`` the validator falls back to regex checks over the
+comment-stripped query. Partition-filter checks need the parser.
+"""
+
 import re
+from functools import lru_cache
 from typing import Any
 
+try:
+    import sqlglot
+    from sqlglot import exp
+
+    SQLGLOT_AVAILABLE = True
+except ImportError:
+    sqlglot = None
+    exp = None
+    SQLGLOT_AVAILABLE = False
+
+# Parsed queries kept for reuse
+AST_CACHE_SIZE = 512
+
+_NO_LIMIT_WARNING = "Query has no LIMIT clause - may return large results"
+
+
+@lru_cache(maxsize=AST_CACHE_SIZE)
+def _parse(query: str) -> tuple[Any, ...]:
+    """Parse a query into statements (cached; callers must not mutate)."""
+    return tuple(
+        statement
+        for statement in sqlglot.parse(query, read="bigquery")
+        if statement is not None
+    )
+
+
+def _require_parser() -> None:
+    if not SQLGLOT_AVAILABLE:
+        raise ImportError(
+            "sqlglot is required for this check; install the 'sql' extra "
+            '(pip install -e ".[sql]")'
+        )
+
+
+# Error-message labels by statement class; the class name is kept as the
+# key so classes missing from older sqlglot releases need no special casing
+_STATEMENT_LABELS = {
+    "Select": "SELECT",
+    "Union": "UNION",
+    "Intersect": "INTERSECT",
+    "Except": "EXCEPT",
+    "Subquery": "SELECT",
+    "Insert": "INSERT",
+    "Update": "UPDATE",
+    "Delete": "DELETE",
+    "Merge": "MERGE",
+    "Create": "CREATE",
+    "Drop": "DROP",
+    "Alter": "ALTER",
+    "TruncateTable": "TRUNCATE TABLE",
+    "Grant": "GRANT",
+    "Revoke": "REVOKE",
+    "Export": "EXPORT DATA",
+    "LoadData": "LOAD DATA",
+    "Declare": "DECLARE",
+    "Set": "SET",
+    "Transaction": "BEGIN TRANSACTION",
+    "Commit": "COMMIT",
+    "Rollback": "ROLLBACK",
+    "EndStatement": "END",
+}
+
+# Statements whose label names the kind of object, e.g. "DROP TABLE"
+_KIND_STATEMENTS = {"CREATE", "DROP", "ALTER"}
+
+# Labels for statements sqlglot keeps as raw commands, by leading keyword
+_COMMAND_LABELS = {"EXECUTE": "EXECUTE IMMEDIATE"}
+
+# Table functions that run SQL outside BigQuery, where it cannot be checked
+_DISALLOWED_FUNCTIONS = {"EXTERNAL_QUERY"}
+
+
+def _statement_label(statement: Any) -> str:
+    """Describe a statement for error messages, e.g. ``DROP TABLE``."""
+    if isinstance(statement, exp.Command):
+        # Unsupported syntax, e.g. "DROP DATASET" or "CALL ds.proc()"
+        keyword = str(statement.this).upper()
+        if keyword in _KIND_STATEMENTS:
+            kind = re.match(r"\s*([A-Za-z_]+)\b", str(statement.expression or ""))
+            return f"{keyword} {kind.group(1).upper()}" if kind else keyword
+        return _COMMAND_LABELS.get(keyword, keyword)
+    label = _STATEMENT_LABELS.get(type(statement).__name__, "UNSUPPORTED STATEMENT")
+    kind = statement.args.get("kind")
+    if label in _KIND_STATEMENTS and isinstance(kind, str):
+        label = f"{label} {kind.upper()}"
+    return label
+
+
+def _table_id(table: Any) -> str:
+    return ".".join(part for part in (table.catalog, table.db, table.name) if part)
+
+
+def _table_matches(table_id: str, name: str) -> bool:
+    """Whether a referenced table is ``name``, allowing either to be partial."""
+    return (
+        table_id == name
+        or name.endswith("." + table_id)
+        or table_id.endswith("." + name)
+    )
+
+
+def _source_tables(select: Any) -> list[Any]:
+    """Tables read directly by a SELECT's FROM and JOIN clauses."""
+    # The FROM arg was renamed "from_" in newer sqlglot releases
+    sources = [select.args.get("from_") or select.args.get("from")]
+    sources += select.args.get("joins") or []
+    return [
+        source.this
+        for source in sources
+        if source is not None and isinstance(source.this, exp.Table)
+    ]
+
+
+def _conjuncts(where: Any) -> list[Any]:
+    """Conditions AND-ed together in a WHERE clause."""
+    if where is None:
+        return []
+    if isinstance(where.this, exp.And):
+        return list(where.this.flatten())
+    return [where.this]
+
+
+def _is_column(node: Any, name: str) -> bool:
+    return isinstance(node, exp.Column) and node.name.lower() == name.lower()
+
+
+def _bounds_range(conjuncts: list[Any], column: str) -> bool:
+    """Whether AND-ed conditions bound ``column`` from below and above."""
+    lower = upper = False
+    for condition in conjuncts:
+        if isinstance(condition, exp.Between) and _is_column(condition.this, column):
+            return True
+        if isinstance(condition, (exp.GT, exp.GTE)):
+            lower |= _is_column(condition.this, column)
+            upper |= _is_column(condition.expression, column)
+        elif isinstance(condition, (exp.LT, exp.LTE)):
+            upper |= _is_column(condition.this, column)
+            lower |= _is_column(condition.expression, column)
+    return lower and upper
+
+
+def _cte_names(statement: Any) -> set[str]:
+    return {cte.alias_or_name for cte in statement.find_all(exp.CTE)}
+
 
 class QueryValidator:
     """Validates BigQuery SQL queries for safety.
 
     Note:
-        This validator uses regex patterns which can be bypassed with careful
-        formatting. For production use with untrusted queries, consider using
-        a proper SQL parser like sqlparse for more robust validation.
+        Without sqlglot the regex fallback can be bypassed with careful
+        formatting; install the ``sql`` extra for untrusted queries.
     """
 
-    # Disallowed patterns for security
+    # Disallowed patterns for security (regex fallback)
     # Note: These patterns handle multiple whitespace and newlines
     DISALLOWED_PATTERNS = [
         r"DROP\s+TABLE",
@@ -28,7 +185,7 @@ class QueryValidator:
         r"REVOKE\s+",
     ]
 
-    # Expensive query patterns to warn about
+    # Expensive query patterns to warn about (regex fallback)
     WARNING_PATTERNS = [
         (r"SELECT\s+\*\s+FROM", "SELECT * queries can be expensive"),
         (r"CROSS\s+JOIN", "CROSS JOIN can produce very large results"),
@@ -47,21 +204,113 @@ class QueryValidator:
         return query.strip()
 
     @staticmethod
-    def validate_query(query: str) -> dict[str, Any]:
+    def validate_query(
+        query: str, partition_columns: dict[str, str] | None = None
+    ) -> dict[str, Any]:
         """
         Validate a BigQuery SQL query for safety.
 
         Args:
             query: SQL query to validate
+            partition_columns: Partition column by table ID (as for
+                ``missing_partition_filters``); reading one of these tables
+                without filtering its partition column is an error. Only
+                checked when sqlglot is installed.
 
         Returns:
-            Dict with 'valid' (bool), 'errors' (list), 'warnings' (list)
+            Dict with 'valid' (bool), 'errors' (list), 'warnings' (list),
+            'statement_type' (str) and 'referenced_tables' (list)
 
         Example:
             >>> result = QueryValidator.validate_query("SELECT * FROM table")
             >>> print(result['warnings'])
-            ['SELECT * queries can be expensive', 'Query has no LIMIT clause']
+            ['SELECT * queries can be expensive', 'Query has no LIMIT clause - may return large results']
         """
+        if SQLGLOT_AVAILABLE:
+            return QueryValidator._validate_parsed(query, partition_columns or {})
+        return QueryValidator._validate_regex(query)
+
+    @staticmethod
+    def _validate_parsed(
+        query: str, partition_columns: dict[str, str]
+    ) -> dict[str, Any]:
+        """Validate on the parsed syntax tree."""
+        errors: list[str] = []
+        warnings: list[str] = []
+        result = {
+            "valid": False,
+            "errors": errors,
+            "warnings": warnings,
+            "statement_type": None,
+            "referenced_tables": [],
+        }
+
+        try:
+            statements = _parse(query)
+        except sqlglot.errors.ParseError as e:
+            errors.append(f"Query could not be parsed: {str(e).splitlines()[0]}")
+            return result
+
+        if not statements:
+            errors.append("Query is empty")
+            return result
+        if len(statements) > 1:
+            errors.append("Multiple statements are not allowed")
+
+        for statement in statements:
+            if not isinstance(statement, exp.Query):
+                errors.append(
+                    "Query contains disallowed operation: "
+                    f"{_statement_label(statement)}"
+                )
+
+        for statement in statements:
+            for function in statement.find_all(exp.Func):
+                if function.name.upper() in _DISALLOWED_FUNCTIONS:
+                    errors.append(
+                        f"Query contains disallowed operation: {function.name.upper()}"
+                    )
+
+        statement = statements[0]
+        result["statement_type"] = _statement_label(statement)
+        result["referenced_tables"] = QueryValidator.referenced_tables(query)
+
+        if any(
+            isinstance(column, exp.Star)
+            or (isinstance(column, exp.Column) and isinstance(column.this, exp.Star))
+            for select in statement.find_all(exp.Select)
+            for column in select.expressions
+        ):
+            warnings.append("SELECT * queries can be expensive")
+        if any(
+            join.args.get("kind") == "CROSS" for join in statement.find_all(exp.Join)
+        ):
+            warnings.append("CROSS JOIN can produce very large results")
+        if any(True for _ in statement.find_all(exp.NEQ)):
+            warnings.append("!= operators can prevent index usage")
+        if isinstance(statement, exp.Query) and not statement.args.get("limit"):
+            warnings.append(_NO_LIMIT_WARNING)
+
+        if partition_columns and not errors:
+            for table_id in QueryValidator.missing_partition_filters(
+                query, partition_columns
+            ):
+                column = next(
+                    col
+                    for name, col in partition_columns.items()
+                    if _table_matches(table_id, name)
+                )
+                errors.append(
+                    f"Query reads partitioned table {table_id} without a filter "
+                    f"on {column}; filter it so BigQuery can prune partitions"
+                )
+
+        result["valid"] = not errors
+        return result
+
+    @staticmethod
+    def _validate_regex(query: str) -> dict[str, Any]:
+        """Validate with regex patterns (fallback without sqlglot)."""
         errors = []
         warnings = []
 
@@ -74,6 +323,10 @@ class QueryValidator:
                 operation = pattern.replace(r"\s+", " ").replace(r"\+", "")
                 errors.append(f"Query contains disallowed operation: {operation}")
 
+        for function in _DISALLOWED_FUNCTIONS:
+            if re.search(rf"\b{function}\s*\(", normalized_query, re.IGNORECASE):
+                errors.append(f"Query contains disallowed operation: {function}")
+
         # Check for warning patterns
         for pattern, message in QueryValidator.WARNING_PATTERNS:
             if re.search(pattern, normalized_query, re.IGNORECASE):
@@ -81,6 +334,179 @@ class QueryValidator:
 
         # Check for LIMIT clause (cost control)
         if not re.search(r"\bLIMIT\s+\d+", normalized_query, re.IGNORECASE):
-            warnings.append("Query has no LIMIT clause - may return large results")
+            warnings.append(_NO_LIMIT_WARNING)
+
+        first_word = normalized_query.split(" ", 1)[0].upper()
+        return {
+            "valid": len(errors) == 0,
+            "errors": errors,
+            "warnings": warnings,
+            "statement_type": first_word or None,
+            "referenced_tables": QueryValidator.referenced_tables(query),
+        }
+
+    @staticmethod
+    def referenced_tables(query: str) -> list[str]:
+        """
+        List the tables a query reads, excluding its CTEs.
+
+        Args:
+            query: SQL query
+
+        Returns:
+            Table IDs as written (``project.dataset.table`` when qualified),
+            without duplicates; empty if the query does not parse
+        """
+        if not SQLGLOT_AVAILABLE:
+            normalized = QueryValidator._normalize_query(query)
+            matches = re.findall(
+                r"\b(?:FROM|JOIN)\s+`?([\w.*-]+)`?", normalized, re.IGNORECASE
+            )
+            return list(dict.fromkeys(matches))
+
+        try:
+            statements = _parse(query)
+        except sqlglot.errors.ParseError:
+            return []
+        tables: list[str] = []
+        for statement in statements:
+            ctes = _cte_names(statement)
+            for table in statement.find_all(exp.Table):
+                if not table.db and table.name in ctes:
+                    continue
+                tables.append(_table_id(table))
+        return list(dict.fromkeys(tables))
+
+    @staticmethod
+    def missing_partition_filters(
+        query: str, partition_columns: dict[str, str]
+    ) -> list[str]:
+        """
+        Find partitioned tables a query reads without filtering on the partition.
+
+        A table counts as filtered when the WHERE clause of each SELECT that
+        reads it references its partition column, so BigQuery can prune
+        partitions instead of scanning the whole table.
+
+        Args:
+            query: SQL query
+            partition_columns: Partition column by table ID (may be
+                ``dataset.table`` or fully qualified)
+
+        Returns:
+            Table IDs (as written in the query) read without a partition
+            filter
+
+        Raises:
+            ImportError: If sqlglot is not installed
+        """
+        _require_parser()
+        missing: list[str] = []
+        for statement in _parse(query):
+            for select in statement.find_all(exp.Select):
+                where = select.args.get("where")
+                filtered = (
+                    {
+                        (column.table, column.name.lower())
+                        for column in where.find_all(exp.Column)
+                    }
+                    if where
+                    else set()
+                )
+                for table in _source_tables(select):
+                    table_id = _table_id(table)
+                    column = next(
+                        (
+                            col
+                            for name, col in partition_columns.items()
+                            if _table_matches(table_id, name)
+                        ),
+                        None,
+                    )
+                    if column is None:
+                        continue
+                    if not (
+                        (table.alias_or_name, column.lower()) in filtered
+                        or ("", column.lower()) in filtered
+                    ):
+                        missing.append(table_id)
+        return list(dict.fromkeys(missing))
 
-        return {"valid": len(errors) == 0, "errors": errors, "warnings": warnings}
+    @staticmethod
+    def pruning_problems(
+        query: str,
+        table: str,
+        partition_field: str | None,
+        cluster_field: str | None,
+    ) -> list[str]:
+        """
+        Check that every read of a table can prune partitions and clusters.
+
+        BigQuery prunes partitions only for a filter on the partition column
+        and skips clustered blocks only for a filter on the first clustering
+        column. Each SELECT reading ``table`` must filter the partition column
+        on a bounded range (``BETWEEN``, or both a lower and an upper bound)
+        and the first clustering column with ``=`` or ``IN``.
+
+        Args:
+            query: SQL query
+            table: Table ID (may be partial, e.g. ``dataset.table``)
+            partition_field: Partition column (None if not partitioned)
+            cluster_field: First clustering column (None if not clustered)
+
+        Returns:
+            Descriptions of missing filters (empty if the query prunes)
+        """
+        if not SQLGLOT_AVAILABLE:
+            return QueryValidator._pruning_problems_regex(
+                query, partition_field, cluster_field
+            )
+
+        problems: list[str] = []
+        for statement in _parse(query):
+            for select in statement.find_all(exp.Select):
+                for source in _source_tables(select):
+                    table_id = _table_id(source)
+                    if not _table_matches(table_id, table):
+                        continue
+                    conjuncts = _conjuncts(select.args.get("where"))
+                    if partition_field and not _bounds_range(
+                        conjuncts, partition_field
+                    ):
+                        problems.append(
+                            f"{table_id}: no bounded range on partition column "
+                            f"{partition_field}"
+                        )
+                    if cluster_field and not any(
+                        isinstance(c, (exp.EQ, exp.In))
+                        and _is_column(c.this, cluster_field)
+                        for c in conjuncts
+                    ):
+                        problems.append(
+                            f"{table_id}: no filter on clustering column "
+                            f"{cluster_field}"
+                        )
+        return problems
+
+    @staticmethod
+    def _pruning_problems_regex(
+        query: str, partition_field: str | None, cluster_field: str | None
+    ) -> list[str]:
+        """Approximate ``pruning_problems`` over the whole query text."""
+        normalized = QueryValidator._normalize_query(query)
+        problems = []
+        if partition_field:
+            column = rf"\b(?:\w+\.)?{re.escape(partition_field)}\s*"
+            bounded = re.search(column + r"BETWEEN\b", normalized, re.I) or (
+                re.search(column + r">", normalized, re.I)
+                and re.search(column + r"<", normalized, re.I)
+            )
+            if not bounded:
+                problems.append(
+                    f"no bounded range on partition column {partition_field}"
+                )
+        if cluster_field:
+            column = rf"\b(?:\w+\.)?{re.escape(cluster_field)}\s*"
+            if not re.search(column + r"(?:=|IN\b)", normalized, re.I):
+                problems.append(f"no filter on clustering column {cluster_field}")
+        return problems
@@ -7,6 +7,8 @@ from typing import Any
 
 from redis.asyncio import Redis
 
+from paidsearchnav_mcp.core.tracing import get_current_span, traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,6 +39,7 @@ class CacheClient:
         self.redis = Redis.from_url(redis_url, decode_responses=False)
         self.default_ttl = default_ttl
         self._connected = False
+        self._stats = {"hits": 0, "misses": 0, "errors": 0}
         logger.info(f"CacheClient initialized with TTL={default_ttl}s")
 
     def _make_key(self, prefix: str, params: dict[str, Any]) -> str:
@@ -62,6 +65,7 @@ class CacheClient:
         logger.debug(f"Generated cache key: {key} from params: {params}")
         return key
 
+    @traced("cache.get")
     async def get(self, key: str) -> dict[str, Any] | None:
         """Get cached value by key.
 
@@ -75,23 +79,32 @@ class CacheClient:
             json.JSONDecodeError: If cached data is not valid JSON
             Exception: If Redis connection fails
         """
+        span = get_current_span()
+        span.set_attribute("cache.key_prefix", key.split(":", 1)[0])
         try:
             data = await self.redis.get(key)
+            span.set_attribute("cache.hit", bool(data))
             if data:
+                span.set_attribute("bytes", len(data))
                 result: dict[str, Any] = json.loads(data)
+                self._stats["hits"] += 1
                 logger.debug(f"Cache hit for key: {key}")
                 return result
+            self._stats["misses"] += 1
             logger.debug(f"Cache miss for key: {key}")
             return None
         except json.JSONDecodeError as e:
+            self._stats["errors"] += 1
             logger.error(f"Failed to decode cached data for key {key}: {e}")
             # Delete corrupted cache entry
             await self.delete(key)
             return None
         except Exception as e:
+            self._stats["errors"] += 1
             logger.error(f"Redis get error for key {key}: {e}")
             raise
 
+    @traced("cache.set")
     async def set(
         self, key: str, value: dict[str, Any], ttl: int | None = None
     ) -> None:
@@ -106,9 +119,12 @@ class CacheClient:
             TypeError: If value is not JSON serializable
             Exception: If Redis connection fails
         """
+        span = get_current_span()
+        span.set_attribute("cache.key_prefix", key.split(":", 1)[0])
         try:
             ttl = ttl or self.default_ttl
             serialized = json.dumps(value)
+            span.set_attribute("bytes", len(serialized))
             await self.redis.setex(key, ttl, serialized)
             logger.debug(f"Cache set for key: {key} with TTL={ttl}s")
         except TypeError as e:
@@ -240,3 +256,16 @@ class CacheClient:
             True if connected, False otherwise
         """
         return self._connected
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Get lookup statistics since the client was created.
+
+        Returns:
+            Hit, miss and error counts plus the hit ratio of successful lookups
+        """
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_ratio": self._stats["hits"] / lookups if lookups else 0.0,
+        }
@@ -12,7 +12,6 @@ from typing import Any, Dict, List, Optional
 try:
     from google.cloud import bigquery
     from google.cloud.exceptions import GoogleCloudError
-    from google.oauth2 import service_account
 
     BIGQUERY_AVAILABLE = True
 except ImportError:
@@ -58,22 +57,16 @@ class GA4BigQueryClient:
     def _get_client(self) -> bigquery.Client:
         """Get or create BigQuery client with explicit credential management."""
         if self._client is None:
+            from paidsearchnav_mcp.clients.bigquery.pool import get_bigquery_client
+
             try:
+                # Shared with other clients of the same project and credentials
+                self._client = get_bigquery_client(
+                    self.project_id, self.credentials_path, self.location
+                )
                 if self.credentials_path:
-                    credentials = service_account.Credentials.from_service_account_file(
-                        self.credentials_path
-                    )
-                    self._client = bigquery.Client(
-                        project=self.project_id,
-                        location=self.location,
-                        credentials=credentials,
-                    )
                     logger.info("Using service account credentials for BigQuery client")
                 else:
-                    # Use default credentials with validation
-                    self._client = bigquery.Client(
-                        project=self.project_id, location=self.location
-                    )
                     logger.info("Using default credentials for BigQuery client")
 
                 # Test the connection
@@ -729,6 +722,9 @@ class GA4BigQueryClient:
         Returns:
             List of result dictionaries
         """
+        from paidsearchnav_mcp.clients.bigquery.pool import BIGQUERY_CLIENTS
+        from paidsearchnav_mcp.clients.bigquery.results import read_result
+
         query_context = query[:100] + "..." if len(query) > 100 else query
 
         try:
@@ -747,19 +743,11 @@ class GA4BigQueryClient:
             job_config.dry_run = False
 
             query_job = client.query(query, job_config=job_config)
-            results = query_job.result()
-
-            # Convert to list of dictionaries
-            records = []
-            for row in results:
-                record = {}
-                for key, value in row.items():
-                    # Handle timestamp conversion
-                    if isinstance(value, datetime):
-                        record[key] = value.isoformat()
-                    else:
-                        record[key] = value
-                records.append(record)
+
+            # Read columnar, then convert (timestamps to ISO strings) per column
+            records = read_result(
+                query_job.result(), read_client=BIGQUERY_CLIENTS.read_client(client)
+            ).to_rows()
 
             logger.info(f"Query executed successfully, returned {len(records)} records")
             logger.info(f"Query processed {query_job.total_bytes_processed} bytes")
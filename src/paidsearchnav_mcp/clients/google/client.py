@@ -1,7 +1,12 @@
 """Google Ads API client implementation."""
 
 import asyncio
+import contextvars
+import functools
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Generator
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -21,13 +26,20 @@ from paidsearchnav_mcp.clients.google.rate_limiting import (
     search_rate_limited,
 )
 from paidsearchnav_mcp.clients.google.validation import GoogleAdsInputValidator
-from paidsearchnav_mcp.core.circuit_breaker import GoogleAdsCircuitBreaker
+from paidsearchnav_mcp.core.circuit_breaker import (
+    AsyncGoogleAdsCircuitBreaker,
+    CircuitBreakerRegistry,
+    GoogleAdsCircuitBreaker,
+)
 from paidsearchnav_mcp.core.config import CircuitBreakerConfig, Settings
 from paidsearchnav_mcp.core.exceptions import (
     APIError,
     AuthenticationError,
+    CircuitOpenError,
+    InvalidPageTokenError,
     RateLimitError,
 )
+from paidsearchnav_mcp.core.tracing import start_span, traced
 from paidsearchnav_mcp.models.campaign import Campaign
 from paidsearchnav_mcp.models.keyword import Keyword, MatchType
 from paidsearchnav_mcp.models.search_term import SearchTerm, SearchTermMetrics
@@ -82,6 +94,24 @@ VALID_CURRENCY_CODES = {
     "NZD",
 }
 
+# Queries whose page tokens are remembered for resuming offset requests
+MAX_PAGE_BOOKMARK_QUERIES = 256
+
+
+def _record_page_attributes(span: Any, rows: list[Any]) -> None:
+    """Record row count and serialized size of a result page on a span.
+
+    Sizing re-serializes every row, so it only runs while the span records.
+    """
+    if not span.is_recording():
+        return
+    span.set_attribute("rows", len(rows))
+    try:
+        span.set_attribute("bytes", sum(type(row).pb(row).ByteSize() for row in rows))
+    except (AttributeError, TypeError):
+        # Not proto-plus messages (e.g. test doubles); skip sizing
+        pass
+
 
 class GoogleAdsAPIClient:
     """Google Ads API client for fetching campaign data."""
@@ -98,6 +128,8 @@ class GoogleAdsAPIClient:
         default_page_size: int = 1000,
         max_page_size: int = 10000,
         settings: Settings | None = None,
+        circuit_breaker_failure_categories: frozenset[str] | None = None,
+        max_circuit_breakers: int = 1000,
     ):
         """Initialize Google Ads API client.
 
@@ -112,6 +144,11 @@ class GoogleAdsAPIClient:
             default_page_size: Default page size for paginated requests (1-10000)
             max_page_size: Maximum page size for paginated requests (Google Ads limit is 10000)
             settings: Application settings for rate limiting configuration
+            circuit_breaker_failure_categories: Error categories that open a
+                circuit (see AsyncGoogleAdsCircuitBreaker.classify_error); all
+                categories if None
+            max_circuit_breakers: Maximum number of per-customer/operation
+                circuit breakers kept in memory
         """
         self.developer_token = developer_token
         self.client_id = client_id
@@ -139,6 +176,19 @@ class GoogleAdsAPIClient:
         if circuit_breaker_config is None:
             circuit_breaker_config = CircuitBreakerConfig()
         self._circuit_breaker = GoogleAdsCircuitBreaker(circuit_breaker_config)
+        # Decorate once instead of building a protected closure per request
+        self._protected_operation = self._circuit_breaker(self._run_operation)
+
+        # Async paths use one breaker per (customer, operation) so a failing
+        # account does not open the circuit for every other account
+        self._circuit_breakers = CircuitBreakerRegistry(
+            lambda customer_id, operation: AsyncGoogleAdsCircuitBreaker(
+                circuit_breaker_config,
+                name=f"GoogleAdsAPI[{customer_id}:{operation}]",
+                failure_categories=circuit_breaker_failure_categories,
+            ),
+            max_breakers=max_circuit_breakers,
+        )
 
         # Initialize rate limiter
         self._rate_limiter = GoogleAdsRateLimiter(settings)
@@ -146,6 +196,12 @@ class GoogleAdsAPIClient:
         # Initialize API efficiency metrics
         self._metrics = APIEfficiencyMetrics()
 
+        # Page tokens by (customer_id, query), keyed by the row they start at,
+        # so offset requests resume near the offset instead of at row 0
+        self._page_bookmarks: OrderedDict[tuple[str, str], dict[int, str]] = (
+            OrderedDict()
+        )
+
     def _get_client(self) -> GoogleAdsClient:
         """Get or create Google Ads client instance."""
         if not self._initialized:
@@ -173,8 +229,15 @@ class GoogleAdsAPIClient:
 
     @property
     def circuit_breaker_metrics(self) -> dict[str, Any]:
-        """Get circuit breaker metrics for monitoring."""
-        return self._circuit_breaker.metrics
+        """Get circuit breaker metrics for monitoring.
+
+        Top-level keys describe the shared breaker used by synchronous calls;
+        ``breaker_registry`` aggregates the per-customer/operation breakers.
+        """
+        return {
+            **self._circuit_breaker.metrics,
+            "breaker_registry": self._circuit_breakers.metrics,
+        }
 
     @property
     def rate_limiter(self) -> GoogleAdsRateLimiter:
@@ -212,12 +275,14 @@ class GoogleAdsAPIClient:
 
         return status
 
+    @traced("google_ads.paginated_search", record_args=("customer_id",))
     def _paginated_search(
         self,
         customer_id: str,
         query: str,
         page_size: int | None = None,
         max_results: int | None = None,
+        offset: int = 0,
     ) -> list[Any]:
         """Execute a paginated Google Ads search query.
 
@@ -238,82 +303,201 @@ class GoogleAdsAPIClient:
             query: GAQL query string
             page_size: Page size for pagination (IGNORED - kept for compatibility)
             max_results: Maximum number of results to return (no limit if None)
+            offset: Number of leading result rows to skip
 
         Returns:
-            List of all results from all pages
+            List of results from all pages, starting at offset
 
         Raises:
-            ValueError: If page_size exceeds max_page_size
+            ValueError: If page_size exceeds max_page_size or offset is negative
             APIError: If circuit breaker is open or operation fails
         """
-        if page_size is None:
-            page_size = self.default_page_size
-        elif page_size > self.max_page_size:
+        ga_service = self._get_client().get_service("GoogleAdsService")
+        pages = self._search_pages(customer_id, query, page_size, max_results, offset)
+        try:
+            request = next(pages)
+            while True:
+                try:
+                    page = self._execute_with_circuit_breaker(
+                        "paginated_search",
+                        functools.partial(self._fetch_page, ga_service, request),
+                    )
+                except Exception as ex:
+                    request = pages.throw(ex)
+                else:
+                    request = pages.send(page)
+        except StopIteration as done:
+            return done.value
+
+    def _find_page_bookmark(self, key: tuple[str, str], offset: int) -> tuple[int, str]:
+        """Find the closest remembered page token at or before a row offset.
+
+        Args:
+            key: (customer_id, query) the tokens were recorded for
+            offset: Row offset the caller wants to start at
+
+        Returns:
+            Tuple of (row the page starts at, page token); (0, "") if none
+        """
+        bookmarks = self._page_bookmarks.get(key)
+        if not bookmarks:
+            return 0, ""
+        self._page_bookmarks.move_to_end(key)
+        starts = [start for start in bookmarks if start <= offset]
+        if not starts:
+            return 0, ""
+        start = max(starts)
+        return start, bookmarks[start]
+
+    def _record_page_bookmark(
+        self, key: tuple[str, str], row_start: int, page_token: str
+    ) -> None:
+        """Remember the page token for the page starting at row_start."""
+        bookmarks = self._page_bookmarks.setdefault(key, {})
+        self._page_bookmarks.move_to_end(key)
+        bookmarks[row_start] = page_token
+        while len(self._page_bookmarks) > MAX_PAGE_BOOKMARK_QUERIES:
+            self._page_bookmarks.popitem(last=False)
+
+    @traced("google_ads.paginated_search", record_args=("customer_id",))
+    async def _paginated_search_async(
+        self,
+        customer_id: str,
+        query: str,
+        page_size: int | None = None,
+        max_results: int | None = None,
+        offset: int = 0,
+    ) -> list[Any]:
+        """Execute a paginated Google Ads search query asynchronously.
+
+        Pagination runs on the event loop; each page is fetched and decoded
+        in the default executor under the customer's circuit breaker.
+
+        Args:
+            customer_id: Google Ads customer ID
+            query: GAQL query string
+            page_size: Page size for pagination (IGNORED - kept for compatibility)
+            max_results: Maximum number of results to return (no limit if None)
+            offset: Number of leading result rows to skip
+
+        Returns:
+            List of results from all pages, starting at offset
+
+        Raises:
+            ValueError: If page_size exceeds max_page_size or offset is negative
+            APIError: If circuit breaker is open or operation fails
+        """
+        ga_service = self._get_client().get_service("GoogleAdsService")
+        pages = self._search_pages(customer_id, query, page_size, max_results, offset)
+        try:
+            request = next(pages)
+            while True:
+                try:
+                    page = await self._execute_async(
+                        customer_id,
+                        "paginated_search",
+                        functools.partial(self._fetch_page, ga_service, request),
+                    )
+                except Exception as ex:
+                    request = pages.throw(ex)
+                else:
+                    request = pages.send(page)
+        except StopIteration as done:
+            return done.value
+
+    def _search_pages(
+        self,
+        customer_id: str,
+        query: str,
+        page_size: int | None,
+        max_results: int | None,
+        offset: int,
+    ) -> Generator[Any, tuple[list[Any], str], list[Any]]:
+        """Paging loop shared by the sync and async paginated searches.
+
+        Yields each SearchGoogleAdsRequest to send and is sent back the page
+        it returned as ``(rows, next page token)``; a failed fetch is thrown
+        in. Returns the collected rows.
+
+        Page tokens seen for a query are remembered, so a request with an
+        offset resumes from the closest earlier page instead of fetching
+        every row before it again. If the API rejects a remembered token as
+        invalid or expired, the query's tokens are forgotten and the search
+        restarts from the first page; any other failure is raised.
+        """
+        if page_size is not None and page_size > self.max_page_size:
             raise ValueError(
                 f"page_size ({page_size}) cannot exceed max_page_size ({self.max_page_size})"
             )
+        if offset < 0:
+            raise ValueError(f"offset ({offset}) cannot be negative")
 
-        # Start metrics tracking
         call_id = self._metrics.start_call(
             operation_type="paginated_search", customer_id=customer_id, query=query
         )
 
         client = self._get_client()
-        ga_service = client.get_service("GoogleAdsService")
+        bookmark_key = (customer_id, query)
+        row_start, page_token = (
+            self._find_page_bookmark(bookmark_key, offset) if offset else (0, "")
+        )
+        resumed = bool(page_token)
 
-        all_results = []
-        page_token = None
-        total_fetched = 0
+        all_results: list[Any] = []
         page_count = 0
 
         try:
             while True:
                 page_count += 1
 
-                # Create search request
                 search_request = client.get_type("SearchGoogleAdsRequest")
                 search_request.customer_id = customer_id
                 search_request.query = query
-                # Note: page_size removed for Google Ads API V17+ compatibility
-                # API now uses fixed page size of 10,000 rows
-
+                # Note: page_size is not sent for Google Ads API V17+
+                # compatibility; the API uses a fixed page size of 10,000 rows
                 if page_token:
                     search_request.page_token = page_token
 
-                # Execute request with circuit breaker
-                response = self._execute_with_circuit_breaker(
-                    "paginated_search",
-                    lambda: ga_service.search(request=search_request),
-                )
-
-                # Collect results from this page
-                page_results = list(response)
-                all_results.extend(page_results)
-                total_fetched += len(page_results)
+                try:
+                    with start_span(
+                        "google_ads.search_page",
+                        {"customer_id": customer_id, "page": page_count},
+                    ):
+                        page_results, page_token = yield search_request
+                except InvalidPageTokenError:
+                    if not resumed:
+                        raise
+                    logger.info(
+                        f"Stored page token rejected for {customer_id}; "
+                        "restarting search from the first page"
+                    )
+                    self._page_bookmarks.pop(bookmark_key, None)
+                    row_start, page_token, resumed = 0, "", False
+                    continue
+                resumed = False
+
+                # Skip rows before the offset on the page that contains it
+                skip = max(0, offset - row_start)
+                row_start += len(page_results)
+                all_results.extend(page_results[skip:])
+                if page_token:
+                    self._record_page_bookmark(bookmark_key, row_start, page_token)
 
                 logger.debug(
-                    f"Fetched page with {len(page_results)} results (total: {total_fetched})"
+                    f"Fetched page with {len(page_results)} results "
+                    f"(total: {len(all_results)})"
                 )
 
-                # Check if we should stop
-                if max_results and total_fetched >= max_results:
-                    # Trim results to max_results
-                    all_results = all_results[:max_results]
+                if max_results and len(all_results) >= max_results:
+                    del all_results[max_results:]
                     break
 
-                # Check if there are more pages
-                if (
-                    not hasattr(response, "next_page_token")
-                    or not response.next_page_token
-                ):
+                if not page_token:
                     logger.debug(
                         f"Pagination complete: no more pages available for {customer_id}"
                     )
                     break
 
-                page_token = response.next_page_token
-
-            # End metrics tracking with success
             self._metrics.end_call(
                 call_id=call_id,
                 record_count=len(all_results),
@@ -321,11 +505,11 @@ class GoogleAdsAPIClient:
                 success=True,
             )
 
-            # Memory efficiency warning for large datasets
             if len(all_results) > 50000:
                 logger.warning(
                     f"Large dataset retrieved: {len(all_results)} records. "
-                    "Consider using search_stream() for memory efficiency."
+                    "Consider using search_stream() or search_stream_async() "
+                    "for memory efficiency."
                 )
 
             logger.info(
@@ -334,46 +518,35 @@ class GoogleAdsAPIClient:
             return all_results
 
         except Exception as ex:
-            # End metrics tracking with error
-            error_type = type(ex).__name__
             self._metrics.end_call(
                 call_id=call_id,
                 record_count=len(all_results),
                 page_count=page_count,
                 success=False,
-                error_type=error_type,
+                error_type=type(ex).__name__,
                 error_message=str(ex),
             )
-
-            # Re-raise the exception
             raise
 
-    async def _paginated_search_async(
-        self,
-        customer_id: str,
-        query: str,
-        page_size: int | None = None,
-        max_results: int | None = None,
-    ) -> list[Any]:
-        """Execute a paginated Google Ads search query asynchronously.
+    @staticmethod
+    def _fetch_page(ga_service: Any, search_request: Any) -> tuple[list[Any], str]:
+        """Fetch and materialize one page of search results.
+
+        Runs in an executor thread so proto decoding stays off the event loop.
 
         Args:
-            customer_id: Google Ads customer ID
-            query: GAQL query string
-            page_size: Page size for pagination (IGNORED - kept for compatibility)
-            max_results: Maximum number of results to return (no limit if None)
+            ga_service: Google Ads service instance
+            search_request: Prepared SearchGoogleAdsRequest
 
         Returns:
-            List of all results from all pages
+            Tuple of (page rows, next page token or empty string)
         """
-        return await asyncio.get_event_loop().run_in_executor(
-            None,
-            self._paginated_search,
-            customer_id,
-            query,
-            page_size,
-            max_results,
-        )
+        with start_span("google_ads.fetch_page") as span:
+            response = ga_service.search(request=search_request)
+            rows = list(response)
+            _record_page_attributes(span, rows)
+        next_page_token = getattr(response, "next_page_token", "") or ""
+        return rows, next_page_token
 
     def search_stream(
         self,
@@ -507,12 +680,10 @@ class GoogleAdsAPIClient:
                 search_request.page_token = page_token
 
             # Execute request with circuit breaker in executor
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._execute_with_circuit_breaker(
-                    "search_stream_async",
-                    lambda: ga_service.search(request=search_request),
-                ),
+            response = await self._execute_async(
+                customer_id,
+                "search_stream_async",
+                lambda: ga_service.search(request=search_request),
             )
 
             # Yield results from this page
@@ -539,6 +710,26 @@ class GoogleAdsAPIClient:
             f"Async search stream completed: {total_yielded} total results from {customer_id}"
         )
 
+    def _run_operation(self, operation_name: str, operation_func: Any) -> Any:
+        """Run an API operation, converting errors to internal exceptions.
+
+        Args:
+            operation_name: Name of the operation for logging
+            operation_func: Function to execute
+
+        Returns:
+            Result of the operation
+        """
+        try:
+            return operation_func()
+        except GoogleAdsException as ex:
+            # Convert Google Ads exceptions to our internal exceptions
+            # This will trigger the circuit breaker appropriately
+            self._handle_google_ads_exception(ex)
+        except Exception as ex:
+            logger.error(f"Unexpected error in {operation_name}: {ex}")
+            raise APIError(f"Unexpected error in {operation_name}: {str(ex)}") from ex
+
     def _execute_with_circuit_breaker(
         self, operation_name: str, operation_func: Any
     ) -> Any:
@@ -554,23 +745,8 @@ class GoogleAdsAPIClient:
         Raises:
             APIError: If circuit breaker is open or operation fails
         """
-
-        @self._circuit_breaker
-        def protected_operation():
-            try:
-                return operation_func()
-            except GoogleAdsException as ex:
-                # Convert Google Ads exceptions to our internal exceptions
-                # This will trigger the circuit breaker appropriately
-                self._handle_google_ads_exception(ex)
-            except Exception as ex:
-                logger.error(f"Unexpected error in {operation_name}: {ex}")
-                raise APIError(
-                    f"Unexpected error in {operation_name}: {str(ex)}"
-                ) from ex
-
         try:
-            return protected_operation()
+            return self._protected_operation(operation_name, operation_func)
         except Exception as ex:
             # If circuit breaker is open, provide helpful error message
             if self._circuit_breaker.state == "open":
@@ -584,6 +760,56 @@ class GoogleAdsAPIClient:
                 ) from ex
             raise
 
+    async def _execute_async(
+        self, customer_id: str, operation_name: str, operation_func: Any
+    ) -> Any:
+        """Execute a blocking API operation off the event loop.
+
+        Admission and state tracking happen on the event loop using the
+        async circuit breaker for (customer_id, operation_name); the call
+        itself runs in the default executor.
+
+        Args:
+            customer_id: Google Ads customer ID the operation targets
+            operation_name: Name of the operation for logging
+            operation_func: Blocking function to execute
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            APIError: If circuit breaker is open or operation fails
+        """
+        breaker = self._circuit_breakers.get(customer_id, operation_name)
+        loop = asyncio.get_running_loop()
+        try:
+            with start_span(
+                "google_ads.execute",
+                {"customer_id": customer_id, "operation": operation_name},
+            ) as span:
+                submitted = time.perf_counter()
+
+                def run() -> Any:
+                    span.set_attribute(
+                        "executor.queue_seconds", time.perf_counter() - submitted
+                    )
+                    return self._run_operation(operation_name, operation_func)
+
+                # Run under a copy of the current context so spans opened in
+                # the executor thread nest under this one
+                context = contextvars.copy_context()
+                return await breaker.call(loop.run_in_executor, None, context.run, run)
+        except CircuitOpenError as ex:
+            logger.warning(
+                f"Google Ads API circuit breaker is OPEN for customer {customer_id} "
+                f"- rejecting {operation_name} call"
+            )
+            raise APIError(
+                f"Google Ads API is temporarily unavailable for this account. "
+                f"Circuit breaker is OPEN due to repeated failures. "
+                f"Operation: {operation_name}"
+            ) from ex
+
     async def _get_customer_currency(self, customer_id: str, ga_service: Any) -> str:
         """Get customer currency code from Google Ads.
 
@@ -602,12 +828,10 @@ class GoogleAdsAPIClient:
                 LIMIT 1
             """.strip()
 
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._execute_with_circuit_breaker(
-                    "get_customer_currency",
-                    lambda: ga_service.search(customer_id=customer_id, query=query),
-                ),
+            response = await self._execute_async(
+                customer_id,
+                "get_customer_currency",
+                lambda: ga_service.search(customer_id=customer_id, query=query),
             )
 
             for row in response:
@@ -789,6 +1013,7 @@ class GoogleAdsAPIClient:
         end_date: datetime | None = None,
         page_size: int | None = None,
         max_results: int | None = None,
+        offset: int = 0,
     ) -> list[Keyword]:
         """Fetch keyword data from Google Ads.
 
@@ -802,6 +1027,7 @@ class GoogleAdsAPIClient:
             end_date: End date for metrics (defaults to yesterday)
             page_size: Number of results per page (uses default if None)
             max_results: Maximum number of results to return (no limit if None)
+            offset: Number of leading keywords to skip
 
         Returns:
             List of Keyword objects
@@ -882,6 +1108,7 @@ class GoogleAdsAPIClient:
                 query=query,
                 page_size=page_size,
                 max_results=max_results,
+                offset=offset,
             )
 
             keywords = []
@@ -968,6 +1195,9 @@ class GoogleAdsAPIClient:
         ad_groups: list[str] | None = None,
         page_size: int | None = None,
         max_results: int | None = None,
+        include_keyword: bool = False,
+        campaign_types: list[str] | None = None,
+        offset: int = 0,
     ) -> list[SearchTerm]:
         """Fetch search terms report data from Google Ads.
 
@@ -979,6 +1209,13 @@ class GoogleAdsAPIClient:
             ad_groups: Optional list of ad group IDs to filter
             page_size: Number of results per page (uses default if None)
             max_results: Maximum number of results to return (no limit if None)
+            include_keyword: Segment by the triggering keyword and populate
+                keyword_id, keyword_text and match_type. Rows are split per
+                keyword, so a search term may appear more than once.
+            campaign_types: Optional campaign types to filter (e.g.
+                ``["PERFORMANCE_MAX"]``), so one query covers every campaign
+                of a type
+            offset: Number of leading search term rows to skip
 
         Returns:
             List of SearchTerm objects
@@ -994,6 +1231,10 @@ class GoogleAdsAPIClient:
         if ad_groups:
             GoogleAdsInputValidator.validate_ad_group_ids(ad_groups)
 
+        # Validate campaign types early to prevent any API calls with malicious input
+        if campaign_types:
+            GoogleAdsInputValidator.validate_campaign_types(campaign_types)
+
         # Validate date range
         self._validate_date_range(start_date, end_date)
 
@@ -1006,6 +1247,15 @@ class GoogleAdsAPIClient:
 
         # Build query (without ad_group_criterion fields which are incompatible with search_term_view)
         # Issue #126: Confirmed compatibility with Google Ads API v20
+        # The triggering keyword is only available as a segment
+        keyword_fields = (
+            """
+                segments.keyword.ad_group_criterion,
+                segments.keyword.info.text,
+                segments.keyword.info.match_type,"""
+            if include_keyword
+            else ""
+        )
         query = f"""
             SELECT
                 search_term_view.search_term,
@@ -1013,7 +1263,7 @@ class GoogleAdsAPIClient:
                 campaign.id,
                 campaign.name,
                 ad_group.id,
-                ad_group.name,
+                ad_group.name,{keyword_fields}
                 metrics.impressions,
                 metrics.clicks,
                 metrics.cost_micros,
@@ -1035,6 +1285,14 @@ class GoogleAdsAPIClient:
                     else f" AND {campaign_filter}"
                 )
 
+        if campaign_types:
+            # Validate campaign types against enum to prevent injection
+            campaign_type_filter = (
+                GoogleAdsInputValidator.build_safe_campaign_type_filter(campaign_types)
+            )
+            if campaign_type_filter:
+                query += f" AND ({campaign_type_filter})"
+
         if ad_groups:
             # Validate ad group IDs to prevent injection
             ad_group_filter, needs_parens = (
@@ -1056,6 +1314,7 @@ class GoogleAdsAPIClient:
                 query=query,
                 page_size=page_size,
                 max_results=max_results,
+                offset=offset,
             )
 
             search_terms = []
@@ -1066,6 +1325,16 @@ class GoogleAdsAPIClient:
                 # Convert micros to currency
                 cost = metrics.cost_micros / MICROS_PER_CURRENCY_UNIT
 
+                keyword_id = keyword_text = match_type = None
+                if include_keyword:
+                    keyword = row.segments.keyword
+                    # Empty for terms not triggered by a keyword (e.g. DSA)
+                    if keyword.info.text:
+                        # Resource name ends in "<ad_group_id>~<criterion_id>"
+                        keyword_id = keyword.ad_group_criterion.rsplit("~", 1)[-1]
+                        keyword_text = keyword.info.text
+                        match_type = keyword.info.match_type.name
+
                 search_terms.append(
                     SearchTerm(
                         search_term=search_term.search_term,
@@ -1073,9 +1342,9 @@ class GoogleAdsAPIClient:
                         campaign_name=row.campaign.name,
                         ad_group_id=str(row.ad_group.id),
                         ad_group_name=row.ad_group.name,
-                        keyword_id=None,  # Not available from search_term_view
-                        keyword_text=None,  # Not available from search_term_view
-                        match_type=None,  # Not available from search_term_view
+                        keyword_id=keyword_id,
+                        keyword_text=keyword_text,
+                        match_type=match_type,
                         date_start=start_date.date() if start_date else None,
                         date_end=end_date.date() if end_date else None,
                         metrics=SearchTermMetrics(
@@ -1097,6 +1366,127 @@ class GoogleAdsAPIClient:
         except GoogleAdsException as e:
             self._handle_google_ads_exception(e)
 
+    @report_rate_limited
+    async def get_daily_performance(
+        self,
+        customer_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        level: str = "CAMPAIGN",
+        campaigns: list[str] | None = None,
+        page_size: int | None = None,
+        max_results: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch metrics segmented by day for every campaign or ad group.
+
+        One query covers every entity and day in the range, so trend
+        analysis needs no per-entity calls. Days without impressions are
+        omitted.
+
+        Args:
+            customer_id: Google Ads customer ID
+            start_date: First day of the report
+            end_date: Last day of the report
+            level: Entity to segment by (CAMPAIGN or AD_GROUP)
+            campaigns: Optional list of campaign IDs to filter
+            page_size: Number of results per page (uses default if None)
+            max_results: Maximum number of results to return (no limit if None)
+
+        Returns:
+            One dictionary per entity and day with ``date`` (YYYY-MM-DD),
+            ``entity_id``, ``entity_name``, ``campaign_id``,
+            ``campaign_name`` and the day's metrics (cost in currency units)
+
+        Raises:
+            ValueError: If the level or campaign IDs are invalid
+            AuthenticationError: For authentication failures
+            RateLimitError: For rate limit errors
+            APIError: For other API errors
+        """
+        # Validate customer ID format
+        customer_id = GoogleAdsInputValidator.validate_customer_id(customer_id)
+
+        # Validate campaign IDs early to prevent any API calls with malicious input
+        if campaigns:
+            GoogleAdsInputValidator.validate_campaign_ids(campaigns)
+
+        level = level.upper().strip()
+        if level not in ("CAMPAIGN", "AD_GROUP"):
+            raise ValueError(f"Invalid level: {level}. Must be CAMPAIGN or AD_GROUP")
+
+        # Validate date range
+        self._validate_date_range(start_date, end_date)
+
+        start_date_str = start_date.strftime("%Y-%m-%d")
+        end_date_str = end_date.strftime("%Y-%m-%d")
+        resource = level.lower()
+        entity_fields = "ad_group.id, ad_group.name," if level == "AD_GROUP" else ""
+
+        query = f"""
+            SELECT
+                segments.date,
+                campaign.id,
+                campaign.name,
+                {entity_fields}
+                metrics.impressions,
+                metrics.clicks,
+                metrics.cost_micros,
+                metrics.conversions,
+                metrics.conversions_value
+            FROM {resource}
+            WHERE segments.date BETWEEN '{start_date_str}' AND '{end_date_str}'
+                AND metrics.impressions > 0
+        """.strip()
+
+        if campaigns:
+            # Validate campaign IDs to prevent injection
+            campaign_filter, needs_parens = (
+                GoogleAdsInputValidator.build_safe_campaign_id_filter(campaigns)
+            )
+            if campaign_filter:
+                query += (
+                    f" AND ({campaign_filter})"
+                    if needs_parens
+                    else f" AND {campaign_filter}"
+                )
+
+        try:
+            # Use paginated search for memory efficiency
+            response_rows = await self._paginated_search_async(
+                customer_id=customer_id,
+                query=query,
+                page_size=page_size,
+                max_results=max_results,
+            )
+
+            daily = []
+            for row in response_rows:
+                metrics = row.metrics
+                entity = row.ad_group if level == "AD_GROUP" else row.campaign
+                daily.append(
+                    {
+                        "date": row.segments.date,
+                        "entity_id": str(entity.id),
+                        "entity_name": entity.name,
+                        "campaign_id": str(row.campaign.id),
+                        "campaign_name": row.campaign.name,
+                        "impressions": metrics.impressions,
+                        "clicks": metrics.clicks,
+                        "cost": metrics.cost_micros / MICROS_PER_CURRENCY_UNIT,
+                        "conversions": metrics.conversions,
+                        "conversion_value": metrics.conversions_value,
+                    }
+                )
+
+            logger.info(
+                f"Fetched {len(daily)} daily {resource} rows for customer "
+                f"{customer_id} between {start_date_str} and {end_date_str}"
+            )
+            return daily
+
+        except GoogleAdsException as e:
+            self._handle_google_ads_exception(e)
+
     async def _fetch_ad_group_negative_keywords(
         self,
         customer_id: str,
@@ -1413,6 +1803,7 @@ class GoogleAdsAPIClient:
         Raises:
             AuthenticationError: For authentication failures
             RateLimitError: For rate limit errors
+            InvalidPageTokenError: For invalid or expired page tokens
             APIError: For other API errors
         """
         error_messages = []
@@ -1425,6 +1816,8 @@ class GoogleAdsAPIClient:
                 raise AuthenticationError(f"Authentication failed: {error.message}")
             elif "RATE_EXCEEDED" in str(error.error_code):
                 raise RateLimitError(f"Rate limit exceeded: {error.message}")
+            elif "PAGE_TOKEN" in str(error.error_code):
+                raise InvalidPageTokenError(f"Page token rejected: {error.message}")
 
         full_message = "; ".join(error_messages)
         logger.error(f"Google Ads API error: {full_message}")
@@ -1530,7 +1923,8 @@ class GoogleAdsAPIClient:
             search_request.customer_id = customer_id
             search_request.query = query
 
-            response = self._execute_with_circuit_breaker(
+            response = await self._execute_async(
+                customer_id,
                 "get_geographic_performance",
                 lambda: ga_service.search(request=search_request),
             )
@@ -1718,7 +2112,8 @@ class GoogleAdsAPIClient:
             search_request.customer_id = customer_id
             search_request.query = query
 
-            response = self._execute_with_circuit_breaker(
+            response = await self._execute_async(
+                customer_id,
                 "get_geographic_performance",
                 lambda: ga_service.search(request=search_request),
             )
@@ -1867,7 +2262,8 @@ class GoogleAdsAPIClient:
         search_request.customer_id = customer_id
         search_request.query = query
 
-        response = self._execute_with_circuit_breaker(
+        response = await self._execute_async(
+            customer_id,
             "get_ad_schedule_performance",
             lambda: ga_service.search(request=search_request),
         )
@@ -1979,7 +2375,8 @@ class GoogleAdsAPIClient:
         search_request.query = query
 
         try:
-            response = self._execute_with_circuit_breaker(
+            response = await self._execute_async(
+                customer_id,
                 "get_ad_schedule_bid_modifiers",
                 lambda: ga_service.search(request=search_request),
             )
@@ -2250,12 +2647,10 @@ class GoogleAdsAPIClient:
         """.strip()
 
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._execute_with_circuit_breaker(
-                    "google_ads_api_search",
-                    lambda: ga_service.search(customer_id=customer_id, query=query),
-                ),
+            response = await self._execute_async(
+                customer_id,
+                "google_ads_api_search",
+                lambda: ga_service.search(customer_id=customer_id, query=query),
             )
 
             location_map = {}
@@ -2358,12 +2753,10 @@ class GoogleAdsAPIClient:
                 f"between {start_date_str} and {end_date_str}"
             )
 
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._execute_with_circuit_breaker(
-                    "google_ads_api_search",
-                    lambda: ga_service.search(customer_id=customer_id, query=query),
-                ),
+            response = await self._execute_async(
+                customer_id,
+                "google_ads_api_search",
+                lambda: ga_service.search(customer_id=customer_id, query=query),
             )
 
             pmax_data = []
@@ -2521,12 +2914,10 @@ class GoogleAdsAPIClient:
                 f"between {start_date_str} and {end_date_str}"
             )
 
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._execute_with_circuit_breaker(
-                    "google_ads_api_search",
-                    lambda: ga_service.search(customer_id=customer_id, query=query),
-                ),
+            response = await self._execute_async(
+                customer_id,
+                "google_ads_api_search",
+                lambda: ga_service.search(customer_id=customer_id, query=query),
             )
 
             search_terms = []
@@ -2608,12 +2999,10 @@ class GoogleAdsAPIClient:
         """.strip()
 
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._execute_with_circuit_breaker(
-                    "google_ads_api_search",
-                    lambda: ga_service.search(customer_id=customer_id, query=query),
-                ),
+            response = await self._execute_async(
+                customer_id,
+                "google_ads_api_search",
+                lambda: ga_service.search(customer_id=customer_id, query=query),
             )
 
             negative_lists = []
@@ -2683,12 +3072,10 @@ class GoogleAdsAPIClient:
         """.strip()
 
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._execute_with_circuit_breaker(
-                    "google_ads_api_search",
-                    lambda: ga_service.search(customer_id=customer_id, query=query),
-                ),
+            response = await self._execute_async(
+                customer_id,
+                "google_ads_api_search",
+                lambda: ga_service.search(customer_id=customer_id, query=query),
             )
 
             shared_sets = []
@@ -2759,12 +3146,10 @@ class GoogleAdsAPIClient:
         """.strip()
 
         try:
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._execute_with_circuit_breaker(
-                    "google_ads_api_search",
-                    lambda: ga_service.search(customer_id=customer_id, query=query),
-                ),
+            response = await self._execute_async(
+                customer_id,
+                "google_ads_api_search",
+                lambda: ga_service.search(customer_id=customer_id, query=query),
             )
 
             negatives = []
@@ -2881,12 +3266,10 @@ class GoogleAdsAPIClient:
                 f"between {start_date_str} and {end_date_str}"
             )
 
-            response = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._execute_with_circuit_breaker(
-                    "google_ads_api_search",
-                    lambda: ga_service.search(customer_id=customer_id, query=query),
-                ),
+            response = await self._execute_async(
+                customer_id,
+                "google_ads_api_search",
+                lambda: ga_service.search(customer_id=customer_id, query=query),
             )
 
             placements = []
@@ -1,14 +1,19 @@
 """API efficiency metrics tracking for Google Ads API operations."""
 
 import logging
+import math
 import time
-from collections import defaultdict
-from dataclasses import dataclass
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Customer ID that histograms of customers beyond ``max_histogram_customers``
+# are folded into
+OTHER_CUSTOMERS = "other"
+
 
 @dataclass
 class APICallMetrics:
@@ -75,17 +80,234 @@ class OperationMetrics:
         return (self.pagination_errors / max(self.total_calls, 1)) * 100
 
 
+@dataclass
+class StreamingHistogram:
+    """Fixed-memory histogram with relative-error quantiles.
+
+    Positive values are counted in logarithmic buckets whose bounds grow by
+    ``gamma = (1 + relative_accuracy) / (1 - relative_accuracy)``, so every
+    quantile estimate is within ``relative_accuracy`` of a true sample value.
+    Recording is O(1). When more than ``max_buckets`` buckets are in use the
+    lowest ones are collapsed, trading accuracy at the bottom of the range for
+    bounded memory. Histograms with the same accuracy can be merged, e.g. to
+    combine metrics exported by several server processes.
+    """
+
+    relative_accuracy: float = 0.01
+    max_buckets: int = 2048
+    buckets: Dict[int, int] = field(default_factory=dict)
+    zero_count: int = 0
+    count: int = 0
+    total: float = 0.0
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if not 0 < self.relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if self.max_buckets < 2:
+            raise ValueError("max_buckets must be at least 2")
+        gamma = (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+        self._gamma = gamma
+        self._log_gamma = math.log(gamma)
+
+    def record(self, value: float, count: int = 1) -> None:
+        """Record a value.
+
+        Args:
+            value: Sample value; negative values are clamped to zero
+            count: Number of occurrences to record
+        """
+        if value <= 0:
+            self.zero_count += count
+            value = 0.0
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + count
+            if len(self.buckets) > self.max_buckets:
+                self._collapse()
+
+        self.count += count
+        self.total += value * count
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if self.max_value is None or value > self.max_value:
+            self.max_value = value
+
+    def _collapse(self) -> None:
+        """Fold the lowest buckets together until within max_buckets."""
+        indexes = sorted(self.buckets)
+        excess = len(indexes) - self.max_buckets
+        target = indexes[excess]
+        for index in indexes[:excess]:
+            self.buckets[target] += self.buckets.pop(index)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the value at quantile ``q``.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or None if nothing was recorded
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+
+        seen = self.zero_count
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                estimate = 2 * self._gamma**index / (self._gamma + 1)
+                # Keep estimates inside the observed range
+                return min(max(estimate, self.min_value), self.max_value)
+        return self.max_value
+
+    def percentiles(
+        self, quantiles: Iterable[float] = (0.5, 0.95, 0.99)
+    ) -> Dict[str, Any]:
+        """Summarize the distribution.
+
+        Args:
+            quantiles: Quantiles to report
+
+        Returns:
+            Dictionary with count, mean, min, max and ``pNN`` estimates
+        """
+        summary: Dict[str, Any] = {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min_value,
+            "max": self.max_value,
+        }
+        for q in quantiles:
+            summary[f"p{q * 100:g}"] = self.quantile(q)
+        return summary
+
+    def merge(self, other: "StreamingHistogram") -> None:
+        """Merge another histogram into this one.
+
+        Args:
+            other: Histogram recorded with the same relative accuracy
+
+        Raises:
+            ValueError: If the histograms use different accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge histograms with different accuracy")
+
+        for index, bucket_count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + bucket_count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        if other.min_value is not None and (
+            self.min_value is None or other.min_value < self.min_value
+        ):
+            self.min_value = other.min_value
+        if other.max_value is not None and (
+            self.max_value is None or other.max_value > self.max_value
+        ):
+            self.max_value = other.max_value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_buckets": self.max_buckets,
+            "buckets": {str(index): n for index, n in self.buckets.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "total": self.total,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StreamingHistogram":
+        """Deserialize a histogram produced by ``to_dict``."""
+        return cls(
+            relative_accuracy=data["relative_accuracy"],
+            max_buckets=data["max_buckets"],
+            buckets={int(index): n for index, n in data["buckets"].items()},
+            zero_count=data["zero_count"],
+            count=data["count"],
+            total=data["total"],
+            min_value=data["min_value"],
+            max_value=data["max_value"],
+        )
+
+
+@dataclass
+class CallHistograms:
+    """Latency, row and page distributions for one operation and customer."""
+
+    response_time: StreamingHistogram = field(default_factory=StreamingHistogram)
+    records: StreamingHistogram = field(default_factory=StreamingHistogram)
+    pages: StreamingHistogram = field(default_factory=StreamingHistogram)
+
+    def merge(self, other: "CallHistograms") -> None:
+        """Merge another set of histograms into this one."""
+        self.response_time.merge(other.response_time)
+        self.records.merge(other.records)
+        self.pages.merge(other.pages)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Get percentile summaries for each distribution."""
+        return {
+            "response_time": self.response_time.percentiles(),
+            "records": self.records.percentiles(),
+            "pages": self.pages.percentiles(),
+        }
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "response_time": self.response_time.to_dict(),
+            "records": self.records.to_dict(),
+            "pages": self.pages.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Dict[str, Any]]) -> "CallHistograms":
+        """Deserialize histograms produced by ``to_dict``."""
+        return cls(
+            response_time=StreamingHistogram.from_dict(data["response_time"]),
+            records=StreamingHistogram.from_dict(data["records"]),
+            pages=StreamingHistogram.from_dict(data["pages"]),
+        )
+
+
 class APIEfficiencyMetrics:
     """Track API call efficiency and performance metrics for Google Ads API."""
 
-    def __init__(self, max_call_history: int = 1000):
+    def __init__(
+        self, max_call_history: int = 1000, max_histogram_customers: int = 100
+    ):
         """Initialize metrics tracker.
 
         Args:
             max_call_history: Maximum number of individual call records to retain
+            max_histogram_customers: Customers given their own histograms;
+                later customers share the ``OTHER_CUSTOMERS`` histograms
         """
         self.max_call_history = max_call_history
-        self.call_history: List[APICallMetrics] = []
+        self.max_histogram_customers = max_histogram_customers
+        self.call_history: Deque[APICallMetrics] = deque(maxlen=max_call_history)
+        # Distributions keyed by (operation_type, customer_id)
+        self.histograms: Dict[Tuple[str, str], CallHistograms] = defaultdict(
+            CallHistograms
+        )
+        self._histogram_customers: set = set()
         self.operation_metrics: Dict[str, OperationMetrics] = defaultdict(
             lambda: OperationMetrics(operation_type="unknown")
         )
@@ -176,10 +398,9 @@ class APIEfficiencyMetrics:
             error_message=error_message,
         )
 
-        # Add to call history (with size limit)
+        # Add to call history (bounded by max_call_history)
         self.call_history.append(call_metrics)
-        if len(self.call_history) > self.max_call_history:
-            self.call_history.pop(0)
+        self._record_distributions(call_metrics)
 
         # Update operation metrics
         op_metrics = self.operation_metrics[operation_type]
@@ -267,10 +488,9 @@ class APIEfficiencyMetrics:
             error_message=error_message,
         )
 
-        # Add to call history
+        # Add to call history (bounded by max_call_history)
         self.call_history.append(call_metrics)
-        if len(self.call_history) > self.max_call_history:
-            self.call_history.pop(0)
+        self._record_distributions(call_metrics)
 
         # Update operation metrics
         op_metrics = self.operation_metrics[operation_type]
@@ -299,6 +519,76 @@ class APIEfficiencyMetrics:
 
         return call_metrics
 
+    def _record_distributions(self, call_metrics: APICallMetrics) -> None:
+        """Record a call in the per-operation, per-customer histograms.
+
+        Latency is recorded for every call so timeouts show up in the tail;
+        row and page counts only for successful calls.
+        """
+        histograms = self.histograms[
+            self._histogram_key(call_metrics.operation_type, call_metrics.customer_id)
+        ]
+        histograms.response_time.record(call_metrics.response_time)
+        if call_metrics.success:
+            histograms.records.record(call_metrics.record_count)
+            histograms.pages.record(call_metrics.page_count)
+
+    def _histogram_key(self, operation_type: str, customer_id: str) -> Tuple[str, str]:
+        """Histogram key for a call, keeping memory fixed as customers grow."""
+        if customer_id not in self._histogram_customers:
+            if len(self._histogram_customers) >= self.max_histogram_customers:
+                return (operation_type, OTHER_CUSTOMERS)
+            self._histogram_customers.add(customer_id)
+        return (operation_type, customer_id)
+
+    def get_percentiles(
+        self,
+        operation_type: Optional[str] = None,
+        customer_id: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get latency, row and page percentiles.
+
+        Args:
+            operation_type: Restrict to one operation type (all if None)
+            customer_id: Restrict to one customer (all if None)
+
+        Returns:
+            Percentile summaries keyed by distribution name
+        """
+        combined = CallHistograms()
+        for (op_type, cust_id), histograms in self.histograms.items():
+            if operation_type is not None and op_type != operation_type:
+                continue
+            if customer_id is not None and cust_id != customer_id:
+                continue
+            combined.merge(histograms)
+        return combined.summary()
+
+    def export_histograms(self) -> List[Dict[str, Any]]:
+        """Export histograms in a JSON-compatible form for cross-process merging.
+
+        Returns:
+            List of serialized histograms with their operation and customer
+        """
+        return [
+            {
+                "operation_type": op_type,
+                "customer_id": cust_id,
+                "histograms": histograms.to_dict(),
+            }
+            for (op_type, cust_id), histograms in self.histograms.items()
+        ]
+
+    def merge_histograms(self, exported: List[Dict[str, Any]]) -> None:
+        """Merge histograms exported by another process.
+
+        Args:
+            exported: Output of ``export_histograms()``
+        """
+        for entry in exported:
+            key = self._histogram_key(entry["operation_type"], entry["customer_id"])
+            self.histograms[key].merge(CallHistograms.from_dict(entry["histograms"]))
+
     def get_overall_metrics(self) -> Dict[str, Any]:
         """Get overall efficiency metrics across all operations.
 
@@ -376,7 +666,9 @@ class APIEfficiencyMetrics:
         Returns:
             List of recent APICallMetrics objects
         """
-        return self.call_history[-limit:] if self.call_history else []
+        if limit <= 0:
+            return []
+        return list(self.call_history)[-limit:]
 
     def get_efficiency_report(self) -> Dict[str, Any]:
         """Get comprehensive efficiency report matching issue requirements.
@@ -392,6 +684,10 @@ class APIEfficiencyMetrics:
             Comprehensive efficiency report
         """
         overall_metrics = self.get_overall_metrics()
+        overall_percentiles = self.get_percentiles()
+        p95_response_time = overall_percentiles["response_time"]["p95"]
+        operation_types = sorted({op_type for op_type, _ in self.histograms})
+        customer_ids = sorted({cust_id for _, cust_id in self.histograms})
 
         # Add KPI-specific metrics
         report = overall_metrics.copy()
@@ -405,6 +701,25 @@ class APIEfficiencyMetrics:
                 ],
                 "response_time_target_2s_met": overall_metrics["average_response_time"]
                 < 2.0,
+                # Tail latency: averages hide the calls that actually time out
+                "response_time_percentiles_seconds": {
+                    key: overall_percentiles["response_time"][key]
+                    for key in ("p50", "p95", "p99")
+                },
+                "p95_response_time_target_2s_met": (
+                    p95_response_time < 2.0 if p95_response_time is not None else None
+                ),
+                "percentiles": {
+                    "overall": overall_percentiles,
+                    "operations": {
+                        op_type: self.get_percentiles(operation_type=op_type)
+                        for op_type in operation_types
+                    },
+                    "customers": {
+                        cust_id: self.get_percentiles(customer_id=cust_id)
+                        for cust_id in customer_ids
+                    },
+                },
                 # KPI: Error Rate
                 "error_rate_percentage": overall_metrics["overall_error_rate"],
                 "pagination_error_rate_percentage": overall_metrics[
@@ -443,6 +758,8 @@ class APIEfficiencyMetrics:
     def clear_metrics(self):
         """Clear all metrics and reset counters."""
         self.call_history.clear()
+        self.histograms.clear()
+        self._histogram_customers.clear()
         self.operation_metrics.clear()
         self._active_calls.clear()
         self._call_counter = 0
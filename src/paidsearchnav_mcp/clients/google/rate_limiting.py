@@ -32,9 +32,16 @@ from paidsearchnav_mcp.clients.google.storage import (
 )
 from paidsearchnav_mcp.core.config import Settings
 from paidsearchnav_mcp.core.exceptions import RateLimitError
+from paidsearchnav_mcp.core.metrics_registry import get_metrics_registry
 
 logger = logging.getLogger(__name__)
 
+_RATE_LIMIT_WAIT_SECONDS = get_metrics_registry().histogram(
+    "psn_rate_limiter_wait_seconds",
+    "Time spent waiting for Google Ads rate limit capacity.",
+    ("operation", "outcome"),
+)
+
 
 class OperationType(Enum):
     """Google Ads API operation types with different rate limit requirements."""
@@ -360,12 +367,18 @@ class GoogleAdsRateLimiter:
         base_check_interval = 1  # Base check interval
         waited = 0
         consecutive_checks = 0
+        started = time.monotonic()
 
         while waited < max_wait_time:
             # Check and reserve atomically to prevent race conditions
             if await self._check_and_reserve_capacity(
                 customer_id, operation_type, operation_size
             ):
+                _RATE_LIMIT_WAIT_SECONDS.observe(
+                    time.monotonic() - started,
+                    operation=operation_type.value,
+                    outcome="allowed",
+                )
                 return
 
             consecutive_checks += 1
@@ -386,6 +399,11 @@ class GoogleAdsRateLimiter:
             await asyncio.sleep(check_interval)
             waited += check_interval
 
+        _RATE_LIMIT_WAIT_SECONDS.observe(
+            time.monotonic() - started,
+            operation=operation_type.value,
+            outcome="exhausted",
+        )
         raise RateLimitError(
             f"Rate limit exceeded and maximum wait time ({max_wait_time}s) reached "
             f"for {customer_id} {operation_type.value}"
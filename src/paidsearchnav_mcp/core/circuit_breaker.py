@@ -1,17 +1,26 @@
 """Circuit breaker implementation for external API calls."""
 
 import asyncio
+import functools
+import inspect
 import logging
 import random
 import threading
 import time
+import weakref
+from collections import OrderedDict
 from functools import lru_cache
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
 
 from circuitbreaker import CircuitBreaker
 
 from paidsearchnav_mcp.core.config import CircuitBreakerConfig
-from paidsearchnav_mcp.core.exceptions import APIError, RateLimitError
+from paidsearchnav_mcp.core.exceptions import (
+    APIError,
+    AuthenticationError,
+    CircuitOpenError,
+    RateLimitError,
+)
 
 try:
     from google.cloud.exceptions import GoogleCloudError
@@ -244,6 +253,18 @@ class BaseCircuitBreaker:
         logger.info(f"{self._name} circuit breaker manually reset")
 
 
+def _log_google_ads_error(exception: Exception) -> None:
+    """Log an error that counts against a Google Ads circuit breaker."""
+    if isinstance(exception, (APIError, RateLimitError)):
+        logger.warning(
+            f"Google Ads circuit breaker triggered by {type(exception).__name__}: {exception}"
+        )
+    else:
+        logger.warning(
+            f"Unexpected exception in Google Ads circuit breaker: {type(exception).__name__}: {exception}"
+        )
+
+
 class GoogleAdsCircuitBreaker(BaseCircuitBreaker):
     """Circuit breaker specifically configured for Google Ads API calls."""
 
@@ -268,14 +289,7 @@ class GoogleAdsCircuitBreaker(BaseCircuitBreaker):
         Returns:
             Dictionary of metric updates based on error type
         """
-        if isinstance(exception, (APIError, RateLimitError)):
-            logger.warning(
-                f"Google Ads circuit breaker triggered by {type(exception).__name__}: {exception}"
-            )
-        else:
-            logger.warning(
-                f"Unexpected exception in Google Ads circuit breaker: {type(exception).__name__}: {exception}"
-            )
+        _log_google_ads_error(exception)
         return {}
 
 
@@ -415,6 +429,496 @@ def create_bigquery_circuit_breaker(
     return BigQueryCircuitBreaker(config)
 
 
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class AsyncCircuitBreaker:
+    """Asyncio-native circuit breaker for coroutines and async generators.
+
+    State and counters are only touched from the event loop thread between
+    awaits, so no locks are needed. The open circuit moves to half-open once
+    ``recovery_timeout`` has elapsed; while half-open at most
+    ``half_open_max_calls`` trial calls run concurrently, and
+    ``success_threshold`` successful trials close the circuit again.
+    """
+
+    def __init__(
+        self,
+        config: CircuitBreakerConfig,
+        name: str,
+        expected_exceptions: tuple[type[Exception], ...] = (Exception,),
+        additional_metrics: Optional[dict[str, Any]] = None,
+        is_failure: Optional[Callable[[Exception], bool]] = None,
+    ):
+        """Initialize circuit breaker with configuration.
+
+        Args:
+            config: Circuit breaker configuration
+            name: Circuit breaker name for identification
+            expected_exceptions: Exception types that count as failures
+            additional_metrics: Additional metrics to track
+            is_failure: Optional predicate further narrowing which expected
+                exceptions count as failures
+
+        Raises:
+            ConfigValidationError: If configuration is invalid
+        """
+        validate_circuit_breaker_config(config)
+        self.config = config
+        self._name = name
+        self._expected_exceptions = expected_exceptions
+        self._is_failure = is_failure
+
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._failure_count = 0
+        self._half_open_successes = 0
+        self._half_open_in_flight = 0
+        self._last_failure: Optional[Exception] = None
+
+        self._metrics: dict[str, Any] = {
+            "total_calls": 0,
+            "failed_calls": 0,
+            "rejected_calls": 0,
+            "circuit_opened_count": 0,
+            "last_failure_time": None,
+        }
+        if additional_metrics:
+            self._metrics.update(additional_metrics)
+
+    @property
+    def name(self) -> str:
+        """Get circuit breaker name."""
+        return self._name
+
+    def _categorize_error(self, exception: Exception) -> dict[str, Any]:
+        """Categorize error for metrics tracking. Override in subclasses.
+
+        Args:
+            exception: Exception to categorize
+
+        Returns:
+            Dictionary of metric updates based on error type
+        """
+        return {}
+
+    def _acquire(self) -> bool:
+        """Admit a call or reject it if the circuit is open.
+
+        Returns:
+            True if the admitted call is a half-open trial call
+
+        Raises:
+            CircuitOpenError: If the circuit is open or no trial slot is free
+        """
+        state = self.state
+        if state == STATE_CLOSED:
+            self._metrics["total_calls"] += 1
+            return False
+
+        if (
+            state == STATE_HALF_OPEN
+            and self._half_open_in_flight < self.config.half_open_max_calls
+        ):
+            self._half_open_in_flight += 1
+            self._metrics["total_calls"] += 1
+            return True
+
+        self._metrics["rejected_calls"] += 1
+        raise CircuitOpenError(
+            f"{self._name} circuit breaker is {state.upper()} - call rejected"
+        )
+
+    def _record_success(self, trial: bool) -> None:
+        """Record a successful call."""
+        if trial:
+            self._half_open_in_flight -= 1
+            if self._state == STATE_HALF_OPEN:
+                self._half_open_successes += 1
+                if self._half_open_successes >= self.config.success_threshold:
+                    self._close()
+        elif self._state == STATE_CLOSED:
+            self._failure_count = 0
+
+    def _record_failure(self, exception: Exception, trial: bool) -> None:
+        """Record a failed call and open the circuit if needed."""
+        self._metrics["failed_calls"] += 1
+        self._metrics["last_failure_time"] = time.time()
+        self._metrics.update(self._categorize_error(exception))
+        self._last_failure = exception
+
+        if trial:
+            self._half_open_in_flight -= 1
+
+        if self._state == STATE_HALF_OPEN:
+            self._open()
+        elif self._state == STATE_CLOSED:
+            self._failure_count += 1
+            if self._failure_count >= self.config.failure_threshold:
+                self._open()
+
+    def _settle(self, exception: Optional[BaseException], trial: bool) -> None:
+        """Record the outcome of an admitted call."""
+        if isinstance(exception, (asyncio.CancelledError, GeneratorExit)):
+            # Cancellation says nothing about service health
+            if trial:
+                self._half_open_in_flight -= 1
+        elif (
+            exception is not None
+            and isinstance(exception, self._expected_exceptions)
+            and (self._is_failure is None or self._is_failure(exception))
+        ):
+            self._record_failure(exception, trial)
+        else:
+            # Mirrors the circuitbreaker library: other exceptions are successes
+            self._record_success(trial)
+
+    def _open(self) -> None:
+        previous_state = self._state
+        self._state = STATE_OPEN
+        self._opened_at = time.monotonic()
+        self._half_open_successes = 0
+        self._metrics["circuit_opened_count"] += 1
+        if previous_state == STATE_HALF_OPEN:
+            logger.error(f"{self._name} circuit breaker re-OPENED after failed trial")
+        else:
+            logger.error(
+                f"{self._name} circuit breaker OPENED after "
+                f"{self._failure_count} failures"
+            )
+
+    def _close(self) -> None:
+        self._state = STATE_CLOSED
+        self._failure_count = 0
+        self._half_open_successes = 0
+        logger.info(f"{self._name} circuit breaker CLOSED - service recovered")
+
+    async def call(
+        self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Await ``func(*args, **kwargs)`` under circuit breaker protection.
+
+        ``func`` may be any callable returning an awaitable, e.g. a coroutine
+        function or ``loop.run_in_executor``.
+
+        Args:
+            func: Callable returning an awaitable
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            Result of the awaited call
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.config.enabled:
+            return await func(*args, **kwargs)
+
+        trial = self._acquire()
+        try:
+            result = await func(*args, **kwargs)
+        except BaseException as e:
+            self._settle(e, trial)
+            raise
+        self._settle(None, trial)
+        return result
+
+    async def stream(self, agen: AsyncIterator[T]) -> AsyncIterator[T]:
+        """Iterate an async iterator under circuit breaker protection.
+
+        The call is admitted before the first item is requested and settled
+        once the iterator is exhausted or raises.
+
+        Args:
+            agen: Async iterator to protect
+
+        Yields:
+            Items from ``agen``
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.config.enabled:
+            async for item in agen:
+                yield item
+            return
+
+        trial = self._acquire()
+        try:
+            async for item in agen:
+                yield item
+        except BaseException as e:
+            self._settle(e, trial)
+            raise
+        finally:
+            aclose = getattr(agen, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        self._settle(None, trial)
+
+    def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Decorator for coroutine functions and async generator functions.
+
+        The wrapper is built once at decoration time.
+
+        Args:
+            func: Coroutine function or async generator function to protect
+
+        Returns:
+            Wrapped function
+        """
+        if inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            def agen_wrapper(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                return self.stream(func(*args, **kwargs))
+
+            return agen_wrapper
+
+        if not asyncio.iscoroutinefunction(func):
+            raise TypeError(
+                f"{self._name} async circuit breaker can only wrap coroutine or "
+                f"async generator functions, got {func!r}"
+            )
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await self.call(func, *args, **kwargs)
+
+        return wrapper
+
+    @property
+    def state(self) -> str:
+        """Get current circuit breaker state."""
+        if (
+            self._state == STATE_OPEN
+            and time.monotonic() - self._opened_at >= self.config.recovery_timeout
+        ):
+            self._state = STATE_HALF_OPEN
+            self._half_open_successes = 0
+            logger.info(
+                f"{self._name} circuit breaker HALF-OPEN - allowing trial calls"
+            )
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """Check if circuit breaker is in open state."""
+        return self.state == STATE_OPEN
+
+    @property
+    def is_healthy(self) -> bool:
+        """Check if service is healthy (circuit closed)."""
+        return self.state == STATE_CLOSED
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get circuit breaker metrics."""
+        return {
+            **self._metrics,
+            "current_state": self.state,
+            "failure_count": self._failure_count,
+            "last_failure": self._last_failure,
+            "failure_threshold": self.config.failure_threshold,
+            "recovery_timeout": self.config.recovery_timeout,
+            "half_open_max_calls": self.config.half_open_max_calls,
+            "half_open_in_flight": self._half_open_in_flight,
+            "health_status": "healthy" if self.is_healthy else "degraded",
+        }
+
+    def reset(self) -> None:
+        """Reset circuit breaker to closed state.
+
+        Trial calls still in flight keep their slots and release them when
+        they settle, so the in-flight count never goes negative.
+        """
+        self._state = STATE_CLOSED
+        self._failure_count = 0
+        self._half_open_successes = 0
+        logger.info(f"{self._name} circuit breaker manually reset")
+
+
+class AsyncGoogleAdsCircuitBreaker(AsyncCircuitBreaker):
+    """Async circuit breaker configured for Google Ads API calls."""
+
+    ERROR_CATEGORIES = ("authentication", "rate_limit", "api", "unexpected")
+
+    def __init__(
+        self,
+        config: CircuitBreakerConfig,
+        name: str = "GoogleAdsAPI",
+        failure_categories: Optional[frozenset[str]] = None,
+    ):
+        """Initialize circuit breaker with configuration.
+
+        Args:
+            config: Circuit breaker configuration
+            name: Circuit breaker name, e.g. scoped to a customer ID
+            failure_categories: Error categories (see ``classify_error``) that
+                count towards opening the circuit; all categories if None
+
+        Raises:
+            ConfigValidationError: If an unknown error category is given
+        """
+        if failure_categories is not None:
+            unknown = set(failure_categories) - set(self.ERROR_CATEGORIES)
+            if unknown:
+                raise ConfigValidationError(
+                    f"Unknown error categories: {', '.join(sorted(unknown))}"
+                )
+
+        super().__init__(
+            config=config,
+            name=name,
+            expected_exceptions=(APIError, RateLimitError, Exception),
+            additional_metrics={
+                f"{category}_error_count": 0 for category in self.ERROR_CATEGORIES
+            },
+            is_failure=(
+                None
+                if failure_categories is None
+                else lambda e: self.classify_error(e) in failure_categories
+            ),
+        )
+
+    @staticmethod
+    def classify_error(exception: Exception) -> str:
+        """Classify a Google Ads error into one of ``ERROR_CATEGORIES``.
+
+        Args:
+            exception: Exception to classify
+
+        Returns:
+            Error category name
+        """
+        if isinstance(exception, AuthenticationError):
+            return "authentication"
+        if isinstance(exception, RateLimitError):
+            return "rate_limit"
+        if isinstance(exception, APIError):
+            return "api"
+        return "unexpected"
+
+    def _categorize_error(self, exception: Exception) -> dict[str, Any]:
+        """Categorize Google Ads API errors for metrics tracking.
+
+        Args:
+            exception: Exception to categorize
+
+        Returns:
+            Dictionary of metric updates based on error type
+        """
+        _log_google_ads_error(exception)
+        key = f"{self.classify_error(exception)}_error_count"
+        return {key: self._metrics[key] + 1}
+
+
+class CircuitBreakerRegistry:
+    """Bounded registry of async circuit breakers keyed by customer and operation.
+
+    Breakers are created on first use and kept in least-recently-used order.
+    When the registry is full the least recently used healthy breaker is
+    evicted; open breakers are only evicted if no healthy one is left.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str, str], AsyncCircuitBreaker],
+        max_breakers: int = 1000,
+    ):
+        """Initialize the registry.
+
+        Args:
+            factory: Callable building a breaker for (customer_id, operation)
+            max_breakers: Maximum number of breakers kept in memory
+
+        Raises:
+            ConfigValidationError: If max_breakers is not positive
+        """
+        if max_breakers <= 0:
+            raise ConfigValidationError("max_breakers must be positive")
+        self._factory = factory
+        self._max_breakers = max_breakers
+        self._breakers: OrderedDict[tuple[str, str], AsyncCircuitBreaker] = (
+            OrderedDict()
+        )
+        self._evicted_count = 0
+
+    def __len__(self) -> int:
+        return len(self._breakers)
+
+    def get(self, customer_id: str, operation: str) -> AsyncCircuitBreaker:
+        """Get or create the breaker for a customer and operation.
+
+        Args:
+            customer_id: Customer the call targets
+            operation: Operation name
+
+        Returns:
+            Circuit breaker for the key
+        """
+        key = (customer_id, operation)
+        breaker = self._breakers.get(key)
+        if breaker is not None:
+            self._breakers.move_to_end(key)
+            return breaker
+
+        breaker = self._factory(customer_id, operation)
+        self._breakers[key] = breaker
+        if len(self._breakers) > self._max_breakers:
+            self._evict()
+        return breaker
+
+    def _evict(self) -> None:
+        """Evict the least recently used breaker, preferring healthy ones."""
+        victim = next(
+            (key for key, b in self._breakers.items() if b.is_healthy),
+            next(iter(self._breakers)),
+        )
+        if not self._breakers[victim].is_healthy:
+            logger.warning(
+                f"Circuit breaker registry full - evicting unhealthy breaker {victim}"
+            )
+        del self._breakers[victim]
+        self._evicted_count += 1
+
+    def reset(self) -> None:
+        """Reset every registered breaker to closed state."""
+        for breaker in self._breakers.values():
+            breaker.reset()
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Get aggregated metrics across all registered breakers."""
+        states = {STATE_CLOSED: 0, STATE_OPEN: 0, STATE_HALF_OPEN: 0}
+        totals = {"total_calls": 0, "failed_calls": 0, "rejected_calls": 0}
+        breakers: dict[str, dict[str, Any]] = {}
+
+        for (customer_id, operation), breaker in self._breakers.items():
+            breaker_metrics = breaker.metrics
+            states[breaker_metrics["current_state"]] += 1
+            for key in totals:
+                totals[key] += breaker_metrics[key]
+            breakers[f"{customer_id}:{operation}"] = breaker_metrics
+
+        return {
+            **totals,
+            "breaker_count": len(self._breakers),
+            "max_breakers": self._max_breakers,
+            "evicted_count": self._evicted_count,
+            "states": states,
+            "open_circuits": [
+                key
+                for key, breaker_metrics in breakers.items()
+                if breaker_metrics["current_state"] != STATE_CLOSED
+            ],
+            "breakers": breakers,
+        }
+
+
 class RetryConfig:
     """Configuration for retry and backoff mechanisms."""
 
@@ -655,10 +1159,17 @@ class BigQueryRetryHandler:
             }
 
 
+# Live handlers from create_bigquery_retry_handler, by name, for metrics
+_retry_handlers: "weakref.WeakValueDictionary[str, BigQueryRetryHandler]" = (
+    weakref.WeakValueDictionary()
+)
+
+
 def create_bigquery_retry_handler(
     max_retries: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 60.0,
+    name: str = "bigquery",
 ) -> BigQueryRetryHandler:
     """Create a retry handler for BigQuery operations.
 
@@ -666,6 +1177,8 @@ def create_bigquery_retry_handler(
         max_retries: Maximum number of retry attempts
         base_delay: Base delay between retries in seconds
         max_delay: Maximum delay between retries in seconds
+        name: Name the handler's metrics are exported under; a later
+            handler with the same name replaces it
 
     Returns:
         Configured retry handler instance
@@ -675,4 +1188,15 @@ def create_bigquery_retry_handler(
         base_delay=base_delay,
         max_delay=max_delay,
     )
-    return BigQueryRetryHandler(retry_config)
+    handler = BigQueryRetryHandler(retry_config)
+    _retry_handlers[name] = handler
+    return handler
+
+
+def get_bigquery_retry_handlers() -> dict[str, BigQueryRetryHandler]:
+    """Get the live retry handlers created with ``create_bigquery_retry_handler``.
+
+    Returns:
+        Handlers by name; handlers no longer referenced elsewhere are dropped
+    """
+    return dict(_retry_handlers)
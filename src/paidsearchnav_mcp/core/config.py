@@ -929,6 +929,11 @@ class CircuitBreakerConfig(BaseModel):
         ge=1,
         description="Number of successful calls needed to close circuit",
     )
+    half_open_max_calls: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum concurrent trial calls admitted while half-open",
+    )
     # Metrics and monitoring
     collect_metrics: bool = Field(
         default=True, description="Whether to collect circuit breaker metrics"
@@ -25,6 +25,18 @@ class RateLimitError(APIError):
     pass
 
 
+class InvalidPageTokenError(APIError):
+    """Raised when the API rejects a page token as invalid or expired."""
+
+    pass
+
+
+class CircuitOpenError(APIError):
+    """Raised when a call is rejected because a circuit breaker is open."""
+
+    pass
+
+
 class AnalysisError(PaidSearchNavError):
     """Raised when analysis fails."""
 
@@ -0,0 +1,700 @@
+"""Unified metrics registry with OpenMetrics text exposition.
+
+Code on hot paths records into ``Counter``, ``Gauge`` and ``Histogram``
+instruments owned by a ``MetricsRegistry``. Metric holders that already keep
+their own state (``APIEfficiencyMetrics``, circuit breakers, cache clients,
+``BigQueryRetryHandler``) are bridged with collectors that translate their
+snapshots into metric families at scrape time, so nothing is counted twice.
+
+The registry renders the OpenMetrics text format understood by Prometheus and
+can be served from the MCP server's HTTP app or a standalone thread when the
+server runs over stdio.
+"""
+
+import logging
+import math
+import re
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+SUMMARY_QUANTILES = {"p50": "0.5", "p95": "0.95", "p99": "0.99"}
+
+_METRIC_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+Collector = Callable[[], Iterable["MetricFamily"]]
+
+
+def _validate_names(name: str, labelnames: Iterable[str]) -> None:
+    """Validate a metric name and its label names.
+
+    Raises:
+        ValueError: If a name is not a valid OpenMetrics identifier
+    """
+    if not _METRIC_NAME_RE.match(name):
+        raise ValueError(f"Invalid metric name: {name!r}")
+    for label in labelnames:
+        if not _LABEL_NAME_RE.match(label) or label.startswith("__"):
+            raise ValueError(f"Invalid label name {label!r} for metric {name}")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value as OpenMetrics text."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value: Any) -> str:
+    """Escape a label value for OpenMetrics text."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+@dataclass
+class MetricFamily:
+    """A named metric with its type, help text and current samples.
+
+    Samples are ``(suffix, labels, value)`` tuples; the suffix is appended to
+    the family name (``_total``, ``_bucket``, ``_count``, ``_sum``).
+    """
+
+    name: str
+    type: str
+    help: str
+    samples: list[tuple[str, dict[str, str], float]] = field(default_factory=list)
+
+    def add(self, value: float, suffix: str = "", **labels: Any) -> None:
+        """Append a sample to the family.
+
+        Args:
+            value: Sample value
+            suffix: Sample name suffix
+            **labels: Label values for the sample
+        """
+        self.samples.append(
+            (suffix, {key: str(val) for key, val in labels.items()}, float(value))
+        )
+
+    def render(self) -> list[str]:
+        """Render the family as OpenMetrics text lines."""
+        lines = [
+            f"# TYPE {self.name} {self.type}",
+            f"# HELP {self.name} {self.help}",
+        ]
+        for suffix, labels, value in self.samples:
+            label_text = ""
+            if labels:
+                label_text = (
+                    "{"
+                    + ",".join(
+                        f'{key}="{_escape_label_value(val)}"'
+                        for key, val in labels.items()
+                    )
+                    + "}"
+                )
+            lines.append(f"{self.name}{suffix}{label_text} {_format_value(value)}")
+        return lines
+
+
+class _Instrument:
+    """Base class for labelled instruments recorded in-process."""
+
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        labelnames = tuple(labelnames)
+        _validate_names(name, labelnames)
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], Any] = {}
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        """Build the storage key for a set of label values.
+
+        Raises:
+            ValueError: If the labels do not match the declared label names
+        """
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {list(self.labelnames)}, "
+                f"got {sorted(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple[str, ...]) -> dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def clear(self) -> None:
+        """Drop every recorded label set."""
+        with self._lock:
+            self._values.clear()
+
+    def collect(self) -> MetricFamily:
+        raise NotImplementedError
+
+
+class Counter(_Instrument):
+    """Monotonically increasing counter."""
+
+    type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increment the counter.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Label values
+
+        Raises:
+            ValueError: If amount is negative
+        """
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        """Get the current value for a label set."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.type, self.help)
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            family.add(value, "_total", **self._labels(key))
+        return family
+
+
+class Gauge(_Instrument):
+    """Value that can go up and down."""
+
+    type = "gauge"
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the gauge to a value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increment the gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Decrement the gauge."""
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        """Get the current value for a label set."""
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.type, self.help)
+        with self._lock:
+            values = list(self._values.items())
+        for key, value in values:
+            family.add(value, **self._labels(key))
+        return family
+
+
+class Histogram(_Instrument):
+    """Histogram with fixed, cumulative upper-bound buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        if "le" in self.labelnames:
+            raise ValueError("Histogram label names cannot include 'le'")
+        bounds = sorted(float(bound) for bound in buckets)
+        if not bounds or len(set(bounds)) != len(bounds):
+            raise ValueError("Histogram buckets must be non-empty and unique")
+        if bounds[-1] != math.inf:
+            bounds.append(math.inf)
+        self.buckets = tuple(bounds)
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record an observation.
+
+        Args:
+            value: Observed value
+            **labels: Label values
+        """
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def collect(self) -> MetricFamily:
+        family = MetricFamily(self.name, self.type, self.help)
+        with self._lock:
+            values = [
+                (key, (list(counts), total, count))
+                for key, (counts, total, count) in self._values.items()
+            ]
+        for key, (counts, total, count) in values:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                family.add(cumulative, "_bucket", **labels, le=_format_value(bound))
+            family.add(count, "_count", **labels)
+            family.add(total, "_sum", **labels)
+        return family
+
+
+class MetricsRegistry:
+    """Registry of instruments and scrape-time collectors."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._instruments: dict[str, _Instrument] = {}
+        self._collectors: list[Collector] = []
+
+    def _get_or_create(
+        self, cls: type[_Instrument], name: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        with self._lock:
+            existing = self._instruments.get(name)
+            if existing is not None:
+                if type(existing) is not cls:
+                    raise ValueError(
+                        f"Metric {name} is already registered as a {existing.type}"
+                    )
+                return existing
+            instrument = cls(name, *args, **kwargs)
+            self._instruments[name] = instrument
+            return instrument
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        """Get or create a counter.
+
+        Args:
+            name: Metric name without the ``_total`` suffix
+            help: Help text
+            labelnames: Label names
+
+        Returns:
+            Registered counter
+        """
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Gauge:
+        """Get or create a gauge.
+
+        Args:
+            name: Metric name
+            help: Help text
+            labelnames: Label names
+
+        Returns:
+            Registered gauge
+        """
+        return self._get_or_create(Gauge, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram.
+
+        Args:
+            name: Metric name
+            help: Help text
+            labelnames: Label names
+            buckets: Bucket upper bounds (``+Inf`` is added automatically)
+
+        Returns:
+            Registered histogram
+        """
+        return self._get_or_create(Histogram, name, help, labelnames, buckets)
+
+    def register_collector(self, collector: Collector) -> Collector:
+        """Register a callable producing metric families at scrape time.
+
+        Usable as a decorator.
+
+        Args:
+            collector: Callable returning an iterable of ``MetricFamily``
+
+        Returns:
+            The collector, unchanged
+        """
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+        return collector
+
+    def unregister_collector(self, collector: Collector) -> None:
+        """Remove a previously registered collector."""
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def collect(self) -> list[MetricFamily]:
+        """Collect every metric family.
+
+        Collector failures are logged and skipped so one broken source never
+        blanks the whole scrape. Families with the same name from several
+        collectors are merged.
+
+        Returns:
+            Metric families ordered by name
+        """
+        with self._lock:
+            instruments = list(self._instruments.values())
+            collectors = list(self._collectors)
+
+        families: dict[str, MetricFamily] = {}
+
+        def _add(family: MetricFamily) -> None:
+            existing = families.get(family.name)
+            if existing is None:
+                families[family.name] = family
+            elif existing.type != family.type:
+                logger.warning(
+                    f"Skipping metric {family.name}: type {family.type} conflicts "
+                    f"with {existing.type}"
+                )
+            else:
+                existing.samples.extend(family.samples)
+
+        for instrument in instruments:
+            _add(instrument.collect())
+        for collector in collectors:
+            try:
+                for family in collector():
+                    _add(family)
+            except Exception as e:
+                logger.warning(f"Metrics collector {collector!r} failed: {e}")
+
+        return [families[name] for name in sorted(families)]
+
+    def render(self) -> str:
+        """Render every metric family in OpenMetrics text format."""
+        lines: list[str] = []
+        for family in self.collect():
+            if family.samples:
+                lines.extend(family.render())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide default registry
+_default_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _default_registry
+
+
+# ============================================================================
+# Collectors for existing metric holders
+# ============================================================================
+
+
+def collect_api_efficiency(api_metrics: Any) -> list[MetricFamily]:
+    """Translate ``APIEfficiencyMetrics`` histograms into metric families.
+
+    Latency is exported as a summary with p50/p95/p99 quantiles; row and page
+    totals as counters.
+
+    Args:
+        api_metrics: ``APIEfficiencyMetrics`` instance
+
+    Returns:
+        Metric families for Google Ads API calls
+    """
+    calls = MetricFamily(
+        "psn_google_ads_api_calls", "counter", "Google Ads API calls by outcome."
+    )
+    rows = MetricFamily(
+        "psn_google_ads_rows_decoded",
+        "counter",
+        "Rows decoded from successful Google Ads API calls.",
+    )
+    pages = MetricFamily(
+        "psn_google_ads_pages_fetched",
+        "counter",
+        "Result pages fetched by successful Google Ads API calls.",
+    )
+    latency = MetricFamily(
+        "psn_google_ads_api_latency_seconds",
+        "summary",
+        "Google Ads API call latency.",
+    )
+
+    for (operation, customer_id), histograms in list(api_metrics.histograms.items()):
+        labels = {"operation": operation, "customer_id": customer_id}
+        response_time = histograms.response_time
+        successes = histograms.records.count
+        calls.add(successes, "_total", **labels, outcome="success")
+        calls.add(response_time.count - successes, "_total", **labels, outcome="error")
+        rows.add(histograms.records.total, "_total", **labels)
+        pages.add(histograms.pages.total, "_total", **labels)
+
+        summary = response_time.percentiles()
+        for key, quantile in SUMMARY_QUANTILES.items():
+            if summary[key] is not None:
+                latency.add(summary[key], **labels, quantile=quantile)
+        latency.add(response_time.count, "_count", **labels)
+        latency.add(response_time.total, "_sum", **labels)
+
+    return [calls, rows, pages, latency]
+
+
+def collect_circuit_breaker(
+    breaker_metrics: dict[str, Any], breaker: str
+) -> list[MetricFamily]:
+    """Translate a circuit breaker ``metrics`` dict into metric families.
+
+    Works for both ``BaseCircuitBreaker`` and ``AsyncCircuitBreaker`` metrics.
+
+    Args:
+        breaker_metrics: The breaker's ``metrics`` property
+        breaker: Breaker label value
+
+    Returns:
+        Metric families for the breaker
+    """
+    state = MetricFamily(
+        "psn_circuit_breaker_state",
+        "gauge",
+        "Circuit breaker state (1 for the current state).",
+    )
+    current_state = breaker_metrics.get("current_state")
+    for name in ("closed", "open", "half_open"):
+        state.add(int(current_state == name), breaker=breaker, state=name)
+
+    families = [state]
+    for key, metric, help in (
+        ("total_calls", "psn_circuit_breaker_calls", "Calls through the breaker."),
+        ("failed_calls", "psn_circuit_breaker_failures", "Failed calls."),
+        (
+            "rejected_calls",
+            "psn_circuit_breaker_rejections",
+            "Calls rejected while open.",
+        ),
+        (
+            "circuit_opened_count",
+            "psn_circuit_breaker_opened",
+            "Times the circuit opened.",
+        ),
+    ):
+        if key in breaker_metrics:
+            family = MetricFamily(metric, "counter", help)
+            family.add(breaker_metrics[key], "_total", breaker=breaker)
+            families.append(family)
+    return families
+
+
+def collect_breaker_registry(
+    registry_metrics: dict[str, Any], breaker: str
+) -> list[MetricFamily]:
+    """Translate ``CircuitBreakerRegistry.metrics`` into metric families.
+
+    Per-breaker state is only exported for circuits that are not closed, which
+    keeps label cardinality proportional to the accounts currently failing.
+
+    Args:
+        registry_metrics: The registry's ``metrics`` property
+        breaker: Breaker label value
+
+    Returns:
+        Metric families for the registry
+    """
+    states = MetricFamily(
+        "psn_circuit_breakers", "gauge", "Registered circuit breakers by state."
+    )
+    for state, count in registry_metrics["states"].items():
+        states.add(count, breaker=breaker, state=state)
+
+    unhealthy = MetricFamily(
+        "psn_circuit_breaker_unhealthy",
+        "gauge",
+        "Per-customer circuits that are open or half-open.",
+    )
+    for key in registry_metrics["open_circuits"]:
+        customer_id, _, operation = key.partition(":")
+        state = registry_metrics["breakers"][key]["current_state"]
+        unhealthy.add(
+            1,
+            breaker=breaker,
+            customer_id=customer_id,
+            operation=operation,
+            state=state,
+        )
+
+    evicted = MetricFamily(
+        "psn_circuit_breaker_evictions", "counter", "Breakers evicted from the LRU."
+    )
+    evicted.add(registry_metrics["evicted_count"], "_total", breaker=breaker)
+
+    # Skip the single-breaker state gauge; per-state counts are exported above
+    totals = collect_circuit_breaker(registry_metrics, breaker)[1:]
+    return [states, unhealthy, evicted, *totals]
+
+
+def collect_cache_stats(stats: dict[str, Any], cache: str) -> list[MetricFamily]:
+    """Translate cache hit/miss statistics into metric families.
+
+    Args:
+        stats: Dict with ``hits``, ``misses``, ``errors`` and ``hit_ratio``
+        cache: Cache label value
+
+    Returns:
+        Metric families for the cache
+    """
+    requests = MetricFamily("psn_cache_requests", "counter", "Cache lookups by result.")
+    for key, result in (("hits", "hit"), ("misses", "miss"), ("errors", "error")):
+        requests.add(stats.get(key, 0), "_total", cache=cache, result=result)
+
+    hit_ratio = MetricFamily(
+        "psn_cache_hit_ratio", "gauge", "Fraction of cache lookups that hit."
+    )
+    hit_ratio.add(stats.get("hit_ratio", 0.0), cache=cache)
+    return [requests, hit_ratio]
+
+
+def collect_retry_handlers(handlers: dict[str, dict[str, Any]]) -> list[MetricFamily]:
+    """Translate ``BigQueryRetryHandler.metrics`` into metric families.
+
+    Args:
+        handlers: Each handler's ``metrics`` property, by handler label value
+
+    Returns:
+        Metric families for the retry handlers
+    """
+    attempts = MetricFamily(
+        "psn_bigquery_retry_attempts", "counter", "Failed attempts seen by the handler."
+    )
+    outcomes = MetricFamily(
+        "psn_bigquery_retry_outcomes", "counter", "Operations by final retry outcome."
+    )
+    errors = MetricFamily(
+        "psn_bigquery_retry_errors", "counter", "Retried errors by category."
+    )
+    for handler, handler_metrics in handlers.items():
+        attempts.add(handler_metrics["total_retries"], "_total", handler=handler)
+        outcomes.add(
+            handler_metrics["successful_retries"],
+            "_total",
+            handler=handler,
+            outcome="success",
+        )
+        outcomes.add(
+            handler_metrics["failed_retries"],
+            "_total",
+            handler=handler,
+            outcome="failure",
+        )
+        for category in ("quota", "timeout", "connection"):
+            errors.add(
+                handler_metrics[f"{category}_retry_count"],
+                "_total",
+                handler=handler,
+                category=category,
+            )
+    return [attempts, outcomes, errors]
+
+
+# ============================================================================
+# Standalone HTTP endpoint
+# ============================================================================
+
+
+def start_metrics_server(
+    port: int,
+    host: str = "127.0.0.1",
+    registry: Optional[MetricsRegistry] = None,
+) -> ThreadingHTTPServer:
+    """Serve ``/metrics`` from a daemon thread.
+
+    Used when the MCP transport has no HTTP app of its own (stdio).
+
+    Args:
+        port: Port to listen on (0 picks a free port)
+        host: Interface to bind
+        registry: Registry to expose (defaults to the process-wide registry)
+
+    Returns:
+        The running server; call ``shutdown()`` to stop it
+    """
+    registry = registry or get_metrics_registry()
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(f"metrics endpoint: {format % args}")
+
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, name="metrics-http", daemon=True
+    )
+    thread.start()
+    logger.info(
+        f"Metrics endpoint listening on http://{host}:{server.server_port}/metrics"
+    )
+    return server
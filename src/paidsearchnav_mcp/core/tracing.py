@@ -0,0 +1,475 @@
+"""Lightweight OpenTelemetry-compatible tracing.
+
+Spans nest through a context variable, so they follow ``await`` chains,
+``asyncio.to_thread`` and executor calls that run under a copied context.
+Tracing is off by default: the global tracer hands out a shared
+non-recording span and ``traced`` calls the wrapped function directly.
+
+Configure an exporter to record spans:
+
+- ``InMemorySpanExporter`` keeps finished spans for tests and ad-hoc profiling
+- ``OTLPFileSpanExporter`` appends OTLP/JSON ``ExportTraceServiceRequest``
+  lines that an OpenTelemetry Collector (``otlpjsonfile`` receiver) or any
+  OTLP-aware viewer can load offline
+
+``PSN_TRACE_FILE`` enables the file exporter at startup.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SERVICE_NAME = "paidsearchnav-mcp"
+INSTRUMENTATION_SCOPE = "paidsearchnav_mcp"
+
+STATUS_UNSET = "UNSET"
+STATUS_OK = "OK"
+STATUS_ERROR = "ERROR"
+_OTLP_STATUS_CODES = {STATUS_UNSET: 0, STATUS_OK: 1, STATUS_ERROR: 2}
+_OTLP_SPAN_KIND_INTERNAL = 1
+
+AttributeValue = str | bool | int | float
+
+
+def _coerce_attribute(value: Any) -> Optional[AttributeValue]:
+    """Coerce a value to a type allowed in span attributes."""
+    if value is None:
+        return None
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
+
+
+def _otlp_value(value: AttributeValue) -> dict[str, Any]:
+    """Encode an attribute value as an OTLP/JSON AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": value}
+
+
+def _otlp_attributes(attributes: dict[str, AttributeValue]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(val)} for key, val in attributes.items()]
+
+
+class Span:
+    """A timed operation with attributes, events and a status."""
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: str = "",
+        attributes: Optional[dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self.attributes: dict[str, AttributeValue] = {}
+        self.events: list[dict[str, Any]] = []
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        if attributes:
+            self.set_attributes(attributes)
+
+    def is_recording(self) -> bool:
+        """Whether attributes set on this span are kept."""
+        return self.end_time_ns is None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute; ``None`` values are ignored."""
+        coerced = _coerce_attribute(value)
+        if coerced is not None:
+            self.attributes[key] = coerced
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        """Set several attributes at once."""
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def add_event(self, name: str, attributes: Optional[dict[str, Any]] = None) -> None:
+        """Record a point-in-time event on the span."""
+        event_attributes = {
+            key: coerced
+            for key, value in (attributes or {}).items()
+            if (coerced := _coerce_attribute(value)) is not None
+        }
+        self.events.append(
+            {"name": name, "time_ns": time.time_ns(), "attributes": event_attributes}
+        )
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Record an exception event and mark the span as failed."""
+        self.add_event(
+            "exception",
+            {
+                "exception.type": type(exception).__name__,
+                "exception.message": str(exception),
+            },
+        )
+        self.set_status(STATUS_ERROR, str(exception))
+
+    def set_status(self, status: str, message: str = "") -> None:
+        """Set the span status (``UNSET``, ``OK`` or ``ERROR``)."""
+        self.status = status
+        self.status_message = message
+
+    def end(self) -> None:
+        """Mark the span finished."""
+        if self.end_time_ns is None:
+            self.end_time_ns = time.time_ns()
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        """Span duration, or None while the span is still open."""
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def to_otlp(self) -> dict[str, Any]:
+        """Encode the span as an OTLP/JSON span object."""
+        status: dict[str, Any] = {"code": _OTLP_STATUS_CODES[self.status]}
+        if self.status_message:
+            status["message"] = self.status_message
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "kind": _OTLP_SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns or self.start_time_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "events": [
+                {
+                    "timeUnixNano": str(event["time_ns"]),
+                    "name": event["name"],
+                    "attributes": _otlp_attributes(event["attributes"]),
+                }
+                for event in self.events
+            ],
+            "status": status,
+        }
+
+
+class NonRecordingSpan:
+    """Span stand-in used while tracing is disabled; every method is a no-op."""
+
+    name = ""
+    attributes: dict[str, AttributeValue] = {}
+
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: Optional[dict[str, Any]] = None) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def set_status(self, status: str, message: str = "") -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+_NON_RECORDING_SPAN = NonRecordingSpan()
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "paidsearchnav_current_span", default=None
+)
+
+
+class SpanExporter:
+    """Receives finished spans."""
+
+    def export(self, spans: list[Span]) -> None:
+        """Export finished spans."""
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Flush and release resources."""
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keep finished spans in memory."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: list[Span] = []
+
+    def export(self, spans: list[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self) -> list[Span]:
+        """Get finished spans in completion order."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Drop every stored span."""
+        with self._lock:
+            self._spans.clear()
+
+
+class OTLPFileSpanExporter(SpanExporter):
+    """Append spans to a file as OTLP/JSON lines."""
+
+    def __init__(self, path: str, service_name: str = SERVICE_NAME):
+        """Initialize the exporter.
+
+        Args:
+            path: File to append to (created if missing)
+            service_name: ``service.name`` resource attribute
+        """
+        self.path = path
+        self.service_name = service_name
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, spans: list[Span]) -> None:
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes(
+                            {"service.name": self.service_name}
+                        )
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": INSTRUMENTATION_SCOPE},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        line = json.dumps(request, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class Tracer:
+    """Creates spans and hands finished spans to an exporter."""
+
+    def __init__(self, exporter: Optional[SpanExporter] = None):
+        """Initialize the tracer.
+
+        Args:
+            exporter: Span exporter; tracing is disabled when None
+        """
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are recorded."""
+        return self.exporter is not None
+
+    @contextmanager
+    def start_span(
+        self, name: str, attributes: Optional[dict[str, Any]] = None
+    ) -> Iterator[Span | NonRecordingSpan]:
+        """Start a span as a child of the current span.
+
+        Exceptions raised inside the block are recorded on the span and
+        re-raised.
+
+        Args:
+            name: Span name
+            attributes: Initial attributes
+
+        Yields:
+            The active span (non-recording when tracing is disabled)
+        """
+        if self.exporter is None:
+            yield _NON_RECORDING_SPAN
+            return
+
+        parent = _current_span.get()
+        span = Span(
+            name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            parent_span_id=parent.span_id if parent else "",
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            try:
+                self.exporter.export([span])
+            except Exception as e:
+                logger.warning(f"Failed to export span {name}: {e}")
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer."""
+    return _tracer
+
+
+def configure_tracing(exporter: Optional[SpanExporter] = None) -> Tracer:
+    """Replace the process-wide tracer.
+
+    Args:
+        exporter: Span exporter, or None to disable tracing
+
+    Returns:
+        The new tracer
+    """
+    global _tracer
+    previous = _tracer.exporter
+    _tracer = Tracer(exporter)
+    if previous is not None and previous is not exporter:
+        previous.shutdown()
+    return _tracer
+
+
+def configure_tracing_from_env() -> Tracer:
+    """Enable the OTLP file exporter when ``PSN_TRACE_FILE`` is set.
+
+    Returns:
+        The process-wide tracer
+    """
+    trace_file = os.getenv("PSN_TRACE_FILE")
+    if trace_file:
+        logger.info(f"Writing OTLP/JSON traces to {trace_file}")
+        return configure_tracing(OTLPFileSpanExporter(trace_file))
+    return get_tracer()
+
+
+def get_current_span() -> Span | NonRecordingSpan:
+    """Get the active span, or a non-recording span outside any trace."""
+    return _current_span.get() or _NON_RECORDING_SPAN
+
+
+def start_span(name: str, attributes: Optional[dict[str, Any]] = None) -> Any:
+    """Start a span on the process-wide tracer.
+
+    Args:
+        name: Span name
+        attributes: Initial attributes
+
+    Returns:
+        Context manager yielding the span
+    """
+    return _tracer.start_span(name, attributes)
+
+
+def _resolve_argument(arguments: dict[str, Any], path: str) -> Any:
+    """Resolve ``name`` or ``name.attr`` against bound call arguments."""
+    head, *rest = path.split(".")
+    value = arguments.get(head)
+    for attr in rest:
+        value = getattr(value, attr, None)
+    return value
+
+
+def traced(
+    name: Optional[str] = None,
+    record_args: tuple[str, ...] = (),
+    result_attributes: Optional[Callable[[Any], dict[str, Any]]] = None,
+    **attributes: Any,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorate a function so each call runs in a span.
+
+    Works for sync and coroutine functions. When tracing is disabled the
+    function is called directly.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        record_args: Argument names, or ``arg.attr`` paths, recorded as
+            attributes named after their last segment; missing arguments
+            are skipped
+        result_attributes: Callable deriving attributes from the return value
+        **attributes: Static span attributes
+
+    Returns:
+        Decorator
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        span_name = name or func.__qualname__
+        signature = inspect.signature(func) if record_args else None
+
+        def _span_attributes(args: tuple, kwargs: dict) -> dict[str, Any]:
+            span_attributes = dict(attributes)
+            if signature is not None:
+                bound = signature.bind_partial(*args, **kwargs).arguments
+                for path in record_args:
+                    value = _resolve_argument(bound, path)
+                    if value is not None:
+                        span_attributes[path.rsplit(".", 1)[-1]] = value
+            return span_attributes
+
+        def _record_result(span: Span | NonRecordingSpan, result: Any) -> None:
+            if result_attributes is not None:
+                span.set_attributes(result_attributes(result))
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                tracer = get_tracer()
+                if not tracer.enabled:
+                    return await func(*args, **kwargs)
+                with tracer.start_span(
+                    span_name, _span_attributes(args, kwargs)
+                ) as span:
+                    result = await func(*args, **kwargs)
+                    _record_result(span, result)
+                    return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.start_span(span_name, _span_attributes(args, kwargs)) as span:
+                result = func(*args, **kwargs)
+                _record_result(span, result)
+                return result
+
+        return sync_wrapper
+
+    return decorator
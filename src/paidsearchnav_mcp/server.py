@@ -1,24 +1,56 @@
 """FastMCP server for PaidSearchNav Google Ads data access."""
 
+import asyncio
 import logging
 import os
 import re
-from datetime import datetime
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import date, datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
 from fastmcp import FastMCP
+from google.cloud import bigquery
 from pydantic import BaseModel, Field
+from starlette.requests import Request
+from starlette.responses import Response
 
 from paidsearchnav_mcp.clients.bigquery.client import BigQueryClient
+from paidsearchnav_mcp.clients.bigquery.cost_gate import (
+    QueryCostError,
+    QueryCostGate,
+    is_cacheable,
+    result_cache_params,
+)
+from paidsearchnav_mcp.clients.bigquery.cost_tracker import CustomerCostTracker
+from paidsearchnav_mcp.clients.bigquery.pool import (
+    BIGQUERY_CLIENTS,
+    get_bigquery_client,
+)
+from paidsearchnav_mcp.clients.bigquery.rollups import rollup_definitions
+from paidsearchnav_mcp.clients.bigquery.schema import BigQueryTableSchema
 from paidsearchnav_mcp.clients.bigquery.validator import QueryValidator
 from paidsearchnav_mcp.clients.cache import CacheClient
 from paidsearchnav_mcp.clients.google.client import GoogleAdsAPIClient
+from paidsearchnav_mcp.core.circuit_breaker import get_bigquery_retry_handlers
+from paidsearchnav_mcp.core.config import BigQueryConfig
 from paidsearchnav_mcp.core.exceptions import (
     APIError,
     AuthenticationError,
     RateLimitError,
 )
+from paidsearchnav_mcp.core.metrics_registry import (
+    OPENMETRICS_CONTENT_TYPE,
+    MetricFamily,
+    collect_api_efficiency,
+    collect_breaker_registry,
+    collect_cache_stats,
+    collect_circuit_breaker,
+    collect_retry_handlers,
+    get_metrics_registry,
+)
+from paidsearchnav_mcp.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 # Warn if debug logging is enabled in production
@@ -46,13 +78,38 @@ class ErrorCode(str, Enum):
     CAMPAIGNS_FETCH_ERROR = "CAMPAIGNS_FETCH_ERROR"
     NEGATIVE_KEYWORDS_FETCH_ERROR = "NEGATIVE_KEYWORDS_FETCH_ERROR"
     GEO_PERFORMANCE_FETCH_ERROR = "GEO_PERFORMANCE_FETCH_ERROR"
+    DAILY_PERFORMANCE_FETCH_ERROR = "DAILY_PERFORMANCE_FETCH_ERROR"
     BIGQUERY_FETCH_ERROR = "BIGQUERY_FETCH_ERROR"
+    QUERY_COST_LIMIT_EXCEEDED = "QUERY_COST_LIMIT_EXCEEDED"
     RATE_LIMIT_EXCEEDED = "RATE_LIMIT_EXCEEDED"
     INTERNAL_ERROR = "INTERNAL_ERROR"
 
 
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm the default BigQuery client at startup; close pooled clients at exit."""
+    project_id = os.getenv("GCP_PROJECT_ID")
+    if project_id:
+        try:
+            # Client construction resolves credentials with blocking I/O
+            await asyncio.to_thread(
+                get_bigquery_client,
+                project_id,
+                os.getenv("GOOGLE_APPLICATION_CREDENTIALS"),
+            )
+        except Exception as e:
+            logger.warning(
+                "BigQuery client warm-up failed; it will be retried on first use: "
+                f"{sanitize_error_message(str(e))}"
+            )
+    try:
+        yield
+    finally:
+        BIGQUERY_CLIENTS.close()
+
+
 # Initialize MCP server
-mcp = FastMCP("PaidSearchNav MCP Server")
+mcp = FastMCP("PaidSearchNav MCP Server", lifespan=_lifespan)
 
 
 # ============================================================================
@@ -101,6 +158,7 @@ def sanitize_error_message(msg: str) -> str:
 # Global client instance for reuse across requests
 _client_instance: GoogleAdsAPIClient | None = None
 _cache_instance: CacheClient | None = None
+_cost_gate_instance: QueryCostGate | None = None
 
 
 def reset_client_for_testing():
@@ -294,6 +352,39 @@ def validate_date_range(
         raise ValueError(f"{start_name} must be before {end_name}")
 
 
+def _tool_span_attributes(result: dict[str, Any]) -> dict[str, Any]:
+    """Summarize a tool response for its trace span.
+
+    Args:
+        result: Tool response dictionary
+
+    Returns:
+        Span attributes with the response status and row count
+    """
+    attributes: dict[str, Any] = {"status": result.get("status", "success")}
+    if isinstance(result.get("data"), list):
+        attributes["rows"] = len(result["data"])
+    if "total_records_analyzed" in result:
+        attributes["rows"] = result["total_records_analyzed"]
+    return attributes
+
+
+def traced_tool(name: str) -> Any:
+    """Trace an MCP tool call, recording the customer ID and response size.
+
+    Args:
+        name: Span name
+
+    Returns:
+        Decorator to apply beneath ``@mcp.tool()``
+    """
+    return traced(
+        name,
+        record_args=("customer_id", "request.customer_id", "request.project_id"),
+        result_attributes=_tool_span_attributes,
+    )
+
+
 # ============================================================================
 # Models
 # ============================================================================
@@ -308,6 +399,14 @@ class SearchTermsRequest(BaseModel):
     campaign_id: str | None = Field(
         None, description="Optional campaign ID to filter by"
     )
+    include_keyword: bool = Field(
+        False,
+        description="Include the triggering keyword text and match type (rows are split per keyword)",
+    )
+    campaign_type: str | None = Field(
+        None,
+        description="Optional campaign type to filter by (e.g. SEARCH, PERFORMANCE_MAX)",
+    )
     limit: int | None = Field(
         None,
         description="Maximum number of results to return (default: no limit, recommended: 1000 for large accounts)",
@@ -350,6 +449,20 @@ class CampaignsRequest(BaseModel):
     end_date: str = Field(..., description="End date in YYYY-MM-DD format")
 
 
+class DailyPerformanceRequest(BaseModel):
+    """Request model for fetching day-segmented performance."""
+
+    customer_id: str = Field(..., description="Google Ads customer ID (without dashes)")
+    start_date: str = Field(..., description="Start date in YYYY-MM-DD format")
+    end_date: str = Field(..., description="End date in YYYY-MM-DD format")
+    level: Literal["CAMPAIGN", "AD_GROUP"] = Field(
+        "CAMPAIGN", description="Entity to segment by: CAMPAIGN or AD_GROUP"
+    )
+    campaign_id: str | None = Field(
+        None, description="Optional campaign ID to filter by"
+    )
+
+
 class NegativeKeywordsRequest(BaseModel):
     """Request model for fetching negative keywords."""
 
@@ -362,10 +475,43 @@ class NegativeKeywordsRequest(BaseModel):
 class BigQueryRequest(BaseModel):
     """Request model for executing BigQuery queries."""
 
-    query: str = Field(..., description="SQL query to execute")
+    query: str | None = Field(
+        None, description="SQL query to execute (omit when paging with job_id)"
+    )
     project_id: str | None = Field(
         None, description="Optional GCP project ID (uses default if not provided)"
     )
+    page_size: int | None = Field(
+        None,
+        description=(
+            "Rows per page. When set, results are returned a page at a time "
+            "with a job_id and page_token for fetching the next page"
+        ),
+        ge=1,
+        le=10000,
+    )
+    job_id: str | None = Field(
+        None,
+        description=(
+            "Job ID from a previous paged query; reads its results without "
+            "re-running the query"
+        ),
+    )
+    page_token: str | None = Field(
+        None, description="Page token from the previous page (use with job_id)"
+    )
+    location: str | None = Field(
+        None, description="Job location from the previous page (use with job_id)"
+    )
+    customer_id: str | None = Field(
+        None, description="Optional customer ID the query runs for (cost budgets)"
+    )
+    confirm_cost: bool = Field(
+        False,
+        description=(
+            "Run the query even if its dry-run estimate is above the byte budget"
+        ),
+    )
 
 
 class BigQuerySchemaRequest(BaseModel):
@@ -384,6 +530,7 @@ class BigQuerySchemaRequest(BaseModel):
 
 
 @mcp.tool()
+@traced_tool("mcp.tool.get_search_terms")
 async def get_search_terms(request: SearchTermsRequest) -> dict[str, Any]:
     """
     Fetch search terms data from Google Ads for the specified date range.
@@ -417,6 +564,10 @@ async def get_search_terms(request: SearchTermsRequest) -> dict[str, Any]:
                     "start_date": request.start_date,
                     "end_date": request.end_date,
                     "campaign_id": request.campaign_id,
+                    "include_keyword": request.include_keyword,
+                    "campaign_type": request.campaign_type,
+                    "limit": request.limit,
+                    "offset": request.offset,
                 },
             )
             cached_data = await cache.get(cache_key)
@@ -438,17 +589,16 @@ async def get_search_terms(request: SearchTermsRequest) -> dict[str, Any]:
             start_date=start_date,
             end_date=end_date,
             campaigns=[request.campaign_id] if request.campaign_id else None,
-            max_results=request.limit if request.limit else None,
+            # The client resumes from the offset; one extra row tells
+            # whether another page follows
+            max_results=request.limit + 1 if request.limit else None,
+            offset=request.offset or 0,
+            include_keyword=request.include_keyword,
+            campaign_types=[request.campaign_type] if request.campaign_type else None,
         )
 
-        # Track original count before pagination for has_more calculation
-        original_count = len(search_terms)
-
-        # Apply offset if specified (client doesn't support offset directly)
-        if request.offset and request.offset > 0:
-            search_terms = search_terms[request.offset :]
-
-        # Apply limit (whether offset was used or not)
+        # Drop the look-ahead row used for has_more
+        has_more = bool(request.limit) and len(search_terms) > request.limit
         if request.limit:
             search_terms = search_terms[: request.limit]
 
@@ -485,12 +635,12 @@ async def get_search_terms(request: SearchTermsRequest) -> dict[str, Any]:
                 "start_date": request.start_date,
                 "end_date": request.end_date,
                 "campaign_id": request.campaign_id,
+                "campaign_type": request.campaign_type,
                 "record_count": len(data),
                 "pagination": {
                     "limit": request.limit,
                     "offset": request.offset,
-                    "has_more": original_count
-                    > (request.offset or 0) + len(search_terms),
+                    "has_more": has_more,
                 },
             },
             "data": data,
@@ -571,6 +721,7 @@ async def get_search_terms(request: SearchTermsRequest) -> dict[str, Any]:
 
 
 @mcp.tool()
+@traced_tool("mcp.tool.get_keywords")
 async def get_keywords(request: KeywordsRequest) -> dict[str, Any]:
     """
     Fetch keywords data from Google Ads campaigns.
@@ -605,6 +756,8 @@ async def get_keywords(request: KeywordsRequest) -> dict[str, Any]:
                     "ad_group_id": request.ad_group_id,
                     "start_date": request.start_date,
                     "end_date": request.end_date,
+                    "limit": request.limit,
+                    "offset": request.offset,
                 },
             )
             cached_data = await cache.get(cache_key)
@@ -627,17 +780,14 @@ async def get_keywords(request: KeywordsRequest) -> dict[str, Any]:
             ad_groups=[request.ad_group_id] if request.ad_group_id else None,
             start_date=start_date,
             end_date=end_date,
-            max_results=request.limit if request.limit else None,
+            # The client resumes from the offset; one extra row tells
+            # whether another page follows
+            max_results=request.limit + 1 if request.limit else None,
+            offset=request.offset or 0,
         )
 
-        # Track original count before pagination for has_more calculation
-        original_count = len(keywords)
-
-        # Apply offset if specified (client doesn't support offset directly)
-        if request.offset and request.offset > 0:
-            keywords = keywords[request.offset :]
-
-        # Apply limit (whether offset was used or not)
+        # Drop the look-ahead row used for has_more
+        has_more = bool(request.limit) and len(keywords) > request.limit
         if request.limit:
             keywords = keywords[: request.limit]
 
@@ -677,7 +827,7 @@ async def get_keywords(request: KeywordsRequest) -> dict[str, Any]:
                 "pagination": {
                     "limit": request.limit,
                     "offset": request.offset,
-                    "has_more": original_count > (request.offset or 0) + len(keywords),
+                    "has_more": has_more,
                 },
             },
             "data": data,
@@ -756,6 +906,7 @@ async def get_keywords(request: KeywordsRequest) -> dict[str, Any]:
 
 
 @mcp.tool()
+@traced_tool("mcp.tool.get_campaigns")
 async def get_campaigns(request: CampaignsRequest) -> dict[str, Any]:
     """
     Fetch campaigns data from Google Ads.
@@ -913,6 +1064,7 @@ async def get_campaigns(request: CampaignsRequest) -> dict[str, Any]:
 
 
 @mcp.tool()
+@traced_tool("mcp.tool.get_negative_keywords")
 async def get_negative_keywords(request: NegativeKeywordsRequest) -> dict[str, Any]:
     """
     Fetch negative keywords from Google Ads campaigns.
@@ -1054,6 +1206,7 @@ async def get_negative_keywords(request: NegativeKeywordsRequest) -> dict[str, A
 
 
 @mcp.tool()
+@traced_tool("mcp.tool.get_geo_performance")
 async def get_geo_performance(request: CampaignsRequest) -> dict[str, Any]:
     """
     Fetch geographic performance data from Google Ads.
@@ -1192,12 +1345,246 @@ async def get_geo_performance(request: CampaignsRequest) -> dict[str, Any]:
         }
 
 
+@mcp.tool()
+@traced_tool("mcp.tool.get_daily_performance")
+async def get_daily_performance(request: DailyPerformanceRequest) -> dict[str, Any]:
+    """
+    Fetch campaign or ad group metrics segmented by day from Google Ads.
+
+    Returns one row per entity and day with impressions, clicks, cost,
+    conversions and conversion value, fetched in a single query. Days
+    without impressions are omitted. Used for trend and change analysis.
+    """
+    try:
+        # Validate inputs
+        customer_id = validate_customer_id(request.customer_id)
+        start_date = validate_date_format(request.start_date, "start_date")
+        end_date = validate_date_format(request.end_date, "end_date")
+        validate_date_range(start_date, end_date)
+
+        # Initialize clients
+        client = _get_google_ads_client()
+        cache = _get_cache_client()
+
+        # Try cache first
+        if cache:
+            cache_key = cache._make_key(
+                "daily_performance",
+                {
+                    "customer_id": customer_id,
+                    "start_date": request.start_date,
+                    "end_date": request.end_date,
+                    "level": request.level,
+                    "campaign_id": request.campaign_id,
+                },
+            )
+            cached_data = await cache.get(cache_key)
+            if cached_data:
+                logger.info(
+                    f"Cache hit for daily performance query: customer={customer_id}, "
+                    f"date_range={request.start_date}:{request.end_date}"
+                )
+                return cached_data
+
+        daily = await client.get_daily_performance(
+            customer_id=customer_id,
+            start_date=start_date,
+            end_date=end_date,
+            level=request.level,
+            campaigns=[request.campaign_id] if request.campaign_id else None,
+        )
+
+        result = {
+            "status": "success",
+            "message": f"Retrieved {len(daily)} daily performance records",
+            "metadata": {
+                "customer_id": request.customer_id,
+                "start_date": request.start_date,
+                "end_date": request.end_date,
+                "level": request.level,
+                "campaign_id": request.campaign_id,
+                "record_count": len(daily),
+            },
+            "data": daily,
+        }
+
+        # Cache the result (only on success, TTL=1 hour for frequently changing data)
+        if cache:
+            try:
+                await cache.set(cache_key, result, ttl=3600)
+            except Exception as cache_error:
+                logger.warning(
+                    f"Failed to cache daily performance result: {cache_error}"
+                )
+
+        return result
+
+    except ValueError as e:
+        logger.error(
+            f"Invalid date format or configuration: {sanitize_error_message(str(e))}",
+            exc_info=True,
+        )
+        return {
+            "status": "error",
+            "error_code": ErrorCode.INVALID_INPUT,
+            "message": f"Invalid input: {str(e)}",
+            "details": {"error_type": "validation", "retry_allowed": False},
+            "data": [],
+        }
+    except AuthenticationError as e:
+        logger.error(
+            f"Authentication failed: {sanitize_error_message(str(e))}", exc_info=True
+        )
+        return {
+            "status": "error",
+            "error_code": ErrorCode.INVALID_CREDENTIALS,
+            "message": "Authentication failed. Please check your credentials.",
+            "details": {"error_type": "authentication", "retry_allowed": False},
+            "data": [],
+        }
+    except RateLimitError as e:
+        logger.warning(f"Rate limit exceeded: {sanitize_error_message(str(e))}")
+        return {
+            "status": "error",
+            "error_code": ErrorCode.RATE_LIMIT_EXCEEDED,
+            "message": "API rate limit exceeded. Please try again later.",
+            "details": {
+                "error_type": "rate_limit",
+                "retry_allowed": True,
+                "retry_after_seconds": 60,
+            },
+            "data": [],
+        }
+    except APIError as e:
+        logger.error(
+            f"Google Ads API error: {sanitize_error_message(str(e))}", exc_info=True
+        )
+        return {
+            "status": "error",
+            "error_code": ErrorCode.DAILY_PERFORMANCE_FETCH_ERROR,
+            "message": f"Google Ads API error: {str(e)}",
+            "details": {"error_type": "api_error", "retry_allowed": True},
+            "data": [],
+        }
+    except Exception as e:
+        logger.error(
+            f"Unexpected error: {sanitize_error_message(str(e))}", exc_info=True
+        )
+        return {
+            "status": "error",
+            "error_code": ErrorCode.INTERNAL_ERROR,
+            "message": "An unexpected error occurred. Please contact support if this persists.",
+            "details": {"error_type": "unexpected"},
+            "data": [],
+        }
+
+
 # ============================================================================
 # Tools - BigQuery
 # ============================================================================
 
 
+class _PooledBigQueryAuthenticator:
+    """Hands cost tracking the pooled BigQuery client for a project."""
+
+    def __init__(self, project_id: str):
+        self.project_id = project_id
+
+    async def get_client(self) -> bigquery.Client:
+        """Get the pooled client (same credentials as BigQueryClient)."""
+        return get_bigquery_client(
+            self.project_id, os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+        )
+
+
+def _get_cost_gate() -> QueryCostGate:
+    """
+    Get the cost gate for ad-hoc BigQuery queries (singleton pattern).
+
+    The per-query byte budget comes from PSN_BIGQUERY_MAX_BYTES_PER_QUERY
+    (default 10 GiB). The gate's CustomerCostTracker is built from the
+    BigQuery config for GCP_PROJECT_ID; it applies per-customer byte
+    budgets and daily budget enforcement, and records what each query
+    run for a customer was billed.
+
+    Returns:
+        Shared QueryCostGate instance
+    """
+    global _cost_gate_instance
+
+    if _cost_gate_instance is None:
+        config = BigQueryConfig(project_id=os.getenv("GCP_PROJECT_ID", ""))
+        tracker = CustomerCostTracker(
+            config, _PooledBigQueryAuthenticator(config.project_id)
+        )
+        _cost_gate_instance = QueryCostGate(cost_tracker=tracker)
+    return _cost_gate_instance
+
+
+def _partition_columns() -> dict[str, str]:
+    """Partition column of each PaidSearchNav table, for ad-hoc query checks.
+
+    Keys are ``dataset.table`` in the configured dataset, so a query naming
+    the table with or without its project or dataset matches.
+    """
+    columns = {
+        name: config["partition_field"]
+        for name, config in BigQueryTableSchema.get_table_configurations().items()
+        if config.get("partition_field")
+    }
+    columns.update((d.name, d.partition_field) for d in rollup_definitions())
+    dataset_id = BigQueryConfig().dataset_id
+    return {f"{dataset_id}.{name}": column for name, column in columns.items()}
+
+
+async def _gate_query_cost(
+    estimate: dict[str, Any], request: BigQueryRequest
+) -> bigquery.QueryJobConfig:
+    """Check a dry-run estimate and cap the job at the approved bytes.
+
+    Raises:
+        QueryCostError: If the query is over budget
+    """
+    max_bytes = await _get_cost_gate().check(
+        estimate, customer_id=request.customer_id, confirmed=request.confirm_cost
+    )
+    return bigquery.QueryJobConfig(maximum_bytes_billed=max_bytes)
+
+
+async def _track_query_cost(query_job: Any, request: BigQueryRequest) -> None:
+    """Record what a query run for a customer was billed."""
+    tracker = _get_cost_gate().cost_tracker
+    if tracker is None or query_job is None or not request.customer_id:
+        return
+    await tracker.track_query_execution(
+        request.customer_id, query_job, analyzer_type="query_bigquery"
+    )
+
+
+def _query_cost_error(e: QueryCostError, query_preview: str | None) -> dict[str, Any]:
+    """Build the error response for a query refused by the cost gate."""
+    message = str(e)
+    if e.requires_confirmation:
+        message += ". Narrow the query or set confirm_cost=true to run it anyway"
+    return {
+        "status": "error",
+        "error_code": ErrorCode.QUERY_COST_LIMIT_EXCEEDED,
+        "message": message,
+        "details": {
+            "error_type": "cost_limit",
+            "bytes_processed": e.bytes_processed,
+            "max_bytes": e.max_bytes,
+            "estimated_cost_usd": e.estimated_cost_usd,
+            "requires_confirmation": e.requires_confirmation,
+            "retry_allowed": e.requires_confirmation,
+            "query_preview": query_preview,
+        },
+        "data": [],
+    }
+
+
 @mcp.tool()
+@traced_tool("mcp.tool.query_bigquery")
 async def query_bigquery(request: BigQueryRequest) -> dict[str, Any]:
     """
     Execute a SQL query against BigQuery.
@@ -1205,10 +1592,31 @@ async def query_bigquery(request: BigQueryRequest) -> dict[str, Any]:
     Supports querying Google Ads data exported to BigQuery, GA4 data,
     and custom datasets. Useful for historical analysis and cross-platform attribution.
     Includes query validation to prevent destructive operations.
+
+    Set page_size to page through large results: the response includes a
+    job_id and page_token, and calling again with those (instead of the
+    query) reads the next page from the finished job without re-running it.
+
+    Queries are dry-run first; ones that would scan more than the byte
+    budget are refused until re-sent with confirm_cost. Repeated queries
+    over unchanged tables are served from cache when Redis is configured.
     """
+    if request.job_id or request.page_size:
+        return await _query_bigquery_page(request)
+    if not request.query:
+        return {
+            "status": "error",
+            "error_code": ErrorCode.INVALID_INPUT,
+            "message": "Invalid input: query or job_id is required",
+            "details": {"error_type": "validation", "retry_allowed": False},
+            "data": [],
+        }
+
     try:
         # Validate query first
-        validation = QueryValidator.validate_query(request.query)
+        validation = QueryValidator.validate_query(
+            request.query, partition_columns=_partition_columns()
+        )
 
         if not validation["valid"]:
             logger.warning(f"BigQuery query validation failed: {validation['errors']}")
@@ -1224,19 +1632,56 @@ async def query_bigquery(request: BigQueryRequest) -> dict[str, Any]:
                 "data": [],
             }
 
-        # Initialize BigQuery client
+        # Wraps the pooled BigQuery client for the project
         client = BigQueryClient(project_id=request.project_id)
 
-        # Execute query
-        results = await client.execute_query(request.query, max_results=10000)
+        # Dry run (free): bytes the query would scan and the tables it reads
+        estimate = await client.estimate_query_cost(request.query)
+
+        # Identical SQL over unchanged tables is answered from cache; tables
+        # without a version (e.g. being streamed into) are never cached
+        cache = _get_cache_client()
+        cache_key = None
+        if cache and is_cacheable(request.query):
+            versions = await client.table_versions(estimate["referenced_tables"])
+            if all(versions.values()):
+                cache_key = cache._make_key(
+                    "bigquery_query",
+                    result_cache_params(client.project_id, request.query, versions),
+                )
+        if cache_key:
+            cached_data = await cache.get(cache_key)
+            if cached_data:
+                logger.info(f"Cache hit for BigQuery query: {cache_key}")
+                cached_data["metadata"]["cache_hit"] = True
+                return cached_data
+
+        job_config = await _gate_query_cost(estimate, request)
+
+        # Execute query; rows stay columnar until the response is built
+        query_result = await client.fetch_results(
+            request.query, max_results=10000, job_config=job_config
+        )
+        await _track_query_cost(query_result.job, request)
+        results = query_result.to_rows()
+
+        message = f"Query executed successfully, returned {len(results)} rows"
+        if query_result.truncated:
+            message += (
+                "; results were truncated, set page_size to page through all rows"
+            )
 
         # Prepare response
         result = {
             "status": "success",
-            "message": f"Query executed successfully, returned {len(results)} rows",
+            "message": message,
             "metadata": {
                 "project_id": client.project_id,
                 "result_count": len(results),
+                "truncated": query_result.truncated,
+                "bytes_processed": estimate["bytes_processed"],
+                "estimated_cost_usd": estimate["estimated_cost_usd"],
+                "cache_hit": False,
                 "query_preview": request.query[:200] + "..."
                 if len(request.query) > 200
                 else request.query,
@@ -1245,8 +1690,20 @@ async def query_bigquery(request: BigQueryRequest) -> dict[str, Any]:
             "data": results,
         }
 
+        if cache_key:
+            try:
+                await cache.set(cache_key, result)
+            except Exception as cache_error:
+                logger.warning(f"Failed to cache BigQuery result: {cache_error}")
+
         return result
 
+    except QueryCostError as e:
+        logger.warning(f"BigQuery query refused by cost gate: {e}")
+        return _query_cost_error(
+            e,
+            request.query[:200] + "..." if len(request.query) > 200 else request.query,
+        )
     except ValueError as e:
         logger.error(
             f"Invalid BigQuery configuration: {sanitize_error_message(str(e))}",
@@ -1278,7 +1735,112 @@ async def query_bigquery(request: BigQueryRequest) -> dict[str, Any]:
         }
 
 
+async def _query_bigquery_page(request: BigQueryRequest) -> dict[str, Any]:
+    """Run a query, or continue a previous one, returning one page of rows."""
+    page_size = request.page_size or 1000
+    query_preview = (
+        request.query[:200] + "..."
+        if request.query and len(request.query) > 200
+        else request.query
+    )
+    try:
+        if request.page_token and not request.job_id:
+            raise ValueError("page_token requires the job_id it was issued for")
+
+        # Wraps the pooled BigQuery client for the project
+        client = BigQueryClient(project_id=request.project_id)
+
+        validation_warnings: list[str] = []
+        if request.job_id:
+            # Later pages come from the finished job's destination table
+            page = await client.fetch_page(
+                request.job_id,
+                page_token=request.page_token,
+                page_size=page_size,
+                location=request.location,
+            )
+        else:
+            if not request.query:
+                raise ValueError("query or job_id is required")
+            validation = QueryValidator.validate_query(
+                request.query, partition_columns=_partition_columns()
+            )
+            if not validation["valid"]:
+                logger.warning(
+                    f"BigQuery query validation failed: {validation['errors']}"
+                )
+                return {
+                    "status": "error",
+                    "error_code": ErrorCode.INVALID_INPUT,
+                    "message": "Query validation failed",
+                    "details": {
+                        "error_type": "validation",
+                        "validation_errors": validation["errors"],
+                        "retry_allowed": False,
+                    },
+                    "data": [],
+                }
+            validation_warnings = validation["warnings"]
+            estimate = await client.estimate_query_cost(request.query)
+            job_config = await _gate_query_cost(estimate, request)
+            page = await client.query_pages(
+                request.query, page_size=page_size, job_config=job_config
+            )
+            await _track_query_cost(page.result.job, request)
+
+        results = page.result.to_rows()
+        return {
+            "status": "success",
+            "message": f"Returned {len(results)} of {page.total_rows} rows",
+            "metadata": {
+                "project_id": client.project_id,
+                "result_count": len(results),
+                "total_rows": page.total_rows,
+                "job_id": page.job_id,
+                "location": page.location,
+                "page_token": page.next_page_token,
+                "has_more": page.next_page_token is not None,
+                "query_preview": query_preview,
+                "validation_warnings": validation_warnings,
+            },
+            "data": results,
+        }
+
+    except QueryCostError as e:
+        logger.warning(f"BigQuery query refused by cost gate: {e}")
+        return _query_cost_error(e, query_preview)
+    except ValueError as e:
+        logger.error(
+            f"Invalid BigQuery paging request: {sanitize_error_message(str(e))}",
+            exc_info=True,
+        )
+        return {
+            "status": "error",
+            "error_code": ErrorCode.INVALID_INPUT,
+            "message": f"Invalid input: {str(e)}",
+            "details": {"error_type": "validation", "retry_allowed": False},
+            "data": [],
+        }
+    except Exception as e:
+        logger.error(
+            f"BigQuery query error: {sanitize_error_message(str(e))}", exc_info=True
+        )
+        return {
+            "status": "error",
+            "error_code": ErrorCode.BIGQUERY_FETCH_ERROR,
+            "message": f"BigQuery error: {str(e)}",
+            "details": {
+                "error_type": type(e).__name__,
+                "retry_allowed": True,
+                "job_id": request.job_id,
+                "query_preview": query_preview,
+            },
+            "data": [],
+        }
+
+
 @mcp.tool()
+@traced_tool("mcp.tool.get_bigquery_schema")
 async def get_bigquery_schema(request: BigQuerySchemaRequest) -> dict[str, Any]:
     """
     Get schema information for a BigQuery table.
@@ -1287,7 +1849,7 @@ async def get_bigquery_schema(request: BigQuerySchemaRequest) -> dict[str, Any]:
     GA4 tables, or custom datasets before writing queries.
     """
     try:
-        # Initialize BigQuery client
+        # Wraps the pooled BigQuery client for the project
         client = BigQueryClient(project_id=request.project_id)
 
         # Get table schema
@@ -1345,6 +1907,7 @@ async def get_bigquery_schema(request: BigQuerySchemaRequest) -> dict[str, Any]:
 
 
 @mcp.tool()
+@traced_tool("mcp.tool.analyze_keyword_match_types")
 async def analyze_keyword_match_types(
     customer_id: str,
     start_date: str,
@@ -1391,6 +1954,7 @@ async def analyze_keyword_match_types(
 
 
 @mcp.tool()
+@traced_tool("mcp.tool.analyze_search_term_waste")
 async def analyze_search_term_waste(
     customer_id: str,
     start_date: str,
@@ -1431,6 +1995,7 @@ async def analyze_search_term_waste(
 
 
 @mcp.tool()
+@traced_tool("mcp.tool.analyze_negative_conflicts")
 async def analyze_negative_conflicts(
     customer_id: str,
 ) -> dict[str, Any]:
@@ -1468,6 +2033,7 @@ async def analyze_negative_conflicts(
 
 
 @mcp.tool()
+@traced_tool("mcp.tool.analyze_geo_performance")
 async def analyze_geo_performance(
     customer_id: str,
     start_date: str,
@@ -1508,10 +2074,75 @@ async def analyze_geo_performance(
 
 
 @mcp.tool()
+@traced_tool("mcp.tool.analyze_performance_trends")
+async def analyze_performance_trends(
+    customer_id: str,
+    start_date: str,
+    end_date: str,
+    level: str = "CAMPAIGN",
+    window_days: int = 7,
+) -> dict[str, Any]:
+    """Find campaigns or ad groups whose performance recently deteriorated.
+
+    Returns what broke in the latest period and when.
+
+    This orchestration tool compares each entity's last ``window_days`` with
+    the period before (cost, conversions, CPA, ROAS) and detects step
+    changes in daily conversions, from a single day-segmented fetch.
+
+    Args:
+        customer_id: Google Ads customer ID (10 digits, no dashes)
+        start_date: Analysis start date (YYYY-MM-DD); cover at least two
+            windows, e.g. 28 days
+        end_date: Analysis end date (YYYY-MM-DD)
+        level: Entity to analyze (CAMPAIGN or AD_GROUP)
+        window_days: Days per comparison period (7 = week over week)
+
+    Returns:
+        Analysis summary with the entities that deteriorated most
+    """
+    from paidsearchnav_mcp.analyzers import TrendAnalyzer
+
+    try:
+        days = (date.fromisoformat(end_date) - date.fromisoformat(start_date)).days + 1
+        if not 1 <= window_days <= days:
+            raise ValueError(
+                f"window_days must be between 1 and the {days}-day date range, "
+                f"got {window_days}"
+            )
+    except ValueError as e:
+        return {
+            "status": "error",
+            "error_code": ErrorCode.INVALID_INPUT,
+            "message": f"Invalid input: {str(e)}",
+            "details": {"error_type": "validation", "retry_allowed": False},
+            "data": {},
+        }
+
+    try:
+        analyzer = TrendAnalyzer(level=level.upper(), window=window_days)
+        summary = await analyzer.analyze(customer_id, start_date, end_date)
+        return summary.model_dump()
+    except Exception as e:
+        logger.error(
+            f"Performance trend analysis failed: {sanitize_error_message(str(e))}",
+            exc_info=True,
+        )
+        return {
+            "status": "error",
+            "error_code": ErrorCode.INTERNAL_ERROR,
+            "message": f"Analysis failed: {str(e)}",
+            "data": {},
+        }
+
+
+@mcp.tool()
+@traced_tool("mcp.tool.analyze_pmax_cannibalization")
 async def analyze_pmax_cannibalization(
     customer_id: str,
     start_date: str,
     end_date: str,
+    estimate_only: bool = False,
 ) -> dict[str, Any]:
     """Detect Performance Max campaigns cannibalizing Search campaigns.
 
@@ -1524,6 +2155,9 @@ async def analyze_pmax_cannibalization(
         customer_id: Google Ads customer ID (10 digits, no dashes)
         start_date: Analysis start date (YYYY-MM-DD)
         end_date: Analysis end date (YYYY-MM-DD)
+        estimate_only: Estimate each PMax campaign's overlap from fixed-size
+            sketches instead of joining every search term (faster on very
+            large accounts; no costs or per-term recommendations)
 
     Returns:
         Analysis summary with PMax negative keyword recommendations
@@ -1531,7 +2165,7 @@ async def analyze_pmax_cannibalization(
     from paidsearchnav_mcp.analyzers import PMaxCannibalizationAnalyzer
 
     try:
-        analyzer = PMaxCannibalizationAnalyzer()
+        analyzer = PMaxCannibalizationAnalyzer(estimate=estimate_only)
         summary = await analyzer.analyze(customer_id, start_date, end_date)
         return summary.model_dump()
     except Exception as e:
@@ -1547,6 +2181,52 @@ async def analyze_pmax_cannibalization(
         }
 
 
+# ============================================================================
+# Metrics
+# ============================================================================
+
+
+@get_metrics_registry().register_collector
+def _collect_client_metrics() -> list[MetricFamily]:
+    """Collect metrics from the shared clients and BigQuery retry handlers.
+
+    Reads the singletons and live handlers at scrape time so clients created
+    (or reset) after startup are always reflected.
+    """
+    families: list[MetricFamily] = []
+    if _client_instance is not None:
+        breaker_metrics = _client_instance.circuit_breaker_metrics
+        families.extend(collect_api_efficiency(_client_instance.api_metrics))
+        families.extend(collect_circuit_breaker(breaker_metrics, "google_ads"))
+        families.extend(
+            collect_breaker_registry(
+                breaker_metrics["breaker_registry"], "google_ads_customer"
+            )
+        )
+    if _cache_instance is not None:
+        families.extend(collect_cache_stats(_cache_instance.stats, "redis"))
+    retry_handlers = get_bigquery_retry_handlers()
+    if retry_handlers:
+        families.extend(
+            collect_retry_handlers(
+                {name: handler.metrics for name, handler in retry_handlers.items()}
+            )
+        )
+    return families
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> Response:
+    """Serve the metrics registry in OpenMetrics text format.
+
+    Available when the server runs over an HTTP transport; for stdio set
+    ``PSN_METRICS_PORT`` to start a standalone endpoint instead.
+    """
+    return Response(
+        get_metrics_registry().render(), media_type=OPENMETRICS_CONTENT_TYPE
+    )
+
+
 # ============================================================================
 # Resources
 # ============================================================================
@@ -1620,12 +2300,10 @@ async def list_bigquery_datasets() -> dict[str, Any]:
     which is useful for discovering available data sources before querying.
     """
     try:
-        # Initialize BigQuery client
+        # Wraps the pooled BigQuery client for the project
         client = BigQueryClient()
 
         # List datasets (run in thread to avoid blocking)
-        import asyncio
-
         def _list_datasets():
             return list(client.client.list_datasets())
 
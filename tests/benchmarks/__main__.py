@@ -0,0 +1,63 @@
+"""Run the analyzer benchmarks.
+
+Usage:
+    python -m tests.benchmarks --sizes 10000 100000 --output bench.json
+    python -m tests.benchmarks --baseline bench.json
+
+Exits with status 1 when ``--baseline`` is given and a case regressed.
+"""
+
+import argparse
+import json
+import sys
+
+from tests.benchmarks.harness import compare, run
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+        help="Search terms per synthetic account",
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="Timed runs per case")
+    parser.add_argument("--only", nargs="+", help="Case names to run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against this JSON file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative time and memory increase over the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.rounds, args.only, args.seed)
+
+    print(f"{'case':<40}{'size':>9}{'seconds':>10}{'peak MB':>10}{'API rows':>10}")
+    for result in results:
+        print(
+            f"{result.name:<40}{result.size:>9}{result.seconds:>10.3f}"
+            f"{result.peak_mb:>10.1f}{sum(result.api_rows.values()):>10}"
+            + ("" if result.status == "success" else f"  {result.status}")
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump([r.to_dict() for r in results], f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
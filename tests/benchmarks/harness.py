@@ -0,0 +1,263 @@
+"""Time, memory and API-call measurements for MCP tools and analyzers.
+
+Each case calls one server tool (the data tools and every ``analyze_*``
+tool) against a ``MockGoogleAdsClient`` serving a synthetic account, so
+results depend only on the code under test and the account size:
+
+- ``seconds``: median wall time over ``rounds`` runs
+- ``peak_mb``: peak traced Python allocation of one extra run (tracing
+  slows allocation-heavy code, so it is kept out of the timed runs)
+- ``api_calls`` / ``api_rows``: client calls made and rows returned by
+  one run, per client method
+
+Analyzer result caches are cleared before every run so each run does the
+full analysis. Results are plain dicts, so a run can be saved as JSON and
+used as the baseline of a later one (see ``compare``).
+"""
+
+import asyncio
+import gc
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any
+from unittest.mock import patch
+
+from paidsearchnav_mcp import server
+from paidsearchnav_mcp.analyzers.incremental import PARTIALS, SUMMARIES
+from tests.benchmarks.synthetic import CUSTOMER_ID, AccountSize, SyntheticAccount
+from tests.mocks.google_ads_mock import MockGoogleAdsClient
+
+# Rows per request when a case pages through a data tool
+PAGE_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Measurements of one case at one account size.
+
+    Attributes:
+        name: Case name
+        size: Search terms in the account
+        seconds: Median wall time of one run
+        peak_mb: Peak traced allocation of one run (MiB)
+        api_calls: Client calls of one run, per client method
+        api_rows: Rows returned by the client in one run, per client method
+        status: Tool status of the last run (``success`` or ``error``)
+    """
+
+    name: str
+    size: int
+    seconds: float
+    peak_mb: float
+    api_calls: dict[str, int]
+    api_rows: dict[str, int]
+    status: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _fn(tool: Any) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """Return the function behind a FastMCP tool."""
+    return tool.fn if hasattr(tool, "fn") else tool
+
+
+async def _all_pages(tool: Any, request_type: type, **fields: Any) -> dict[str, Any]:
+    """Page through a data tool the way the streaming analyzers do."""
+    offset, rows = 0, 0
+    while True:
+        result = await _fn(tool)(request_type(**fields, limit=PAGE_SIZE, offset=offset))
+        if result.get("status") != "success":
+            return result
+        rows += len(result["data"])
+        offset += PAGE_SIZE
+        if not result["metadata"]["pagination"]["has_more"]:
+            return {"status": "success", "record_count": rows}
+
+
+def cases(account: SyntheticAccount) -> dict[str, Callable[[], Awaitable[dict]]]:
+    """Build the benchmark cases for an account.
+
+    Args:
+        account: Account the mock client serves
+
+    Returns:
+        Case name to a coroutine function running the case once
+    """
+    dates = {
+        "customer_id": CUSTOMER_ID,
+        "start_date": account.start_date.isoformat(),
+        "end_date": account.end_date.isoformat(),
+    }
+    return {
+        "get_campaigns": lambda: _fn(server.get_campaigns)(
+            server.CampaignsRequest(**dates)
+        ),
+        "get_search_terms": lambda: _all_pages(
+            server.get_search_terms, server.SearchTermsRequest, **dates
+        ),
+        "get_keywords": lambda: _all_pages(
+            server.get_keywords, server.KeywordsRequest, **dates
+        ),
+        "get_negative_keywords": lambda: _fn(server.get_negative_keywords)(
+            server.NegativeKeywordsRequest(customer_id=CUSTOMER_ID)
+        ),
+        "get_geo_performance": lambda: _fn(server.get_geo_performance)(
+            server.CampaignsRequest(**dates)
+        ),
+        "get_daily_performance": lambda: _fn(server.get_daily_performance)(
+            server.DailyPerformanceRequest(**dates)
+        ),
+        "analyze_keyword_match_types": lambda: _fn(server.analyze_keyword_match_types)(
+            **dates
+        ),
+        "analyze_search_term_waste": lambda: _fn(server.analyze_search_term_waste)(
+            **dates
+        ),
+        "analyze_negative_conflicts": lambda: _fn(server.analyze_negative_conflicts)(
+            CUSTOMER_ID
+        ),
+        "analyze_geo_performance": lambda: _fn(server.analyze_geo_performance)(**dates),
+        "analyze_performance_trends": lambda: _fn(server.analyze_performance_trends)(
+            **dates
+        ),
+        "analyze_pmax_cannibalization": lambda: _fn(
+            server.analyze_pmax_cannibalization
+        )(**dates),
+        "analyze_pmax_cannibalization_estimate": lambda: _fn(
+            server.analyze_pmax_cannibalization
+        )(**dates, estimate_only=True),
+    }
+
+
+@contextmanager
+def serving(client: MockGoogleAdsClient):
+    """Route the server's Google Ads client to ``client``, without a cache."""
+    with (
+        patch.object(server, "_get_google_ads_client", return_value=client),
+        patch.object(server, "_get_cache_client", return_value=None),
+    ):
+        yield
+
+
+def _run(case: Callable[[], Awaitable[dict]]) -> dict[str, Any]:
+    PARTIALS.clear()
+    SUMMARIES.clear()
+    return asyncio.run(case())
+
+
+def measure(
+    name: str,
+    case: Callable[[], Awaitable[dict]],
+    client: MockGoogleAdsClient,
+    rounds: int = 3,
+) -> BenchmarkResult:
+    """Measure one case.
+
+    Args:
+        name: Case name
+        case: Coroutine function running the case once
+        client: Mock client the case is served by
+        rounds: Timed runs; the median is reported
+
+    Returns:
+        The case's measurements
+    """
+    times = []
+    for _ in range(rounds):
+        gc.collect()
+        client.reset_counts()
+        started = time.perf_counter()
+        result = _run(case)
+        times.append(time.perf_counter() - started)
+    calls, rows = dict(client.calls), dict(client.rows)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _run(case)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=name,
+        size=client.account.size.search_terms,
+        seconds=statistics.median(times),
+        peak_mb=peak / 2**20,
+        api_calls=calls,
+        api_rows=rows,
+        # Analyzer summaries carry no status; failures are error dicts
+        status=result.get("status", "success"),
+    )
+
+
+def run(
+    sizes: list[int],
+    rounds: int = 3,
+    only: list[str] | None = None,
+    seed: int = 0,
+) -> list[BenchmarkResult]:
+    """Measure every case at every account size.
+
+    Args:
+        sizes: Search terms per account, one account per size
+        rounds: Timed runs per case
+        only: Case names to run (default: all)
+        seed: Account generator seed
+
+    Returns:
+        One result per case and size
+    """
+    results = []
+    for size in sizes:
+        account = SyntheticAccount.generate(AccountSize(search_terms=size), seed=seed)
+        client = MockGoogleAdsClient(account)
+        with serving(client):
+            for name, case in cases(account).items():
+                if only and name not in only:
+                    continue
+                results.append(measure(name, case, client, rounds))
+    return results
+
+
+def compare(
+    results: list[BenchmarkResult],
+    baseline: list[dict[str, Any]],
+    tolerance: float = 0.2,
+) -> list[str]:
+    """Find results that regressed against a saved baseline.
+
+    Time and memory regress when they exceed the baseline by more than
+    ``tolerance``; API calls and rows regress on any increase, since they
+    do not vary between runs.
+
+    Args:
+        results: Current results
+        baseline: Results of an earlier run, as saved by ``to_dict``
+        tolerance: Allowed relative increase in time and memory
+
+    Returns:
+        One message per regression (empty if none)
+    """
+    previous = {(b["name"], b["size"]): b for b in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result.name, result.size))
+        if before is None:
+            continue
+        label = f"{result.name}@{result.size}"
+        for metric in ("seconds", "peak_mb"):
+            old, new = before[metric], getattr(result, metric)
+            if old > 0 and new > old * (1 + tolerance):
+                regressions.append(f"{label}: {metric} {old:.3f} -> {new:.3f}")
+        for metric in ("api_calls", "api_rows"):
+            for method, new in getattr(result, metric).items():
+                old = before[metric].get(method, 0)
+                if new > old:
+                    regressions.append(f"{label}: {metric}[{method}] {old} -> {new}")
+    return regressions
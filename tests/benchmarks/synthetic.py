@@ -0,0 +1,364 @@
+"""Seeded synthetic Google Ads accounts for analyzer benchmarks.
+
+Real accounts are heavy-tailed: a few campaigns, keywords and words take
+most of the traffic and a long tail of search terms each costs a few
+dollars. The generator reproduces that shape with Zipf draws so analyzers
+see realistic group sizes, dictionary cardinalities and n-gram overlap:
+
+- campaigns: 80% Search, 20% Performance Max; traffic is Zipfian
+- keywords: built from a Zipfian vocabulary, in Search ad groups
+- search terms: a keyword's text plus 0-2 extra words; PMax terms reuse
+  the same generator so they overlap Search terms
+- negatives: 1-2 word phrases from the head of the vocabulary
+- geo rows: country > region > city locations with Zipfian spend
+- daily rows: per-campaign days with weekly seasonality
+
+Records are produced in the shapes ``GoogleAdsAPIClient`` returns (models
+for search terms, keywords and campaigns; dicts for the rest), once, so
+building them is never part of a measurement.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+
+from paidsearchnav_mcp.models.campaign import Campaign
+from paidsearchnav_mcp.models.keyword import Keyword
+from paidsearchnav_mcp.models.search_term import SearchTerm, SearchTermMetrics
+
+CUSTOMER_ID = "1234567890"
+
+# Head of the vocabulary: common words, including typical waste words
+_COMMON_WORDS = (
+    "shoes running near me best cheap free buy sale online women men kids "
+    "how to jobs reviews discount store size used repair diy trail red"
+).split()
+
+
+@dataclass(frozen=True)
+class AccountSize:
+    """Row counts for a synthetic account, derived from ``search_terms``.
+
+    Attributes:
+        search_terms: Search term rows
+        keywords: Keywords (default: one per 10 search terms)
+        negatives: Negative keywords (default: one per 20 search terms)
+        geo_rows: Location rows (default: one per 10 search terms)
+        campaigns: Campaigns (default: one per 2,000 search terms, 5-500)
+        days: Days of daily performance
+    """
+
+    search_terms: int = 10_000
+    keywords: int | None = None
+    negatives: int | None = None
+    geo_rows: int | None = None
+    campaigns: int | None = None
+    days: int = 28
+
+    def resolved(self) -> "AccountSize":
+        """Return a copy with every derived count filled in."""
+        n = self.search_terms
+        return AccountSize(
+            search_terms=n,
+            keywords=self.keywords or max(50, n // 10),
+            negatives=self.negatives or max(20, n // 20),
+            geo_rows=self.geo_rows or max(50, n // 10),
+            campaigns=self.campaigns or min(500, max(5, n // 2000)),
+            days=self.days,
+        )
+
+
+@dataclass
+class SyntheticAccount:
+    """One generated account, in Google Ads client return shapes.
+
+    Attributes:
+        size: Resolved row counts
+        start_date: First day covered
+        end_date: Last day covered
+        campaigns: Campaign models
+        keywords: Keyword models
+        search_terms: SearchTerm models
+        negatives: Negative keyword dicts
+        geo_rows: Geographic performance dicts
+        daily_rows: Daily campaign performance dicts
+    """
+
+    size: AccountSize
+    start_date: date
+    end_date: date
+    campaigns: list[Campaign] = field(default_factory=list)
+    keywords: list[Keyword] = field(default_factory=list)
+    search_terms: list[SearchTerm] = field(default_factory=list)
+    negatives: list[dict[str, Any]] = field(default_factory=list)
+    geo_rows: list[dict[str, Any]] = field(default_factory=list)
+    daily_rows: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def generate(
+        cls, size: AccountSize | None = None, seed: int = 0
+    ) -> "SyntheticAccount":
+        """Generate an account.
+
+        Args:
+            size: Row counts (default: 10,000 search terms)
+            seed: Random seed; equal seeds give identical accounts
+
+        Returns:
+            The generated account
+        """
+        size = (size or AccountSize()).resolved()
+        rng = np.random.default_rng(seed)
+        end = date(2025, 1, 31)
+        account = cls(size, end - timedelta(days=size.days - 1), end)
+        generator = _Generator(rng, size)
+        account.campaigns = generator.campaigns()
+        account.keywords = generator.keywords(account.campaigns)
+        account.search_terms = generator.search_terms(
+            account.campaigns, account.keywords
+        )
+        account.negatives = generator.negatives(account.campaigns)
+        account.geo_rows = generator.geo_rows(account.campaigns)
+        account.daily_rows = generator.daily_rows(account.campaigns, account.start_date)
+        return account
+
+
+def zipf_choice(
+    rng: np.random.Generator, n: int, size: int, a: float = 1.2
+) -> np.ndarray:
+    """Draw ``size`` ranks in ``[0, n)`` with probability ~ ``1 / (rank + 1)**a``."""
+    weights = 1.0 / np.arange(1, n + 1) ** a
+    return rng.choice(n, size=size, p=weights / weights.sum())
+
+
+class _Generator:
+    """Draws each record type from one shared random stream."""
+
+    def __init__(self, rng: np.random.Generator, size: AccountSize):
+        self.rng = rng
+        self.size = size
+        vocabulary = max(len(_COMMON_WORDS), size.search_terms // 20)
+        self.words = np.array(
+            _COMMON_WORDS + [f"w{i}" for i in range(vocabulary - len(_COMMON_WORDS))],
+            dtype=object,
+        )
+
+    def phrases(self, count: int, min_words: int, max_words: int) -> list[str]:
+        """Build ``count`` phrases of Zipf-distributed words."""
+        lengths = self.rng.integers(min_words, max_words + 1, size=count)
+        words = self.words[zipf_choice(self.rng, len(self.words), int(lengths.sum()))]
+        ends = np.cumsum(lengths)
+        return [" ".join(words[end - n : end]) for n, end in zip(lengths, ends)]
+
+    def metrics(self, count: int, scale: float) -> dict[str, np.ndarray]:
+        """Heavy-tailed impressions, clicks, cost, conversions and value."""
+        rank = self.rng.permutation(count) + 1
+        impressions = np.ceil(
+            scale / rank**0.8 * self.rng.lognormal(0, 0.5, count)
+        ).astype(np.int64)
+        clicks = self.rng.binomial(impressions, self.rng.beta(2, 40, count))
+        cost = np.round(clicks * self.rng.lognormal(0.3, 0.4, count), 2)
+        conversions = self.rng.binomial(clicks, self.rng.beta(1, 25, count)).astype(
+            float
+        )
+        value = np.round(conversions * self.rng.lognormal(4, 0.5, count), 2)
+        return {
+            "impressions": impressions,
+            "clicks": clicks,
+            "cost": cost,
+            "conversions": conversions,
+            "conversion_value": value,
+        }
+
+    def campaigns(self) -> list[Campaign]:
+        count = self.size.campaigns
+        pmax = self.rng.random(count) < 0.2
+        pmax[0], pmax[-1] = False, True  # At least one of each type
+        return [
+            Campaign.model_construct(
+                campaign_id=str(1000 + i),
+                customer_id=CUSTOMER_ID,
+                name=f"{'PMax' if pmax[i] else 'Search'} Campaign {i}",
+                status="ENABLED",
+                type="PERFORMANCE_MAX" if pmax[i] else "SEARCH",
+                budget_amount=float(self.rng.integers(20, 500)),
+                budget_currency="USD",
+                bidding_strategy="MAXIMIZE_CONVERSIONS",
+                target_cpa=None,
+                target_roas=None,
+                impressions=0,
+                clicks=0,
+                cost=0.0,
+                conversions=0.0,
+                conversion_value=0.0,
+            )
+            for i in range(count)
+        ]
+
+    def keywords(self, campaigns: list[Campaign]) -> list[Keyword]:
+        count = self.size.keywords
+        search = [c for c in campaigns if c.type == "SEARCH"]
+        owners = zipf_choice(self.rng, len(search), count, a=1.0)
+        ad_groups = self.rng.integers(0, 10, size=count)
+        match_types = self.rng.choice(
+            ["EXACT", "PHRASE", "BROAD"], count, p=[0.3, 0.3, 0.4]
+        )
+        metrics = self.metrics(count, scale=50_000)
+        texts = self.phrases(count, 1, 3)
+        return [
+            Keyword.model_construct(
+                keyword_id=str(100_000 + i),
+                campaign_id=search[owner].campaign_id,
+                campaign_name=search[owner].name,
+                ad_group_id=f"{search[owner].campaign_id}{ad_group}",
+                ad_group_name=f"Ad Group {ad_group}",
+                text=text,
+                match_type=match_type,
+                status="ENABLED",
+                cpc_bid=1.5,
+                quality_score=int(self.rng.integers(1, 11)),
+                impressions=int(metrics["impressions"][i]),
+                clicks=int(metrics["clicks"][i]),
+                cost=float(metrics["cost"][i]),
+                conversions=float(metrics["conversions"][i]),
+                conversion_value=float(metrics["conversion_value"][i]),
+            )
+            for i, (owner, ad_group, match_type, text) in enumerate(
+                zip(owners, ad_groups, match_types, texts)
+            )
+        ]
+
+    def search_terms(
+        self, campaigns: list[Campaign], keywords: list[Keyword]
+    ) -> list[SearchTerm]:
+        count = self.size.search_terms
+        pmax = [c for c in campaigns if c.type == "PERFORMANCE_MAX"]
+        sources = zipf_choice(self.rng, len(keywords), count, a=1.0)
+        in_pmax = self.rng.random(count) < 0.25
+        pmax_owner = self.rng.integers(0, len(pmax), size=count)
+        extra_words = self.rng.choice(3, size=count, p=[0.4, 0.4, 0.2])
+        extras = iter(self.phrases(int((extra_words > 0).sum()), 1, 2))
+        metrics = self.metrics(count, scale=5_000)
+
+        terms = []
+        for i in range(count):
+            keyword = keywords[sources[i]]
+            text = keyword.text
+            if extra_words[i]:
+                text = f"{text} {next(extras)}"
+            if in_pmax[i]:
+                campaign = pmax[pmax_owner[i]]
+                owner = {
+                    "campaign_id": campaign.campaign_id,
+                    "campaign_name": campaign.name,
+                    "ad_group_id": None,
+                    "ad_group_name": "Asset Group",
+                    "keyword_id": None,
+                    "keyword_text": None,
+                    "match_type": None,
+                }
+            else:
+                owner = {
+                    "campaign_id": keyword.campaign_id,
+                    "campaign_name": keyword.campaign_name,
+                    "ad_group_id": keyword.ad_group_id,
+                    "ad_group_name": keyword.ad_group_name,
+                    "keyword_id": keyword.keyword_id,
+                    "keyword_text": keyword.text,
+                    "match_type": keyword.match_type,
+                }
+            terms.append(
+                SearchTerm.model_construct(
+                    search_term=text,
+                    metrics=SearchTermMetrics.model_construct(
+                        impressions=int(metrics["impressions"][i]),
+                        clicks=int(metrics["clicks"][i]),
+                        cost=float(metrics["cost"][i]),
+                        conversions=float(metrics["conversions"][i]),
+                        conversion_value=float(metrics["conversion_value"][i]),
+                    ),
+                    **owner,
+                )
+            )
+        return terms
+
+    def negatives(self, campaigns: list[Campaign]) -> list[dict[str, Any]]:
+        count = self.size.negatives
+        texts = self.phrases(count, 1, 2)
+        levels = self.rng.choice(["campaign", "ad_group", "shared_set"], count)
+        match_types = self.rng.choice(["EXACT", "PHRASE", "BROAD"], count)
+        owners = self.rng.integers(0, len(campaigns), size=count)
+        return [
+            {
+                "id": str(500_000 + i),
+                "text": text,
+                "match_type": match_type,
+                "level": level,
+                "campaign_id": campaigns[owner].campaign_id,
+                "campaign_name": campaigns[owner].name,
+            }
+            for i, (text, match_type, level, owner) in enumerate(
+                zip(texts, match_types, levels, owners)
+            )
+        ]
+
+    def geo_rows(self, campaigns: list[Campaign]) -> list[dict[str, Any]]:
+        count = self.size.geo_rows
+        countries = zipf_choice(self.rng, 5, count, a=1.5)
+        regions = zipf_choice(self.rng, 50, count, a=1.0)
+        owners = zipf_choice(self.rng, len(campaigns), count, a=1.0)
+        metrics = self.metrics(count, scale=20_000)
+        return [
+            {
+                "campaign_id": campaigns[owner].campaign_id,
+                "campaign_name": campaigns[owner].name,
+                "location_type": "LOCATION_OF_PRESENCE",
+                "country_name": f"Country {country}",
+                "region_name": f"Region {country}-{region}",
+                "city_name": f"City {i}",
+                "impressions": int(metrics["impressions"][i]),
+                "clicks": int(metrics["clicks"][i]),
+                "conversions": float(metrics["conversions"][i]),
+                "cost_micros": int(metrics["cost"][i] * 1_000_000),
+                "conversion_value_micros": int(
+                    metrics["conversion_value"][i] * 1_000_000
+                ),
+            }
+            for i, (country, region, owner) in enumerate(
+                zip(countries, regions, owners)
+            )
+        ]
+
+    def daily_rows(
+        self, campaigns: list[Campaign], start: date
+    ) -> list[dict[str, Any]]:
+        days = self.size.days
+        base = 1000.0 / np.arange(1, len(campaigns) + 1) ** 0.8
+        weekly = 1 + 0.2 * np.sin(2 * np.pi * np.arange(days) / 7)
+        cost = (
+            base[None, :]
+            * weekly[:, None]
+            * self.rng.lognormal(0, 0.1, (days, len(campaigns)))
+        )
+        conversions = self.rng.poisson(cost / 40)
+        rows = []
+        for day in range(days):
+            day_str = (start + timedelta(days=day)).isoformat()
+            for i, campaign in enumerate(campaigns):
+                rows.append(
+                    {
+                        "date": day_str,
+                        "entity_id": campaign.campaign_id,
+                        "entity_name": campaign.name,
+                        "campaign_id": campaign.campaign_id,
+                        "campaign_name": campaign.name,
+                        "impressions": int(cost[day, i] * 20),
+                        "clicks": int(cost[day, i] / 1.5),
+                        "cost": round(float(cost[day, i]), 2),
+                        "conversions": float(conversions[day, i]),
+                        "conversion_value": float(conversions[day, i]) * 60.0,
+                    }
+                )
+        return rows
@@ -0,0 +1,121 @@
+"""Smoke tests for the analyzer benchmark harness.
+
+Runs every benchmark case once on a small synthetic account, so the suite
+stays runnable as tools change. Set ``PSN_BENCH_SEARCH_TERMS`` to run the
+same checks on a larger account; full measurements are taken with
+``python -m tests.benchmarks``.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from paidsearchnav_mcp import server
+from tests.benchmarks.harness import BenchmarkResult, cases, compare, measure, serving
+from tests.benchmarks.synthetic import CUSTOMER_ID, AccountSize, SyntheticAccount
+from tests.mocks.google_ads_mock import MockGoogleAdsClient
+
+SEARCH_TERMS = int(os.environ.get("PSN_BENCH_SEARCH_TERMS", "2000"))
+
+
+@pytest.fixture(scope="module")
+def account():
+    return SyntheticAccount.generate(AccountSize(search_terms=SEARCH_TERMS))
+
+
+@pytest.fixture
+def client(account):
+    client = MockGoogleAdsClient(account)
+    with serving(client):
+        yield client
+
+
+class TestSyntheticAccount:
+    """Test the synthetic account generator."""
+
+    def test_same_seed_same_account(self):
+        """Test generation is deterministic per seed."""
+        first = SyntheticAccount.generate(AccountSize(search_terms=500), seed=3)
+        second = SyntheticAccount.generate(AccountSize(search_terms=500), seed=3)
+        other = SyntheticAccount.generate(AccountSize(search_terms=500), seed=4)
+
+        terms = [t.search_term for t in first.search_terms]
+        assert terms == [t.search_term for t in second.search_terms]
+        assert terms != [t.search_term for t in other.search_terms]
+
+    def test_sizes_and_shape(self, account):
+        """Test row counts and the Search / PMax split."""
+        size = account.size
+        assert len(account.search_terms) == size.search_terms
+        assert len(account.keywords) == size.keywords
+        assert len(account.daily_rows) == size.days * size.campaigns
+        types = {c.type for c in account.campaigns}
+        assert types == {"SEARCH", "PERFORMANCE_MAX"}
+        pmax = {c.campaign_id for c in account.campaigns if c.type == "PERFORMANCE_MAX"}
+        assert all(
+            (t.keyword_text is None) == (t.campaign_id in pmax)
+            for t in account.search_terms
+        )
+
+
+class TestBenchmarkCases:
+    """Test every benchmark case runs and pulls the expected data."""
+
+    def test_every_case_succeeds(self, account, client):
+        """Test each case succeeds and records time, memory and API use."""
+        for name, case in cases(account).items():
+            result = measure(name, case, client, rounds=1)
+            assert result.status == "success", name
+            assert result.seconds > 0
+            assert result.peak_mb > 0
+            assert sum(result.api_calls.values()) >= 1, name
+
+    def test_data_tool_pages_cover_account(self, account, client):
+        """Test paging through search terms returns every row exactly once."""
+        result = asyncio.run(cases(account)["get_search_terms"]())
+        assert result["record_count"] == len(account.search_terms)
+
+    def test_streaming_analyzer_sees_every_page(self, account, client):
+        """Test analyzers paging with small pages analyze the whole account."""
+        summary = asyncio.run(
+            server.analyze_search_term_waste.fn(
+                CUSTOMER_ID,
+                account.start_date.isoformat(),
+                account.end_date.isoformat(),
+            )
+        )
+        assert summary["total_records_analyzed"] == len(account.search_terms)
+
+
+class TestCompare:
+    """Test regression detection against a baseline."""
+
+    def test_flags_slower_and_chattier_runs(self):
+        """Test time beyond tolerance and any extra API rows regress."""
+        baseline = BenchmarkResult(
+            "case",
+            100,
+            1.0,
+            10.0,
+            {"get_search_terms": 2},
+            {"get_search_terms": 100},
+            "success",
+        ).to_dict()
+        current = [
+            BenchmarkResult(
+                "case",
+                100,
+                1.1,
+                20.0,
+                {"get_search_terms": 2},
+                {"get_search_terms": 150},
+                "success",
+            )
+        ]
+
+        regressions = compare(current, [baseline], tolerance=0.2)
+
+        assert len(regressions) == 2
+        assert regressions[0].startswith("case@100: peak_mb")
+        assert "api_rows[get_search_terms] 100 -> 150" in regressions[1]
@@ -3,6 +3,8 @@
 import sys
 from unittest.mock import MagicMock, Mock
 
+import pytest
+
 # Mock the archived paidsearchnav modules before any imports
 # This prevents ModuleNotFoundError when importing paidsearchnav_mcp modules
 
@@ -53,3 +55,17 @@ paidsearchnav_mocks["paidsearchnav.platforms.google.validation"].GoogleAdsInputV
 
 # Update sys.modules before any test imports
 sys.modules.update(paidsearchnav_mocks)
+
+
+@pytest.fixture(autouse=True)
+def _reset_bigquery_client_pool():
+    """Give every test a fresh BigQuery client pool.
+
+    Pooled clients outlive a test, so a client created under one test's
+    ``bigquery.Client`` mock would otherwise be handed to the next test.
+    """
+    from paidsearchnav_mcp.clients.bigquery.pool import BIGQUERY_CLIENTS
+
+    BIGQUERY_CLIENTS.close()
+    yield
+    BIGQUERY_CLIENTS.close()
@@ -0,0 +1,142 @@
+"""Mock Google Ads client serving a synthetic account, for benchmarks."""
+
+from collections import Counter
+from typing import Any
+
+from tests.benchmarks.synthetic import SyntheticAccount
+
+
+class MockGoogleAdsClient:
+    """Mock Google Ads client for testing.
+
+    Serves the records of a ``SyntheticAccount`` through the same async
+    methods the MCP server calls on ``GoogleAdsAPIClient``, honoring the
+    filters, ``offset`` and ``max_results`` those calls pass. Every call and every row
+    returned is counted, so callers can assert how much data a tool or
+    analyzer pulled from the API.
+    """
+
+    def __init__(self, account: SyntheticAccount):
+        self.account = account
+        self.calls: Counter[str] = Counter()
+        self.rows: Counter[str] = Counter()
+
+    def reset_counts(self) -> None:
+        """Forget the calls and rows counted so far."""
+        self.calls.clear()
+        self.rows.clear()
+
+    def _serve(
+        self, method: str, records: list, max_results: int | None, offset: int = 0
+    ) -> list:
+        records = records[offset:]
+        if max_results is not None:
+            records = records[:max_results]
+        self.calls[method] += 1
+        self.rows[method] += len(records)
+        return records
+
+    async def get_campaigns(
+        self,
+        customer_id: str,
+        campaign_types: list[str] | None = None,
+        start_date: Any = None,
+        end_date: Any = None,
+        page_size: int | None = None,
+        max_results: int | None = None,
+    ) -> list:
+        """Get campaigns, optionally filtered by type."""
+        campaigns = self.account.campaigns
+        if campaign_types:
+            campaigns = [c for c in campaigns if c.type in campaign_types]
+        return self._serve("get_campaigns", campaigns, max_results)
+
+    async def get_keywords(
+        self,
+        customer_id: str,
+        campaigns: list[str] | None = None,
+        ad_groups: list[str] | None = None,
+        campaign_id: str | None = None,
+        include_metrics: bool = True,
+        start_date: Any = None,
+        end_date: Any = None,
+        page_size: int | None = None,
+        max_results: int | None = None,
+        offset: int = 0,
+    ) -> list:
+        """Get keywords, optionally filtered by campaign and ad group."""
+        keywords = self.account.keywords
+        if campaign_id:
+            campaigns = [*(campaigns or []), campaign_id]
+        if campaigns:
+            keywords = [k for k in keywords if k.campaign_id in campaigns]
+        if ad_groups:
+            keywords = [k for k in keywords if k.ad_group_id in ad_groups]
+        return self._serve("get_keywords", keywords, max_results, offset)
+
+    async def get_search_terms(
+        self,
+        customer_id: str,
+        start_date: Any,
+        end_date: Any,
+        campaigns: list[str] | None = None,
+        ad_groups: list[str] | None = None,
+        page_size: int | None = None,
+        max_results: int | None = None,
+        include_keyword: bool = False,
+        campaign_types: list[str] | None = None,
+        offset: int = 0,
+    ) -> list:
+        """Get search terms, optionally filtered by campaign and type."""
+        terms = self.account.search_terms
+        if campaigns:
+            terms = [t for t in terms if t.campaign_id in campaigns]
+        if ad_groups:
+            terms = [t for t in terms if t.ad_group_id in ad_groups]
+        if campaign_types:
+            types = {c.campaign_id: c.type for c in self.account.campaigns}
+            terms = [t for t in terms if types[t.campaign_id] in campaign_types]
+        return self._serve("get_search_terms", terms, max_results, offset)
+
+    async def get_negative_keywords(
+        self,
+        customer_id: str,
+        include_shared_sets: bool = True,
+        page_size: int | None = None,
+        max_results: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get negative keywords, optionally without shared sets."""
+        negatives = self.account.negatives
+        if not include_shared_sets:
+            negatives = [n for n in negatives if n["level"] != "shared_set"]
+        return self._serve("get_negative_keywords", negatives, max_results)
+
+    async def get_geographic_performance(
+        self,
+        customer_id: str,
+        start_date: Any,
+        end_date: Any,
+        geographic_level: str = "CITY",
+        campaign_ids: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get location performance rows."""
+        rows = self.account.geo_rows
+        if campaign_ids:
+            rows = [r for r in rows if r["campaign_id"] in campaign_ids]
+        return self._serve("get_geographic_performance", rows, None)
+
+    async def get_daily_performance(
+        self,
+        customer_id: str,
+        start_date: Any,
+        end_date: Any,
+        level: str = "CAMPAIGN",
+        campaigns: list[str] | None = None,
+        page_size: int | None = None,
+        max_results: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get daily campaign rows (ad group level serves the same rows)."""
+        rows = self.account.daily_rows
+        if campaigns:
+            rows = [r for r in rows if r["campaign_id"] in campaigns]
+        return self._serve("get_daily_performance", rows, max_results)
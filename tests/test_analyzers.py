@@ -1,18 +1,22 @@
 """Tests for PaidSearchNav analyzers module."""
 
-import pytest
+import random
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from paidsearchnav_mcp.analyzers import (
     AnalysisSummary,
     BaseAnalyzer,
+    GeoPerformanceAnalyzer,
     KeywordMatchAnalyzer,
-    SearchTermWasteAnalyzer,
     NegativeConflictAnalyzer,
-    GeoPerformanceAnalyzer,
     PMaxCannibalizationAnalyzer,
+    SearchTermWasteAnalyzer,
 )
+from paidsearchnav_mcp.analyzers.frame import NEGATIVE_KEYWORD_FIELDS, MetricsFrame
+from paidsearchnav_mcp.analyzers.negative_conflicts import _KEYWORD_COLUMNS
 
 
 class TestBaseAnalyzer:
@@ -671,6 +675,51 @@ class TestNegativeConflictAnalyzer:
         # Not all words present - should not conflict
         assert not analyzer._is_conflict("golf shoes", "tennis shoes", "BROAD")
 
+    def test_find_conflicts_matches_pairwise_check(self):
+        """Test indexed matching finds the same conflicts as _is_conflict."""
+        analyzer = NegativeConflictAnalyzer()
+        rng = random.Random(7)
+        words = ["red", "golf", "shoes", "cheap", "nike", "men", "sale", "buy"]
+        keywords = [
+            {
+                "keyword_text": " ".join(rng.sample(words, rng.randint(0, 3))).title(),
+                "campaign_name": f"Campaign {i % 3}",
+                "impressions": i,
+                "conversion_value": float(rng.randint(0, 20)),
+            }
+            for i in range(300)
+        ]
+        negatives = [
+            {
+                "text": " ".join(rng.sample(words, rng.randint(1, 2))),
+                "match_type": rng.choice(["EXACT", "PHRASE", "BROAD"]),
+                "level": "CAMPAIGN",
+            }
+            for _ in range(40)
+        ]
+
+        expected = []
+        for keyword in keywords:
+            keyword_text = keyword["keyword_text"].lower()
+            for negative in negatives:
+                if analyzer._is_conflict(
+                    keyword_text, negative["text"], negative["match_type"]
+                ):
+                    expected.append(
+                        (keyword_text, negative["text"], keyword["conversion_value"])
+                    )
+        expected.sort(key=lambda conflict: conflict[2], reverse=True)
+
+        count, top_10 = analyzer._find_conflicts(
+            MetricsFrame.from_records(keywords, _KEYWORD_COLUMNS),
+            MetricsFrame.from_records(negatives, NEGATIVE_KEYWORD_FIELDS),
+        )
+        assert count == len(expected)
+        assert [
+            (c["positive_keyword"], c["negative_keyword"], c["estimated_savings"])
+            for c in top_10
+        ] == expected[:10]
+
 
 class TestGeoPerformanceAnalyzer:
     """Test GeoPerformanceAnalyzer."""
@@ -5,6 +5,7 @@ and to ensure deterministic, fast test execution.
 """
 
 import os
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
 import pytest
@@ -31,8 +32,8 @@ async def test_execute_query_success(mock_bigquery_client):
     mock_query_job.result.return_value = [mock_row]
     mock_bigquery_client.return_value.query.return_value = mock_query_job
 
-    # Execute test
-    client = BigQueryClient()
+    # Execute test (row path; the Arrow path is covered in test_query_results)
+    client = BigQueryClient(use_arrow=False)
     results = await client.execute_query("SELECT 1 as test_value")
 
     # Verify
@@ -55,7 +56,7 @@ async def test_execute_query_with_timeout(mock_bigquery_client):
     mock_bigquery_client.return_value.query.return_value = mock_query_job
 
     # Execute with custom timeout
-    client = BigQueryClient()
+    client = BigQueryClient(use_arrow=False)
     await client.execute_query("SELECT 1", timeout=60)
 
     # Verify timeout was passed to query() (not result())
@@ -116,6 +117,7 @@ async def test_estimate_query_cost_success(mock_bigquery_client):
     mock_query_job = Mock()
     mock_query_job.total_bytes_processed = 1024**3  # 1 GB
     mock_query_job.total_bytes_billed = 1024**3 * 10  # 10 GB (minimum billing)
+    mock_query_job.referenced_tables = []
 
     mock_bigquery_client.return_value.query.return_value = mock_query_job
 
@@ -142,6 +144,7 @@ async def test_estimate_query_cost_cached(mock_bigquery_client):
     mock_query_job = Mock()
     mock_query_job.total_bytes_processed = 0
     mock_query_job.total_bytes_billed = 0
+    mock_query_job.referenced_tables = []
 
     mock_bigquery_client.return_value.query.return_value = mock_query_job
 
@@ -154,6 +157,26 @@ async def test_estimate_query_cost_cached(mock_bigquery_client):
     assert cost_info["estimated_cost_usd"] == 0
 
 
+@pytest.mark.asyncio
+@patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}, clear=False)
+@patch("paidsearchnav_mcp.clients.bigquery.client.bigquery.Client")
+async def test_table_versions_omit_tables_with_streaming_buffer(
+    mock_bigquery_client,
+):
+    """Test a table with a streaming buffer has no cacheable version."""
+    os.environ.pop("GOOGLE_APPLICATION_CREDENTIALS", None)
+    modified = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    tables = {
+        "p.d.t": Mock(modified=modified, streaming_buffer=None),
+        "p.d.streamed": Mock(modified=modified, streaming_buffer=Mock()),
+    }
+    mock_bigquery_client.return_value.get_table.side_effect = tables.get
+
+    versions = await BigQueryClient().table_versions(list(tables))
+
+    assert versions == {"p.d.t": modified.isoformat(), "p.d.streamed": None}
+
+
 def test_bigquery_client_requires_project_id():
     """Test that BigQueryClient raises ValueError without project_id."""
     # Clear env var
@@ -12,7 +12,10 @@ from paidsearchnav_mcp.clients.bigquery.customer_registry import (
 @pytest.fixture
 def mock_bigquery_client():
     """Mock BigQuery client for testing."""
-    with patch("paidsearchnav_mcp.clients.bigquery.customer_registry.bigquery") as mock:
+    with (
+        patch("paidsearchnav_mcp.clients.bigquery.customer_registry.bigquery") as mock,
+        patch("paidsearchnav_mcp.clients.bigquery.pool.bigquery", mock),
+    ):
         yield mock
 
 
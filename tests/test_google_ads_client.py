@@ -42,6 +42,7 @@ Once the import issues are resolved, run with:
 
 import asyncio
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from typing import Any
 
@@ -652,6 +653,142 @@ class TestGetSearchTerms:
                 "1234567890", start_date=start_date, end_date=end_date
             )
 
+    @pytest.mark.asyncio
+    async def test_get_search_terms_resumes_from_offset(
+        self, client, mock_google_ads_client, mock_google_ads_service
+    ):
+        """Test a later page resumes from a remembered page token."""
+        mock_instance = mock_google_ads_client.load_from_dict.return_value
+        mock_instance.get_type.side_effect = lambda name: SimpleNamespace()
+
+        def row(i):
+            row = MagicMock()
+            row.search_term_view.search_term = f"term {i}"
+            row.metrics.cost_micros = 0
+            return row
+
+        rows = [row(i) for i in range(150)]
+        pages = {"": (rows[:100], "page-2"), "page-2": (rows[100:], "")}
+        tokens = []
+
+        def search(request):
+            token = getattr(request, "page_token", "")
+            tokens.append(token)
+            page, next_token = pages[token]
+            response = MagicMock()
+            response.__iter__ = lambda self: iter(page)
+            response.next_page_token = next_token
+            return response
+
+        mock_google_ads_service.search.side_effect = search
+        start_date = datetime.now() - timedelta(days=30)
+        end_date = datetime.now() - timedelta(days=1)
+
+        first = await client.get_search_terms(
+            "1234567890", start_date=start_date, end_date=end_date, max_results=10
+        )
+        later = await client.get_search_terms(
+            "1234567890",
+            start_date=start_date,
+            end_date=end_date,
+            max_results=10,
+            offset=120,
+        )
+
+        assert [t.search_term for t in first] == [f"term {i}" for i in range(10)]
+        assert [t.search_term for t in later] == [f"term {i}" for i in range(120, 130)]
+        # The later page starts from the page holding row 120, not row 0
+        assert tokens == ["", "page-2"]
+
+    def test_sync_search_pages_like_async_search(
+        self, client, mock_google_ads_client, mock_google_ads_service
+    ):
+        """Test the sync search shares the offset and page token handling."""
+        mock_instance = mock_google_ads_client.load_from_dict.return_value
+        mock_instance.get_type.side_effect = lambda name: SimpleNamespace()
+        pages = {
+            "": (list(range(100)), "page-2"),
+            "page-2": (list(range(100, 150)), ""),
+        }
+        tokens = []
+
+        def search(request):
+            token = getattr(request, "page_token", "")
+            tokens.append(token)
+            page, next_token = pages[token]
+            response = MagicMock()
+            response.__iter__ = lambda self: iter(page)
+            response.next_page_token = next_token
+            return response
+
+        mock_google_ads_service.search.side_effect = search
+        everything = client._paginated_search("1234567890", "SELECT x")
+        later = client._paginated_search(
+            "1234567890", "SELECT x", max_results=5, offset=120
+        )
+
+        assert everything == list(range(150))
+        assert later == list(range(120, 125))
+        assert tokens == ["", "page-2", "page-2"]
+
+    def test_resumed_search_restarts_only_on_page_token_errors(
+        self, client, mock_google_ads_client, mock_google_ads_service
+    ):
+        """Test a rejected remembered token restarts; other errors propagate."""
+        from paidsearchnav_mcp.core.exceptions import (
+            InvalidPageTokenError,
+            RateLimitError as ApiRateLimitError,
+        )
+
+        mock_instance = mock_google_ads_client.load_from_dict.return_value
+        mock_instance.get_type.side_effect = lambda name: SimpleNamespace()
+        pages = {
+            "": (list(range(100)), "page-2"),
+            "page-2": (list(range(100, 150)), ""),
+        }
+        tokens = []
+        failure = None
+
+        def api_error(code):
+            error = SimpleNamespace(error_code=code, message="rejected")
+            return GoogleAdsException(
+                error=MagicMock(),
+                call=MagicMock(),
+                failure=SimpleNamespace(errors=[error]),
+                request_id="request-1",
+            )
+
+        def search(request):
+            token = getattr(request, "page_token", "")
+            tokens.append(token)
+            if token and failure:
+                raise api_error(failure)
+            page, next_token = pages[token]
+            response = MagicMock()
+            response.__iter__ = lambda self: iter(page)
+            response.next_page_token = next_token
+            return response
+
+        mock_google_ads_service.search.side_effect = search
+        client._paginated_search("1234567890", "SELECT x")
+
+        failure = "quota_error: RATE_EXCEEDED"
+        tokens.clear()
+        with pytest.raises(ApiRateLimitError):
+            client._paginated_search(
+                "1234567890", "SELECT x", max_results=5, offset=120
+            )
+        assert tokens == ["page-2"]
+
+        failure = "request_error: EXPIRED_PAGE_TOKEN"
+        tokens.clear()
+        with pytest.raises(InvalidPageTokenError):
+            # Restarted from the first page, so "page-2" fails again unresumed
+            client._paginated_search(
+                "1234567890", "SELECT x", max_results=5, offset=120
+            )
+        assert tokens == ["page-2", "", "page-2"]
+
 
 # ============================================================================
 # GET_NEGATIVE_KEYWORDS TESTS
@@ -1,11 +1,12 @@
 """Integration tests for MCP server tools.
 
-Tests all 5 implemented MCP tools with mocked Google Ads API client:
+Tests the implemented MCP tools with mocked Google Ads API client:
 - get_search_terms
 - get_keywords
 - get_campaigns
 - get_negative_keywords
 - get_geo_performance
+- get_daily_performance
 """
 
 from unittest.mock import AsyncMock, patch
@@ -14,10 +15,12 @@ import pytest
 
 from paidsearchnav_mcp.server import (
     CampaignsRequest,
+    DailyPerformanceRequest,
     KeywordsRequest,
     NegativeKeywordsRequest,
     SearchTermsRequest,
     get_campaigns,
+    get_daily_performance,
     get_geo_performance,
     get_keywords,
     get_negative_keywords,
@@ -444,6 +447,8 @@ async def test_get_search_terms_success(mock_env_credentials, mock_search_terms)
         call_args = mock_client.get_search_terms.call_args
         assert call_args.kwargs["customer_id"] == "1234567890"
         assert call_args.kwargs["campaigns"] == ["111"]
+        assert call_args.kwargs["include_keyword"] is False
+        assert call_args.kwargs["campaign_types"] is None
 
 
 @pytest.mark.asyncio
@@ -470,6 +475,42 @@ async def test_get_search_terms_no_campaign_filter(
         assert call_args.kwargs["campaigns"] is None
 
 
+@pytest.mark.asyncio
+async def test_get_search_terms_offset_page(mock_env_credentials, mock_search_terms):
+    """Test a later page is fetched from its offset and cached under its own key."""
+    request = SearchTermsRequest(
+        customer_id="1234567890",
+        start_date="2024-01-01",
+        end_date="2024-01-31",
+        limit=1,
+        offset=5,
+    )
+    cache = AsyncMock()
+    cache.get.return_value = None
+    cache._make_key = lambda prefix, params: f"{prefix}:{sorted(params.items())}"
+
+    with (
+        patch("paidsearchnav_mcp.server.GoogleAdsAPIClient") as mock_client_class,
+        patch("paidsearchnav_mcp.server._get_cache_client", return_value=cache),
+    ):
+        mock_client = AsyncMock()
+        mock_client.get_search_terms = AsyncMock(return_value=mock_search_terms)
+        mock_client_class.return_value = mock_client
+
+        result = await get_search_terms.fn(request)
+
+    call_args = mock_client.get_search_terms.call_args
+    assert call_args.kwargs["offset"] == 5
+    assert call_args.kwargs["max_results"] == 2
+    assert result["metadata"]["record_count"] == 1
+    assert result["metadata"]["pagination"]["has_more"] is True
+    assert result["data"][0]["search_term"] == "running shoes"
+
+    cache_key = cache.set.call_args.args[0]
+    assert "('limit', 1)" in cache_key
+    assert "('offset', 5)" in cache_key
+
+
 @pytest.mark.asyncio
 async def test_get_search_terms_invalid_date_format(mock_env_credentials):
     """Test search terms with invalid date format."""
@@ -613,6 +654,31 @@ async def test_get_keywords_no_filters(mock_env_credentials, mock_keywords):
         assert call_args.kwargs["ad_groups"] is None
 
 
+@pytest.mark.asyncio
+async def test_get_keywords_last_page(mock_env_credentials, mock_keywords):
+    """Test the last page is fetched from its offset and reports no more pages."""
+    request = KeywordsRequest(
+        customer_id="1234567890",
+        start_date="2024-01-01",
+        end_date="2024-01-31",
+        limit=10,
+        offset=10,
+    )
+
+    with patch("paidsearchnav_mcp.server.GoogleAdsAPIClient") as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client.get_keywords = AsyncMock(return_value=mock_keywords)
+        mock_client_class.return_value = mock_client
+
+        result = await get_keywords.fn(request)
+
+    call_args = mock_client.get_keywords.call_args
+    assert call_args.kwargs["offset"] == 10
+    assert call_args.kwargs["max_results"] == 11
+    assert result["metadata"]["record_count"] == 2
+    assert result["metadata"]["pagination"]["has_more"] is False
+
+
 @pytest.mark.asyncio
 async def test_get_keywords_missing_credentials(monkeypatch):
     """Test keywords with missing credentials."""
@@ -1174,3 +1240,45 @@ def test_bigquery_client_import():
     from paidsearchnav_mcp.clients.bigquery.client import BigQueryClient
 
     assert BigQueryClient is not None
+
+
+@pytest.mark.asyncio
+async def test_get_daily_performance_success(mock_env_credentials):
+    """Test day-segmented performance retrieval."""
+    daily = [
+        {
+            "date": "2024-01-01",
+            "entity_id": "222",
+            "entity_name": "Shoes",
+            "campaign_id": "111",
+            "campaign_name": "Search",
+            "impressions": 100,
+            "clicks": 10,
+            "cost": 12.5,
+            "conversions": 1.0,
+            "conversion_value": 40.0,
+        }
+    ]
+    request = DailyPerformanceRequest(
+        customer_id="1234567890",
+        start_date="2024-01-01",
+        end_date="2024-01-31",
+        level="AD_GROUP",
+        campaign_id="111",
+    )
+
+    with patch("paidsearchnav_mcp.server.GoogleAdsAPIClient") as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client.get_daily_performance = AsyncMock(return_value=daily)
+        mock_client_class.return_value = mock_client
+
+        result = await get_daily_performance.fn(request)
+
+        assert result["status"] == "success"
+        assert result["metadata"]["level"] == "AD_GROUP"
+        assert result["metadata"]["record_count"] == 1
+        assert result["data"] == daily
+
+        call_args = mock_client.get_daily_performance.call_args
+        assert call_args.kwargs["level"] == "AD_GROUP"
+        assert call_args.kwargs["campaigns"] == ["111"]
@@ -1,7 +1,9 @@
 """Tests for MCP server functionality."""
 
 import os
-from unittest.mock import patch
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
 
 
 def test_create_mcp_server():
@@ -53,6 +55,243 @@ def test_bigquery_request_model():
     assert request_with_project.project_id == "my-project"
 
 
+async def test_query_bigquery_pages_with_job_id():
+    """Test paging by job_id reads the finished job instead of re-querying."""
+    from paidsearchnav_mcp.clients.bigquery.results import QueryResult, ResultPage
+    from paidsearchnav_mcp.server import BigQueryRequest, query_bigquery
+
+    page = ResultPage(QueryResult(rows=[{"n": 2}]), "job-1", "EU", None, 3)
+    with patch("paidsearchnav_mcp.server.BigQueryClient") as client_cls:
+        client = client_cls.return_value
+        client.project_id = "my-project"
+        client.fetch_page = AsyncMock(return_value=page)
+        client.query_pages = AsyncMock()
+
+        result = await query_bigquery.fn(
+            BigQueryRequest(
+                job_id="job-1", page_token="token-2", location="EU", page_size=2
+            )
+        )
+
+    assert result["status"] == "success"
+    assert result["data"] == [{"n": 2}]
+    assert result["metadata"]["has_more"] is False
+    client.query_pages.assert_not_called()
+    client.fetch_page.assert_awaited_once_with(
+        "job-1", page_token="token-2", page_size=2, location="EU"
+    )
+
+
+async def test_query_bigquery_page_token_requires_job_id():
+    """Test a page token without its job is rejected."""
+    from paidsearchnav_mcp.server import BigQueryRequest, ErrorCode, query_bigquery
+
+    result = await query_bigquery.fn(BigQueryRequest(page_token="token-2"))
+
+    assert result["status"] == "error"
+    assert result["error_code"] == ErrorCode.INVALID_INPUT
+
+
+async def test_query_bigquery_returns_cached_result_without_running_query():
+    """Test a repeated query over unchanged tables is served from cache."""
+    from paidsearchnav_mcp.server import BigQueryRequest, query_bigquery
+
+    cached = {"status": "success", "metadata": {"cache_hit": False}, "data": []}
+    cache = AsyncMock()
+    cache._make_key = lambda prefix, params: f"{prefix}:key"
+    cache.get.return_value = cached
+    with (
+        patch("paidsearchnav_mcp.server.BigQueryClient") as client_cls,
+        patch("paidsearchnav_mcp.server._get_cache_client", return_value=cache),
+    ):
+        client = client_cls.return_value
+        client.project_id = "my-project"
+        client.estimate_query_cost = AsyncMock(
+            return_value={
+                "bytes_processed": 100,
+                "estimated_cost_usd": 0.0,
+                "referenced_tables": ["p.d.t"],
+            }
+        )
+        client.table_versions = AsyncMock(return_value={"p.d.t": "v1"})
+        client.fetch_results = AsyncMock()
+
+        result = await query_bigquery.fn(BigQueryRequest(query="SELECT a FROM t"))
+
+    assert result["metadata"]["cache_hit"] is True
+    client.fetch_results.assert_not_called()
+
+
+async def test_query_bigquery_requires_partition_filter():
+    """Test an ad-hoc query must filter a known partitioned table's partition."""
+    pytest.importorskip("sqlglot")
+    from paidsearchnav_mcp.server import BigQueryRequest, ErrorCode, query_bigquery
+
+    with patch("paidsearchnav_mcp.server.BigQueryClient") as client_cls:
+        result = await query_bigquery.fn(
+            BigQueryRequest(query="SELECT cost FROM paidsearchnav.search_terms")
+        )
+
+    assert result["error_code"] == ErrorCode.INVALID_INPUT
+    assert "without a filter on date" in result["details"]["validation_errors"][0]
+    client_cls.assert_not_called()
+
+
+async def test_query_bigquery_skips_cache_for_streamed_tables():
+    """Test a query over a table being streamed into is never cached."""
+    from paidsearchnav_mcp.clients.bigquery.results import QueryResult
+    from paidsearchnav_mcp.server import BigQueryRequest, query_bigquery
+
+    cache = AsyncMock()
+    cache._make_key = lambda prefix, params: f"{prefix}:key"
+    with (
+        patch("paidsearchnav_mcp.server.BigQueryClient") as client_cls,
+        patch("paidsearchnav_mcp.server._get_cache_client", return_value=cache),
+    ):
+        client = client_cls.return_value
+        client.project_id = "my-project"
+        client.estimate_query_cost = AsyncMock(
+            return_value={
+                "bytes_processed": 100,
+                "estimated_cost_usd": 0.0,
+                "referenced_tables": ["p.d.t", "p.d.streamed"],
+            }
+        )
+        client.table_versions = AsyncMock(
+            return_value={"p.d.t": "v1", "p.d.streamed": None}
+        )
+        client.fetch_results = AsyncMock(return_value=QueryResult(rows=[{"a": 1}]))
+
+        result = await query_bigquery.fn(BigQueryRequest(query="SELECT a FROM t"))
+
+    assert result["data"] == [{"a": 1}]
+    assert result["metadata"]["cache_hit"] is False
+    cache.get.assert_not_called()
+    cache.set.assert_not_called()
+
+
+async def test_query_bigquery_refuses_query_over_byte_budget():
+    """Test an expensive query needs confirm_cost before it runs."""
+    from paidsearchnav_mcp.server import BigQueryRequest, ErrorCode, query_bigquery
+
+    with (
+        patch("paidsearchnav_mcp.server.BigQueryClient") as client_cls,
+        patch("paidsearchnav_mcp.server._get_cache_client", return_value=None),
+        patch.dict(os.environ, {"PSN_BIGQUERY_MAX_BYTES_PER_QUERY": "1000"}),
+        patch("paidsearchnav_mcp.server._cost_gate_instance", None),
+    ):
+        client = client_cls.return_value
+        client.project_id = "my-project"
+        client.estimate_query_cost = AsyncMock(
+            return_value={
+                "bytes_processed": 5000,
+                "estimated_cost_usd": 0.01,
+                "referenced_tables": [],
+            }
+        )
+        client.fetch_results = AsyncMock()
+
+        result = await query_bigquery.fn(BigQueryRequest(query="SELECT a FROM t"))
+
+    assert result["error_code"] == ErrorCode.QUERY_COST_LIMIT_EXCEEDED
+    assert result["details"]["requires_confirmation"] is True
+    client.fetch_results.assert_not_called()
+
+
+async def test_query_bigquery_applies_customer_byte_budget():
+    """Test the gate's cost tracker supplies the customer's byte budget."""
+    from paidsearchnav_mcp.server import (
+        BigQueryRequest,
+        ErrorCode,
+        _get_cost_gate,
+        query_bigquery,
+    )
+
+    with (
+        patch("paidsearchnav_mcp.server.BigQueryClient") as client_cls,
+        patch("paidsearchnav_mcp.server._get_cache_client", return_value=None),
+        patch("paidsearchnav_mcp.server._cost_gate_instance", None),
+    ):
+        tracker = _get_cost_gate().cost_tracker
+        tracker.set_query_byte_budget("1234567890", 1000)
+        tracker.check_enhanced_budget_enforcement = AsyncMock(
+            return_value={"allowed": True}
+        )
+        client = client_cls.return_value
+        client.estimate_query_cost = AsyncMock(
+            return_value={
+                "bytes_processed": 5000,
+                "estimated_cost_usd": 0.01,
+                "referenced_tables": [],
+            }
+        )
+        client.fetch_results = AsyncMock()
+
+        result = await query_bigquery.fn(
+            BigQueryRequest(query="SELECT a FROM t", customer_id="1234567890")
+        )
+
+    assert result["error_code"] == ErrorCode.QUERY_COST_LIMIT_EXCEEDED
+    assert result["details"]["max_bytes"] == 1000
+    tracker.check_enhanced_budget_enforcement.assert_awaited_once_with(
+        "1234567890", 0.01
+    )
+    client.fetch_results.assert_not_called()
+
+
+async def test_query_bigquery_records_bytes_billed_for_customer():
+    """Test a query run for a customer is recorded with its bytes billed."""
+    from paidsearchnav_mcp.clients.bigquery.results import QueryResult
+    from paidsearchnav_mcp.server import (
+        BigQueryRequest,
+        _get_cost_gate,
+        query_bigquery,
+    )
+
+    job = Mock(
+        job_id="job-1",
+        total_bytes_processed=1000,
+        total_bytes_billed=10 * 1024**2,
+        slot_millis=0,
+        ended=None,
+    )
+    with (
+        patch("paidsearchnav_mcp.server.BigQueryClient") as client_cls,
+        patch("paidsearchnav_mcp.server._get_cache_client", return_value=None),
+        patch("paidsearchnav_mcp.server._cost_gate_instance", None),
+    ):
+        tracker = _get_cost_gate().cost_tracker
+        tracker.check_enhanced_budget_enforcement = AsyncMock(
+            return_value={"allowed": True}
+        )
+        tracker._check_budget_limits = AsyncMock()
+        tracker._enhanced_monitor.check_budget_enforcement = AsyncMock(
+            return_value={"allowed": True}
+        )
+        client = client_cls.return_value
+        client.project_id = "my-project"
+        client.estimate_query_cost = AsyncMock(
+            return_value={
+                "bytes_processed": 1000,
+                "estimated_cost_usd": 0.0,
+                "referenced_tables": [],
+            }
+        )
+        client.fetch_results = AsyncMock(
+            return_value=QueryResult(rows=[{"a": 1}], job=job)
+        )
+
+        result = await query_bigquery.fn(
+            BigQueryRequest(query="SELECT a FROM t", customer_id="1234567890")
+        )
+
+    assert result["status"] == "success"
+    [record] = tracker.cost_records
+    assert record["customer_id"] == "1234567890"
+    assert record["job_id"] == "job-1"
+    assert record["bytes_billed"] == 10 * 1024**2
+
+
 def test_bigquery_schema_request_model():
     """Test BigQuerySchemaRequest model can be instantiated."""
     from paidsearchnav_mcp.server import BigQuerySchemaRequest
@@ -149,3 +388,40 @@ def test_server_module_exports():
     assert hasattr(server, "health_check")
     assert hasattr(server, "get_config")
     assert hasattr(server, "create_mcp_server")
+
+
+def test_metrics_endpoint_serves_openmetrics():
+    """Test the /metrics route renders the shared registry."""
+    from starlette.testclient import TestClient
+
+    from paidsearchnav_mcp.core.metrics_registry import (
+        OPENMETRICS_CONTENT_TYPE,
+        get_metrics_registry,
+    )
+    from paidsearchnav_mcp.server import create_mcp_server
+
+    get_metrics_registry().counter("psn_test_scrapes", "Test scrapes.").inc()
+
+    with TestClient(create_mcp_server().http_app()) as client:
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == OPENMETRICS_CONTENT_TYPE
+    assert "psn_test_scrapes_total" in response.text
+    assert response.text.endswith("# EOF\n")
+
+
+def test_metrics_endpoint_includes_bigquery_retry_handlers():
+    """Test retry handlers created by the factory are scraped by name."""
+    from starlette.testclient import TestClient
+
+    from paidsearchnav_mcp.core.circuit_breaker import create_bigquery_retry_handler
+    from paidsearchnav_mcp.server import create_mcp_server
+
+    handler = create_bigquery_retry_handler(name="test-export")
+    handler._update_metrics(total_retries=2)
+
+    with TestClient(create_mcp_server().http_app()) as client:
+        response = client.get("/metrics")
+
+    assert 'psn_bigquery_retry_attempts_total{handler="test-export"} 2' in response.text
@@ -0,0 +1,121 @@
+"""Tests for analyzer execution backends."""
+
+import numpy as np
+import pytest
+
+from paidsearchnav_mcp.analyzers import execution
+from paidsearchnav_mcp.analyzers.execution import (
+    INLINE,
+    ProcessBackend,
+    backend_for,
+    share_frames,
+)
+from paidsearchnav_mcp.analyzers.frame import (
+    NEGATIVE_KEYWORD_FIELDS,
+    Field,
+    MetricsFrame,
+)
+from paidsearchnav_mcp.analyzers.negative_conflicts import (
+    _KEYWORD_COLUMNS,
+    NegativeConflictAnalyzer,
+)
+
+FIELDS = {"search_term": Field("str"), "clicks": Field("int"), "cost": Field()}
+
+
+def _frame(n):
+    return MetricsFrame.from_records(
+        [
+            {"search_term": f"term {i % 7}", "clicks": i, "cost": i / 4}
+            for i in range(n)
+        ],
+        FIELDS,
+    )
+
+
+class TestSharedFrames:
+    """Test copying frames through shared memory."""
+
+    def test_round_trip_preserves_columns(self):
+        """Test attached frames equal the originals, including empty ones."""
+        frames = [_frame(25), _frame(0), _frame(3).filter(np.array([1, 0, 1], bool))]
+        memory, handle = share_frames(frames)
+        try:
+            attached_memory, attached = handle.attach()
+            assert [f.to_records() for f in attached] == [
+                f.to_records() for f in frames
+            ]
+            assert attached[0]["clicks"].dtype == np.int64
+            assert not attached[0]["cost"].flags.writeable
+            attached.clear()
+            attached_memory.close()
+        finally:
+            memory.close()
+            memory.unlink()
+
+
+class TestBackendSelection:
+    """Test choosing a backend per analyzer."""
+
+    @pytest.fixture(autouse=True)
+    def no_shared_pool(self, monkeypatch):
+        monkeypatch.setattr(execution, "_process_backend", None)
+
+    def test_inline_by_default(self, monkeypatch):
+        """Test analyzers run inline unless selected."""
+        monkeypatch.delenv("PSN_ANALYZER_PROCESSES", raising=False)
+        assert NegativeConflictAnalyzer().backend is INLINE
+
+    def test_selected_analyzers_share_one_pool(self, monkeypatch):
+        """Test named analyzers get the process pool and others stay inline."""
+        monkeypatch.setenv("PSN_ANALYZER_PROCESSES", "NegativeConflictAnalyzer, X")
+        monkeypatch.setenv("PSN_ANALYZER_WORKERS", "3")
+
+        backend = backend_for("NegativeConflictAnalyzer")
+        assert isinstance(backend, ProcessBackend)
+        assert backend.max_workers == 3
+        assert backend_for("X") is backend
+        assert backend_for("KeywordMatchAnalyzer") is INLINE
+
+        monkeypatch.setenv("PSN_ANALYZER_PROCESSES", "all")
+        assert backend_for("KeywordMatchAnalyzer") is backend
+
+
+class TestProcessBackend:
+    """Test running analyzer steps in worker processes."""
+
+    async def test_worker_result_matches_inline(self):
+        """Test conflict matching gives the same result in a worker."""
+        analyzer = NegativeConflictAnalyzer()
+        keywords = MetricsFrame.from_records(
+            [
+                {"keyword_text": "Golf Shoes", "conversion_value": 40.0},
+                {"keyword_text": "red golf shoes", "conversion_value": 90.0},
+                {"keyword_text": "tennis balls", "conversion_value": 10.0},
+            ],
+            _KEYWORD_COLUMNS,
+        )
+        negatives = MetricsFrame.from_records(
+            [
+                {"text": "golf", "match_type": "BROAD"},
+                {"text": "golf shoes", "match_type": "EXACT"},
+            ],
+            NEGATIVE_KEYWORD_FIELDS,
+        )
+
+        backend = ProcessBackend(max_workers=1)
+        try:
+            result = await backend.run(
+                analyzer._find_conflicts, keywords, negatives=negatives
+            )
+        finally:
+            backend.shutdown()
+
+        assert result == await INLINE.run(analyzer._find_conflicts, keywords, negatives)
+        count, top = result
+        assert count == 3
+        assert [c["positive_keyword"] for c in top] == [
+            "red golf shoes",
+            "golf shoes",
+            "golf shoes",
+        ]
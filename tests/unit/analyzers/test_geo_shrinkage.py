@@ -0,0 +1,117 @@
+"""Tests for empirical-Bayes shrinkage of geo rates."""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from paidsearchnav_mcp.analyzers.geo_performance import GeoPerformanceAnalyzer
+from paidsearchnav_mcp.analyzers.shrinkage import (
+    MAX_PRIOR_STRENGTH,
+    gamma_interval,
+    prior_strength,
+    shrink_hierarchy,
+)
+
+
+class TestShrinkage:
+    """Test the vectorized shrinkage helpers."""
+
+    def test_prior_strength_tracks_heterogeneity(self):
+        """Test pure Poisson noise pools fully and real spread pools less."""
+        rng = np.random.default_rng(1)
+        exposure = rng.uniform(100, 1000, size=2000)
+        parent = np.full(2000, 0.02)
+
+        noise_only = rng.poisson(0.02 * exposure).astype(float)
+        spread = rng.poisson(rng.gamma(2.0, 0.01, size=2000) * exposure)
+
+        assert prior_strength(noise_only, exposure, parent) > 10_000
+        # True rates ~ Gamma(shape=2, mean=0.02) => strength = 2 / 0.02
+        assert prior_strength(spread.astype(float), exposure, parent) == pytest.approx(
+            100, rel=0.2
+        )
+        assert prior_strength(np.zeros(3), np.zeros(3), parent[:3]) == (
+            MAX_PRIOR_STRENGTH
+        )
+
+    def test_small_segments_shrink_toward_their_parent(self):
+        """Test a sparse city moves to its state's rate, not the account's."""
+        rng = np.random.default_rng(2)
+        # Two states with very different conversion rates per dollar
+        state = np.repeat([0, 1], 500)
+        exposure = np.full(1000, 500.0)
+        successes = rng.poisson(np.where(state == 0, 0.01, 0.05) * exposure)
+        # A $20 city with one lucky conversion in the weak state
+        successes = np.append(successes, 1).astype(float)
+        exposure = np.append(exposure, 20.0)
+        state = np.append(state, 0)
+
+        shape, rate, strengths = shrink_hierarchy(successes, exposure, [state])
+
+        posterior = shape / rate
+        assert len(strengths) == 2
+        assert posterior[-1] == pytest.approx(0.01, rel=0.3)
+        assert posterior[:500].mean() == pytest.approx(0.01, rel=0.1)
+        assert posterior[500:1000].mean() == pytest.approx(0.05, rel=0.1)
+
+    def test_gamma_interval_matches_quantiles(self):
+        """Test the interval is close to exact Gamma 5th/95th percentiles."""
+        lower, upper = gamma_interval(np.array([100.0, 4.0]), np.array([1.0, 2.0]))
+
+        assert lower == pytest.approx([84.14, 0.6835], rel=0.01)
+        assert upper == pytest.approx([117.01, 3.879], rel=0.01)
+
+    def test_gamma_interval_stays_positive_for_sparse_locations(self):
+        """Test tiny posterior shapes keep a finite CPA bound."""
+        # $50 ZIP codes with no conversions and a weak prior
+        shape = np.array([0.001, 0.01, 0.1])
+        lower, upper = gamma_interval(shape, np.full(3, 50.0))
+
+        assert (upper > 0).all()
+        assert np.isfinite(1 / upper).all()
+        assert (lower < upper).all()
+        # Exact Gamma 95th percentiles
+        assert upper * 50 == pytest.approx([2.974e-23, 3.363e-3, 0.5804], rel=0.3)
+
+
+class TestGeoShrinkageAnalyzer:
+    """Test the geo analyzer at ZIP-code scale."""
+
+    async def test_analyzes_100k_zip_codes_quickly(self):
+        """Test 100K rows are scored in well under a second."""
+        rng = np.random.default_rng(3)
+        n = 100_000
+        states = rng.integers(0, 50, size=n)
+        cost = rng.gamma(1.0, 40.0, size=n)
+        conversions = rng.poisson(cost * rng.gamma(4.0, 0.005, size=n))
+        rows = [
+            {
+                "postal_code": f"{i:05d}",
+                "region_name": f"State {states[i]}",
+                "country_name": "United States",
+                "impressions": 200,
+                "cost_micros": cost[i] * 1e6,
+                "conversions": float(conversions[i]),
+                "conversion_value_micros": conversions[i] * 50e6,
+            }
+            for i in range(n)
+        ]
+
+        with patch("paidsearchnav_mcp.server.get_geo_performance") as mock_geo:
+            mock_geo.fn = AsyncMock(return_value={"data": rows})
+            started = time.perf_counter()
+            result = await GeoPerformanceAnalyzer().analyze(
+                "1234567890", "2025-01-01", "2025-01-31"
+            )
+            elapsed = time.perf_counter() - started
+
+        assert result.total_records_analyzed == n
+        assert len(result.top_recommendations) == 10
+        impacts = [abs(r["estimated_savings"]) for r in result.top_recommendations]
+        assert impacts == sorted(impacts, reverse=True)
+        for recommendation in result.top_recommendations:
+            low, high = recommendation["cpa_interval"]
+            assert low <= recommendation["expected_cpa"] <= high
+        assert elapsed < 1.0
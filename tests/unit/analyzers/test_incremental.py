@@ -0,0 +1,169 @@
+"""Tests for fingerprint-keyed reuse of analyzer results."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from paidsearchnav_mcp.analyzers.frame import Field, MetricsFrame
+from paidsearchnav_mcp.analyzers.incremental import (
+    PARTIALS,
+    SUMMARIES,
+    ResultCache,
+)
+from paidsearchnav_mcp.analyzers.search_term_waste import SearchTermWasteAnalyzer
+
+FIELDS = {"search_term": Field("str"), "cost": Field()}
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    PARTIALS.clear()
+    SUMMARIES.clear()
+    yield
+    PARTIALS.clear()
+    SUMMARIES.clear()
+
+
+def _search_term(term, cost, conversions=0.0):
+    return {
+        "search_term": term,
+        "campaign_name": "Search",
+        "metrics": {
+            "cost": cost,
+            "clicks": 5,
+            "impressions": 100,
+            "conversions": conversions,
+        },
+    }
+
+
+def _pages(*pages):
+    """Fake get_search_terms serving ``pages`` 500 rows at a time."""
+
+    async def get_search_terms(request):
+        index = request.offset // request.limit
+        return {
+            "status": "success",
+            "data": pages[index],
+            "metadata": {"pagination": {"has_more": index + 1 < len(pages)}},
+        }
+
+    return get_search_terms
+
+
+async def _analyze(analyzer, get_search_terms):
+    with patch("paidsearchnav_mcp.server.get_search_terms") as mock_get_st:
+        mock_get_st.fn = get_search_terms
+        return await analyzer.analyze("1234567890", "2025-01-01", "2025-01-31")
+
+
+def _page(prefix, n=500, cost=12.0):
+    return [_search_term(f"{prefix} term {i}", cost + i % 7) for i in range(n)]
+
+
+class TestResultCache:
+    """Test the bounded LRU cache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test a lookup protects an entry from the next eviction."""
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert (cache.hits, cache.misses) == (3, 1)
+
+    def test_bounded_by_estimated_bytes(self):
+        """Test entries are evicted by size and oversized values are skipped."""
+        cache = ResultCache(max_entries=100, max_bytes=20_000)
+        for key in "abc":
+            cache.put(key, np.zeros(1000))
+
+        assert cache.get("a") is None
+        assert cache.nbytes == 16_000
+
+        cache.put("huge", np.zeros(5000))
+        assert cache.get("huge") is None
+        assert len(cache) == 2
+
+
+class TestFingerprint:
+    """Test frame fingerprints."""
+
+    def test_equal_frames_share_fingerprint(self):
+        """Test fingerprints depend on contents, not on how frames were built."""
+        rows = [{"search_term": "shoes", "cost": 1.5}, {"search_term": "boots"}]
+        first = MetricsFrame.from_records(rows, FIELDS)
+        second = MetricsFrame.from_records([dict(row) for row in rows], FIELDS)
+        assert first.fingerprint() == second.fingerprint()
+
+    def test_any_change_changes_fingerprint(self):
+        """Test a changed value, string or column name changes the fingerprint."""
+        rows = [{"search_term": "shoes", "cost": 1.5}]
+        base = MetricsFrame.from_records(rows, FIELDS).fingerprint()
+        changed_value = MetricsFrame.from_records(
+            [{"search_term": "shoes", "cost": 1.6}], FIELDS
+        )
+        changed_string = MetricsFrame.from_records(
+            [{"search_term": "shoe", "cost": 1.5}], FIELDS
+        )
+        renamed = MetricsFrame.from_records(
+            rows, {"search_term": Field("str"), "spend": Field(path="cost")}
+        )
+        fingerprints = {
+            base,
+            changed_value.fingerprint(),
+            changed_string.fingerprint(),
+            renamed.fingerprint(),
+        }
+        assert len(fingerprints) == 4
+
+
+class TestIncrementalWaste:
+    """Test re-running the waste analysis on unchanged and changed data."""
+
+    async def test_unchanged_rerun_reuses_summary(self):
+        """Test a second run over the same pages reduces nothing."""
+        fetch = _pages(_page("red"), _page("blue", n=40))
+        first = await _analyze(SearchTermWasteAnalyzer(), fetch)
+
+        with patch.object(
+            SearchTermWasteAnalyzer, "_scan_page", side_effect=AssertionError
+        ):
+            second = await _analyze(SearchTermWasteAnalyzer(), fetch)
+
+        assert second == first
+        assert second is not first
+
+    async def test_changed_page_is_the_only_one_reduced(self):
+        """Test only the changed page is reduced and the result is exact."""
+        before = await _analyze(
+            SearchTermWasteAnalyzer(), _pages(_page("red"), _page("blue"))
+        )
+        changed = _pages(_page("red"), _page("blue", cost=90.0))
+
+        original = SearchTermWasteAnalyzer._scan_page
+        with patch.object(
+            SearchTermWasteAnalyzer, "_scan_page", autospec=True, side_effect=original
+        ) as scan_page:
+            incremental = await _analyze(SearchTermWasteAnalyzer(), changed)
+        assert scan_page.call_count == 1
+
+        PARTIALS.clear()
+        SUMMARIES.clear()
+        assert incremental == await _analyze(SearchTermWasteAnalyzer(), changed)
+        assert incremental.estimated_monthly_savings > before.estimated_monthly_savings
+
+    async def test_settings_are_part_of_the_key(self):
+        """Test analyzers with different thresholds do not share results."""
+        fetch = _pages(_page("red", n=20))
+        default = await _analyze(SearchTermWasteAnalyzer(), fetch)
+        strict = await _analyze(SearchTermWasteAnalyzer(min_cost=1000.0), fetch)
+
+        assert default.top_recommendations
+        assert strict.top_recommendations == []
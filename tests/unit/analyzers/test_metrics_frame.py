@@ -0,0 +1,217 @@
+"""Tests for the columnar MetricsFrame shared by the analyzers."""
+
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from paidsearchnav_mcp.analyzers.frame import (
+    KEYWORD_FIELDS,
+    SEARCH_TERM_FIELDS,
+    DictionaryColumn,
+    Field,
+    FrameBuilder,
+    MetricsFrame,
+)
+from paidsearchnav_mcp.analyzers.geo_performance import GeoPerformanceAnalyzer
+from paidsearchnav_mcp.analyzers.pmax_cannibalization import (
+    PMaxCannibalizationAnalyzer,
+)
+from paidsearchnav_mcp.models.keyword import KeywordMatchType
+
+
+def _search_term(term, cost, conversions=0.0, campaign_id="1"):
+    return {
+        "search_term": term,
+        "campaign_id": campaign_id,
+        "metrics": {"cost": cost, "conversions": conversions, "clicks": 10},
+    }
+
+
+def _page(data, has_more=False):
+    return {
+        "status": "success",
+        "data": data,
+        "metadata": {"pagination": {"has_more": has_more}},
+    }
+
+
+class TestMetricsFrame:
+    """Test frame construction and vectorized operations."""
+
+    def test_from_records_reads_nested_paths_and_defaults(self):
+        """Test dotted paths, missing values and str enums."""
+        frame = MetricsFrame.from_records(
+            [
+                {"search_term": "shoes", "metrics": {"cost": 1.5, "clicks": 3}},
+                {"search_term": None, "metrics": None},
+            ],
+            SEARCH_TERM_FIELDS,
+        )
+        keywords = MetricsFrame.from_records(
+            [{"match_type": KeywordMatchType.PHRASE}, {}], KEYWORD_FIELDS
+        )
+
+        assert len(frame) == 2
+        assert frame["cost"].tolist() == [1.5, 0.0]
+        assert frame["clicks"].dtype == np.int64
+        assert frame.strings("search_term").tolist() == ["shoes", ""]
+        assert keywords.strings("match_type").tolist() == ["PHRASE", "BROAD"]
+        assert keywords.row(0)["match_type"] is KeywordMatchType.PHRASE
+
+    def test_rejects_unknown_kind_and_ragged_columns(self):
+        """Test invalid schemas and column lengths fail fast."""
+        with pytest.raises(ValueError):
+            Field("decimal")
+        with pytest.raises(ValueError):
+            MetricsFrame({"a": np.zeros(2), "b": np.zeros(3)})
+
+    def test_concat_merges_dictionaries(self):
+        """Test pages with different dictionaries share codes after concat."""
+        builder = FrameBuilder({"term": Field("str"), "cost": Field()})
+        builder.append([{"term": "a", "cost": 1}, {"term": "b", "cost": 2}])
+        builder.append([{"term": "b", "cost": 3}, {"term": "c", "cost": 4}])
+
+        frame = builder.build()
+
+        assert len(builder) == 4
+        assert frame["term"].values.tolist() == ["a", "b", "c"]
+        assert frame["term"].codes.tolist() == [0, 1, 1, 2]
+        assert len(FrameBuilder(KEYWORD_FIELDS).build()) == 0
+
+    def test_normalized_merges_case_and_whitespace(self):
+        """Test normalization only rewrites the dictionary."""
+        column = DictionaryColumn.encode(["Shoes ", "shoes", "Boots"])
+
+        normalized = column.normalized()
+
+        assert normalized.decode().tolist() == ["shoes", "shoes", "boots"]
+        assert len(normalized.values) == 2
+        assert normalized.isin(("boots",)).tolist() == [False, False, True]
+
+    def test_group_sum_keeps_first_seen_order(self):
+        """Test group sums, counts and integer dtypes."""
+        frame = MetricsFrame.from_records(
+            [
+                {"match_type": "EXACT", "clicks": 1, "cost": 1.0},
+                {"match_type": "BROAD", "clicks": 2, "cost": 2.5},
+                {"match_type": "EXACT", "clicks": 3, "cost": 0.5},
+            ],
+            KEYWORD_FIELDS,
+        )
+
+        grouped = frame.group_sum("match_type", ("clicks", "cost")).to_records()
+
+        assert grouped == [
+            {"match_type": "EXACT", "count": 2, "clicks": 4, "cost": 1.5},
+            {"match_type": "BROAD", "count": 1, "clicks": 2, "cost": 2.5},
+        ]
+        assert isinstance(grouped[0]["clicks"], int)
+
+    def test_top_k_matches_stable_sort(self):
+        """Test top-k agrees with sorted(reverse=True), ties included."""
+        rng = np.random.default_rng(7)
+        costs = rng.integers(0, 20, size=500).astype(float)
+        frame = MetricsFrame({"cost": costs})
+
+        expected = sorted(range(500), key=lambda i: costs[i], reverse=True)[:25]
+
+        assert frame.top_k("cost", 25).tolist() == expected
+        assert (
+            frame.top_k("cost", 3, descending=False).tolist()
+            == sorted(range(500), key=lambda i: costs[i])[:3]
+        )
+        assert frame.top_k("cost", 1000).tolist() == sorted(
+            range(500), key=lambda i: costs[i], reverse=True
+        )
+        assert frame.filter(costs > 100).top_k("cost", 5).tolist() == []
+
+
+class TestColumnarAnalyzers:
+    """Test analyzers that consume frames end to end."""
+
+    async def test_geo_performance_ranks_by_impact(self):
+        """Test geo recommendations are classified and ranked by impact."""
+
+        def location(name, cost, conversions, impressions=500):
+            return {
+                "city_name": name,
+                "region_name": "Texas",
+                "country_name": "United States",
+                "impressions": impressions,
+                "cost_micros": cost * 1e6,
+                "conversions": conversions,
+                "conversion_value_micros": conversions * 100e6,
+            }
+
+        locations = [
+            location("Dallas", 800, 0),  # No conversions: bid down or exclude
+            location("Austin", 1000, 50),  # Cheap conversions: bid up
+            location("Houston", 3000, 10),  # Expensive conversions: bid down
+            location("Plano", 2000, 20),  # Close to average
+            location("Frisco", 60, 0),  # Too little spend to judge
+            location("Waco", 999, 0, impressions=5),  # Below min impressions
+        ]
+
+        with patch("paidsearchnav_mcp.server.get_geo_performance") as mock_geo:
+            mock_geo.fn = AsyncMock(return_value={"data": locations})
+            result = await GeoPerformanceAnalyzer().analyze(
+                "1234567890", "2025-01-01", "2025-01-31"
+            )
+
+        actions = [(r["location"], r["action"]) for r in result.top_recommendations]
+        assert actions == [
+            ("Houston", "BID_DOWN"),
+            ("Austin", "BID_UP"),
+            ("Dallas", "BID_DOWN or EXCLUDE"),
+        ]
+        assert result.total_records_analyzed == 5
+        # Bid ups are an investment capped at current spend, not savings
+        assert result.top_recommendations[1]["estimated_savings"] == -1000.0
+        assert result.estimated_monthly_savings == pytest.approx(
+            sum(r["estimated_savings"] for r in result.top_recommendations[::2])
+        )
+
+    async def test_pmax_overlap_joins_on_lowercased_terms(self):
+        """Test PMax/Search overlap is found across campaigns and case."""
+        campaigns = {
+            "data": [
+                {"campaign_id": "1", "type": "PERFORMANCE_MAX"},
+                {"campaign_id": "2", "type": "SEARCH"},
+            ]
+        }
+        pages = {
+            "PERFORMANCE_MAX": _page(
+                [
+                    _search_term("Running Shoes", 40.0, conversions=1.0),
+                    _search_term("trail shoes", 5.0),
+                ]
+            ),
+            "SEARCH": _page(
+                [
+                    _search_term("running shoes", 30.0, 3.0, "2"),
+                    _search_term("trail shoes", 5.0, 0.0, "2"),
+                    _search_term("boots", 50.0, 1.0, "2"),
+                ]
+            ),
+        }
+
+        async def get_search_terms(request):
+            return pages[request.campaign_type]
+
+        with (
+            patch("paidsearchnav_mcp.server.get_campaigns") as mock_campaigns,
+            patch("paidsearchnav_mcp.server.get_search_terms") as mock_terms,
+        ):
+            mock_campaigns.fn = AsyncMock(return_value=campaigns)
+            mock_terms.fn = get_search_terms
+            result = await PMaxCannibalizationAnalyzer().analyze(
+                "1234567890", "2025-01-01", "2025-01-31"
+            )
+
+        assert result.total_records_analyzed == 2
+        (recommendation,) = result.top_recommendations
+        assert recommendation["search_term"] == "running shoes"
+        assert recommendation["action"] == "Add to PMax negative keywords"
+        assert recommendation["total_cost"] == 70.0
+        assert result.estimated_monthly_savings == 20.0
@@ -0,0 +1,193 @@
+"""Tests for n-gram waste mining."""
+
+from collections import defaultdict
+from unittest.mock import patch
+
+import numpy as np
+
+from paidsearchnav_mcp.analyzers.frame import Field, MetricsFrame
+from paidsearchnav_mcp.analyzers.ngrams import NGramCounter, term_ngrams
+from paidsearchnav_mcp.analyzers.search_term_waste import SearchTermWasteAnalyzer
+
+FIELDS = {"search_term": Field("str"), "cost": Field(), "clicks": Field("int")}
+
+
+def _frame(rows):
+    return MetricsFrame.from_records(
+        [{"search_term": t, "cost": c, "clicks": 1} for t, c in rows], FIELDS
+    )
+
+
+def _search_term(term, cost, conversions=0.0):
+    return {
+        "search_term": term,
+        "metrics": {
+            "cost": cost,
+            "clicks": 5,
+            "impressions": 100,
+            "conversions": conversions,
+        },
+    }
+
+
+class TestNGramCounter:
+    """Test streaming n-gram totals."""
+
+    def test_term_ngrams_are_distinct_word_ngrams(self):
+        """Test repeated n-grams within a term are counted once."""
+        assert term_ngrams("Buy buy  shoes!", max_n=2) == {
+            "buy",
+            "shoes",
+            "buy buy",
+            "buy shoes",
+        }
+
+    def test_totals_match_brute_force_across_pages(self):
+        """Test totals equal a dictionary count over all rows."""
+        rng = np.random.default_rng(5)
+        words = ["red", "blue", "shoes", "boots", "cheap", "free"]
+        rows = [
+            (" ".join(rng.choice(words, size=rng.integers(1, 5))), float(i % 13))
+            for i in range(600)
+        ]
+        counter = NGramCounter(("cost", "clicks"))
+        for start in range(0, 600, 128):
+            counter.add(_frame(rows[start : start + 128]))
+
+        expected = defaultdict(lambda: [0, 0.0])
+        for term, cost in rows:
+            for ngram in term_ngrams(term):
+                expected[ngram][0] += 1
+                expected[ngram][1] += cost
+
+        frame = counter.to_frame()
+        actual = {
+            row["ngram"]: [row["count"], row["cost"]] for row in frame.to_records()
+        }
+        assert actual == expected
+        assert frame["clicks"].dtype == np.int64
+        assert frame["clicks"].tolist() == frame["count"].tolist()
+
+    def test_pruning_bounds_memory(self):
+        """Test rare n-grams are dropped once the table exceeds its limit."""
+        counter = NGramCounter(("cost",), max_n=1, min_support=2, max_ngrams=50)
+        counter.add(_frame([("common", 1.0)] * 3))
+        counter.add(_frame([(f"rare{i}", 5.0) for i in range(100)]))
+
+        records = counter.to_frame().to_records()
+        assert len(counter) <= 50
+        assert records == [
+            {"ngram": "common", "words": 1, "count": 3, "cost": 3.0},
+        ]
+
+    def test_pruned_ngrams_keep_an_upper_bound(self):
+        """Test a pruned n-gram seen again is not reported as exact."""
+        fields = {"search_term": Field("str"), "conversions": Field()}
+
+        def page(rows):
+            return MetricsFrame.from_records(
+                [{"search_term": t, "conversions": c} for t, c in rows], fields
+            )
+
+        def counter():
+            return NGramCounter(
+                ("conversions",),
+                max_n=1,
+                min_support=2,
+                max_ngrams=50,
+                bounded=("conversions",),
+            )
+
+        pruned = counter()
+        pruned.add(page([("common", 0.0)] * 2))
+        pruned.add(page([("rare0", 1.0)] + [(f"rare{i}", 0.0) for i in range(1, 100)]))
+        pruned.add(page([("rare0", 0.0)] * 2))
+        unpruned = counter()
+        unpruned.add(page([("common", 0.0), ("other", 0.0)]))
+        total = counter()
+        total.merge(pruned)
+        total.merge(unpruned)
+
+        for merged in (pruned, total):
+            rows = {row["ngram"]: row for row in merged.to_frame().to_records()}
+            assert rows["rare0"]["conversions"] == 0.0
+            assert rows["rare0"]["conversions_max"] == 1.0
+            assert rows["common"]["conversions_max"] == 0.0
+        # "other" may have been among the n-grams pruned on the first counter
+        assert rows["other"]["conversions_max"] == 1.0
+
+
+class TestNGramWaste:
+    """Test n-gram negatives in the waste analysis."""
+
+    async def test_long_tail_phrase_outranks_individual_terms(self):
+        """Test a shared non-converting word becomes one phrase negative."""
+        rows = [_search_term(f"free shoes {i}", 4.0) for i in range(30)]
+        rows += [
+            _search_term("running shoes", 50.0, conversions=3.0),
+            _search_term("cheap boots", 40.0),
+            _search_term("cheap boots sale", 30.0, conversions=1.0),
+        ]
+        page = {
+            "status": "success",
+            "data": rows,
+            "metadata": {"pagination": {"has_more": False}},
+        }
+
+        async def get_search_terms(request):
+            return page
+
+        with patch("paidsearchnav_mcp.server.get_search_terms") as mock_get_st:
+            mock_get_st.fn = get_search_terms
+            result = await SearchTermWasteAnalyzer().analyze(
+                "1234567890", "2025-01-01", "2025-01-31"
+            )
+
+        recommendations = result.top_recommendations
+        assert recommendations[0]["search_term"] == "free"
+        assert recommendations[0]["match_type"] == "PHRASE"
+        assert recommendations[0]["matched_search_terms"] == 30
+        assert recommendations[0]["estimated_savings"] == 120.0
+        # "shoes" and "cheap" appear in converting terms; covered bigrams
+        # like "free shoes" are not repeated
+        texts = [r["search_term"] for r in recommendations]
+        assert texts == ["free", "cheap boots"]
+        assert result.estimated_monthly_savings == 160.0
+
+    def test_nested_ngrams_are_not_both_picked(self):
+        """Test a phrase inside a picked phrase is skipped, so no cost counts twice."""
+        fields = {
+            "ngram": Field("str"),
+            "words": Field("int"),
+            "count": Field("int"),
+            "cost": Field(),
+            "clicks": Field("int"),
+            "impressions": Field("int"),
+            "conversions": Field(),
+            "conversions_max": Field(),
+        }
+        # "free" was pruned and re-added, so it totals less than "free jobs"
+        ngrams = MetricsFrame.from_records(
+            [
+                {
+                    "ngram": ngram,
+                    "words": ngram.count(" ") + 1,
+                    "count": 5,
+                    "cost": cost,
+                    "clicks": 50,
+                    "impressions": 500,
+                    "conversions": 0.0,
+                    "conversions_max": conversions_max,
+                }
+                for ngram, cost, conversions_max in (
+                    ("free jobs", 50.0, 0.0),
+                    ("free", 40.0, 0.0),
+                    ("jobs online", 30.0, 2.0),
+                )
+            ],
+            fields,
+        )
+
+        picked = SearchTermWasteAnalyzer()._find_wasteful_ngrams(ngrams)
+
+        assert [p["search_term"] for p in picked] == ["free jobs"]
@@ -0,0 +1,156 @@
+"""Tests for search term set sketches and PMax overlap estimates."""
+
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from paidsearchnav_mcp.analyzers.pmax_cannibalization import (
+    PMaxCannibalizationAnalyzer,
+)
+from paidsearchnav_mcp.analyzers.sketches import (
+    HyperLogLog,
+    OverlapProbe,
+    TermSetSketch,
+    hash_terms,
+)
+
+
+def _terms(prefix, n):
+    return hash_terms(f"{prefix} term {i}" for i in range(n))
+
+
+class TestHashTerms:
+    """Test term hashing."""
+
+    def test_hashes_normalized_text(self):
+        """Test case and spacing variants hash alike and others do not."""
+        hashes = hash_terms(["Running  Shoes", "running shoes", "trail shoes"])
+        assert hashes.dtype == np.uint64
+        assert hashes[0] == hashes[1] != hashes[2]
+
+
+class TestHyperLogLog:
+    """Test distinct count estimates."""
+
+    @pytest.mark.parametrize("n", [10, 1000, 50_000])
+    def test_count_within_error(self, n):
+        """Test estimates stay within a few standard errors."""
+        sketch = HyperLogLog()
+        sketch.add(_terms("a", n))
+        sketch.add(_terms("a", n // 2))  # Duplicates are not recounted
+        assert sketch.count() == pytest.approx(n, rel=0.06)
+
+    def test_merge_is_union(self):
+        """Test merging counts the union of both sets."""
+        first, second = HyperLogLog(), HyperLogLog()
+        first.add(_terms("a", 3000))
+        second.add(_terms("a", 1000))
+        second.add(_terms("b", 2000))
+        first.merge(second)
+        assert first.count() == pytest.approx(5000, rel=0.06)
+
+    def test_rejects_mismatched_precision(self):
+        """Test sketches of different precision cannot merge."""
+        with pytest.raises(ValueError):
+            HyperLogLog(10).merge(HyperLogLog(12))
+
+
+class TestOverlapProbe:
+    """Test containment-based overlap estimates."""
+
+    def _overlap(self, first, second_hashes):
+        probe = OverlapProbe([first])
+        probe.add(second_hashes)
+        return probe.overlap(first)
+
+    def test_overlap_within_error(self):
+        """Test the estimated intersection is close to the exact one."""
+        first = TermSetSketch()
+        first.add(_terms("a", 4000))
+        second = np.concatenate([_terms("a", 4000)[3000:], _terms("b", 1000)])
+        assert self._overlap(first, second) == pytest.approx(1000, abs=250)
+
+    def test_small_set_against_much_larger_set(self):
+        """Test precision depends on the small set, not the union."""
+        first = TermSetSketch()
+        first.add(_terms("a", 2000))
+        # |A & B| = 1000 of a 200k-term union
+        second = np.concatenate([_terms("a", 2000)[1000:], _terms("b", 199_000)])
+        assert self._overlap(first, second) == pytest.approx(1000, rel=0.2)
+
+    def test_sets_smaller_than_the_sample_are_exact(self):
+        """Test a fully sampled set gives its exact count and overlap."""
+        first = TermSetSketch()
+        first.add(_terms("a", 100))
+        assert first.count() == 100
+        assert self._overlap(first, _terms("a", 40)) == 40
+
+    def test_disjoint_sets_do_not_overlap(self):
+        """Test unrelated sets estimate no overlap."""
+        first = TermSetSketch()
+        first.add(_terms("a", 1000))
+        assert self._overlap(first, _terms("b", 1000)) == 0.0
+
+    def test_rejects_sketch_not_probed(self):
+        """Test asking about a sketch the probe was not built from fails."""
+        first, other = TermSetSketch(), TermSetSketch()
+        first.add(_terms("a", 10))
+        other.add(_terms("b", 10))
+        with pytest.raises(ValueError):
+            OverlapProbe([first]).overlap(other)
+
+
+class TestPMaxEstimate:
+    """Test the analyzer's sketch-based estimate mode."""
+
+    async def test_ranks_pmax_campaigns_by_estimated_overlap(self):
+        """Test overlap is estimated per PMax campaign against all of Search."""
+        campaigns = {
+            "data": [
+                {"campaign_id": "1", "name": "PMax Shoes", "type": "PERFORMANCE_MAX"},
+                {"campaign_id": "2", "name": "PMax Boots", "type": "PERFORMANCE_MAX"},
+                {"campaign_id": "3", "name": "Search", "type": "SEARCH"},
+            ]
+        }
+
+        def rows(campaign_id, prefix, n):
+            return [
+                {"search_term": f"{prefix} term {i}", "campaign_id": campaign_id}
+                for i in range(n)
+            ]
+
+        pages = {
+            # Campaign 1 shares most of its terms with Search, campaign 2 none
+            "PERFORMANCE_MAX": rows("1", "shoes", 400) + rows("2", "boots", 300),
+            "SEARCH": rows("3", "SHOES", 300) + rows("3", "sandals", 200),
+        }
+
+        async def get_search_terms(request):
+            data = pages[request.campaign_type]
+            return {
+                "status": "success",
+                "data": data[request.offset : request.offset + request.limit],
+                "metadata": {
+                    "pagination": {
+                        "has_more": request.offset + request.limit < len(data)
+                    }
+                },
+            }
+
+        with (
+            patch("paidsearchnav_mcp.server.get_campaigns") as mock_campaigns,
+            patch("paidsearchnav_mcp.server.get_search_terms") as mock_terms,
+        ):
+            mock_campaigns.fn = AsyncMock(return_value=campaigns)
+            mock_terms.fn = get_search_terms
+            result = await PMaxCannibalizationAnalyzer(estimate=True).analyze(
+                "1234567890", "2025-01-01", "2025-01-31"
+            )
+
+        (recommendation,) = result.top_recommendations
+        assert recommendation["campaign"] == "PMax Shoes"
+        assert recommendation["estimated_search_terms"] == pytest.approx(400, rel=0.1)
+        assert recommendation["overlap_share"] == pytest.approx(0.75, abs=0.2)
+        assert result.total_records_analyzed == pytest.approx(700, rel=0.1)
+        assert result.estimated_monthly_savings == 0.0
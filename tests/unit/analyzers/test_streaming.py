@@ -0,0 +1,148 @@
+"""Tests for streaming analyzer reducers."""
+
+import random
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from paidsearchnav_mcp.analyzers.frame import Field, MetricsFrame
+from paidsearchnav_mcp.analyzers.search_term_waste import SearchTermWasteAnalyzer
+from paidsearchnav_mcp.analyzers.streaming import GroupTotals, TopK, iter_pages
+
+FIELDS = {"term": Field("str"), "cost": Field()}
+
+
+def _paged(rows):
+    """Serve rows like an MCP data tool, one (offset, limit) page at a time."""
+
+    async def fetch(request):
+        offset, size = request
+        return {
+            "status": "success",
+            "data": rows[offset : offset + size],
+            "metadata": {"pagination": {"has_more": offset + size < len(rows)}},
+        }
+
+    return fetch
+
+
+class TestTopK:
+    """Test the bounded top-k reducer."""
+
+    def test_matches_sorted_with_ties_across_batches(self):
+        """Test results equal a stable descending sort of everything offered."""
+        rng = random.Random(3)
+        keys = [float(rng.randint(0, 30)) for _ in range(1000)]
+        top = TopK(15)
+        for start in range(0, 1000, 128):
+            batch = np.array(keys[start : start + 128])
+            top.offer_batch(batch, lambda i, start=start: start + i)
+
+        expected = sorted(range(1000), key=lambda i: keys[i], reverse=True)[:15]
+        assert top.results() == expected
+        assert len(top) == 15
+
+    def test_offer_batch_skips_rows_that_cannot_win(self):
+        """Test items are only built for rows that beat the current k-th best."""
+        top = TopK(2)
+        top.offer_batch(np.array([10.0, 20.0]), str)
+        built = []
+
+        top.offer_batch(np.array([1.0, 15.0, 10.0]), lambda i: built.append(i) or i)
+
+        assert built == [1]
+        assert top.results() == ["1", 1]
+
+
+class TestGroupTotals:
+    """Test running per-key sums."""
+
+    def test_totals_across_batches(self):
+        """Test counts and sums merge across frames with different dictionaries."""
+        totals = GroupTotals(("cost",))
+        totals.add(
+            MetricsFrame.from_records(
+                [{"term": "a", "cost": 1.0}, {"term": "b", "cost": 2.0}], FIELDS
+            ),
+            "term",
+        )
+        totals.add(
+            MetricsFrame.from_records(
+                [{"term": "b", "cost": 3.0}, {"term": "c", "cost": 4.0}], FIELDS
+            ),
+            "term",
+        )
+
+        assert totals.rows == 4
+        assert totals.get("b") == {"count": 2, "cost": 5.0}
+        assert totals.get("missing") is None
+        assert [row["term"] for row in totals.to_records("term")] == ["a", "b", "c"]
+
+
+class TestIterPages:
+    """Test the paginated fetch generator."""
+
+    async def test_yields_frames_until_last_page(self):
+        """Test every page is converted and pagination stops at has_more."""
+        rows = [{"term": str(i), "cost": i} for i in range(5)]
+        fetch = AsyncMock(side_effect=_paged(rows))
+
+        pages = [
+            page
+            async for page in iter_pages(
+                fetch, lambda offset, limit: (offset, limit), FIELDS, limit=2
+            )
+        ]
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert fetch.call_count == 3
+
+    async def test_stops_on_failed_page(self):
+        """Test a failed page ends iteration without raising."""
+        fetch = AsyncMock(return_value={"status": "error", "message": "quota"})
+
+        pages = [page async for page in iter_pages(fetch, lambda o, n: (o, n), FIELDS)]
+
+        assert pages == []
+
+
+class TestStreamingAnalyzers:
+    """Test analyzers reduce pages without materializing them."""
+
+    async def test_search_term_waste_across_pages(self):
+        """Test counts and top 10 are computed over every page."""
+        rows = [
+            {
+                "search_term": f"term {i}",
+                "metrics": {
+                    "cost": float(i % 40),
+                    "clicks": 10,
+                    "impressions": 500,
+                    "conversions": 1.0 if i % 7 == 0 else 0.0,
+                },
+            }
+            for i in range(1200)
+        ]
+
+        async def get_search_terms(request):
+            return await _paged(rows)((request.offset, request.limit))
+
+        with patch("paidsearchnav_mcp.server.get_search_terms") as mock_get_st:
+            mock_get_st.fn = get_search_terms
+            result = await SearchTermWasteAnalyzer().analyze(
+                "1234567890", "2025-01-01", "2025-01-31"
+            )
+
+        wasteful = [
+            row
+            for row in rows
+            if row["metrics"]["conversions"] == 0 and row["metrics"]["cost"] >= 10
+        ]
+        expected = sorted(
+            wasteful, key=lambda row: row["metrics"]["cost"], reverse=True
+        )
+        assert result.total_records_analyzed == 1200
+        assert [r["search_term"] for r in result.top_recommendations] == [
+            row["search_term"] for row in expected[:10]
+        ]
+        assert f"{len(wasteful)} search terms" in result.primary_issue
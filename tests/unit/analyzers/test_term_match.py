@@ -0,0 +1,112 @@
+"""Tests for close-variant search term to keyword matching."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from paidsearchnav_mcp.analyzers.frame import DictionaryColumn
+from paidsearchnav_mcp.analyzers.keyword_match import KeywordMatchAnalyzer
+from paidsearchnav_mcp.analyzers.term_match import (
+    close_variant_key,
+    exact_close_variants,
+    stem_token,
+)
+
+
+class TestCloseVariantKey:
+    """Test close-variant folding."""
+
+    @pytest.mark.parametrize(
+        "variant",
+        [
+            "Running Shoes",
+            "running shoe",
+            "shoes running",
+            "running-shoes!",
+            "shoes for running",
+            "  RUNNING   SHOES ",
+        ],
+    )
+    def test_variants_share_a_key(self, variant):
+        """Test case, punctuation, plurals, word order and function words fold."""
+        assert close_variant_key(variant) == close_variant_key("running shoes")
+
+    def test_different_terms_stay_apart(self):
+        """Test added content words and accents are handled distinctly."""
+        assert close_variant_key("best running shoes") != close_variant_key(
+            "running shoes"
+        )
+        assert close_variant_key("Café & Bar") == close_variant_key("cafe bar")
+        assert close_variant_key("the") == "the"
+        assert close_variant_key("") == ""
+
+    @pytest.mark.parametrize(
+        ("token", "stem"),
+        [
+            ("batteries", "battery"),
+            ("boxes", "box"),
+            ("glasses", "glass"),
+            ("shoes", "shoe"),
+            ("bus", "bus"),
+            ("gas", "gas"),
+        ],
+    )
+    def test_stem_token(self, token, stem):
+        """Test plural stemming leaves singular words ending in s alone."""
+        assert stem_token(token) == stem
+
+    def test_exact_close_variants_mask(self):
+        """Test row-aligned matching ignores rows without a keyword."""
+        keywords = DictionaryColumn.encode(["running shoes", "running shoes", ""])
+        terms = DictionaryColumn.encode(["shoes running", "best running shoes", ""])
+
+        assert exact_close_variants(keywords, terms).tolist() == [True, False, False]
+
+
+class TestKeywordMatchJoin:
+    """Test the analyzer joins search terms to their triggering keywords."""
+
+    async def test_finds_opportunity_from_segmented_search_terms(self):
+        """Test close variants of the triggering keyword count as exact."""
+        keywords = {
+            "status": "success",
+            "data": [
+                {
+                    "keyword_text": "Running Shoes",
+                    "match_type": "BROAD",
+                    "impressions": 1000,
+                    "cost": 400.0,
+                    "conversions": 10.0,
+                    "conversion_value": 2000.0,
+                }
+            ],
+            "metadata": {"pagination": {"has_more": False}},
+        }
+        terms = ["running shoes", "running shoe", "shoes running", "trail shoes"]
+        search_terms = {
+            "status": "success",
+            "data": [
+                {"search_term": term, "keyword_text": "running shoes", "metrics": {}}
+                for term in terms
+            ],
+            "metadata": {"pagination": {"has_more": False}},
+        }
+
+        with (
+            patch("paidsearchnav_mcp.server.get_keywords") as mock_keywords,
+            patch("paidsearchnav_mcp.server.get_search_terms") as mock_terms,
+        ):
+            mock_keywords.fn = AsyncMock(return_value=keywords)
+            mock_terms.fn = AsyncMock(return_value=search_terms)
+            result = await KeywordMatchAnalyzer().analyze(
+                "1234567890", "2025-01-01", "2025-01-31"
+            )
+
+        assert mock_terms.fn.call_args.args[0].include_keyword is True
+        (recommendation,) = [
+            r
+            for r in result.top_recommendations
+            if r["recommended_match_type"] == "EXACT"
+        ]
+        assert recommendation["keyword"] == "running shoes"
+        assert recommendation["exact_match_ratio"] == 0.75
@@ -0,0 +1,176 @@
+"""Tests for day x entity panels and the trend analyzer."""
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from paidsearchnav_mcp.analyzers.frame import DAILY_FIELDS, MetricsFrame
+from paidsearchnav_mcp.analyzers.incremental import SUMMARIES
+from paidsearchnav_mcp.analyzers.timeseries import (
+    DailyPanel,
+    change_points,
+    ratio,
+    rolling_sum,
+)
+from paidsearchnav_mcp.analyzers.trends import TrendAnalyzer
+from paidsearchnav_mcp.server import analyze_performance_trends
+
+START = date(2025, 1, 1)
+
+
+@pytest.fixture(autouse=True)
+def clear_summaries():
+    SUMMARIES.clear()
+    yield
+    SUMMARIES.clear()
+
+
+def _day(offset, entity, cost, conversions, value=0.0):
+    return {
+        "date": (START + timedelta(days=offset)).isoformat(),
+        "entity_id": entity,
+        "entity_name": f"Campaign {entity}",
+        "campaign_name": f"Campaign {entity}",
+        "cost": cost,
+        "conversions": conversions,
+        "conversion_value": value,
+    }
+
+
+class TestDailyPanel:
+    """Test scattering sparse rows into a dense panel."""
+
+    def test_missing_days_are_zero_and_out_of_range_dropped(self):
+        """Test gaps, repeated days, bad dates and out-of-range days."""
+        rows = [
+            _day(0, "a", 1.0, 0),
+            _day(0, "a", 2.0, 0),
+            _day(2, "b", 5.0, 1),
+            _day(9, "b", 7.0, 1),
+            {**_day(1, "a", 4.0, 0), "date": ""},
+            {**_day(1, "a", 8.0, 0), "date": "2025-13-01"},
+            {**_day(1, "b", 16.0, 0), "date": "not a date"},
+        ]
+        frame = MetricsFrame.from_records(rows, DAILY_FIELDS)
+        panel = DailyPanel.from_frame(
+            frame, START, START + timedelta(days=3), ("cost",)
+        )
+
+        assert len(panel) == 4
+        assert panel.entities.tolist() == ["a", "b"]
+        assert panel["cost"].tolist() == [
+            [3.0, 0.0],
+            [0.0, 0.0],
+            [0.0, 5.0],
+            [0.0, 0.0],
+        ]
+
+
+class TestWindows:
+    """Test rolling sums and ratios."""
+
+    def test_rolling_sum_matches_slices(self):
+        """Test every row sums its trailing window."""
+        values = np.arange(20.0).reshape(10, 2)
+        sums = rolling_sum(values, 3)
+        for t in range(10):
+            assert (
+                sums[t].tolist() == values[max(0, t - 2) : t + 1].sum(axis=0).tolist()
+            )
+
+    def test_ratio_is_nan_without_denominator(self):
+        """Test a zero denominator gives NaN rather than inf."""
+        assert np.isnan(ratio(np.array([5.0, 1.0]), np.array([0.0, 2.0]))).tolist() == [
+            True,
+            False,
+        ]
+
+
+class TestChangePoints:
+    """Test vectorized mean-shift detection."""
+
+    def test_finds_shift_in_each_column(self):
+        """Test a drop is located and scored while a flat column is not."""
+        rng = np.random.default_rng(7)
+        values = rng.poisson(20, (30, 2)).astype(float)
+        values[21:, 1] = rng.poisson(5, 9)
+
+        shifts = change_points(values)
+
+        assert shifts.index[1] == 21
+        assert shifts.score[1] < -4
+        assert shifts.after[1] < shifts.before[1]
+        assert abs(shifts.score[0]) < 4
+
+    def test_short_series_has_no_change(self):
+        """Test series shorter than two segments are not split."""
+        shifts = change_points(np.ones((4, 3)), min_segment=3)
+        assert shifts.score.tolist() == [0.0, 0.0, 0.0]
+
+
+async def _analyze(rows, **settings):
+    async def get_daily_performance(request):
+        assert request.level == settings.get("level", "CAMPAIGN")
+        return {"status": "success", "data": rows}
+
+    with patch("paidsearchnav_mcp.server.get_daily_performance") as mock_fetch:
+        mock_fetch.fn = get_daily_performance
+        return await TrendAnalyzer(**settings).analyze(
+            "1234567890", START.isoformat(), (START + timedelta(days=27)).isoformat()
+        )
+
+
+class TestTrendAnalyzer:
+    """Test week-over-week deterioration detection."""
+
+    async def test_flags_campaign_whose_conversions_dropped(self):
+        """Test a conversion drop is ranked, dated and costed."""
+        rows = []
+        for day in range(28):
+            # Steady campaign
+            rows.append(_day(day, "1", 100.0, 10, 400.0))
+            # Same spend, conversions collapse from day 21
+            rows.append(_day(day, "2", 100.0, 10 if day < 21 else 2, 300.0))
+
+        result = await _analyze(rows)
+
+        (recommendation,) = result.top_recommendations
+        assert recommendation["entity_id"] == "2"
+        assert recommendation["cpa"] == {"previous": 10.0, "latest": 50.0}
+        assert recommendation["change_point"]["date"] == "2025-01-22"
+        # $700 spent for 14 conversions that used to cost $140, every week
+        assert recommendation["estimated_savings"] == pytest.approx(560 * 30 / 7)
+        assert result.total_records_analyzed == 56
+        assert "Account CPA rose" in result.primary_issue
+
+    async def test_zero_conversions_points_at_tracking(self):
+        """Test an entity that stopped converting is sent to tracking checks."""
+        rows = [_day(day, "1", 20.0, 1 if day < 21 else 0) for day in range(28)]
+
+        result = await _analyze(rows)
+
+        (recommendation,) = result.top_recommendations
+        assert recommendation["cpa"]["latest"] is None
+        assert recommendation["action"] == "Check conversion tracking and landing pages"
+
+    async def test_short_range_is_rejected_without_fetching(self):
+        """Test ranges shorter than two windows return early."""
+        with patch("paidsearchnav_mcp.server.get_daily_performance") as mock_fetch:
+            mock_fetch.fn = None  # Would fail if called
+            result = await TrendAnalyzer(window=14).analyze(
+                "1234567890", "2025-01-01", "2025-01-20"
+            )
+        assert result.top_recommendations == []
+        assert "too short" in result.primary_issue
+
+    @pytest.mark.parametrize("window_days", [0, -1, 32])
+    async def test_tool_rejects_invalid_window(self, window_days):
+        """Test the tool reports a window outside the date range as bad input."""
+        result = await analyze_performance_trends.fn(
+            "1234567890", "2025-01-01", "2025-01-31", window_days=window_days
+        )
+
+        assert result["error_code"] == "INVALID_INPUT"
+        assert "window_days" in result["message"]
@@ -0,0 +1,334 @@
+"""Tests for the asyncio-native circuit breaker."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from paidsearchnav_mcp.clients.google.client import GoogleAdsAPIClient
+from paidsearchnav_mcp.core.circuit_breaker import (
+    AsyncCircuitBreaker,
+    AsyncGoogleAdsCircuitBreaker,
+    CircuitBreakerRegistry,
+    ConfigValidationError,
+)
+from paidsearchnav_mcp.core.config import CircuitBreakerConfig
+from paidsearchnav_mcp.core.exceptions import (
+    APIError,
+    AuthenticationError,
+    CircuitOpenError,
+    RateLimitError,
+)
+
+
+def _expire_open_state(breaker: AsyncCircuitBreaker) -> None:
+    """Pretend the recovery timeout has elapsed."""
+    breaker._opened_at = time.monotonic() - breaker.config.recovery_timeout - 1
+
+
+class TestAsyncCircuitBreaker:
+    """Test AsyncCircuitBreaker functionality."""
+
+    async def test_call_success_tracking(self):
+        """Test successful coroutine calls are counted."""
+        breaker = AsyncCircuitBreaker(CircuitBreakerConfig(), name="test")
+
+        async def succeed():
+            return "success"
+
+        assert await breaker.call(succeed) == "success"
+        assert breaker.metrics["total_calls"] == 1
+        assert breaker.metrics["failed_calls"] == 0
+        assert breaker.state == "closed"
+
+    async def test_opens_after_threshold_and_rejects(self):
+        """Test the circuit opens after the failure threshold and rejects calls."""
+        config = CircuitBreakerConfig(failure_threshold=2)
+        breaker = AsyncCircuitBreaker(config, name="test")
+
+        async def fail():
+            raise APIError("boom")
+
+        for _ in range(2):
+            with pytest.raises(APIError):
+                await breaker.call(fail)
+
+        assert breaker.state == "open"
+        assert breaker.metrics["circuit_opened_count"] == 1
+
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(fail)
+        assert breaker.metrics["rejected_calls"] == 1
+        assert breaker.metrics["total_calls"] == 2
+
+    async def test_half_open_limits_concurrent_trials(self):
+        """Test only half_open_max_calls trial calls run while half-open."""
+        config = CircuitBreakerConfig(
+            failure_threshold=1, success_threshold=2, half_open_max_calls=2
+        )
+        breaker = AsyncCircuitBreaker(config, name="test")
+
+        async def fail():
+            raise APIError("boom")
+
+        with pytest.raises(APIError):
+            await breaker.call(fail)
+        _expire_open_state(breaker)
+
+        release = asyncio.Event()
+
+        async def slow_success():
+            await release.wait()
+            return "ok"
+
+        trials = [asyncio.create_task(breaker.call(slow_success)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert breaker.state == "half_open"
+        assert breaker.metrics["half_open_in_flight"] == 2
+
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(slow_success)
+
+        release.set()
+        assert await asyncio.gather(*trials) == ["ok", "ok"]
+        assert breaker.state == "closed"
+
+    async def test_failed_trial_reopens_circuit(self):
+        """Test a failing half-open trial re-opens the circuit."""
+        breaker = AsyncCircuitBreaker(
+            CircuitBreakerConfig(failure_threshold=1), name="test"
+        )
+
+        async def fail():
+            raise APIError("boom")
+
+        with pytest.raises(APIError):
+            await breaker.call(fail)
+        _expire_open_state(breaker)
+
+        with pytest.raises(APIError):
+            await breaker.call(fail)
+        assert breaker.state == "open"
+        assert breaker.metrics["circuit_opened_count"] == 2
+        assert breaker.metrics["half_open_in_flight"] == 0
+
+    async def test_reset_lets_in_flight_trials_release_their_slots(self):
+        """Test resetting during a trial does not drive the count negative."""
+        breaker = AsyncCircuitBreaker(
+            CircuitBreakerConfig(failure_threshold=1), name="test"
+        )
+
+        async def fail():
+            raise APIError("boom")
+
+        with pytest.raises(APIError):
+            await breaker.call(fail)
+        _expire_open_state(breaker)
+
+        release = asyncio.Event()
+
+        async def slow_success():
+            await release.wait()
+            return "ok"
+
+        trial = asyncio.create_task(breaker.call(slow_success))
+        await asyncio.sleep(0)
+        breaker.reset()
+        assert breaker.metrics["half_open_in_flight"] == 1
+
+        release.set()
+        assert await trial == "ok"
+        assert breaker.state == "closed"
+        assert breaker.metrics["half_open_in_flight"] == 0
+
+    async def test_cancellation_is_not_a_failure(self):
+        """Test cancelled calls neither fail nor leak trial slots."""
+        breaker = AsyncCircuitBreaker(
+            CircuitBreakerConfig(failure_threshold=1), name="test"
+        )
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        task = asyncio.create_task(breaker.call(hang))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert breaker.state == "closed"
+        assert breaker.metrics["failed_calls"] == 0
+
+    async def test_decorates_coroutine_function(self):
+        """Test decorating a coroutine function."""
+        breaker = AsyncCircuitBreaker(CircuitBreakerConfig(), name="test")
+
+        @breaker
+        async def double(value):
+            return value * 2
+
+        assert await double(21) == 42
+        assert breaker.metrics["total_calls"] == 1
+
+    async def test_decorates_async_generator_function(self):
+        """Test decorating an async generator counts failures mid-stream."""
+        breaker = AsyncCircuitBreaker(
+            CircuitBreakerConfig(failure_threshold=1), name="test"
+        )
+
+        @breaker
+        async def rows(fail_after):
+            for i in range(fail_after):
+                yield i
+            raise APIError("stream broke")
+
+        received = []
+        with pytest.raises(APIError):
+            async for row in rows(3):
+                received.append(row)
+
+        assert received == [0, 1, 2]
+        assert breaker.state == "open"
+
+    def test_rejects_sync_function(self):
+        """Test the async breaker refuses to wrap plain functions."""
+        breaker = AsyncCircuitBreaker(CircuitBreakerConfig(), name="test")
+
+        with pytest.raises(TypeError):
+            breaker(lambda: None)
+
+    async def test_disabled_passthrough(self):
+        """Test a disabled breaker never opens."""
+        breaker = AsyncCircuitBreaker(
+            CircuitBreakerConfig(enabled=False, failure_threshold=1), name="test"
+        )
+
+        async def fail():
+            raise APIError("boom")
+
+        for _ in range(3):
+            with pytest.raises(APIError):
+                await breaker.call(fail)
+        assert breaker.state == "closed"
+
+
+class TestCircuitBreakerRegistry:
+    """Test CircuitBreakerRegistry keying, eviction and metrics."""
+
+    @staticmethod
+    def _registry(max_breakers=10, failure_categories=None):
+        config = CircuitBreakerConfig(failure_threshold=1)
+        return CircuitBreakerRegistry(
+            lambda customer_id, operation: AsyncGoogleAdsCircuitBreaker(
+                config,
+                name=f"{customer_id}:{operation}",
+                failure_categories=failure_categories,
+            ),
+            max_breakers=max_breakers,
+        )
+
+    def test_breakers_keyed_by_customer_and_operation(self):
+        """Test each (customer, operation) pair gets its own breaker."""
+        registry = self._registry()
+
+        first = registry.get("111", "search")
+        assert registry.get("111", "search") is first
+        assert registry.get("111", "report") is not first
+        assert registry.get("222", "search") is not first
+        assert len(registry) == 3
+
+    async def test_evicts_least_recently_used_healthy_breaker(self):
+        """Test eviction skips open breakers and drops the LRU healthy one."""
+        registry = self._registry(max_breakers=2)
+
+        async def fail():
+            raise APIError("boom")
+
+        broken = registry.get("111", "search")
+        with pytest.raises(APIError):
+            await broken.call(fail)
+        healthy = registry.get("222", "search")
+
+        registry.get("333", "search")
+
+        assert registry.get("111", "search") is broken
+        assert registry.get("222", "search") is not healthy
+        assert registry.metrics["evicted_count"] == 2
+
+    async def test_failure_categories_filter_tripping_errors(self):
+        """Test only configured error categories open the circuit."""
+        registry = self._registry(failure_categories=frozenset({"rate_limit"}))
+        breaker = registry.get("111", "search")
+
+        async def raise_error(error):
+            raise error
+
+        with pytest.raises(AuthenticationError):
+            await breaker.call(raise_error, AuthenticationError("no access"))
+        assert breaker.state == "closed"
+
+        with pytest.raises(RateLimitError):
+            await breaker.call(raise_error, RateLimitError("slow down"))
+        assert breaker.state == "open"
+        assert breaker.metrics["rate_limit_error_count"] == 1
+
+    def test_unknown_failure_category_rejected(self):
+        """Test unknown error categories fail fast."""
+        with pytest.raises(ConfigValidationError):
+            AsyncGoogleAdsCircuitBreaker(
+                CircuitBreakerConfig(), failure_categories=frozenset({"bogus"})
+            )
+
+    async def test_aggregated_metrics(self):
+        """Test registry metrics aggregate state and call counts."""
+        registry = self._registry()
+
+        async def fail():
+            raise APIError("boom")
+
+        async def succeed():
+            return True
+
+        with pytest.raises(APIError):
+            await registry.get("111", "search").call(fail)
+        await registry.get("222", "search").call(succeed)
+
+        metrics = registry.metrics
+        assert metrics["breaker_count"] == 2
+        assert metrics["total_calls"] == 2
+        assert metrics["failed_calls"] == 1
+        assert metrics["states"] == {"closed": 1, "open": 1, "half_open": 0}
+        assert metrics["open_circuits"] == ["111:search"]
+
+
+class TestClientBreakerIsolation:
+    """Test GoogleAdsAPIClient isolates circuit breakers per customer."""
+
+    @pytest.fixture
+    def client(self):
+        return GoogleAdsAPIClient(
+            developer_token="token",
+            client_id="client-id",
+            client_secret="secret",
+            refresh_token="refresh",
+            circuit_breaker_config=CircuitBreakerConfig(failure_threshold=1),
+        )
+
+    async def test_failing_customer_does_not_open_other_circuits(self, client):
+        """Test one account's failures leave other accounts' circuits closed."""
+
+        def fail():
+            raise APIError("permission denied")
+
+        with pytest.raises(APIError):
+            await client._execute_async("1111111111", "search", fail)
+        with pytest.raises(APIError, match="temporarily unavailable"):
+            await client._execute_async("1111111111", "search", MagicMock())
+
+        assert await client._execute_async("2222222222", "search", lambda: 7) == 7
+        assert await client._execute_async("1111111111", "report", lambda: 8) == 8
+
+        registry_metrics = client.circuit_breaker_metrics["breaker_registry"]
+        assert registry_metrics["open_circuits"] == ["1111111111:search"]
+        assert registry_metrics["breaker_count"] == 3
@@ -0,0 +1,218 @@
+"""Tests for the unified metrics registry and OpenMetrics exporter."""
+
+import urllib.request
+
+import pytest
+
+from paidsearchnav_mcp.clients.google.metrics import APIEfficiencyMetrics
+from paidsearchnav_mcp.core.circuit_breaker import (
+    AsyncCircuitBreaker,
+    BigQueryRetryHandler,
+    CircuitBreakerRegistry,
+)
+from paidsearchnav_mcp.core.config import CircuitBreakerConfig
+from paidsearchnav_mcp.core.exceptions import APIError
+from paidsearchnav_mcp.core.metrics_registry import (
+    OPENMETRICS_CONTENT_TYPE,
+    MetricsRegistry,
+    collect_api_efficiency,
+    collect_breaker_registry,
+    collect_cache_stats,
+    collect_retry_handlers,
+    start_metrics_server,
+)
+
+
+def _sample_lines(text: str) -> set[str]:
+    return {line for line in text.splitlines() if not line.startswith("#")}
+
+
+class TestInstruments:
+    """Test counters, gauges and histograms."""
+
+    def test_counter_renders_total_suffix(self):
+        """Test counters render with a _total sample and escaped labels."""
+        registry = MetricsRegistry()
+        counter = registry.counter("psn_test_calls", "Test calls.", ("operation",))
+        counter.inc(operation="search")
+        counter.inc(2, operation='say "hi"')
+
+        text = registry.render()
+
+        assert "# TYPE psn_test_calls counter" in text
+        assert 'psn_test_calls_total{operation="search"} 1' in text
+        assert 'psn_test_calls_total{operation="say \\"hi\\""} 2' in text
+        assert text.endswith("# EOF\n")
+
+    def test_counter_rejects_negative_and_wrong_labels(self):
+        """Test invalid counter updates fail fast."""
+        counter = MetricsRegistry().counter("psn_test", "Test.", ("operation",))
+
+        with pytest.raises(ValueError):
+            counter.inc(-1, operation="search")
+        with pytest.raises(ValueError):
+            counter.inc(customer_id="111")
+
+    def test_gauge_set_inc_dec(self):
+        """Test gauges move in both directions."""
+        gauge = MetricsRegistry().gauge("psn_in_flight", "In-flight calls.")
+        gauge.set(5)
+        gauge.inc(2)
+        gauge.dec(4)
+
+        assert gauge.value() == 3
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test histogram buckets, count and sum."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram(
+            "psn_wait_seconds", "Wait time.", ("operation",), buckets=(1, 5)
+        )
+        for value in (0.5, 2, 10):
+            histogram.observe(value, operation="search")
+
+        lines = _sample_lines(registry.render())
+
+        assert 'psn_wait_seconds_bucket{operation="search",le="1"} 1' in lines
+        assert 'psn_wait_seconds_bucket{operation="search",le="5"} 2' in lines
+        assert 'psn_wait_seconds_bucket{operation="search",le="+Inf"} 3' in lines
+        assert 'psn_wait_seconds_count{operation="search"} 3' in lines
+        assert 'psn_wait_seconds_sum{operation="search"} 12.5' in lines
+
+    def test_get_or_create_and_type_conflict(self):
+        """Test instruments are shared by name and types cannot clash."""
+        registry = MetricsRegistry()
+        counter = registry.counter("psn_shared", "Shared.")
+
+        assert registry.counter("psn_shared", "Shared.") is counter
+        with pytest.raises(ValueError):
+            registry.gauge("psn_shared", "Shared.")
+
+    def test_failing_collector_is_skipped(self):
+        """Test a broken collector does not blank the scrape."""
+        registry = MetricsRegistry()
+        registry.counter("psn_ok", "Still exported.").inc()
+
+        @registry.register_collector
+        def broken():
+            raise RuntimeError("source went away")
+
+        assert "psn_ok_total 1" in registry.render()
+
+
+class TestCollectors:
+    """Test bridges from existing metric holders."""
+
+    def test_api_efficiency_collector(self):
+        """Test API calls, rows and latency quantiles are exported."""
+        api_metrics = APIEfficiencyMetrics()
+        api_metrics.track_simple_call("search", "111", 0.5, record_count=200)
+        api_metrics.track_simple_call(
+            "search", "111", 2.0, success=False, error_type="Timeout"
+        )
+        registry = MetricsRegistry()
+        registry.register_collector(lambda: collect_api_efficiency(api_metrics))
+
+        lines = _sample_lines(registry.render())
+
+        assert (
+            'psn_google_ads_api_calls_total{operation="search",customer_id="111",'
+            'outcome="success"} 1' in lines
+        )
+        assert (
+            'psn_google_ads_api_calls_total{operation="search",customer_id="111",'
+            'outcome="error"} 1' in lines
+        )
+        assert (
+            'psn_google_ads_rows_decoded_total{operation="search",customer_id="111"}'
+            " 200" in lines
+        )
+        assert any(
+            line.startswith("psn_google_ads_api_latency_seconds{")
+            and 'quantile="0.99"' in line
+            for line in lines
+        )
+
+    async def test_breaker_registry_collector(self):
+        """Test breaker state counts and unhealthy circuits are exported."""
+        config = CircuitBreakerConfig(failure_threshold=1)
+        breakers = CircuitBreakerRegistry(
+            lambda customer_id, operation: AsyncCircuitBreaker(config, name="test")
+        )
+
+        async def fail():
+            raise APIError("boom")
+
+        with pytest.raises(APIError):
+            await breakers.get("111", "search").call(fail)
+        breakers.get("222", "search")
+
+        registry = MetricsRegistry()
+        registry.register_collector(
+            lambda: collect_breaker_registry(breakers.metrics, "google_ads")
+        )
+        lines = _sample_lines(registry.render())
+
+        assert 'psn_circuit_breakers{breaker="google_ads",state="open"} 1' in lines
+        assert 'psn_circuit_breakers{breaker="google_ads",state="closed"} 1' in lines
+        assert (
+            'psn_circuit_breaker_unhealthy{breaker="google_ads",customer_id="111",'
+            'operation="search",state="open"} 1' in lines
+        )
+        assert 'psn_circuit_breaker_failures_total{breaker="google_ads"} 1' in lines
+
+    def test_cache_and_retry_collectors(self):
+        """Test cache hit ratio and retry counters are exported."""
+        registry = MetricsRegistry()
+        registry.register_collector(
+            lambda: collect_cache_stats(
+                {"hits": 3, "misses": 1, "errors": 0, "hit_ratio": 0.75}, "redis"
+            )
+        )
+        registry.register_collector(
+            lambda: collect_retry_handlers(
+                {
+                    "bigquery": {
+                        "total_retries": 4,
+                        "successful_retries": 1,
+                        "failed_retries": 1,
+                        "quota_retry_count": 2,
+                        "timeout_retry_count": 1,
+                        "connection_retry_count": 0,
+                    },
+                    "export": BigQueryRetryHandler().metrics,
+                }
+            )
+        )
+        text = registry.render()
+        lines = _sample_lines(text)
+
+        assert 'psn_cache_requests_total{cache="redis",result="hit"} 3' in lines
+        assert 'psn_cache_hit_ratio{cache="redis"} 0.75' in lines
+        assert 'psn_bigquery_retry_attempts_total{handler="bigquery"} 4' in lines
+        assert 'psn_bigquery_retry_attempts_total{handler="export"} 0' in lines
+        assert text.count("# TYPE psn_bigquery_retry_attempts counter") == 1
+        assert (
+            'psn_bigquery_retry_errors_total{handler="bigquery",category="quota"} 2'
+            in lines
+        )
+
+
+class TestMetricsServer:
+    """Test the standalone HTTP endpoint."""
+
+    def test_serves_metrics(self):
+        """Test /metrics returns OpenMetrics text and other paths 404."""
+        registry = MetricsRegistry()
+        registry.counter("psn_scrapes", "Scrapes.").inc()
+        server = start_metrics_server(0, registry=registry)
+        base = f"http://127.0.0.1:{server.server_port}"
+        try:
+            with urllib.request.urlopen(f"{base}/metrics") as response:
+                assert response.headers["Content-Type"] == OPENMETRICS_CONTENT_TYPE
+                assert "psn_scrapes_total 1" in response.read().decode()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{base}/other")
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,168 @@
+"""Tests for OpenTelemetry-compatible tracing spans."""
+
+import asyncio
+import json
+
+import pytest
+
+from paidsearchnav_mcp.analyzers.base import AnalysisSummary, BaseAnalyzer
+from paidsearchnav_mcp.clients.google.client import GoogleAdsAPIClient
+from paidsearchnav_mcp.core.tracing import (
+    STATUS_ERROR,
+    InMemorySpanExporter,
+    OTLPFileSpanExporter,
+    configure_tracing,
+    get_current_span,
+    get_tracer,
+    start_span,
+    traced,
+)
+
+
+@pytest.fixture
+def exporter():
+    """Enable tracing into memory for the duration of a test."""
+    exporter = InMemorySpanExporter()
+    configure_tracing(exporter)
+    yield exporter
+    configure_tracing(None)
+
+
+def _by_name(exporter):
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+class TestTracer:
+    """Test span lifecycle and context propagation."""
+
+    def test_disabled_by_default(self):
+        """Test the default tracer hands out non-recording spans."""
+        assert not get_tracer().enabled
+        with start_span("ignored", {"rows": 1}) as span:
+            assert not span.is_recording()
+            assert not get_current_span().is_recording()
+
+    async def test_spans_nest_across_await_and_threads(self, exporter):
+        """Test child spans share the trace and point at their parent."""
+
+        def blocking_child():
+            with start_span("thread_child"):
+                pass
+
+        with start_span("root"):
+            with start_span("async_child"):
+                await asyncio.sleep(0)
+            await asyncio.to_thread(blocking_child)
+
+        spans = _by_name(exporter)
+        root = spans["root"]
+        assert root.parent_span_id == ""
+        for name in ("async_child", "thread_child"):
+            assert spans[name].trace_id == root.trace_id
+            assert spans[name].parent_span_id == root.span_id
+        assert not get_current_span().is_recording()
+
+    def test_exception_marks_span_failed(self, exporter):
+        """Test exceptions are recorded and re-raised."""
+        with pytest.raises(ValueError):
+            with start_span("failing"):
+                raise ValueError("bad input")
+
+        (span,) = exporter.get_finished_spans()
+        assert span.status == STATUS_ERROR
+        assert span.events[0]["attributes"]["exception.type"] == "ValueError"
+
+    async def test_traced_records_arguments_and_result(self, exporter):
+        """Test traced() records named arguments and result attributes."""
+
+        class Request:
+            customer_id = "1234567890"
+
+        @traced(
+            "tool.fetch",
+            record_args=("request.customer_id", "missing"),
+            result_attributes=lambda result: {"rows": len(result)},
+            source="test",
+        )
+        async def fetch(request):
+            return [1, 2, 3]
+
+        assert await fetch(Request()) == [1, 2, 3]
+
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "tool.fetch"
+        assert span.attributes == {
+            "source": "test",
+            "customer_id": "1234567890",
+            "rows": 3,
+        }
+
+    def test_otlp_file_exporter(self, tmp_path):
+        """Test spans are written as OTLP/JSON lines."""
+        path = tmp_path / "traces.jsonl"
+        configure_tracing(OTLPFileSpanExporter(str(path)))
+        try:
+            with start_span("parent"):
+                with start_span("child", {"rows": 10, "ratio": 0.5}):
+                    pass
+        finally:
+            configure_tracing(None)
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        spans = [
+            line["resourceSpans"][0]["scopeSpans"][0]["spans"][0] for line in lines
+        ]
+        child, parent = spans
+        assert child["parentSpanId"] == parent["spanId"]
+        assert child["traceId"] == parent["traceId"]
+        assert {"key": "rows", "value": {"intValue": "10"}} in child["attributes"]
+        assert int(child["endTimeUnixNano"]) >= int(child["startTimeUnixNano"])
+
+
+class TestInstrumentation:
+    """Test spans emitted by analyzers and the Google Ads client."""
+
+    async def test_analyzer_analyze_is_traced(self, exporter):
+        """Test BaseAnalyzer subclasses get an analysis span automatically."""
+
+        class StubAnalyzer(BaseAnalyzer):
+            async def analyze(self, customer_id, start_date, end_date, **kwargs):
+                return AnalysisSummary(
+                    total_records_analyzed=42,
+                    estimated_monthly_savings=0.0,
+                    primary_issue="none",
+                    top_recommendations=[{"a": 1}],
+                    implementation_steps=[],
+                    analysis_period=f"{start_date} to {end_date}",
+                    customer_id=customer_id,
+                )
+
+        await StubAnalyzer().analyze("1234567890", "2025-01-01", "2025-01-31")
+
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "analyzer.StubAnalyzer"
+        assert span.attributes["customer_id"] == "1234567890"
+        assert span.attributes["records_analyzed"] == 42
+        assert span.attributes["recommendations"] == 1
+
+    async def test_executor_work_nests_under_execute_span(self, exporter):
+        """Test spans opened in the executor thread attach to the API call."""
+        client = GoogleAdsAPIClient(
+            developer_token="token",
+            client_id="client-id",
+            client_secret="secret",
+            refresh_token="refresh",
+        )
+
+        def operation():
+            with start_span("google_ads.fetch_page") as span:
+                span.set_attribute("rows", 5)
+            return "ok"
+
+        assert await client._execute_async("1111111111", "search", operation) == "ok"
+
+        spans = _by_name(exporter)
+        execute = spans["google_ads.execute"]
+        assert spans["google_ads.fetch_page"].parent_span_id == execute.span_id
+        assert execute.attributes["customer_id"] == "1111111111"
+        assert execute.attributes["executor.queue_seconds"] >= 0
@@ -0,0 +1,93 @@
+"""Tests for the process-wide BigQuery client pool."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from paidsearchnav_mcp.clients.bigquery.client import BigQueryClient
+from paidsearchnav_mcp.clients.bigquery.pool import BigQueryClientPool
+
+
+@pytest.fixture
+def mock_bigquery():
+    """Mock bigquery.Client returning a new client per construction."""
+    with patch("paidsearchnav_mcp.clients.bigquery.pool.bigquery") as mock:
+        mock.Client.side_effect = lambda **kwargs: Mock(
+            project=kwargs["project"], _credentials=Mock(), _http=Mock()
+        )
+        yield mock
+
+
+@pytest.fixture
+def mock_service_account():
+    with patch("paidsearchnav_mcp.clients.bigquery.pool.service_account") as mock:
+        yield mock
+
+
+class TestBigQueryClientPool:
+    """Test client sharing and lifecycle."""
+
+    def test_reuses_client_per_project(self, mock_bigquery):
+        """Test one client is created per project and location."""
+        pool = BigQueryClientPool()
+
+        first = pool.get("project-a")
+        assert pool.get("project-a") is first
+        assert pool.get("project-a", location="EU") is not first
+        assert pool.get("project-b") is not first
+        assert mock_bigquery.Client.call_count == 3
+        assert len(pool) == 3
+
+    def test_projects_share_credentials_and_session(
+        self, mock_bigquery, mock_service_account
+    ):
+        """Test a credentials file is read once and its session reused."""
+        pool = BigQueryClientPool(max_connections=64)
+
+        first = pool.get("project-a", "/keys/sa.json")
+        pool.get("project-b", "/keys/sa.json")
+
+        mock_service_account.Credentials.from_service_account_file.assert_called_once_with(
+            "/keys/sa.json"
+        )
+        second_kwargs = mock_bigquery.Client.call_args_list[1].kwargs
+        assert second_kwargs["credentials"] is first._credentials
+        assert second_kwargs["_http"] is first._http
+        # The shared session's connection pool is sized once
+        ((scheme, adapter), _) = first._http.mount.call_args
+        assert scheme == "https://"
+        assert adapter._pool_maxsize == 64
+
+    def test_concurrent_first_use_creates_one_client(self, mock_bigquery):
+        """Test racing threads all get the same client."""
+        pool = BigQueryClientPool()
+
+        with ThreadPoolExecutor(8) as executor:
+            clients = list(executor.map(lambda _: pool.get("project-a"), range(32)))
+
+        assert all(client is clients[0] for client in clients)
+        assert mock_bigquery.Client.call_count == 1
+
+    def test_close_closes_and_empties(self, mock_bigquery):
+        """Test closing releases every client and later gets recreate them."""
+        pool = BigQueryClientPool()
+        first = pool.get("project-a")
+
+        pool.close()
+
+        first.close.assert_called_once()
+        assert len(pool) == 0
+        assert pool.get("project-a") is not first
+
+
+@patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}, clear=False)
+def test_bigquery_clients_share_pooled_client(mock_bigquery):
+    """Test per-request BigQueryClient wrappers reuse one underlying client."""
+    os.environ.pop("GOOGLE_APPLICATION_CREDENTIALS", None)
+
+    first, second = BigQueryClient(), BigQueryClient()
+
+    assert first.client is second.client
+    mock_bigquery.Client.assert_called_once_with(project="test-project")
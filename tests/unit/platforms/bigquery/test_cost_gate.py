@@ -0,0 +1,103 @@
+"""Tests for the BigQuery query cost gate and result cache keys."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from paidsearchnav_mcp.clients.bigquery.cost_gate import (
+    QueryCostError,
+    QueryCostGate,
+    is_cacheable,
+    normalize_sql,
+    result_cache_params,
+)
+
+GIB = 1024**3
+
+
+def _estimate(bytes_processed):
+    return {
+        "bytes_processed": bytes_processed,
+        "estimated_cost_usd": round(bytes_processed / 1024**4 * 6.25, 4),
+        "referenced_tables": ["p.d.t"],
+    }
+
+
+class TestNormalizeSql:
+    """Test SQL normalization for cache keys."""
+
+    def test_ignores_comments_whitespace_and_semicolons(self):
+        """Test formatting differences normalize to the same SQL."""
+        a = "SELECT a,\n  b -- columns\nFROM `p.d.t`  /* source */ LIMIT 10;"
+        b = "SELECT a, b FROM `p.d.t` LIMIT 10"
+
+        assert normalize_sql(a) == normalize_sql(b) == b
+
+    def test_keeps_literals_verbatim(self):
+        """Test whitespace and comment markers inside literals are kept."""
+        query = "SELECT 'a  b -- c' AS x"
+
+        assert normalize_sql(query) == query
+        assert normalize_sql("SELECT 'a b' AS x") != normalize_sql(query)
+
+    def test_non_deterministic_queries_are_not_cacheable(self):
+        """Test queries using the clock or randomness skip the cache."""
+        assert is_cacheable("SELECT * FROM t WHERE d = '2025-01-01'")
+        assert not is_cacheable("SELECT * FROM t WHERE d = CURRENT_DATE()")
+        assert not is_cacheable("SELECT RAND() FROM t")
+
+    def test_cache_key_changes_with_table_versions(self):
+        """Test a modified table invalidates the cached result."""
+        before = result_cache_params("p", "SELECT 1 FROM t", {"p.d.t": "v1"})
+        after = result_cache_params("p", "SELECT 1 FROM t", {"p.d.t": "v2"})
+
+        assert before != after
+
+
+class TestQueryCostGate:
+    """Test QueryCostGate."""
+
+    async def test_allows_query_within_budget_and_caps_billing(self):
+        """Test a query under budget runs capped at the budget."""
+        gate = QueryCostGate(max_bytes=10 * GIB)
+
+        assert await gate.check(_estimate(GIB)) == 10 * GIB
+
+    async def test_over_budget_requires_confirmation(self):
+        """Test a query over budget is refused until confirmed."""
+        gate = QueryCostGate(max_bytes=GIB)
+
+        with pytest.raises(QueryCostError) as exc_info:
+            await gate.check(_estimate(5 * GIB))
+
+        assert exc_info.value.requires_confirmation
+        assert exc_info.value.bytes_processed == 5 * GIB
+        assert await gate.check(_estimate(5 * GIB), confirmed=True) is None
+
+    async def test_uses_customer_budgets_from_cost_tracker(self):
+        """Test per-customer byte budgets and budget enforcement apply."""
+        tracker = Mock()
+        tracker.get_query_byte_budget.return_value = 2 * GIB
+        tracker.check_enhanced_budget_enforcement = AsyncMock(
+            return_value={"allowed": True}
+        )
+        gate = QueryCostGate(max_bytes=10 * GIB, cost_tracker=tracker)
+
+        assert await gate.check(_estimate(GIB), customer_id="c1") == 2 * GIB
+        with pytest.raises(QueryCostError):
+            await gate.check(_estimate(3 * GIB), customer_id="c1")
+        tracker.get_query_byte_budget.assert_called_with("c1", 10 * GIB)
+
+    async def test_exhausted_customer_budget_cannot_be_confirmed(self):
+        """Test budget enforcement refusals ignore confirmation."""
+        tracker = Mock()
+        tracker.get_query_byte_budget.return_value = 10 * GIB
+        tracker.check_enhanced_budget_enforcement = AsyncMock(
+            return_value={"allowed": False, "reason": "Emergency cost limit"}
+        )
+        gate = QueryCostGate(cost_tracker=tracker)
+
+        with pytest.raises(QueryCostError, match="Emergency") as exc_info:
+            await gate.check(_estimate(GIB), customer_id="c1", confirmed=True)
+
+        assert not exc_info.value.requires_confirmation
@@ -0,0 +1,167 @@
+"""Tests for non-blocking BigQuery job polling."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from paidsearchnav_mcp.clients.bigquery.jobs import (
+    FAST_POLLS,
+    AsyncJobManager,
+    backoff_interval,
+)
+from paidsearchnav_mcp.clients.bigquery.timeout_client import (
+    BigQueryTimeoutClient,
+    BigQueryTimeoutError,
+)
+from paidsearchnav_mcp.clients.bigquery.timeout_config import (
+    CustomerTier,
+    OperationTimeouts,
+)
+
+
+def _job(done_after: int | None = None):
+    """Mock job reporting done on poll ``done_after`` (never if None)."""
+    job = Mock()
+    job.job_id = "job-1"
+    job.error_result = None
+    polls = []
+
+    def done():
+        polls.append(time.monotonic())
+        return done_after is not None and len(polls) >= done_after
+
+    job.done.side_effect = done
+    job.polls = polls
+    return job
+
+
+class TestBackoffInterval:
+    """Test the poll schedule."""
+
+    def test_fast_polls_then_doubles_up_to_max(self):
+        """Test the interval is flat, then doubles, then caps."""
+        intervals = [backoff_interval(n, 1.0, 10.0) for n in range(1, 9)]
+
+        assert intervals[:FAST_POLLS] == [1.0] * FAST_POLLS
+        assert intervals[FAST_POLLS:] == [2.0, 4.0, 8.0, 10.0, 10.0]
+
+
+class TestAsyncJobManager:
+    """Test AsyncJobManager."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_many_jobs_with_one_poller(self):
+        """Test concurrent waits share one polling task."""
+        manager = AsyncJobManager()
+        jobs = [_job(done_after=3) for _ in range(20)]
+
+        waits = [asyncio.create_task(manager.wait(job, 5, 0.01)) for job in jobs]
+        await asyncio.sleep(0)
+        poller = manager._poller
+
+        assert await asyncio.gather(*waits) == jobs
+        assert manager._poller is poller
+        assert all(len(job.polls) == 3 for job in jobs)
+        assert manager.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_finished_job_returns_after_one_poll(self):
+        """Test a job that is already done is not waited on."""
+        manager = AsyncJobManager()
+        job = _job(done_after=1)
+
+        assert await manager.wait(job, 5, 10) is job
+        assert len(job.polls) == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_job(self):
+        """Test a timed-out wait stops polling and cancels the job."""
+        manager = AsyncJobManager()
+        job = _job()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await manager.wait(job, 0.05, 0.01)
+
+        job.cancel.assert_called_once()
+        assert manager.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_cancels_job(self):
+        """Test a cancelled caller (e.g. a disconnected client) cancels the job."""
+        manager = AsyncJobManager()
+        job = _job()
+
+        waiter = asyncio.create_task(manager.wait(job, 5, 0.01))
+        await asyncio.sleep(0.03)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.gather(*manager._cancellations)
+
+        job.cancel.assert_called_once()
+        assert manager.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_poll_error_propagates(self):
+        """Test an error reloading the job is raised to the waiter."""
+        manager = AsyncJobManager()
+        job = Mock()
+        job.done.side_effect = RuntimeError("reload failed")
+
+        with pytest.raises(RuntimeError, match="reload failed"):
+            await manager.wait(job, 5, 0.01)
+
+    @pytest.mark.asyncio
+    async def test_slow_poll_does_not_block_event_loop(self):
+        """Test the loop keeps running while done() blocks in a thread."""
+        manager = AsyncJobManager()
+        release = threading.Event()
+        job = Mock()
+        job.done.side_effect = lambda: release.wait(5)
+
+        waiter = asyncio.create_task(manager.wait(job, 5, 0.01))
+        ticks = 0
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            ticks += 1
+        release.set()
+
+        assert ticks == 5
+        assert await waiter is job
+
+
+class TestQueryWithTimeout:
+    """Test BigQueryTimeoutClient.query_with_timeout on the job manager."""
+
+    @pytest.fixture
+    def timeout_client(self):
+        client = BigQueryTimeoutClient(Mock(), CustomerTier.STANDARD)
+        # Sub-second values keep the test fast
+        config = OperationTimeouts(query_timeout=0.1, job_poll_interval=0.01)
+        with patch.object(client, "_get_timeout_config", return_value=config):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_returns_finished_job(self, timeout_client):
+        """Test the job is returned once polling sees it done."""
+        job = _job(done_after=3)
+        timeout_client.client.query.return_value = job
+
+        assert await timeout_client.query_with_timeout("SELECT 1") is job
+        timeout_client.client.query.assert_called_once()
+        job.reload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_and_cancels(self, timeout_client):
+        """Test a job still running at the deadline is cancelled."""
+        job = _job()
+        timeout_client.client.query.return_value = job
+
+        with pytest.raises(BigQueryTimeoutError, match="Query timed out after"):
+            await timeout_client.query_with_timeout("SELECT 1")
+
+        job.cancel.assert_called_once()
+        timeout_client.client.query.assert_called_once()
@@ -1,10 +1,20 @@
 """Tests for BigQuery schema migrations."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from google.cloud import bigquery
 
-from paidsearchnav_mcp.platforms.bigquery.migrations import BigQueryMigrations
+from paidsearchnav_mcp.clients.bigquery.migrations import (
+    BigQueryMigrations,
+    MigrationPlan,
+    TableChange,
+)
+from paidsearchnav_mcp.clients.bigquery.rollups import SourceState
+from paidsearchnav_mcp.clients.bigquery.schema import BigQueryTableSchema
 
 
 class TestBigQueryMigrations:
@@ -161,10 +171,10 @@ class TestBigQueryMigrations:
                 migrations, "create_table", return_value=True
             ) as mock_create_table,
             patch(
-                "paidsearchnav.platforms.bigquery.schema.BigQueryTableSchema.get_all_schemas"
+                "paidsearchnav_mcp.clients.bigquery.schema.BigQueryTableSchema.get_all_schemas"
             ) as mock_schemas,
             patch(
-                "paidsearchnav.platforms.bigquery.schema.BigQueryTableSchema.get_table_configurations"
+                "paidsearchnav_mcp.clients.bigquery.schema.BigQueryTableSchema.get_table_configurations"
             ) as mock_configs,
         ):
             # Mock schemas and configurations
@@ -311,10 +321,10 @@ class TestBigQueryMigrations:
             patch.object(migrations, "drop_table", return_value=True) as mock_drop,
             patch.object(migrations, "create_table", return_value=True) as mock_create,
             patch(
-                "paidsearchnav.platforms.bigquery.schema.BigQueryTableSchema.get_all_schemas"
+                "paidsearchnav_mcp.clients.bigquery.schema.BigQueryTableSchema.get_all_schemas"
             ) as mock_schemas,
             patch(
-                "paidsearchnav.platforms.bigquery.schema.BigQueryTableSchema.get_table_configurations"
+                "paidsearchnav_mcp.clients.bigquery.schema.BigQueryTableSchema.get_table_configurations"
             ) as mock_configs,
         ):
             mock_schemas.return_value = {"test_table": [MagicMock()]}
@@ -342,10 +352,266 @@ class TestBigQueryMigrations:
     async def test_recreate_table_unknown(self, migrations):
         """Test recreation of unknown table."""
         with patch(
-            "paidsearchnav.platforms.bigquery.schema.BigQueryTableSchema.get_all_schemas"
+            "paidsearchnav_mcp.clients.bigquery.schema.BigQueryTableSchema.get_all_schemas"
         ) as mock_schemas:
             mock_schemas.return_value = {}
 
             result = await migrations.recreate_table("unknown_table")
 
             assert result is False
+
+    @pytest.mark.asyncio
+    async def test_create_rollup_tables(self, migrations):
+        """Test rollup tables are created in refresh order."""
+        with (
+            patch.object(migrations, "ensure_dataset_exists", return_value=True),
+            patch.object(migrations, "_run_rollup_job", AsyncMock()) as mock_run,
+        ):
+            result = await migrations.create_rollup_tables()
+
+        assert result == {"search_terms_daily": True, "search_terms_weekly": True}
+        state_sql, daily_sql, weekly_sql = (
+            call.args[0] for call in mock_run.call_args_list
+        )
+        assert "rollup_refresh_state" in state_sql
+        assert "FROM `test-project.test_dataset.search_terms`" in daily_sql
+        assert "FROM `test-project.test_dataset.search_terms_daily`" in weekly_sql
+        assert "PARTITION BY date CLUSTER BY customer_id, campaign_id" in weekly_sql
+
+    @pytest.mark.asyncio
+    async def test_refresh_rollup_merges_stale_partitions_in_batches(self, migrations):
+        """Test only stale partitions are merged, a batch per statement."""
+        modified = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        stale = [date(2025, 1, 1) + timedelta(days=i) for i in range(40)]
+        sources = {d: SourceState(modified, 1) for d in stale}
+        fresh = {date(2024, 12, 31): SourceState(modified, 1)}
+        job = MagicMock(num_dml_affected_rows=10, total_bytes_processed=100)
+
+        with (
+            patch.object(
+                migrations,
+                "_rollup_source_state",
+                AsyncMock(return_value={**sources, **fresh}),
+            ),
+            patch.object(
+                migrations, "_rollup_watermarks", AsyncMock(return_value=fresh)
+            ),
+            patch.object(
+                migrations, "_run_rollup_job", AsyncMock(return_value=job)
+            ) as mock_run,
+        ):
+            result = await migrations.refresh_rollup("search_terms_daily")
+
+        assert result["rows_affected"] == 20
+        assert len(result["partitions"]) == 40
+        merges = [
+            call.args
+            for call in mock_run.call_args_list
+            if call.args[0].startswith(
+                "MERGE `test-project.test_dataset.search_terms_daily`"
+            )
+        ]
+        assert len(merges) == 2
+        sql, job_config = merges[1]
+        params = {p.name: p for p in job_config.query_parameters}
+        assert params["partitions"].values == stale[31:]
+        assert params["start_date"].value == date(2025, 2, 1)
+        assert params["end_date"].value == date(2025, 2, 9)
+
+    @pytest.mark.asyncio
+    async def test_refresh_rollup_records_watermarks_after_merge(self, migrations):
+        """Test each merged batch records the source state it was read from."""
+        modified = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        sources = {date(2025, 1, 1): SourceState(modified, 1)}
+        watermarks = {date(2025, 1, 2): SourceState(modified, 1)}
+        job = MagicMock(num_dml_affected_rows=0, total_bytes_processed=0)
+
+        with (
+            patch.object(
+                migrations, "_rollup_source_state", AsyncMock(return_value=sources)
+            ),
+            patch.object(
+                migrations, "_rollup_watermarks", AsyncMock(return_value=watermarks)
+            ),
+            patch.object(
+                migrations, "_run_rollup_job", AsyncMock(return_value=job)
+            ) as mock_run,
+        ):
+            result = await migrations.refresh_rollup("search_terms_daily")
+
+        # The deleted source partition is rebuilt (emptied) along with the new one
+        assert result["partitions"] == ["2025-01-01", "2025-01-02"]
+        merge_sql, record = mock_run.call_args_list[-2:]
+        assert merge_sql.args[0].startswith(
+            "MERGE `test-project.test_dataset.search_terms_daily`"
+        )
+        sql, job_config = record.args
+        assert sql.startswith("MERGE `test-project.test_dataset.rollup_refresh_state`")
+        params = {p.name: p for p in job_config.query_parameters}
+        assert params["rollup"].value == "search_terms_daily"
+        recorded = {
+            s.struct_values["partition_date"]: (
+                s.struct_values["source_modified"],
+                s.struct_values["source_partitions"],
+            )
+            for s in params["watermarks"].values
+        }
+        assert recorded == {
+            date(2025, 1, 1): (modified, 1),
+            date(2025, 1, 2): (None, 0),
+        }
+
+    @pytest.mark.asyncio
+    async def test_refresh_rollup_for_customer_needs_dates(self, migrations):
+        """Test customer-scoped refreshes rebuild the given dates only."""
+        job = MagicMock(num_dml_affected_rows=1, total_bytes_processed=1)
+
+        with patch.object(
+            migrations, "_run_rollup_job", AsyncMock(return_value=job)
+        ) as mock_run:
+            refused = await migrations.refresh_rollup(
+                "search_terms_weekly", customer_id="123"
+            )
+            result = await migrations.refresh_rollup(
+                "search_terms_weekly", dates=[date(2025, 6, 4)], customer_id="123"
+            )
+
+        assert "error" in refused
+        assert result["partitions"] == ["2025-06-02"]
+        sql, job_config = mock_run.call_args.args
+        assert "T.customer_id = @customer_id" in sql
+        assert "customer_id" in {p.name for p in job_config.query_parameters}
+
+
+def _column(table, name, data_type, partitioning=False, clustering=None):
+    return SimpleNamespace(
+        table_name=table,
+        column_name=name,
+        data_type=data_type,
+        is_partitioning_column="YES" if partitioning else "NO",
+        clustering_ordinal_position=clustering,
+    )
+
+
+class TestMigrationPlan:
+    """Test planning and applying migrations from INFORMATION_SCHEMA."""
+
+    @pytest.fixture
+    def migrations(self):
+        config = SimpleNamespace(
+            project_id="test-project", dataset_id="test_dataset", location="US"
+        )
+        return BigQueryMigrations(config)
+
+    @pytest.fixture
+    def desired(self):
+        schemas = {
+            "search_terms": [
+                bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
+                bigquery.SchemaField("customer_id", "STRING", mode="REQUIRED"),
+                bigquery.SchemaField("clicks", "INTEGER"),
+                bigquery.SchemaField("labels", "STRING", mode="REPEATED"),
+            ],
+            "keywords": [
+                bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
+                bigquery.SchemaField("cost", "FLOAT"),
+                bigquery.SchemaField("owner", "STRING", mode="REQUIRED"),
+            ],
+            "campaigns": [bigquery.SchemaField("date", "DATE")],
+            "ad_groups": [],
+        }
+        config = {"partition_field": "date", "cluster_fields": ["customer_id"]}
+        configs = {name: {**config, "partition_type": "DAY"} for name in schemas}
+        with (
+            patch.object(BigQueryTableSchema, "get_all_schemas", return_value=schemas),
+            patch.object(
+                BigQueryTableSchema, "get_table_configurations", return_value=configs
+            ),
+        ):
+            yield schemas
+
+    async def test_plan_diffs_every_table_in_one_query(self, migrations, desired):
+        """Test creates, alters and incompatible changes come from one query."""
+        rows = [
+            _column("search_terms", "date", "DATE", partitioning=True),
+            _column("search_terms", "customer_id", "STRING", clustering=1),
+            _column("search_terms", "clicks", "INT64"),
+            _column("keywords", "date", "DATE", partitioning=True),
+            _column("keywords", "cost", "NUMERIC(10, 2)", clustering=1),
+        ]
+        client = MagicMock()
+        client.query.return_value.result.return_value = rows
+        migrations._client = client
+
+        plan = await migrations.plan_migrations()
+
+        assert client.query.call_count == 1
+        assert "INFORMATION_SCHEMA.COLUMNS" in client.query.call_args.args[0]
+        assert plan.to_dict()["create"] == ["campaigns"]
+        assert plan.skipped == ["ad_groups"]
+        (alter,) = plan.by_action("alter")
+        assert [f.name for f in alter.add_columns] == ["labels"]
+        assert alter.cluster_fields is None
+        (incompatible,) = plan.by_action("incompatible")
+        assert incompatible.table == "keywords"
+        assert incompatible.problems == [
+            "column cost is NUMERIC(10, 2), expected FLOAT64",
+            "new column owner is REQUIRED",
+        ]
+
+    async def test_apply_runs_changes_with_bounded_concurrency(
+        self, migrations, desired
+    ):
+        """Test changes run concurrently, never more than max_concurrency."""
+        running = peak = 0
+
+        async def create_table(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True
+
+        plan = MigrationPlan(
+            changes=[TableChange(f"t{i}", "create") for i in range(5)]
+            + [TableChange("keywords", "incompatible", problems=["x"])]
+        )
+        desired.update({f"t{i}": desired["campaigns"] for i in range(5)})
+
+        with (
+            patch.object(
+                migrations, "ensure_dataset_exists", AsyncMock(return_value=True)
+            ),
+            patch.object(migrations, "create_table", side_effect=create_table),
+        ):
+            dry_run = await migrations.apply_migrations(plan, dry_run=True)
+            report = await migrations.apply_migrations(plan, max_concurrency=2)
+
+        assert dry_run["results"] == {}
+        assert report["results"] == {f"t{i}": True for i in range(5)}
+        assert report["plan"]["incompatible"] == {"keywords": ["x"]}
+        assert peak == 2
+
+    async def test_alter_adds_columns_and_clustering_in_one_update(self, migrations):
+        """Test an alter appends new columns and reclusters in one update."""
+        table = SimpleNamespace(
+            schema=[bigquery.SchemaField("date", "DATE")], clustering_fields=None
+        )
+        client = MagicMock()
+        client.get_table.return_value = table
+        migrations._client = client
+        change = TableChange(
+            "search_terms",
+            "alter",
+            add_columns=[bigquery.SchemaField("clicks", "INTEGER")],
+            cluster_fields=["customer_id"],
+        )
+
+        assert await migrations._alter_table(change) is True
+
+        client.update_table.assert_called_once_with(
+            table, ["schema", "clustering_fields"]
+        )
+        assert [f.name for f in table.schema] == ["date", "clicks"]
+        assert table.clustering_fields == ["customer_id"]
@@ -0,0 +1,162 @@
+"""Tests for partition- and cluster-pruning query planning."""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from google.api_core.exceptions import NotFound
+
+from paidsearchnav_mcp.clients.bigquery.analytics import BigQueryAnalyticsEngine
+from paidsearchnav_mcp.clients.bigquery.planner import (
+    PruningError,
+    QueryPlanner,
+    Rollup,
+    date_window,
+)
+from paidsearchnav_mcp.clients.bigquery.validator import QueryValidator
+
+
+def _client(bytes_processed=1024, existing=()):
+    client = Mock()
+    client.query.return_value = Mock(total_bytes_processed=bytes_processed)
+
+    def get_table(table_id):
+        if table_id.rsplit(".", 1)[-1] not in existing:
+            raise NotFound(table_id)
+        return Mock()
+
+    client.get_table.side_effect = get_table
+    return client
+
+
+def _build(source):
+    return (
+        f"SELECT search_term, {source.agg('SUM', 'cost')} FROM {source.table} "
+        f"WHERE {source.filter} GROUP BY 1"
+    )
+
+
+class TestPruningChecks:
+    """Test QueryValidator.pruning_problems."""
+
+    @pytest.mark.parametrize(
+        "where, expected",
+        [
+            ("customer_id = @c AND date BETWEEN @s AND @e", 0),
+            ("customer_id IN ('1', '2') AND date >= @s AND date <= @e", 0),
+            (
+                "customer_id = @c AND date >= DATE_SUB(CURRENT_DATE(), INTERVAL 30 DAY)",
+                1,
+            ),
+            ("date BETWEEN @s AND @e", 1),
+            ("campaign_id = @c", 2),
+        ],
+    )
+    def test_requires_bounded_partition_and_cluster_key(self, where, expected):
+        """Test open-ended ranges and missing cluster filters are reported."""
+        query = f"SELECT * FROM `p.ads.search_terms` WHERE {where}"
+
+        problems = QueryValidator.pruning_problems(
+            query, "ads.search_terms", "date", "customer_id"
+        )
+
+        assert len(problems) == expected
+
+
+class TestQueryPlanner:
+    """Test QueryPlanner."""
+
+    def test_scan_filter_puts_cluster_key_first(self):
+        """Test the generated predicate prunes by customer and date."""
+        planner = QueryPlanner("p", "ads")
+
+        assert planner.scan_filter("search_terms", alias="s") == (
+            "s.customer_id = @customer_id AND s.date BETWEEN @start_date AND @end_date"
+        )
+
+    def test_strict_planner_rejects_full_scans(self):
+        """Test a query without the scan filter raises."""
+        planner = QueryPlanner("p", "ads")
+        query = "SELECT * FROM `p.ads.keywords` WHERE clicks > 0"
+
+        with pytest.raises(PruningError, match="keywords"):
+            planner.verify(query, "keywords")
+        assert QueryPlanner("p", "ads", strict=False).verify(query, "keywords")
+
+    async def test_plan_dry_runs_with_query_parameters(self):
+        """Test the plan records the dry-run bytes using a copied job config."""
+        from google.cloud import bigquery
+
+        client = _client(bytes_processed=5000)
+        job_config = bigquery.QueryJobConfig(use_query_cache=True)
+
+        plan = await QueryPlanner("p", "ads").plan(
+            client, "search_terms", _build, {"search_term", "cost"}, job_config
+        )
+
+        assert plan.bytes_processed == 5000
+        assert not plan.uses_rollup
+        assert "`p.ads.search_terms`" in plan.query
+        dry_config = client.query.call_args.kwargs["job_config"]
+        assert dry_config.dry_run and not dry_config.use_query_cache
+        assert not job_config.dry_run
+
+    async def test_routes_to_existing_rollup_covering_columns(self):
+        """Test queries go to the first rollup that exists and has the columns."""
+        planner = QueryPlanner("p", "ads")
+        dimensions = frozenset({"customer_id", "date", "search_term"})
+        planner.register_rollup(
+            Rollup("search_terms_narrow", "search_terms", dimensions, frozenset())
+        )
+        planner.register_rollup(
+            Rollup("search_terms_missing", "search_terms", dimensions, {"cost"})
+        )
+        planner.register_rollup(
+            Rollup("search_terms_daily", "search_terms", dimensions, {"cost"})
+        )
+        client = _client(existing={"search_terms_daily"})
+        aggregates = {("SUM", "cost")}
+
+        plan = await planner.plan(
+            client, "search_terms", _build, set(dimensions), aggregates=aggregates
+        )
+        await planner.plan(
+            client, "search_terms", _build, set(dimensions), aggregates=aggregates
+        )
+
+        assert plan.table == "search_terms_daily"
+        assert plan.uses_rollup
+        assert "`p.ads.search_terms_daily`" in plan.query
+        # Existence is checked once per rollup, never for non-covering ones
+        assert client.get_table.call_count == 2
+
+
+async def test_analytics_queries_are_planned_with_date_parameters():
+    """Test analytics queries prune by customer and an explicit date window."""
+    client = _client()
+    client.query.return_value.result.return_value = []
+    authenticator = SimpleNamespace(get_client=AsyncMock(return_value=client))
+    config = SimpleNamespace(
+        project_id="p",
+        dataset_id="ads",
+        enable_query_cache=True,
+        max_query_bytes=10**9,
+    )
+    engine = BigQueryAnalyticsEngine(config, authenticator)
+
+    assert await engine.get_search_terms_insights("123", date_range=7) == []
+    assert await engine.get_keyword_bid_recommendations("123") == []
+
+    # A dry run and a run per query
+    assert client.query.call_count == 4
+    for call in client.query.call_args_list:
+        query = call.args[0]
+        assert "CURRENT_DATE" not in query
+        assert "customer_id = @customer_id" in query
+    params = {
+        p.name: p.value
+        for p in client.query.call_args_list[1].kwargs["job_config"].query_parameters
+    }
+    assert (params["start_date"], params["end_date"]) == date_window(7)
+    assert isinstance(params["end_date"], date)
@@ -0,0 +1,175 @@
+"""Tests for columnar BigQuery query results."""
+
+import os
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from paidsearchnav_mcp.clients.bigquery.client import BigQueryClient
+from paidsearchnav_mcp.clients.bigquery.results import (
+    QueryResult,
+    read_result,
+    to_json_value,
+)
+
+STAMP = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+class TestToJsonValue:
+    """Test conversion of BigQuery values for responses."""
+
+    def test_converts_non_json_types(self):
+        """Test dates, NUMERIC, BYTES and nested values become JSON types."""
+        assert to_json_value(STAMP) == "2025-01-02T03:04:05+00:00"
+        assert to_json_value(date(2025, 1, 2)) == "2025-01-02"
+        assert to_json_value(Decimal("1.50")) == 1.5
+        assert to_json_value(b"\x00\xff") == "AP8="
+        assert to_json_value({"at": [STAMP], "n": 1}) == {
+            "at": ["2025-01-02T03:04:05+00:00"],
+            "n": 1,
+        }
+
+
+class TestRowResults:
+    """Test results read without pyarrow."""
+
+    def test_truncates_at_max_results(self):
+        """Test reading stops after max_results rows and flags truncation."""
+        rows = iter([{"n": i} for i in range(10)])
+
+        result = read_result(rows, max_results=3, use_arrow=False)
+
+        assert result.truncated
+        assert not result.is_arrow
+        assert result.to_rows() == [{"n": 0}, {"n": 1}, {"n": 2}]
+        # Nothing past the first extra row was read
+        assert next(rows) == {"n": 4}
+
+    def test_slice_and_convert(self):
+        """Test slicing pages through rows and converts on output."""
+        result = QueryResult(rows=[{"at": STAMP, "n": i} for i in range(5)])
+
+        page = result.slice(3, 10)
+
+        assert len(page) == 2
+        assert page.to_rows()[0] == {"at": "2025-01-02T03:04:05+00:00", "n": 3}
+
+
+class TestArrowResults:
+    """Test results read as Arrow record batches."""
+
+    @pytest.fixture
+    def pa(self):
+        return pytest.importorskip("pyarrow")
+
+    def _rows(self, pa, batches):
+        read = []
+
+        def to_arrow_iterable(bqstorage_client=None):
+            for batch in batches:
+                read.append(batch)
+                yield batch
+
+        rows = Mock(schema=[])
+        rows.to_arrow_iterable = to_arrow_iterable
+        return rows, read
+
+    def test_stops_reading_after_max_results(self, pa):
+        """Test batches past max_results are not downloaded."""
+        batches = [
+            pa.record_batch({"n": list(range(i, i + 4))}) for i in range(0, 40, 4)
+        ]
+        rows, read = self._rows(pa, batches)
+
+        result = read_result(rows, max_results=6, use_arrow=True)
+
+        assert result.is_arrow and result.truncated
+        assert len(read) == 2
+        assert [r["n"] for r in result.to_rows()] == list(range(6))
+
+    def test_slices_share_memory_and_convert_columns(self, pa):
+        """Test pages are zero-copy views and timestamps become strings."""
+        table = pa.table(
+            {
+                "at": pa.array([STAMP] * 4, pa.timestamp("us", tz="UTC")),
+                "n": [0, 1, 2, 3],
+            }
+        )
+        result = QueryResult(table)
+
+        page = result.slice(1, 2)
+
+        assert page.table.column("n").chunks[0].buffers()[1].address == (
+            table.column("n").chunks[0].buffers()[1].address
+        )
+        assert page.to_rows() == [
+            {"at": "2025-01-02T03:04:05+00:00", "n": 1},
+            {"at": "2025-01-02T03:04:05+00:00", "n": 2},
+        ]
+
+
+@pytest.mark.asyncio
+@patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}, clear=False)
+@patch("paidsearchnav_mcp.clients.bigquery.client.bigquery.Client")
+async def test_fetch_results_reports_truncation(mock_bigquery_client):
+    """Test fetch_results keeps max_results rows and flags the rest."""
+    os.environ.pop("GOOGLE_APPLICATION_CREDENTIALS", None)
+    mock_query_job = Mock()
+    mock_query_job.result.return_value = [{"n": i} for i in range(5)]
+    mock_bigquery_client.return_value.query.return_value = mock_query_job
+
+    client = BigQueryClient(use_arrow=False)
+    result = await client.fetch_results("SELECT n FROM t", max_results=2)
+
+    assert result.truncated
+    assert result.to_rows() == [{"n": 0}, {"n": 1}]
+
+
+def _paged_rows(rows, next_page_token, total_rows):
+    """Mock RowIterator over a single page."""
+    iterator = Mock(next_page_token=next_page_token, total_rows=total_rows)
+    iterator.pages = iter([rows])
+    return iterator
+
+
+@pytest.mark.asyncio
+@patch.dict(os.environ, {"GCP_PROJECT_ID": "test-project"}, clear=False)
+@patch("paidsearchnav_mcp.clients.bigquery.client.bigquery.Client")
+async def test_pages_through_job_without_rerunning_query(mock_bigquery_client):
+    """Test later pages are read from the finished job's destination table."""
+    os.environ.pop("GOOGLE_APPLICATION_CREDENTIALS", None)
+    bq = mock_bigquery_client.return_value
+    job = Mock(
+        job_id="job-1",
+        location="EU",
+        job_type="query",
+        error_result=None,
+        destination="project.dataset._anon",
+    )
+    job.done.return_value = True
+    bq.query.return_value = job
+    bq.get_job.return_value = job
+    bq.list_rows.side_effect = [
+        _paged_rows([{"n": 0}, {"n": 1}], "token-2", 3),
+        _paged_rows([{"n": 2}], None, 3),
+    ]
+
+    client = BigQueryClient(use_arrow=False)
+    first = await client.query_pages("SELECT n FROM t", page_size=2)
+    second = await client.fetch_page(
+        first.job_id, first.next_page_token, page_size=2, location=first.location
+    )
+
+    assert first.result.to_rows() == [{"n": 0}, {"n": 1}]
+    assert (first.job_id, first.next_page_token, first.total_rows) == (
+        "job-1",
+        "token-2",
+        3,
+    )
+    assert second.result.to_rows() == [{"n": 2}]
+    assert second.next_page_token is None
+    bq.query.assert_called_once()
+    bq.get_job.assert_called_once_with("job-1", location="EU")
+    assert bq.list_rows.call_args.kwargs == {"page_token": "token-2", "page_size": 2}
@@ -0,0 +1,154 @@
+"""Tests for parser-based BigQuery query validation."""
+
+from unittest.mock import patch
+
+import pytest
+
+from paidsearchnav_mcp.clients.bigquery import validator
+from paidsearchnav_mcp.clients.bigquery.validator import QueryValidator
+
+EVENTS_QUERY = (
+    "SELECT e.campaign_id, SUM(e.cost) FROM `proj.ads.events` AS e "
+    "JOIN ads.campaigns AS c ON e.campaign_id = c.id "
+    "WHERE c.status = 'ENABLED' GROUP BY 1"
+)
+
+
+@pytest.fixture
+def parser():
+    """Skip unless sqlglot is installed."""
+    pytest.importorskip("sqlglot")
+
+
+class TestParsedValidation:
+    """Test validation on the parsed syntax tree."""
+
+    def test_classifies_statements(self, parser):
+        """Test only read-only queries pass, whatever the formatting."""
+        assert QueryValidator.validate_query(EVENTS_QUERY)["statement_type"] == (
+            "SELECT"
+        )
+        result = QueryValidator.validate_query("/* x */ DROP /* y */ TABLE ads.t")
+
+        assert result["valid"] is False
+        assert result["errors"] == ["Query contains disallowed operation: DROP TABLE"]
+
+    def test_rejects_statements_regexes_miss(self, parser):
+        """Test DML hidden behind a second statement or MERGE is rejected."""
+        assert not QueryValidator.validate_query("SELECT 1; SELECT 2")["valid"]
+        assert not QueryValidator.validate_query(
+            "MERGE ads.t USING ads.s ON t.id = s.id WHEN MATCHED THEN DELETE"
+        )["valid"]
+        assert not QueryValidator.validate_query("SELECT FROM WHERE")["valid"]
+
+    @pytest.mark.parametrize(
+        ("query", "label"),
+        [
+            ("EXECUTE IMMEDIATE 'DELETE FROM ads.t WHERE TRUE'", "EXECUTE IMMEDIATE"),
+            ("CALL ads.cleanup()", "CALL"),
+            ("DROP SCHEMA ads", "DROP SCHEMA"),
+            ("TRUNCATE TABLE ads.t", "TRUNCATE TABLE"),
+            ("DELETE FROM ads.t WHERE TRUE", "DELETE"),
+        ],
+    )
+    def test_labels_disallowed_statements(self, parser, query, label):
+        """Test error messages name the statement, not fragments of it."""
+        result = QueryValidator.validate_query(query)
+
+        assert result["valid"] is False
+        assert result["statement_type"] == label
+        assert result["errors"] == [f"Query contains disallowed operation: {label}"]
+
+    def test_rejects_external_query(self, parser):
+        """Test SQL sent to an external database through EXTERNAL_QUERY is refused."""
+        result = QueryValidator.validate_query(
+            "SELECT * FROM EXTERNAL_QUERY('conn', 'DELETE FROM x') LIMIT 5"
+        )
+
+        assert result["valid"] is False
+        assert result["errors"] == [
+            "Query contains disallowed operation: EXTERNAL_QUERY"
+        ]
+
+    def test_keywords_in_literals_are_not_operations(self, parser):
+        """Test a string mentioning DROP TABLE is not an error."""
+        result = QueryValidator.validate_query(
+            "SELECT id FROM ads.t WHERE note = 'drop table later' LIMIT 5"
+        )
+
+        assert result["valid"] is True
+        assert result["warnings"] == []
+
+    def test_extracts_referenced_tables_without_ctes(self, parser):
+        """Test CTE names are not reported as tables."""
+        query = "WITH recent AS (SELECT * FROM ads.events) SELECT * FROM recent"
+
+        assert QueryValidator.referenced_tables(query) == ["ads.events"]
+        assert set(QueryValidator.referenced_tables(EVENTS_QUERY)) == {
+            "proj.ads.events",
+            "ads.campaigns",
+        }
+
+    def test_parsed_queries_are_cached(self, parser):
+        """Test repeated validation reuses the parsed tree."""
+        validator._parse.cache_clear()
+
+        QueryValidator.validate_query(EVENTS_QUERY)
+        QueryValidator.validate_query(EVENTS_QUERY)
+        QueryValidator.missing_partition_filters(EVENTS_QUERY, {})
+
+        info = validator._parse.cache_info()
+        assert info.misses == 1
+        assert info.hits >= 2
+
+
+class TestPartitionFilters:
+    """Test partition-filter checks."""
+
+    def test_finds_tables_without_partition_filter(self, parser):
+        """Test a partitioned table read without its partition column is flagged."""
+        missing = QueryValidator.missing_partition_filters(
+            EVENTS_QUERY, {"ads.events": "event_date"}
+        )
+
+        assert missing == ["proj.ads.events"]
+
+    def test_validation_requires_partition_filters(self, parser):
+        """Test validation refuses unfiltered reads of partitioned tables."""
+        partition_columns = {"ads.events": "event_date"}
+        filtered = EVENTS_QUERY.replace(
+            "WHERE", "WHERE e.event_date >= '2025-01-01' AND"
+        )
+
+        refused = QueryValidator.validate_query(EVENTS_QUERY, partition_columns)
+        accepted = QueryValidator.validate_query(filtered, partition_columns)
+
+        assert refused["valid"] is False
+        assert refused["errors"] == [
+            "Query reads partitioned table proj.ads.events without a filter on "
+            "event_date; filter it so BigQuery can prune partitions"
+        ]
+        assert accepted["valid"] is True
+
+
+def test_regex_fallback_without_sqlglot():
+    """Test validation still works when sqlglot is not installed."""
+    with patch.object(validator, "SQLGLOT_AVAILABLE", False):
+        result = QueryValidator.validate_query("DROP TABLE ads.t")
+        tables = QueryValidator.referenced_tables(EVENTS_QUERY)
+        with pytest.raises(ImportError, match="sql"):
+            QueryValidator.missing_partition_filters(EVENTS_QUERY, {})
+
+    assert result["valid"] is False
+    assert tables == ["proj.ads.events", "ads.campaigns"]
+
+
+def test_regex_fallback_rejects_external_query():
+    """Test the regex fallback also refuses EXTERNAL_QUERY."""
+    with patch.object(validator, "SQLGLOT_AVAILABLE", False):
+        result = QueryValidator.validate_query(
+            "SELECT * FROM external_query ('conn', 'SELECT 1') LIMIT 5"
+        )
+
+    assert result["valid"] is False
+    assert result["errors"] == ["Query contains disallowed operation: EXTERNAL_QUERY"]
@@ -0,0 +1,140 @@
+"""Tests for rollup tables and routing analytics queries to them."""
+
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from google.api_core.exceptions import NotFound
+
+from paidsearchnav_mcp.clients.bigquery.analytics import BigQueryAnalyticsEngine
+from paidsearchnav_mcp.clients.bigquery.rollups import (
+    SourceState,
+    rollup_definitions,
+    stale_partitions,
+)
+
+# A Monday and the Sunday four weeks later
+MONDAY = date(2025, 6, 2)
+SUNDAY = date(2025, 6, 29)
+
+
+def _definitions():
+    return {d.name: d for d in rollup_definitions()}
+
+
+class TestRollupDefinitions:
+    """Test rollup SQL generation."""
+
+    def test_stores_re_aggregatable_measures(self):
+        """Test averages are stored as sums and counts."""
+        daily = _definitions()["search_terms_daily"]
+
+        assert daily.measures["quality_score"] == ("SUM", "quality_score")
+        assert daily.measures["quality_score_count"] == ("COUNT", "quality_score")
+        assert daily.measures["row_count"] == ("COUNT", "*")
+        assert {"date", "customer_id"} <= daily.to_rollup().dimensions
+
+    def test_weekly_rollup_is_merged_from_daily(self):
+        """Test the weekly MERGE re-aggregates the daily rollup by week."""
+        definitions = _definitions()
+        weekly = definitions["search_terms_weekly"]
+
+        sql = weekly.merge_sql(
+            "p", "ads", definitions["search_terms_daily"].to_rollup()
+        )
+
+        assert "FROM `p.ads.search_terms_daily`" in sql
+        assert "DATE_TRUNC(date, WEEK(MONDAY)) AS date" in sql
+        assert "SUM(row_count) AS row_count" in sql
+        assert "MAX(date_max) AS date_max" in sql
+        assert "SUM(quality_score_count) AS quality_score_count" in sql
+        assert "WHEN NOT MATCHED BY SOURCE AND T.date BETWEEN" in sql
+
+    def test_weekly_partitions_cover_whole_weeks(self):
+        """Test source dates map to week partitions and a full-week window."""
+        weekly = _definitions()["search_terms_weekly"]
+
+        partitions = weekly.partition_dates([date(2025, 6, 4), date(2025, 6, 3)])
+
+        assert partitions == [MONDAY]
+        assert weekly.refresh_window(partitions) == (MONDAY, date(2025, 6, 8))
+
+
+class TestStalePartitions:
+    """Test stale partitions are found from recorded refresh watermarks."""
+
+    MODIFIED = datetime(2025, 6, 3, tzinfo=timezone.utc)
+
+    def test_refresh_without_changes_stays_fresh(self):
+        """Test a partition is fresh once its source state is recorded."""
+        sources = {MONDAY: SourceState(self.MODIFIED, 7)}
+
+        assert stale_partitions(sources, {}) == [MONDAY]
+        assert stale_partitions(sources, dict(sources)) == []
+
+    def test_modified_and_added_sources_are_stale(self):
+        """Test newer or extra source partitions make a partition stale."""
+        later = datetime(2025, 6, 4, tzinfo=timezone.utc)
+        watermarks = {MONDAY: SourceState(self.MODIFIED, 7)}
+
+        assert stale_partitions({MONDAY: SourceState(later, 7)}, watermarks) == [MONDAY]
+        assert stale_partitions(
+            {MONDAY: SourceState(self.MODIFIED, 8)}, watermarks
+        ) == [MONDAY]
+
+    def test_deleted_sources_are_stale_until_refreshed(self):
+        """Test a partition whose sources were deleted is rebuilt once."""
+        watermarks = {MONDAY: SourceState(self.MODIFIED, 7)}
+
+        assert stale_partitions({}, watermarks) == [MONDAY]
+        assert stale_partitions({}, {MONDAY: SourceState()}) == []
+
+
+class TestRollupRouting:
+    """Test analytics queries are answered from the smallest rollup."""
+
+    async def _query(self, **kwargs):
+        client = Mock()
+        client.query.return_value = Mock(total_bytes_processed=1024)
+        client.query.return_value.result.return_value = []
+        if kwargs.pop("rollups_exist", True):
+            client.get_table.return_value = Mock()
+        else:
+            client.get_table.side_effect = NotFound("missing")
+        authenticator = SimpleNamespace(get_client=AsyncMock(return_value=client))
+        config = SimpleNamespace(
+            project_id="p",
+            dataset_id="ads",
+            enable_query_cache=True,
+            max_query_bytes=10**9,
+        )
+        engine = BigQueryAnalyticsEngine(config, authenticator)
+
+        assert await engine.get_search_terms_insights("123", **kwargs) == []
+        return client.query.call_args.args[0]
+
+    async def test_whole_weeks_read_weekly_rollup(self):
+        """Test a Monday-to-Sunday window reads the weekly rollup."""
+        query = await self._query(date_range=27, end_date=SUNDAY)
+
+        assert "`p.ads.search_terms_weekly`" in query
+        assert "SAFE_DIVIDE(SUM(quality_score), SUM(quality_score_count))" in query
+        assert "SUM(row_count) as days_active" in query
+
+    async def test_partial_weeks_read_daily_rollup(self):
+        """Test other windows read the daily rollup."""
+        query = await self._query(
+            date_range=30, end_date=SUNDAY, filters={"campaign_id": "9"}
+        )
+
+        assert "`p.ads.search_terms_daily`" in query
+        assert "campaign_id = @campaign_id" in query
+
+    async def test_raw_row_filters_read_source(self):
+        """Test filters on raw rows, or missing rollups, fall back to the source."""
+        min_cost = await self._query(filters={"min_cost": 5})
+        missing = await self._query(rollups_exist=False)
+
+        for query in (min_cost, missing):
+            assert "`p.ads.search_terms`" in query
+            assert "AVG(quality_score)" in query
@@ -1,7 +1,10 @@
 """Tests for BigQuery service functionality."""
 
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from paidsearchnav_mcp.clients.bigquery import streaming
+from paidsearchnav_mcp.clients.bigquery.service import BigQueryService
 from paidsearchnav_mcp.core.config import BigQueryConfig, BigQueryTier
-from paidsearchnav_mcp.platforms.bigquery.service import BigQueryService
 
 
 class TestBigQueryService:
@@ -19,6 +22,7 @@ class TestBigQueryService:
         service = BigQueryService(config)
 
         assert service.config == config
+        assert service.streamer.cost_tracker is service.cost_tracker
         assert service.is_enabled is True
         assert service.is_premium is True
         assert service.is_enterprise is False
@@ -138,3 +142,51 @@ class TestBigQueryService:
         service_enterprise = BigQueryService(config_enterprise)
         assert service_enterprise.is_premium is True
         assert service_enterprise.is_enterprise is True
+
+    async def test_streamed_batches_are_reported_to_cost_tracker(self):
+        """Test rows streamed through the service are tracked per batch."""
+        config = BigQueryConfig(
+            enabled=True,
+            tier=BigQueryTier.PREMIUM,
+            project_id="test-project",
+            dataset_id="test_dataset",
+        )
+        service = BigQueryService(config)
+        service.cost_tracker.track_streaming_insert = AsyncMock()
+
+        class _Session:
+            """Session writing every appended row as one batch."""
+
+            def __init__(self, write_client, table_path, serializer, on_batch):
+                self.on_batch = on_batch
+                self.rows_written = self.bytes_written = self.batches_written = 0
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return None
+
+            async def append(self, rows):
+                self.rows_written += len(rows)
+                self.batches_written += 1
+                await self.on_batch(streaming.RowBatch(rows=rows, num_bytes=64))
+
+        with (
+            patch.object(
+                service.authenticator, "get_client", AsyncMock(return_value=None)
+            ),
+            patch.object(
+                service.streamer, "_get_write_client", return_value=MagicMock()
+            ),
+            patch.object(streaming, "StorageWriteSession", _Session),
+        ):
+            result = await service.streamer.stream_rows(
+                "search_terms", [{"search_term": "running shoes"}], "123"
+            )
+
+        assert result["success"] is True
+        args, kwargs = service.cost_tracker.track_streaming_insert.await_args
+        assert args[:2] == ("123", "search_terms")
+        assert args[2][0]["customer_id"] == "123"
+        assert kwargs == {"bytes_inserted": 64, "storage_write_api": True}
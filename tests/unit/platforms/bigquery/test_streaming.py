@@ -0,0 +1,297 @@
+"""Tests for Storage Write API ingestion."""
+
+import threading
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from google.api_core import exceptions as api_exceptions
+
+from paidsearchnav_mcp.clients.bigquery import streaming
+from paidsearchnav_mcp.clients.bigquery.schema import BigQueryTableSchema
+from paidsearchnav_mcp.clients.bigquery.streaming import (
+    BigQueryDataStreamer,
+    ProtoRowSerializer,
+    RowBatcher,
+    StorageWriteSession,
+)
+
+
+def _search_term(i=0):
+    return {
+        "date": "2025-06-02",
+        "campaign_id": "c1",
+        "campaign_name": "Brand",
+        "ad_group_id": "a1",
+        "ad_group_name": "Core",
+        "search_term": f"term {i}",
+        "impressions": 100,
+        "clicks": 5,
+        "cost": 2.5,
+        "conversions": 1.0,
+    }
+
+
+@pytest.fixture
+def serializer():
+    schema = BigQueryTableSchema.get_search_terms_schema()
+    if not schema:
+        pytest.skip("BigQuery library not available")
+    return ProtoRowSerializer(schema)
+
+
+class TestProtoRowSerializer:
+    """Test protobuf row serialization."""
+
+    def test_encodes_dates_timestamps_and_ignores_unknown_keys(self, serializer):
+        """Test values use the Storage Write API encodings."""
+        created = datetime(2025, 6, 2, 12, tzinfo=timezone.utc)
+        row = {**_search_term(), "created_at": created, "not_a_column": "x"}
+
+        message = serializer.message_class.FromString(serializer.serialize(row))
+
+        assert message.date == (date(2025, 6, 2) - date(1970, 1, 1)).days
+        assert message.created_at == int(created.timestamp()) * 1_000_000
+        assert message.search_term == "term 0"
+        assert message.cost == 2.5
+        assert not message.HasField("quality_score")
+
+
+class TestRowBatcher:
+    """Test batching by size and age."""
+
+    def test_flushes_on_row_count(self):
+        """Test a batch is returned when it reaches max_rows."""
+        batcher = RowBatcher(max_rows=2)
+
+        assert batcher.add({"i": 1}, b"a") is None
+        batch = batcher.add({"i": 2}, b"b")
+
+        assert batch.rows == [{"i": 1}, {"i": 2}]
+        assert batcher.flush() is None
+
+    def test_row_that_does_not_fit_starts_next_batch(self):
+        """Test batches never exceed max_bytes."""
+        batcher = RowBatcher(max_bytes=10)
+
+        batcher.add({"i": 1}, b"x" * 6)
+        batch = batcher.add({"i": 2}, b"x" * 6)
+
+        assert batch.num_bytes == 6
+        assert batcher.flush().rows == [{"i": 2}]
+        with pytest.raises(ValueError):
+            batcher.add({"i": 3}, b"x" * 11)
+
+    def test_partial_batch_is_due_after_max_latency(self):
+        """Test the age of the oldest buffered row triggers a flush."""
+        now = [100.0]
+        batcher = RowBatcher(max_latency=2.0, clock=lambda: now[0])
+
+        assert not batcher.due()
+        batcher.add({"i": 1}, b"a")
+        now[0] += 1.0
+        batcher.add({"i": 2}, b"b")
+        assert not batcher.due()
+        now[0] += 1.0
+        assert batcher.due()
+
+
+# Outcome of an append left unacknowledged until its connection closes
+_UNTIL_CLOSED = object()
+
+
+class _FailAfterSends:
+    """Outcome failing with ``error`` once the connection has ``sends`` sends."""
+
+    def __init__(self, error, sends):
+        self.error = error
+        self.sends = sends
+
+
+class _AppendStream:
+    """Fake append connection recording each request's offset and size.
+
+    Like ``AppendRowsStream``, closing it fails unacknowledged appends and
+    later sends with ``StreamClosedError``.
+    """
+
+    instances = []
+
+    def __init__(self, client, template, failures=None):
+        self.template = template
+        self.failures = failures if failures is not None else []
+        self.offsets = []
+        self.closed = False
+        self._changed = threading.Condition()
+        _AppendStream.instances.append(self)
+
+    def send(self, request):
+        with self._changed:
+            if self.closed:
+                raise streaming.write_exceptions.StreamClosedError("closed")
+            self.offsets.append(
+                (request.offset, len(request.proto_rows.rows.serialized_rows))
+            )
+            self._changed.notify_all()
+        outcome = self.failures.pop(0) if self.failures else None
+
+        def result():
+            if outcome is _UNTIL_CLOSED:
+                self._wait_for(lambda: self.closed)
+                raise streaming.write_exceptions.StreamClosedError(
+                    "Stream closed before receiving a response."
+                )
+            if isinstance(outcome, _FailAfterSends):
+                self._wait_for(lambda: len(self.offsets) >= outcome.sends)
+                raise outcome.error
+            if outcome is not None:
+                raise outcome
+            return SimpleNamespace()
+
+        return SimpleNamespace(result=result)
+
+    def close(self):
+        with self._changed:
+            self.closed = True
+            self._changed.notify_all()
+
+    def _wait_for(self, predicate):
+        with self._changed:
+            assert self._changed.wait_for(predicate, timeout=5)
+
+
+@pytest.fixture
+def write_api():
+    """Skip unless google-cloud-bigquery-storage is installed."""
+    pytest.importorskip("google.cloud.bigquery_storage_v1")
+    _AppendStream.instances = []
+    client = MagicMock()
+    client.create_write_stream.return_value = SimpleNamespace(name="stream-1")
+    client.batch_commit_write_streams.return_value = SimpleNamespace(stream_errors=[])
+    with patch.object(streaming, "RETRY_BASE_DELAY", 0):
+        yield client
+
+
+def _session(client, serializer, failures=(), **kwargs):
+    session = StorageWriteSession(
+        client,
+        "projects/p/datasets/ads/tables/search_terms",
+        serializer,
+        batcher=RowBatcher(max_rows=2),
+        **kwargs,
+    )
+    failures = list(failures)
+    factory = lambda c, t: _AppendStream(c, t, failures)  # noqa: E731
+    return session, patch.object(streaming.writer, "AppendRowsStream", factory)
+
+
+class TestStorageWriteSession:
+    """Test appends, retries and commits."""
+
+    async def test_appends_contiguous_offsets_and_commits(self, write_api, serializer):
+        """Test batches get consecutive offsets and the stream is committed."""
+        on_batch = AsyncMock()
+        session, append_stream = _session(write_api, serializer, on_batch=on_batch)
+
+        with append_stream:
+            async with session:
+                await session.append([_search_term(i) for i in range(5)])
+
+        sent = sorted(_AppendStream.instances[0].offsets)
+        assert sent == [(0, 2), (2, 2), (4, 1)]
+        assert session.rows_written == 5
+        assert on_batch.await_count == 3
+        write_api.finalize_write_stream.assert_called_once_with(name="stream-1")
+        write_api.batch_commit_write_streams.assert_called_once()
+
+    async def test_retries_at_same_offset_on_new_connection(
+        self, write_api, serializer
+    ):
+        """Test a transient failure is resent at its offset; duplicates are no-ops."""
+        failures = [
+            api_exceptions.ServiceUnavailable("blip"),
+            api_exceptions.AlreadyExists("offset 0 already written"),
+        ]
+        session, append_stream = _session(write_api, serializer, failures)
+
+        with append_stream:
+            async with session:
+                await session.append([_search_term(i) for i in range(2)])
+
+        first, second = _AppendStream.instances
+        assert first.closed
+        assert first.offsets == [(0, 2)]
+        assert second.offsets == [(0, 2)]
+        assert session.rows_written == 2
+
+    async def test_in_flight_appends_are_retried_when_connection_closes(
+        self, write_api, serializer
+    ):
+        """Test a retry closing the connection resends the other in-flight batch."""
+        failures = [
+            _FailAfterSends(api_exceptions.ServiceUnavailable("blip"), sends=2),
+            _UNTIL_CLOSED,
+        ]
+        session, append_stream = _session(write_api, serializer, failures)
+
+        with append_stream:
+            async with session:
+                await session.append([_search_term(i) for i in range(4)])
+
+        first, second = _AppendStream.instances
+        assert first.closed
+        assert first.offsets == [(0, 2), (2, 2)]
+        assert sorted(second.offsets) == [(0, 2), (2, 2)]
+        assert session.rows_written == 4
+        write_api.batch_commit_write_streams.assert_called_once()
+
+    async def test_failed_append_is_not_committed(self, write_api, serializer):
+        """Test a permanent failure surfaces and the pending stream is abandoned."""
+        failures = [api_exceptions.InvalidArgument("bad row")]
+        session, append_stream = _session(write_api, serializer, failures)
+
+        with append_stream, pytest.raises(api_exceptions.InvalidArgument):
+            async with session:
+                await session.append([_search_term(i) for i in range(2)])
+
+        write_api.batch_commit_write_streams.assert_not_called()
+
+
+class TestBigQueryDataStreamer:
+    """Test BigQueryDataStreamer."""
+
+    def _streamer(self, cost_tracker=None):
+        config = SimpleNamespace(enabled=True, project_id="p", dataset_id="ads")
+        client = SimpleNamespace(_credentials=object())
+        authenticator = SimpleNamespace(get_client=AsyncMock(return_value=client))
+        return BigQueryDataStreamer(config, authenticator, cost_tracker)
+
+    async def test_reports_cost_per_batch(self, write_api, serializer):
+        """Test each written batch is reported as Storage Write API usage."""
+        tracker = MagicMock()
+        tracker.track_streaming_insert = AsyncMock()
+        streamer = self._streamer(tracker)
+        write_api.table_path.return_value = "projects/p/datasets/ads/tables/t"
+
+        with (
+            patch.object(streaming.bigquery_storage_v1, "BigQueryWriteClient") as cls,
+            patch.object(streaming.writer, "AppendRowsStream", _AppendStream),
+        ):
+            cls.return_value = write_api
+            result = await streamer.stream_search_terms([_search_term()], "123")
+
+        assert result["success"] is True
+        assert result["rows_written"] == 1
+        args, kwargs = tracker.track_streaming_insert.await_args
+        assert args[:2] == ("123", "search_terms")
+        assert args[2][0]["customer_id"] == "123"
+        assert kwargs["storage_write_api"] is True
+
+    async def test_reports_missing_storage_library(self):
+        """Test streaming fails cleanly without google-cloud-bigquery-storage."""
+        with patch.object(streaming, "bigquery_storage_v1", None):
+            result = await self._streamer().stream_keywords([{}], "123")
+
+        assert result["success"] is False
+        assert "bigquery-storage" in result["error"]
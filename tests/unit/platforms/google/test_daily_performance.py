@@ -0,0 +1,82 @@
+"""Tests for fetching day-segmented campaign and ad group metrics."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from paidsearchnav_mcp.clients.google.client import GoogleAdsAPIClient
+
+
+def _row(day):
+    row = MagicMock()
+    row.segments.date = day
+    row.campaign.id = 1
+    row.campaign.name = "Campaign"
+    row.ad_group.id = 2
+    row.ad_group.name = "Ad Group"
+    row.metrics.impressions = 10
+    row.metrics.clicks = 1
+    row.metrics.cost_micros = 2_500_000
+    row.metrics.conversions = 1.0
+    row.metrics.conversions_value = 30.0
+    return row
+
+
+async def _fetch(rows, **kwargs):
+    client = GoogleAdsAPIClient(
+        developer_token="token",
+        client_id="client-id",
+        client_secret="secret",
+        refresh_token="refresh",
+    )
+    search = AsyncMock(return_value=rows)
+    with (
+        patch.object(client, "_get_client", return_value=MagicMock()),
+        patch.object(client, "_paginated_search_async", search),
+    ):
+        daily = await client.get_daily_performance(
+            "1234567890", datetime(2025, 1, 1), datetime(2025, 1, 31), **kwargs
+        )
+    return daily, search.call_args.kwargs["query"]
+
+
+class TestDailyPerformance:
+    """Test the day-segmented fetch."""
+
+    async def test_campaign_level_rows(self):
+        """Test one row per campaign and day, with cost in currency units."""
+        daily, query = await _fetch([_row("2025-01-02")])
+
+        assert "segments.date," in query
+        assert "FROM campaign" in query
+        assert daily == [
+            {
+                "date": "2025-01-02",
+                "entity_id": "1",
+                "entity_name": "Campaign",
+                "campaign_id": "1",
+                "campaign_name": "Campaign",
+                "impressions": 10,
+                "clicks": 1,
+                "cost": 2.5,
+                "conversions": 1.0,
+                "conversion_value": 30.0,
+            }
+        ]
+
+    async def test_ad_group_level_filters_campaigns(self):
+        """Test ad group rows are keyed by ad group within campaign filters."""
+        daily, query = await _fetch(
+            [_row("2025-01-02")], level="ad_group", campaigns=["1"]
+        )
+
+        assert "FROM ad_group" in query
+        assert "campaign.id = 1" in query
+        assert daily[0]["entity_id"] == "2"
+        assert daily[0]["campaign_id"] == "1"
+
+    async def test_rejects_unknown_level(self):
+        """Test levels outside CAMPAIGN and AD_GROUP never reach the API."""
+        with pytest.raises(ValueError):
+            await _fetch([], level="KEYWORD")
@@ -0,0 +1,158 @@
+"""Tests for streaming percentile histograms in API efficiency metrics."""
+
+import json
+import random
+
+import pytest
+
+from paidsearchnav_mcp.clients.google.metrics import (
+    OTHER_CUSTOMERS,
+    APIEfficiencyMetrics,
+    StreamingHistogram,
+)
+
+
+class TestStreamingHistogram:
+    """Test StreamingHistogram accuracy, memory bounds and merging."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test quantile estimates stay within the configured relative error."""
+        rng = random.Random(42)
+        values = [rng.lognormvariate(0, 1.5) for _ in range(20000)]
+        histogram = StreamingHistogram(relative_accuracy=0.01)
+        for value in values:
+            histogram.record(value)
+
+        ordered = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            exact = ordered[int(q * (len(ordered) - 1))]
+            assert histogram.quantile(q) == pytest.approx(exact, rel=0.03)
+
+        assert histogram.count == len(values)
+        assert histogram.max_value == max(values)
+
+    def test_memory_is_bounded(self):
+        """Test bucket count never exceeds max_buckets."""
+        histogram = StreamingHistogram(relative_accuracy=0.01, max_buckets=64)
+        for exponent in range(-6, 7):
+            for _ in range(10):
+                histogram.record(10.0**exponent)
+
+        assert len(histogram.buckets) <= 64
+        assert histogram.quantile(1.0) == pytest.approx(1e6, rel=0.02)
+
+    def test_zero_values(self):
+        """Test zero values are counted without a log bucket."""
+        histogram = StreamingHistogram()
+        histogram.record(0)
+        histogram.record(0)
+        histogram.record(10)
+
+        assert histogram.quantile(0.5) == 0.0
+        assert histogram.quantile(1.0) == pytest.approx(10, rel=0.01)
+
+    def test_empty_histogram(self):
+        """Test percentiles of an empty histogram are None."""
+        summary = StreamingHistogram().percentiles()
+
+        assert summary["count"] == 0
+        assert summary["p50"] is None
+        assert summary["p99"] is None
+
+    def test_merge_matches_single_histogram(self):
+        """Test merging serialized halves equals recording everything at once."""
+        values = [i / 10 for i in range(1, 1001)]
+        whole, left, right = (StreamingHistogram() for _ in range(3))
+        for value in values:
+            whole.record(value)
+        for value in values[:500]:
+            left.record(value)
+        for value in values[500:]:
+            right.record(value)
+
+        restored = StreamingHistogram.from_dict(json.loads(json.dumps(right.to_dict())))
+        left.merge(restored)
+
+        assert left.percentiles() == pytest.approx(whole.percentiles())
+
+    def test_merge_rejects_different_accuracy(self):
+        """Test merging incompatible histograms fails."""
+        with pytest.raises(ValueError):
+            StreamingHistogram(relative_accuracy=0.01).merge(
+                StreamingHistogram(relative_accuracy=0.02)
+            )
+
+
+class TestAPIEfficiencyPercentiles:
+    """Test percentile reporting in APIEfficiencyMetrics."""
+
+    def test_efficiency_report_exposes_tail_latency(self):
+        """Test p50/p95/p99 appear in the efficiency report."""
+        metrics = APIEfficiencyMetrics()
+        for _ in range(98):
+            metrics.track_simple_call("search", "111", response_time=0.2)
+        for _ in range(2):
+            metrics.track_simple_call(
+                "search", "222", response_time=30.0, success=False, error_type="Timeout"
+            )
+
+        report = metrics.get_efficiency_report()
+
+        latency = report["response_time_percentiles_seconds"]
+        assert latency["p50"] == pytest.approx(0.2, rel=0.02)
+        assert latency["p99"] == pytest.approx(30.0, rel=0.02)
+        assert report["p95_response_time_target_2s_met"] is True
+        assert report["percentiles"]["customers"]["222"]["response_time"]["count"] == 2
+        assert report["percentiles"]["operations"]["search"]["records"]["count"] == 98
+
+    def test_filter_by_operation_and_customer(self):
+        """Test percentiles can be narrowed to an operation or customer."""
+        metrics = APIEfficiencyMetrics()
+        metrics.track_simple_call("search", "111", 1.0, record_count=100, page_count=1)
+        metrics.track_simple_call(
+            "report", "111", 5.0, record_count=10000, page_count=2
+        )
+
+        search = metrics.get_percentiles(operation_type="search")
+        assert search["records"]["p50"] == pytest.approx(100, rel=0.02)
+        customer = metrics.get_percentiles(customer_id="111")
+        assert customer["pages"]["max"] == 2
+
+    def test_merge_exported_histograms(self):
+        """Test histograms exported by another process can be merged."""
+        local, remote = APIEfficiencyMetrics(), APIEfficiencyMetrics()
+        local.track_simple_call("search", "111", 1.0)
+        remote.track_simple_call("search", "111", 3.0)
+
+        local.merge_histograms(json.loads(json.dumps(remote.export_histograms())))
+
+        assert local.get_percentiles()["response_time"]["count"] == 2
+
+    def test_call_history_bounded(self):
+        """Test call history keeps only the most recent calls."""
+        metrics = APIEfficiencyMetrics(max_call_history=3)
+        for i in range(5):
+            metrics.track_simple_call("search", "111", float(i))
+
+        assert [c.response_time for c in metrics.get_recent_calls(10)] == [
+            2.0,
+            3.0,
+            4.0,
+        ]
+        assert len(metrics.get_recent_calls(2)) == 2
+
+    def test_histograms_bounded_by_customer_count(self):
+        """Test customers beyond the limit share one histogram per operation."""
+        metrics = APIEfficiencyMetrics(max_histogram_customers=2)
+        for i in range(50):
+            metrics.track_simple_call("search", str(i), 1.0)
+        metrics.track_simple_call("search", "0", 1.0)
+
+        assert set(metrics.histograms) == {
+            ("search", "0"),
+            ("search", "1"),
+            ("search", OTHER_CUSTOMERS),
+        }
+        assert metrics.get_percentiles(customer_id="0")["response_time"]["count"] == 2
+        other = metrics.get_percentiles(customer_id=OTHER_CUSTOMERS)
+        assert other["response_time"]["count"] == 48
@@ -0,0 +1,73 @@
+"""Tests for fetching search terms with their triggering keywords."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from paidsearchnav_mcp.clients.google.client import GoogleAdsAPIClient
+
+
+def _row(search_term, keyword_text="", match_type="UNSPECIFIED"):
+    row = MagicMock()
+    row.search_term_view.search_term = search_term
+    row.campaign.id = 1
+    row.campaign.name = "Campaign"
+    row.ad_group.id = 2
+    row.ad_group.name = "Ad Group"
+    row.segments.keyword.ad_group_criterion = "customers/1/adGroupCriteria/2~345"
+    row.segments.keyword.info.text = keyword_text
+    row.segments.keyword.info.match_type.name = match_type
+    row.metrics.impressions = 10
+    row.metrics.clicks = 1
+    row.metrics.cost_micros = 2_000_000
+    row.metrics.conversions = 0.0
+    row.metrics.conversions_value = 0.0
+    return row
+
+
+async def _fetch(rows, **kwargs):
+    client = GoogleAdsAPIClient(
+        developer_token="token",
+        client_id="client-id",
+        client_secret="secret",
+        refresh_token="refresh",
+    )
+    search = AsyncMock(return_value=rows)
+    with (
+        patch.object(client, "_get_client", return_value=MagicMock()),
+        patch.object(client, "_paginated_search_async", search),
+    ):
+        search_terms = await client.get_search_terms(
+            "1234567890", datetime(2025, 1, 1), datetime(2025, 1, 31), **kwargs
+        )
+    return search_terms, search.call_args.kwargs["query"]
+
+
+class TestSearchTermKeywords:
+    """Test the include_keyword fetch path."""
+
+    async def test_include_keyword_selects_and_populates_keyword(self):
+        """Test the keyword segment is queried and copied onto each term."""
+        search_terms, query = await _fetch(
+            [_row("red shoes", "shoes", "BROAD"), _row("dsa term")],
+            include_keyword=True,
+        )
+
+        assert "segments.keyword.info.text" in query
+        assert search_terms[0].keyword_text == "shoes"
+        assert search_terms[0].match_type == "BROAD"
+        assert search_terms[0].keyword_id == "345"
+        # Terms without a keyword (e.g. DSA) fall back to model inference
+        assert search_terms[1].keyword_id is None
+
+    async def test_keyword_segment_is_opt_in(self):
+        """Test the default query keeps one row per search term."""
+        search_terms, query = await _fetch([_row("red shoes", "shoes", "BROAD")])
+
+        assert "segments.keyword" not in query
+        assert search_terms[0].keyword_id is None
+
+    async def test_campaign_types_filter_on_channel_type(self):
+        """Test one query can cover every campaign of a type."""
+        _, query = await _fetch([], campaign_types=["performance_max"])
+
+        assert "campaign.advertising_channel_type = 'PERFORMANCE_MAX'" in query